@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Compare benchmark results against a stored baseline.
+
+A case regresses when its minimum wall time or its peak memory grows by
+more than the threshold relative to the baseline. The script prints a table
+of every case present in both files and exits non-zero if any case
+regressed, so it can gate CI.
+
+Usage:
+    uv run python benchmarks/compare_benchmarks.py benchmarks/baseline.json benchmarks/results.json
+    uv run python benchmarks/compare_benchmarks.py baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+
+from pathlib import Path
+from typing import Any
+
+
+METRICS = ("seconds_min", "peak_memory_bytes")
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+) -> tuple[list[tuple[str, str, float, float, float]], list[str]]:
+    """Compare two results files.
+
+    Args:
+        baseline: Parsed baseline results file.
+        current: Parsed current results file.
+        threshold: Allowed relative growth, e.g. 0.25 for 25%.
+
+    Returns:
+        Tuple of (rows, regressions). Each row is (case, metric, baseline value,
+        current value, relative change). Regressions lists "case:metric" keys
+        that exceeded the threshold.
+    """
+    rows = []
+    regressions = []
+    base_results = baseline.get("results", {})
+    for name, result in sorted(current.get("results", {}).items()):
+        base = base_results.get(name)
+        if base is None or base.get("size") != result.get("size"):
+            continue
+
+        for metric in METRICS:
+            old, new = base[metric], result[metric]
+            change = (new - old) / old if old else 0.0
+            rows.append((name, metric, old, new, change))
+            if change > threshold:
+                regressions.append(f"{name}:{metric}")
+
+    return rows, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path, help="Stored baseline results file")
+    parser.add_argument("current", type=Path, help="Results file to check")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative growth (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    if baseline.get("meta", {}).get("scale") != current.get("meta", {}).get("scale"):
+        print("Warning: baseline and current results were produced with different --scale values", file=sys.stderr)
+
+    rows, regressions = compare(baseline, current, args.threshold)
+
+    print(f"{'Case':<32} {'Metric':<18} {'Baseline':>14} {'Current':>14} {'Change':>9}")
+    print("-" * 91)
+    for name, metric, old, new, change in rows:
+        marker = "  <-- regression" if f"{name}:{metric}" in regressions else ""
+        print(f"{name:<32} {metric:<18} {old:>14.6g} {new:>14.6g} {change:>+8.1%}{marker}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+
+    print(f"\nNo regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
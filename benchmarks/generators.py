@@ -0,0 +1,162 @@
+"""Deterministic generators for large, realistic command output.
+
+Every generator takes a line count and a seed and always returns the same
+text for the same arguments, so benchmark runs on different machines or
+commits parse byte-identical input.
+"""
+
+import json
+import random
+
+from collections.abc import Iterator
+
+
+USERS = ("root", "systemd+", "dbus", "polkitd", "chrony", "postgres", "nginx", "apache", "mysql", "lightspeed")
+COMMANDS = (
+    "/usr/lib/systemd/systemd --switched-root --system --deserialize 31",
+    "/usr/sbin/sshd -D",
+    "nginx: worker process",
+    "/usr/bin/python3 -s /usr/sbin/firewalld --nofork --nopid",
+    "/usr/libexec/postgresql-check-db-dir postgresql",
+    "postgres: checkpointer",
+    "/usr/sbin/httpd -DFOREGROUND",
+    "/usr/lib/jvm/java-17-openjdk/bin/java -Xms2g -Xmx8g -jar /opt/app/service.jar --spring.profiles.active=prod",
+    "[kworker/u16:3-events_unbound]",
+    "/usr/bin/containerd-shim-runc-v2 -namespace moby -id 5d1c0f",
+)
+STATES = ("S", "Ss", "R", "Sl", "Ssl", "I<", "D", "Z")
+PROCESS_NAMES = ("sshd", "nginx", "postgres", "httpd", "java", "chronyd", "systemd-resolve", "containerd")
+HOSTNAMES = ("web01", "db02", "cache03")
+JOURNAL_IDENTS = ("sshd", "systemd", "kernel", "NetworkManager", "nginx", "postgres", "CROND", "dbus-broker")
+JOURNAL_MESSAGES = (
+    "Accepted publickey for {user} from 10.{a}.{b}.{c} port {port} ssh2: ED25519 SHA256:Zm9vYmFy",
+    "Started Session {num} of User {user}.",
+    "pam_unix(sshd:session): session opened for user {user}(uid={uid}) by (uid=0)",
+    "Connection closed by 10.{a}.{b}.{c} port {port} [preauth]",
+    "{user} : TTY=pts/{b} ; PWD=/home/{user} ; USER=root ; COMMAND=/usr/bin/systemctl restart nginx",
+    "device eth0: state change: activated -> activated (reason 'none', sys-iface-state: 'managed')",
+    'worker process {num} exited on signal 9, upstream "10.{a}.{b}.{c}:{port}"',
+    "checkpoint complete: wrote {num} buffers (0.{b}%); 0 WAL file(s) added, 0 removed, {c} recycled",
+    "(root) CMD (run-parts /etc/cron.hourly)",
+    'audit: type=1400 audit({num}.{port}:{c}): avc:  denied  {{ read }} for  pid={uid} comm="{user}"',
+)
+FILE_EXTENSIONS = ("log", "gz", "conf", "db", "tar", "json", "rpm", "img", "core", "tmp")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _address(rng: random.Random) -> str:
+    if rng.random() < 0.2:
+        return f"[2001:db8::{rng.randrange(1, 0xFFFF):x}]"
+    return f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+
+def generate_ps_aux(lines: int, seed: int = 0) -> str:
+    """Generate ``ps aux --sort=-%cpu`` output with ``lines`` process rows."""
+    rng = random.Random(seed)
+    rows = ["USER         PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND"]
+    for pid in range(1, lines + 1):
+        rows.append(
+            f"{rng.choice(USERS):<10} {pid:>6} {rng.random() * 100:4.1f} {rng.random() * 10:4.1f} "
+            f"{rng.randrange(1, 10_000_000):>7} {rng.randrange(0, 4_000_000):>6} "
+            f"{rng.choice(('?', 'pts/0', 'pts/1', 'tty1')):<8} {rng.choice(STATES):<4} "
+            f"{rng.randrange(24):02d}:{rng.randrange(60):02d}   {rng.randrange(600):d}:{rng.randrange(60):02d} "
+            f"{rng.choice(COMMANDS)}"
+        )
+    return "\n".join(rows) + "\n"
+
+
+def generate_ss_tunap(lines: int, seed: int = 0) -> str:
+    """Generate ``ss -tunap`` output with ``lines`` socket rows."""
+    rng = random.Random(seed)
+    rows = ["Netid State      Recv-Q Send-Q Local Address:Port  Peer Address:Port Process"]
+    for _ in range(lines):
+        netid = "tcp" if rng.random() < 0.85 else "udp"
+        state = rng.choice(("ESTAB", "TIME-WAIT", "CLOSE-WAIT", "SYN-SENT", "LISTEN")) if netid == "tcp" else "UNCONN"
+        name = rng.choice(PROCESS_NAMES)
+        process = f'users:(("{name}",pid={rng.randrange(1, 4_000_000)},fd={rng.randrange(3, 1024)}))'
+        rows.append(
+            f"{netid:<5} {state:<10} {rng.randrange(0, 512):<6} {rng.randrange(0, 512):<6} "
+            f"{_address(rng)}:{rng.randrange(1, 65536)} {_address(rng)}:{rng.randrange(1, 65536)} "
+            f"{process if rng.random() < 0.7 else ''}"
+        )
+    return "\n".join(rows) + "\n"
+
+
+def generate_find_printf(entries: int, order_by: str = "size", seed: int = 0) -> str:
+    """Generate ``find -printf`` output matching the ``list_files_<order_by>`` commands."""
+    rng = random.Random(seed)
+    rows = []
+    for idx in range(entries):
+        name = f"{rng.choice(('app', 'data', 'backup', 'core', 'session', 'cache'))}-{idx:07d}.{rng.choice(FILE_EXTENSIONS)}"
+        if order_by == "size":
+            rows.append(f"{int(rng.paretovariate(1.2) * 512)}\t{name}")
+        elif order_by == "modified":
+            rows.append(f"{1_700_000_000 + rng.random() * 30_000_000:.10f}\t{name}")
+        else:
+            rows.append(name)
+    return "\n".join(rows) + "\n"
+
+
+def generate_du_listing(entries: int, root: str = "/srv/data", seed: int = 0) -> str:
+    """Generate ``du -b --max-depth=1`` output, including the trailing parent directory line."""
+    rng = random.Random(seed)
+    rows = []
+    total = 0
+    for idx in range(entries):
+        size = int(rng.paretovariate(1.1) * 4096)
+        total += size
+        rows.append(f"{size}\t{root}/dir-{idx:07d}")
+    rows.append(f"{total}\t{root}")
+    return "\n".join(rows) + "\n"
+
+
+def _journal_entries(lines: int, seed: int) -> Iterator[tuple[int, str, str, int | None, str]]:
+    """Yield (seconds, hostname, identifier, pid, message) for synthetic journal entries."""
+    rng = random.Random(seed)
+    timestamp = 0
+    for _ in range(lines):
+        timestamp += rng.randrange(0, 5)
+        ident = rng.choice(JOURNAL_IDENTS)
+        pid = None if ident == "kernel" else rng.randrange(1, 4_000_000)
+        message = rng.choice(JOURNAL_MESSAGES).format(
+            user=rng.choice(USERS),
+            a=rng.randrange(256),
+            b=rng.randrange(256),
+            c=rng.randrange(1, 255),
+            port=rng.randrange(1024, 65536),
+            num=rng.randrange(1, 100_000),
+            uid=rng.randrange(1000, 60000),
+        )
+        yield timestamp, rng.choice(HOSTNAMES), ident, pid, message
+
+
+def generate_journal(lines: int, seed: int = 0) -> str:
+    """Generate ``journalctl`` short-format output with ``lines`` entries."""
+    rows = []
+    for timestamp, hostname, ident, pid, message in _journal_entries(lines, seed):
+        hours, rest = divmod(timestamp, 3600)
+        minutes, seconds = divmod(rest, 60)
+        rows.append(
+            f"{MONTHS[(hours // 24 // 28) % 12]} {(hours // 24) % 28 + 1:02d} {hours % 24:02d}:{minutes:02d}:{seconds:02d} "
+            f"{hostname} {ident}{'' if pid is None else f'[{pid}]'}: {message}"
+        )
+    return "\n".join(rows) + "\n"
+
+
+def generate_journal_json(lines: int, seed: int = 0) -> str:
+    """Generate ``journalctl -o json`` output with ``lines`` entries, as requested by get_journal_logs."""
+    rows = []
+    for index, (timestamp, hostname, ident, pid, message) in enumerate(_journal_entries(lines, seed)):
+        entry = {
+            "__CURSOR": f"s=5a1c0f;i={index:x};b=9e2d47;m={timestamp * 1_000_000:x};t={timestamp:x};x={index:x}",
+            "__REALTIME_TIMESTAMP": str((1_700_000_000 + timestamp) * 1_000_000),
+            "__MONOTONIC_TIMESTAMP": str(timestamp * 1_000_000),
+            "_BOOT_ID": "9e2d47",
+            "_HOSTNAME": hostname,
+            "SYSLOG_IDENTIFIER": ident,
+            "MESSAGE": message,
+        }
+        if pid is not None:
+            entry["_PID"] = str(pid)
+        rows.append(json.dumps(entry))
+    return "\n".join(rows) + "\n"
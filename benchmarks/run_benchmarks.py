@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Time and memory-profile the output parsers and formatters.
+
+Each benchmark case generates a large synthetic command output with the
+deterministic generators in ``generators.py``, then measures the parse or
+format function on it. Wall time is the minimum and median over several
+runs; memory is the peak traced allocation of one extra run under
+``tracemalloc``. Results are written as JSON for ``compare_benchmarks.py``.
+
+Usage:
+    uv run python benchmarks/run_benchmarks.py --output benchmarks/results.json
+    uv run python benchmarks/run_benchmarks.py --scale 0.1 --filter ps
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+
+from generators import generate_du_listing
+from generators import generate_find_printf
+from generators import generate_journal
+from generators import generate_journal_json
+from generators import generate_ps_aux
+from generators import generate_ss_tunap
+
+from linux_mcp_server.formatters import format_network_connections
+from linux_mcp_server.formatters import format_process_list
+from linux_mcp_server.formatters import format_service_logs
+from linux_mcp_server.log_templates import mine_templates
+from linux_mcp_server.models import LogEntries
+from linux_mcp_server.parsers import iter_file_listing
+from linux_mcp_server.parsers import iter_journal_json
+from linux_mcp_server.parsers import parse_directory_listing
+from linux_mcp_server.parsers import parse_file_listing
+from linux_mcp_server.parsers import parse_ps_output
+from linux_mcp_server.parsers import parse_ss_connections
+from linux_mcp_server.parsers import parse_ss_listening
+from linux_mcp_server.tools.storage import OrderBy
+from linux_mcp_server.tools.storage import select_rows
+from linux_mcp_server.tools.storage import SortBy
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A single benchmark.
+
+    Attributes:
+        name: Unique case name, used as the key in the results file.
+        description: Human-readable description of the input.
+        size: Number of input lines or entries at scale 1.0.
+        setup: Builds the input for the measured function from a scaled size.
+            Setup time is not measured.
+        func: The function being measured; receives the output of ``setup``.
+    """
+
+    name: str
+    description: str
+    size: int
+    setup: Callable[[int], Any]
+    func: Callable[[Any], Any]
+
+
+CASES: tuple[BenchmarkCase, ...] = (
+    BenchmarkCase(
+        name="parse_ps_output",
+        description="ps aux",
+        size=50_000,
+        setup=generate_ps_aux,
+        func=parse_ps_output,
+    ),
+    BenchmarkCase(
+        name="format_process_list",
+        description="ps aux",
+        size=50_000,
+        setup=lambda n: parse_ps_output(generate_ps_aux(n)),
+        func=format_process_list,
+    ),
+    BenchmarkCase(
+        name="parse_ss_connections",
+        description="ss -tunap",
+        size=200_000,
+        setup=generate_ss_tunap,
+        func=parse_ss_connections,
+    ),
+    BenchmarkCase(
+        name="parse_ss_listening",
+        description="ss -tunap",
+        size=200_000,
+        setup=generate_ss_tunap,
+        func=parse_ss_listening,
+    ),
+    BenchmarkCase(
+        name="format_network_connections",
+        description="ss -tunap",
+        size=200_000,
+        setup=lambda n: parse_ss_connections(generate_ss_tunap(n)),
+        func=format_network_connections,
+    ),
+    BenchmarkCase(
+        name="parse_file_listing_size",
+        description="find -printf '%s\\t%f\\n'",
+        size=1_000_000,
+        setup=lambda n: generate_find_printf(n, "size"),
+        func=lambda stdout: parse_file_listing(stdout, "size"),
+    ),
+    BenchmarkCase(
+        name="parse_file_listing_modified",
+        description="find -printf '%T@\\t%f\\n'",
+        size=1_000_000,
+        setup=lambda n: generate_find_printf(n, "modified"),
+        func=lambda stdout: parse_file_listing(stdout, "modified"),
+    ),
+    BenchmarkCase(
+        name="parse_file_listing_name",
+        description="find -printf '%f\\n'",
+        size=1_000_000,
+        setup=lambda n: generate_find_printf(n, "name"),
+        func=lambda stdout: parse_file_listing(stdout, "name"),
+    ),
+    BenchmarkCase(
+        name="select_top_20_files_by_size",
+        description="find -printf '%s\\t%f\\n'",
+        size=1_000_000,
+        setup=lambda n: generate_find_printf(n, "size"),
+        func=lambda stdout: select_rows(iter_file_listing(stdout, "size"), OrderBy.SIZE, SortBy.DESCENDING, 20),
+    ),
+    BenchmarkCase(
+        name="parse_directory_listing_size",
+        description="du -b --max-depth=1",
+        size=100_000,
+        setup=generate_du_listing,
+        func=lambda stdout: parse_directory_listing(stdout, "size"),
+    ),
+    BenchmarkCase(
+        name="log_entries_journal",
+        description="journalctl short output",
+        size=10_000,
+        setup=generate_journal,
+        func=lambda stdout: LogEntries(entries=[line for line in stdout.strip().splitlines() if line]),
+    ),
+    BenchmarkCase(
+        name="format_service_logs",
+        description="journalctl short output",
+        size=10_000,
+        setup=generate_journal,
+        func=lambda stdout: format_service_logs(stdout, "sshd.service", 10_000),
+    ),
+    BenchmarkCase(
+        name="iter_journal_json",
+        description="journalctl -o json",
+        size=100_000,
+        setup=generate_journal_json,
+        func=lambda stdout: list(iter_journal_json(stdout)),
+    ),
+    BenchmarkCase(
+        name="mine_log_templates",
+        description="journalctl short output",
+        size=1_000_000,
+        setup=generate_journal,
+        func=lambda stdout: mine_templates(stdout.splitlines()),
+    ),
+)
+
+
+def _time_case(func: Callable[[Any], Any], data: Any, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _peak_memory(func: Callable[[Any], Any], data: Any) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run_case(case: BenchmarkCase, scale: float, repeat: int) -> dict[str, Any]:
+    """Run one benchmark case and return its result record."""
+    size = max(1, int(case.size * scale))
+    data = case.setup(size)
+    timings = _time_case(case.func, data, repeat)
+    return {
+        "input": f"{case.description} ({size} entries)",
+        "size": size,
+        "seconds_min": min(timings),
+        "seconds_median": statistics.median(timings),
+        "peak_memory_bytes": _peak_memory(case.func, data),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", type=Path, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every input size by this factor")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this substring")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for case in CASES:
+        if args.filter not in case.name:
+            continue
+        print(f"Running {case.name} ...", file=sys.stderr)
+        results[case.name] = run_case(case, args.scale, args.repeat)
+        print(
+            f"  min {results[case.name]['seconds_min'] * 1000:.1f} ms, "
+            f"peak {results[case.name]['peak_memory_bytes'] / 1024 / 1024:.1f} MiB",
+            file=sys.stderr,
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
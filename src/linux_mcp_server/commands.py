@@ -23,6 +23,13 @@ class CommandSpec(BaseModel):
         optional_flags: Maps parameter names to flag arguments that are added
             when the parameter is truthy. For example:
             {"unit": ["--unit", "{unit}"]} adds "--unit <value>" when unit is provided.
+        script: Optional bash script. When set, the command runs as
+            ``bash -c <script> bash <args>`` so the substituted args become the
+            script's positional parameters. The script is passed through
+            verbatim and never substituted, so it may contain braces.
+        verbatim: Names of parameters whose values are passed through
+            unchanged, so they may contain braces. Their placeholders must
+            make up a whole argument, e.g. "{pattern}".
     """
 
     model_config = ConfigDict(frozen=True)
@@ -30,6 +37,25 @@ class CommandSpec(BaseModel):
     args: tuple[str, ...]
     fallback: tuple[str, ...] | None = None
     optional_flags: Mapping[str, tuple[str, ...]] | None = None
+    script: str | None = None
+    verbatim: frozenset[str] = frozenset()
+
+    def _substitute(self, args: Sequence[str], **kwargs: object) -> tuple[str, ...]:
+        values = {f"{{{name}}}": str(kwargs[name]) for name in self.verbatim if name in kwargs}
+        return tuple(values[arg] if arg in values else substitute_command_args((arg,), **kwargs)[0] for arg in args)
+
+    def _build_args(self, **kwargs: object) -> tuple[tuple[str, ...], tuple[str, ...] | None]:
+        """Substitute placeholders in the command and fallback arguments."""
+        args = list(self._substitute(self.args, **kwargs))
+        if self.optional_flags:
+            for param_name, flag_args in self.optional_flags.items():
+                if kwargs.get(param_name):
+                    args.extend(self._substitute(flag_args, **kwargs))
+        if self.script:
+            args[:0] = ("bash", "-c", self.script, "bash")
+
+        fallback = self._substitute(self.fallback, **kwargs) if self.fallback else None
+        return tuple(args), fallback
 
     async def run(self, host: str | None = None, **kwargs: object) -> tuple[int, str, str]:
         """Run the command with optional fallback.
@@ -38,13 +64,8 @@ class CommandSpec(BaseModel):
             host: Optional remote host address.
             **kwargs: Additional arguments passed to substitute_command_args.
         """
-        args = list(substitute_command_args(self.args, **kwargs))
-        if self.optional_flags:
-            for param_name, flag_args in self.optional_flags.items():
-                if kwargs.get(param_name):
-                    args.extend(substitute_command_args(flag_args, **kwargs))
-
-        returncode, stdout, stderr = await execute_with_fallback(tuple(args), fallback=self.fallback, host=host)
+        args, fallback = self._build_args(**kwargs)
+        returncode, stdout, stderr = await execute_with_fallback(args, fallback=fallback, host=host)
         stdout = stdout if isinstance(stdout, str) else stdout.decode("utf-8", errors="replace")
         stderr = stderr if isinstance(stderr, str) else stderr.decode("utf-8", errors="replace")
         return returncode, stdout, stderr
@@ -56,20 +77,770 @@ class CommandSpec(BaseModel):
             host: Optional remote host address.
             **kwargs: Additional arguments passed to substitute_command_args.
         """
-        args = list(substitute_command_args(self.args, **kwargs))
-        if self.optional_flags:
-            for param_name, flag_args in self.optional_flags.items():
-                if kwargs.get(param_name):
-                    args.extend(substitute_command_args(flag_args, **kwargs))
-
-        returncode, stdout, stderr = await execute_with_fallback(
-            tuple(args), fallback=self.fallback, host=host, encoding=None
-        )
+        args, fallback = self._build_args(**kwargs)
+        returncode, stdout, stderr = await execute_with_fallback(args, fallback=fallback, host=host, encoding=None)
         stdout = stdout if isinstance(stdout, bytes) else stdout.encode("utf-8")
         stderr = stderr if isinstance(stderr, bytes) else stderr.encode("utf-8")
         return returncode, stdout, stderr
 
 
+# Sort and truncate a listing on the target so that only the selected lines
+# are transferred. Positional arguments are the sort flags, the line count, and
+# the listing command. A failing sort or head (e.g. on hosts without GNU
+# coreutils) exits non-zero so the plain listing fallback is sorted client-side.
+# Lines are "KEY<TAB>NAME"; ties on the key are ordered by name, ascending in
+# both directions, so the cutoff matches select_rows.
+LISTING_TOP_N_SCRIPT = """\
+set -o pipefail
+flags=$1 count=$2
+shift 2
+"$@" | LC_ALL=C sort -t $'\\t' -k "1,1${flags#-}" -k 2 | head -n "$count"
+status=$?
+# sort is killed by SIGPIPE once head has read enough lines
+[ "$status" -eq 141 ] && status=0
+exit "$status"
+"""
+
+# Like LISTING_TOP_N_SCRIPT, for du output whose last line is the parent
+# directory. That line is kept last so the output has the same shape as du's.
+# du exits non-zero when some subdirectories are unreadable, so any output is
+# a success, and a failing sort returns the full listing instead of running
+# the whole du again.
+DU_TOP_N_SCRIPT = """\
+set -o pipefail
+flags=$1 count=$2
+shift 2
+out=$("$@")
+status=$?
+[ -n "$out" ] || exit "$status"
+printf '%s\\n' "$out" | sed '$d' | LC_ALL=C sort -t $'\\t' -k "1,1${flags#-}" -k 2 | head -n "$count"
+status=$?
+if [ "$status" -ne 0 ] && [ "$status" -ne 141 ]; then
+    printf '%s\\n' "$out"
+    exit 0
+fi
+printf '%s\\n' "$out" | tail -n 1
+"""
+
+# Like du -b --one-file-system --max-depth=1, with the first-level
+# subdirectories sized by up to $1 du processes in parallel. Subdirectories on
+# other filesystems are skipped, as du skips them. A file with hard links in
+# several subdirectories is counted in each. The last line is the directory
+# itself, the sum of its children and its own entries. Returns non-zero only
+# without output, since du also fails for unreadable subdirectories.
+DU_CHILDREN_FUNCTION = """\
+du_children() {
+    local jobs=$1 root=$2 dev
+    dev=$(stat -c %d -- "$root") || return
+    {
+        find "$root" -mindepth 1 -maxdepth 1 -type d -printf '%D/%p\\0' |
+            while IFS= read -r -d '' entry; do
+                if [ "${entry%%/*}" = "$dev" ]; then
+                    printf '%s\\0' "${entry#*/}"
+                fi
+            done |
+            xargs -0 -r -P "$jobs" -n 1 du -bs --one-file-system --
+        find "$root" -maxdepth 1 -printf 'own\\t%d\\t%y\\t%s\\n'
+    } | ROOT=$root awk -F '\\t' '
+        $1 == "own" { if ($2 == 0 || $3 != "d") total += $4; next }
+        { total += $1; print }
+        END { if (NR) printf "%.0f\\t%s\\n", total, ENVIRON["ROOT"]; exit NR == 0 }'
+}
+"""
+
+DU_CHILDREN_SCRIPT = DU_CHILDREN_FUNCTION + 'du_children "$@"\n'
+
+# Walk a tree under a time budget and keep only the largest files in a bounded
+# min-heap, so memory on both ends is O(count) instead of O(tree). Positional
+# arguments are the count, the time budget in seconds, and the find command.
+# The heap is printed unsorted, followed by a "scanned" line with the number of
+# entries seen and a "status" line with find's exit code (124 when the budget
+# ran out). A missing timeout or awk exits non-zero so the plain find fallback
+# runs instead.
+LARGEST_FILES_SCRIPT = r"""
+count=$1 budget=$2
+shift 2
+timeout "$budget" "$@" | LC_ALL=C awk -v count="$count" '
+function sift_up(i,    parent, s, l) {
+    s = size[i]; l = line[i]
+    while (i > 1) {
+        parent = int(i / 2)
+        if (size[parent] <= s) break
+        size[i] = size[parent]; line[i] = line[parent]; i = parent
+    }
+    size[i] = s; line[i] = l
+}
+function sift_down(i,    child, s, l) {
+    s = size[i]; l = line[i]
+    while ((child = 2 * i) <= n) {
+        if (child < n && size[child + 1] < size[child]) child++
+        if (size[child] >= s) break
+        size[i] = size[child]; line[i] = line[child]; i = child
+    }
+    size[i] = s; line[i] = l
+}
+!/^[0-9]+\t/ { next }
+n < count { n++; size[n] = $1 + 0; line[n] = $0; sift_up(n); next }
+$1 + 0 > size[1] { size[1] = $1 + 0; line[1] = $0; sift_down(1) }
+END {
+    for (i = 1; i <= n; i++) print line[i]
+    printf "scanned\t%d\n", NR
+}'
+status=("${PIPESTATUS[@]}")
+case "${status[0]}" in 126 | 127) exit 127 ;; esac
+[ "${status[1]}" -eq 0 ] || exit 127
+printf 'status\t%s\n' "${status[0]}"
+"""
+
+# Properties of systemd units read in one systemctl show call. The argument is
+# a newline-separated list of unit names.
+SERVICE_PROPERTIES_SCRIPT = r"""
+mapfile -t units <<< "$1"
+systemctl show --no-pager \
+    --property=Id,Description,LoadState,ActiveState,SubState,UnitFileState,Result,MainPID,ExecMainStatus \
+    --property=NRestarts,MemoryCurrent,CPUUsageNSec,TasksCurrent,ActiveEnterTimestamp \
+    -- "${units[@]}"
+"""
+
+# Failed units and boot timings in one call. The boot timings only change on
+# reboot, so they are skipped when the boot ID matches the first argument.
+# The second argument is the number of slowest units to report. Sections are
+# introduced by "@@ NAME" lines.
+TRIAGE_SCRIPT = r"""
+read -r boot_id < /proc/sys/kernel/random/boot_id
+echo "@@ boot $boot_id"
+echo "@@ failed"
+systemctl list-units --failed --all --no-pager --output=json 2>/dev/null ||
+    systemctl list-units --failed --all --no-pager --plain --no-legend || exit
+[ "$boot_id" = "$1" ] && exit 0
+echo "@@ blame"
+systemd-analyze blame --no-pager 2>/dev/null | head -n "$2"
+echo "@@ chain"
+systemd-analyze critical-chain --no-pager 2>/dev/null
+exit 0
+"""
+
+# Sum the cgroup v2 accounting files of each unit into one line per unit:
+# UNIT MEMORY ANON FILE CPU_USEC READ_BYTES WRITE_BYTES PIDS, with "-" for
+# files that are missing because their controller is not enabled.
+CGROUP_STATS_AWK = r"""
+BEGIN {
+    # Units and io.stat files are taken from the arguments, since empty files
+    # have no first line; an empty io.stat means the unit did no I/O yet
+    for (i = 1; i < ARGC; i++) {
+        n = split(ARGV[i], part, "/")
+        units[part[n - 1]] = 1
+        if (part[n] == "io.stat") io[part[n - 1]] = 1
+    }
+}
+FNR == 1 {
+    n = split(FILENAME, part, "/")
+    unit = part[n - 1]
+    file = part[n]
+}
+file == "memory.current" { memory[unit] = $1 }
+file == "memory.stat" && ($1 == "anon" || $1 == "file") { stat[unit, $1] = $2 }
+file == "cpu.stat" && $1 == "usage_usec" { cpu[unit] = $2 }
+file == "pids.current" { pids[unit] = $1 }
+file == "io.stat" {
+    for (i = 2; i <= NF; i++) {
+        split($i, kv, "=")
+        if (kv[1] == "rbytes") rbytes[unit] += kv[2]
+        else if (kv[1] == "wbytes") wbytes[unit] += kv[2]
+    }
+}
+END {
+    for (unit in units) {
+        printf "%s %s %s %s %s", unit, \
+            (unit in memory) ? memory[unit] : "-", \
+            ((unit, "anon") in stat) ? stat[unit, "anon"] : "-", \
+            ((unit, "file") in stat) ? stat[unit, "file"] : "-", \
+            (unit in cpu) ? cpu[unit] : "-"
+        if (unit in io) printf " %.0f %.0f", rbytes[unit], wbytes[unit]
+        else printf " - -"
+        printf " %s\n", (unit in pids) ? pids[unit] : "-"
+    }
+}
+"""
+
+# Read the accounting files of every cgroup directly under a slice with one
+# awk process per sample. With an interval, a second sample is taken after
+# it. Each sample starts with "@@ sample UPTIME" so rates can be computed.
+# Arguments are the slice directory and the interval in seconds.
+CGROUP_STATS_SCRIPT = (
+    f"cgroup_awk='{CGROUP_STATS_AWK}'\n"
+    + r"""
+root=$1 interval=$2
+sample() {
+    local files=() dir name uptime rest
+    for dir in "$root"/*/; do
+        for name in memory.current memory.stat cpu.stat io.stat pids.current; do
+            [ -r "$dir$name" ] && files+=("$dir$name")
+        done
+    done
+    if [ ${#files[@]} -eq 0 ]; then
+        echo "No cgroup v2 accounting files under $root" >&2
+        exit 2
+    fi
+    read -r uptime rest < /proc/uptime
+    echo "@@ sample $uptime"
+    LC_ALL=C awk "$cgroup_awk" "${files[@]}"
+}
+sample
+[ "$interval" = 0 ] && exit 0
+sleep "$interval"
+sample
+"""
+)
+
+# Read the CPU, network and disk counters twice, an interval apart, in one
+# execution. Each sample starts with "@@ sample UPTIME" and holds "@@ stat",
+# "@@ net" and "@@ disk" sections with the raw lines of /proc/stat,
+# /proc/net/dev and /proc/diskstats. The argument is the interval in seconds.
+ACTIVITY_SCRIPT = r"""
+sample() {
+    local uptime rest
+    read -r uptime rest < /proc/uptime
+    echo "@@ sample $uptime"
+    echo "@@ stat"
+    grep '^cpu' /proc/stat
+    echo "@@ net"
+    tail -n +3 /proc/net/dev
+    echo "@@ disk"
+    cat /proc/diskstats 2>/dev/null
+}
+sample
+sleep "$1"
+sample
+"""
+
+# Read /proc/cpuinfo and /proc/loadavg once and the aggregate CPU line of
+# /proc/stat twice, an interval apart, in one execution. Each /proc/stat read
+# is an "@@ sample UPTIME" line followed by an "@@ stat" section; the other
+# files are in "@@ cpuinfo" and "@@ loadavg" sections. The argument is the
+# interval in seconds; with 0 only one sample is taken.
+CPU_INFO_SCRIPT = r"""
+sample() {
+    local uptime rest
+    read -r uptime rest < /proc/uptime
+    echo "@@ sample $uptime"
+    echo "@@ stat"
+    grep '^cpu ' /proc/stat
+}
+sample
+echo "@@ cpuinfo"
+cat /proc/cpuinfo
+echo "@@ loadavg"
+cat /proc/loadavg
+[ "$1" = 0 ] && exit 0
+sleep "$1"
+sample
+"""
+
+# Reduce the lightweight system counters to "NAME VALUE" lines: uptime, load
+# averages, meminfo in kB, busy and total CPU jiffies, bytes received and sent
+# on all interfaces but lo, and the "some" 10 second pressure averages.
+METRICS_AWK = r"""
+FILENAME == "/proc/uptime" { print "uptime", $1 }
+FILENAME == "/proc/loadavg" { print "load1", $1; print "load5", $2; print "load15", $3 }
+FILENAME == "/proc/meminfo" && $1 ~ /^(MemTotal|MemAvailable|SwapTotal|SwapFree):$/ {
+    sub(/:$/, "", $1)
+    print $1, $2
+}
+FILENAME == "/proc/stat" && $1 == "cpu" {
+    busy = $2 + $3 + $4 + $7 + $8 + $9
+    printf "cpu_busy %.0f\ncpu_total %.0f\n", busy, busy + $5 + $6
+}
+FILENAME == "/proc/net/dev" && FNR > 2 {
+    line = $0
+    sub(/:/, " ", line)
+    split(line, field, " ")
+    if (field[1] != "lo") { rx += field[2]; tx += field[10] }
+}
+FILENAME ~ /^\/proc\/pressure\// && $1 == "some" {
+    name = FILENAME
+    sub(/.*\//, "", name)
+    split($2, kv, "=")
+    print "psi_" name, kv[2]
+}
+END { printf "rx_bytes %.0f\ntx_bytes %.0f\n", rx, tx }
+"""
+
+# Read all counters of one collector sample with a single awk process.
+# Pressure files exist but fail to read when PSI is disabled at boot.
+METRICS_SCRIPT = (
+    f"metrics_awk='{METRICS_AWK}'\n"
+    + r"""
+files=(/proc/uptime /proc/loadavg /proc/meminfo /proc/stat /proc/net/dev)
+for file in /proc/pressure/cpu /proc/pressure/memory /proc/pressure/io; do
+    read -r _ 2>/dev/null < "$file" && files+=("$file")
+done
+LC_ALL=C awk "$metrics_awk" "${files[@]}"
+"""
+)
+
+# Read the pressure files of the cpu, memory, io and irq resources with one awk
+# process per sample, prefixing each line with its resource. Arguments are the
+# directory, the file name suffix (".pressure" in a cgroup) and the interval
+# between two samples in seconds, or 0 for a single sample. Each sample starts
+# with "@@ sample UPTIME". Pressure files exist but fail to read when PSI is
+# disabled at boot.
+PRESSURE_SCRIPT = r"""
+dir=$1 suffix=$2 interval=$3
+sample() {
+    local files=() resource uptime rest
+    for resource in cpu memory io irq; do
+        read -r _ 2>/dev/null < "$dir/$resource$suffix" && files+=("$dir/$resource$suffix")
+    done
+    if [ ${#files[@]} -eq 0 ]; then
+        echo "Pressure stall information is not available in $dir" >&2
+        exit 2
+    fi
+    read -r uptime rest < /proc/uptime
+    echo "@@ sample $uptime"
+    LC_ALL=C awk -v suffix="$suffix" '{
+        n = split(FILENAME, part, "/")
+        print substr(part[n], 1, length(part[n]) - length(suffix)), $0
+    }' "${files[@]}"
+}
+sample
+[ "$interval" = 0 ] && exit 0
+sleep "$interval"
+sample
+"""
+
+# Print /proc/meminfo and, when a count is given and /proc/slabinfo is readable
+# (usually only by root), the largest slab caches as "NAME ACTIVE_OBJS
+# NUM_OBJS OBJSIZE BYTES" lines, sorted on the target. Sections start with
+# "@@ meminfo" and "@@ slabinfo". The argument is the number of slab caches.
+MEMINFO_SCRIPT = r"""
+echo "@@ meminfo"
+cat /proc/meminfo || exit
+[ "$1" -gt 0 ] 2>/dev/null || exit 0
+read -r _ 2>/dev/null < /proc/slabinfo || exit 0
+echo "@@ slabinfo"
+pagesize=$(getconf PAGESIZE 2>/dev/null || echo 4096)
+LC_ALL=C awk -v pagesize="$pagesize" 'NR > 2 {
+    printf "%s %s %s %s %.0f\n", $1, $2, $3, $4, $15 * $6 * pagesize
+}' /proc/slabinfo | sort -k5,5nr | head -n "$1"
+exit 0
+"""
+
+# Aggregate find output of a directory walk for the directory size index. In
+# "tree" mode every directory gets its own apparent size (the directory entry
+# plus the non-directory entries directly inside it); in "own" mode only the
+# walk root does, and its subdirectories are listed as "c\tPATH" lines; in
+# "total" mode everything under the walk root is summed into it and reported
+# as "s\tSIZE\tMTIME\tPATH". Mount points are left out in every mode, like
+# du -x, since find -xdev still lists them without descending. Files with more
+# than one link are left out of the sizes and reported once per walker as
+# "l\tDEV:INODE\tSIZE\tDIRECTORY" so they can be counted once. Directories are
+# reported as "d\tSIZE\tMTIME\tPATH". Lines are written one at a time so
+# parallel walkers never interleave partial lines.
+DIRECTORY_WALK_AWK = r"""
+{
+    path = $0
+    for (i = 0; i < 7; i++) path = substr(path, index(path, "\t") + 1)
+    if ($1 == 0) { root_dev = $6; root = path }
+    if ($6 != root_dev) next
+    if ($2 == "d") {
+        if ($1 == 0 || mode == "tree") {
+            own[path] += $3
+            mtime[path] = $4
+        } else if (mode == "own") {
+            printf "c\t%s\n", path
+            fflush()
+        } else {
+            own[root] += $3
+        }
+        next
+    }
+    if ($1 == 0) next
+    parent = root
+    if (mode == "tree") {
+        parent = path
+        sub(/\/[^\/]*$/, "", parent)
+        if (parent == "") parent = "/"
+    }
+    if ($5 > 1) {
+        key = $6 ":" $7
+        if (!(key in seen)) {
+            seen[key] = 1
+            printf "l\t%s\t%.0f\t%s\n", key, $3, parent
+            fflush()
+        }
+        next
+    }
+    own[parent] += $3
+}
+END {
+    kind = mode == "total" ? "s" : "d"
+    for (dir in mtime) {
+        printf "%s\t%.0f\t%s\t%s\n", kind, own[dir], mtime[dir], dir
+        fflush()
+    }
+}
+"""
+
+# Shell function walk MODE DIRECTORY used by the directory index scripts. The
+# scripts first print "t\tTIME" with the target's clock, so the next change
+# check can look for directories modified since the walk started.
+DIRECTORY_WALK_FUNCTION = (
+    f"aggregate='{DIRECTORY_WALK_AWK}'\n"
+    + r"""
+walk() {
+    local mode=$1 depth=()
+    [ "$mode" = own ] && depth=(-maxdepth 1)
+    find "$2" -xdev "${depth[@]}" -printf '%d\t%y\t%s\t%T@\t%n\t%D\t%i\t%p\n' |
+        LC_ALL=C awk -F '\t' -v mode="$mode" "$aggregate"
+    return "${PIPESTATUS[0]}"
+}
+printf 't\t%s\n' "$(date +%s.%N)"
+"""
+)
+
+# Walk a whole tree for the directory size index. Arguments are the number of
+# parallel walkers and the root; with more than one walker, each first-level
+# subdirectory on the root's filesystem is walked by its own process.
+DIRECTORY_SIZES_SCRIPT = (
+    DIRECTORY_WALK_FUNCTION
+    + r"""
+jobs=$1 root=$2
+if [ "$jobs" -le 1 ]; then
+    walk tree "$root"
+    exit
+fi
+export aggregate
+export -f walk
+walk own "$root" || exit
+find "$root" -mindepth 1 -maxdepth 1 -type d -printf '%D\t%p\n' |
+    LC_ALL=C awk -F '\t' -v dev="$(stat -c %d -- "$root")" '$1 == dev { print substr($0, index($0, "\t") + 1) }' |
+    xargs -d '\n' -r -n 1 -P "$jobs" bash -c 'walk tree "$1"' bash
+"""
+)
+
+# Rescan the directories of an indexed tree that changed since a time on the
+# target's clock. Arguments are that time, the depth below which the index
+# keeps only subtree totals (0 for none) and the root. Only directories are
+# visited to find those whose mtime or ctime is newer, so files are not
+# stat'ed unless their directory changed. A changed directory above the depth
+# is walked in "own" mode; a changed directory at or below it gets its
+# ancestor at the depth walked in "total" mode. Exits with code 2 when the
+# root is gone.
+DIRECTORY_CHANGES_SCRIPT = (
+    DIRECTORY_WALK_FUNCTION
+    + r"""
+since=$1 depth=$2 root=$3
+[ -d "$root" ] || { echo "$root: No such directory" >&2; exit 2; }
+find "$root" -xdev -type d -printf '%d\t%D\t%T@\t%C@\t%p\n' |
+    LC_ALL=C awk -F '\t' -v since="$since" -v depth="$depth" '
+BEGIN { since += 0; depth += 0 }
+NR == 1 { dev = $2 }
+$2 != dev || ($3 < since && $4 < since) { next }
+{
+    path = $0
+    for (i = 0; i < 4; i++) path = substr(path, index(path, "\t") + 1)
+    mode = "own"
+    if (depth > 0 && $1 >= depth) {
+        for (d = $1; d > depth; d--) sub(/\/[^\/]*$/, "", path)
+        mode = "total"
+    }
+    print mode "\t" path
+}' | LC_ALL=C sort -u | while IFS=$'\t' read -r mode dir; do walk "$mode" "$dir"; done
+exit 0
+"""
+)
+
+# Exit code of READ_FILE_RANGE_SCRIPT when the path is not a regular file
+NOT_A_FILE_EXIT_CODE = 3
+
+# Read a byte range of a regular file in one round trip. Arguments are the
+# path, the start offset (negative values count back from the end), the
+# maximum number of bytes, and a fingerprint from an earlier read. The first
+# output line is "SIZE OFFSET FINGERPRINT" with the file size, the resolved
+# start offset and the current fingerprint, followed by the raw bytes unless
+# the fingerprint matched. The fingerprint "INODE-SIZE-MTIME", with the mtime
+# in nanoseconds, changes when the file is written to or replaced. Empty files
+# and files on pseudo filesystems such as proc and sysfs, which report no
+# blocks, change without their size or mtime changing, so their fingerprint
+# is "-" and never matches. tail seeks to the offset, so large files are never
+# read from the start.
+READ_FILE_RANGE_SCRIPT = r"""
+path=$1 offset=$2 length=$3 known=$4
+[ -f "$path" ] || exit 3
+info=$(stat --dereference --format '%s %i-%s-%.9Y' -- "$path") || exit
+size=${info%% *} fingerprint=${info#* }
+blocks=$(stat --dereference --file-system --format %b -- "$path") || blocks=0
+if [ "$size" -eq 0 ] || [ "$blocks" -eq 0 ]; then
+    fingerprint=-
+fi
+if [ "$offset" -lt 0 ]; then
+    offset=$((size + offset))
+    [ "$offset" -lt 0 ] && offset=0
+fi
+printf '%s %s %s\n' "$size" "$offset" "$fingerprint"
+[ "$fingerprint" = "$known" ] && exit 0
+tail -c +"$((offset + 1))" -- "$path" | head -c "$length"
+status=("${PIPESTATUS[@]}")
+# tail is killed by SIGPIPE once head has enough bytes
+[ "${status[0]}" -eq 0 ] || [ "${status[0]}" -eq 141 ] || exit "${status[0]}"
+exit "${status[1]}"
+"""
+
+# Filter log lines with the ERE in $LOG_PATTERN, byte-wise in the C locale.
+# The pattern comes from the environment because awk -v would process
+# backslash escapes in it.
+# Reads TOTAL bytes and prints "M MATCHES CONSUMED COUNT" followed by the
+# COUNT kept lines: the last LIMIT matches with keep=last, or the first LIMIT
+# with keep=first, which stops reading at the LIMIT-th match. CONSUMED counts
+# the bytes through the last line that was read completely. A final line
+# without a newline is only matched with match_partial and only counted as
+# read with consume_partial. With skip_first the first line, which may start
+# mid-line, is read but never matched. A single line of at least the budget
+# is consumed so a cursor always moves forward.
+LOG_FILTER_AWK = r"""
+BEGIN {
+    pattern = ENVIRON["LOG_PATTERN"]
+    if (icase) pattern = tolower(pattern)
+}
+done { next }
+{
+    offset += length($0) + 1
+    partial = offset > total
+    if (partial && !match_partial) next
+    if (!partial || consume_partial) consumed = partial ? total : offset
+    if (NR == 1 && skip_first) next
+    line = icase ? tolower($0) : $0
+    if ((line ~ pattern) == (invert == 1)) next
+    matches++
+    if (keep == "last") {
+        kept[matches % limit] = $0
+    } else {
+        kept[matches] = $0
+        done = matches >= limit
+    }
+}
+END {
+    if (!consumed && budget && total >= budget) consumed = total
+    first = keep == "last" && matches > limit ? matches - limit + 1 : 1
+    printf "M %d %d %d\n", matches, consumed, matches - first + 1
+    for (i = first; i <= matches; i++) print kept[keep == "last" ? i % limit : i]
+}
+"""
+
+
+# Read a log file by lines or from a cursor. Arguments are the path, the
+# number of lines, a fingerprint from an earlier read, a cursor
+# "INODE:OFFSET" (empty for the last lines), the byte budget, and for
+# filtering an extended regular expression, "1" to invert the match, "1" to
+# ignore case, the maximum number of matches, and "1" to search the whole
+# file rather than its last budget bytes. The first output line is the
+# fingerprint; nothing follows if it matched. Then come segments, each with a
+# "KIND INODE START END" header line:
+#   R  bytes START..END of the rotated file that still has the cursor's
+#      inode, exactly END - START bytes
+#   C  the current file up to END, running to the end of the output. Without
+#      a cursor it holds the last lines of the final budget bytes.
+# With a pattern, each header is instead followed by a "M MATCHES CONSUMED
+# COUNT" line and COUNT matching lines, where CONSUMED is the number of bytes
+# after START up to which the segment was read (see LOG_FILTER_AWK).
+# Matches from the rotated file count against the maximum, and the current
+# file is skipped once the maximum is reached.
+# A cursor whose inode is gone continues from the start of the current file,
+# after the unread rest of the rotated file when it can still be found next to
+# it. A cursor past the end of the file (truncated in place) starts over.
+READ_LOG_FILE_SCRIPT = (
+    f"log_filter_awk='{LOG_FILTER_AWK}'\n"
+    + r"""
+set -o pipefail
+path=$1 lines=$2 known=$3 cursor=$4 budget=$5
+pattern=$6 invert=${7:-0} icase=${8:-0} max_matches=${9:-1} whole_file=${10:-0}
+info=$(stat --dereference --format '%i %s %Y' -- "$path") || exit
+read -r inode size mtime <<< "$info"
+printf '%s-%s-%s\n' "$inode" "$size" "$mtime"
+[ "$inode-$size-$mtime" = "$known" ] && exit 0
+
+copy() {
+    tail -c +"$(($2 + 1))" -- "$1" | head -c "$(($3 - $2))"
+    local status=("${PIPESTATUS[@]}")
+    # tail is killed by SIGPIPE when the file grew past the end offset
+    [ "${status[0]}" -eq 0 ] || [ "${status[0]}" -eq 141 ] || exit "${status[0]}"
+    return "${status[1]}"
+}
+
+# filter FILE START END KEEP MATCH_PARTIAL CONSUME_PARTIAL SKIP_FIRST
+filter() {
+    copy "$1" "$2" "$3" | LOG_PATTERN=$pattern LC_ALL=C awk -v total="$(($3 - $2))" -v keep="$4" \
+        -v match_partial="$5" -v consume_partial="$6" -v skip_first="$7" -v budget="$budget" \
+        -v invert="$invert" -v icase="$icase" -v limit="$max_matches" "$log_filter_awk"
+}
+
+if [ -z "$cursor" ]; then
+    start=$((size > budget ? size - budget : 0))
+    [ -n "$pattern" ] && [ "$whole_file" = 1 ] && start=0
+    printf 'C %s %s %s\n' "$inode" "$start" "$size"
+    if [ -z "$pattern" ]; then
+        copy "$path" "$start" "$size" | tail -n "$lines"
+        exit
+    fi
+    filter "$path" "$start" "$size" last 1 0 "$((start > 0))"
+    exit
+fi
+
+cursor_inode=${cursor%%:*} offset=${cursor#*:}
+if [ "$cursor_inode" != "$inode" ]; then
+    rotated=$(find "${path%/*}/" -maxdepth 1 -type f -inum "$cursor_inode" -name "${path##*/}*" -print -quit 2>/dev/null)
+    if [ -n "$rotated" ] && rotated_size=$(stat --format %s -- "$rotated") && [ "$offset" -lt "$rotated_size" ]; then
+        end=$((rotated_size - offset > budget ? offset + budget : rotated_size))
+        printf 'R %s %s %s\n' "$cursor_inode" "$offset" "$end"
+        if [ -z "$pattern" ]; then
+            copy "$rotated" "$offset" "$end" || exit
+        else
+            complete=$((end == rotated_size))
+            # the sentinel keeps trailing empty lines from being stripped
+            segment=$(filter "$rotated" "$offset" "$end" first "$complete" "$complete" 0 && echo .) || exit
+            printf '%s' "${segment%.}"
+            read -r _ _ _ count <<< "$segment"
+            max_matches=$((max_matches - count))
+            [ "$max_matches" -gt 0 ] || exit 0
+        fi
+        budget=$((budget - (end - offset)))
+    fi
+    offset=0
+elif [ "$offset" -gt "$size" ]; then
+    offset=0
+fi
+
+end=$((size - offset > budget ? offset + budget : size))
+printf 'C %s %s %s\n' "$inode" "$offset" "$end"
+if [ -z "$pattern" ]; then
+    copy "$path" "$offset" "$end"
+else
+    filter "$path" "$offset" "$end" first 0 0 0
+fi
+"""
+)
+
+# Count journalctl -o json entries by time bucket, unit and priority. Older
+# journalctl versions put spaces around the colons. Prints
+# "T TOTAL UNGROUPED", then for each group a "G<TAB>START<TAB>UNIT<TAB>PRIORITY
+# <TAB>COUNT" line followed by up to SAMPLES "S<TAB>COUNT<TAB>MESSAGE" lines
+# with its most frequent messages. START is the bucket start in seconds since
+# the epoch; UNIT and MESSAGE are still JSON-escaped, and messages are cut to
+# 512 bytes. Memory is bounded: entries that would open more than 1000 groups
+# are only counted as ungrouped, and only the first 100 distinct messages of
+# a group are candidates for samples.
+JOURNAL_AGGREGATE_AWK = r"""
+function value(name, chars,   rest) {
+    if (!match($0, "\"" name "\" *: *\"")) return ""
+    rest = substr($0, RSTART + RLENGTH)
+    return match(rest, "^" chars "*\"") ? substr(rest, 1, RLENGTH - 1) : ""
+}
+BEGIN {
+    STRING = "([^\"\\\\]|\\\\.)"
+    max_groups = 1000
+    max_messages = 100
+}
+{
+    total++
+    timestamp = value("__REALTIME_TIMESTAMP", "[0-9]")
+    start = length(timestamp) > 6 ? substr(timestamp, 1, length(timestamp) - 6) + 0 : 0
+    start -= start % bucket
+    group = start "\t" value("_SYSTEMD_UNIT", STRING) "\t" value("PRIORITY", "[0-7]")
+    if (!(group in count)) {
+        if (groups >= max_groups) {
+            ungrouped++
+            next
+        }
+        groups++
+    }
+    count[group]++
+    if (!samples) next
+
+    message = substr(value("MESSAGE", STRING), 1, 512)
+    if ((group, message) in seen) {
+        seen[group, message]++
+    } else if (distinct[group] < max_messages) {
+        seen[group, message] = 1
+        text[group, ++distinct[group]] = message
+    }
+}
+END {
+    printf "T %d %d\n", total, ungrouped
+    for (group in count) {
+        printf "G\t%s\t%d\n", group, count[group]
+        for (k = 1; k <= samples && k <= distinct[group]; k++) {
+            best = 0
+            for (i = 1; i <= distinct[group]; i++) {
+                if ((group, i) in taken) continue
+                if (!best || seen[group, text[group, i]] > seen[group, text[group, best]]) best = i
+            }
+            taken[group, best] = 1
+            printf "S\t%d\t%s\n", seen[group, text[group, best]], text[group, best]
+        }
+    }
+}
+"""
+
+# Aggregate journal entries on the target so only the counts are transferred.
+# Arguments are the bucket size in seconds and the number of message samples
+# per group, followed by journalctl filter arguments.
+JOURNAL_AGGREGATE_SCRIPT = (
+    f"journal_aggregate_awk='{JOURNAL_AGGREGATE_AWK}'\n"
+    + r"""
+set -o pipefail
+bucket=$1 samples=$2
+shift 2
+journalctl --no-pager --all --output=json --output-fields=_SYSTEMD_UNIT,PRIORITY,MESSAGE "$@" |
+    LC_ALL=C awk -v bucket="$bucket" -v samples="$samples" "$journal_aggregate_awk"
+"""
+)
+
+
+# Select /dev/kmsg records by sequence number and level. Records are
+# "PRIORITY,SEQUENCE,MICROSECONDS,FLAGS[,...];MESSAGE" followed by indented
+# dictionary lines, which are dropped. With a cursor (after >= 0) the oldest
+# records after it are printed, otherwise the newest. Sequence numbers
+# restart at 0 on boot, so a cursor beyond the last record is from an earlier
+# boot and the oldest records are printed instead.
+KMSG_AWK = r"""
+/^[^ ]/ {
+    split(substr($0, 1, index($0, ";") - 1), field, ",")
+    last = field[2] + 0
+    if (field[1] % 8 > level) next
+    if (after < 0) {
+        kept[n++ % lines] = $0
+        next
+    }
+    if (oldest < lines) head[oldest++] = $0
+    if (last > after && n < lines) kept[n++] = $0
+}
+END {
+    if (after < 0) {
+        for (i = n > lines ? n - lines : 0; i < n; i++) print kept[i % lines]
+    } else if (last < after) {
+        for (i = 0; i < oldest; i++) print head[i]
+    } else {
+        for (i = 0; i < n; i++) print kept[i]
+    }
+}
+"""
+
+# Read the kernel log buffer through /dev/kmsg. Each read returns one record
+# and a non-blocking read fails with EAGAIN at the end of the buffer, so dd
+# stops there instead of waiting for new messages. Opening the device checks
+# the syslog permission, so that failure is reported before reading.
+# Arguments are the cursor, the number of records and the maximum level.
+KMSG_SCRIPT = (
+    f"kmsg_awk='{KMSG_AWK}'\n"
+    + r"""
+exec 3</dev/kmsg || exit 2
+dd iflag=nonblock bs=16384 status=none <&3 2>/dev/null |
+    LC_ALL=C awk -v after="${1:--1}" -v lines="$2" -v level="$3" "$kmsg_awk"
+"""
+)
+
+
 class CommandGroup(BaseModel):
     """Group of related commands for multi-command tool operations.
 
@@ -91,13 +862,18 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
         # === Services ===
         "list_services": CommandGroup(
             commands={
-                "default": CommandSpec(args=("systemctl", "list-units", "--type=service", "--all", "--no-pager")),
-            }
-        ),
-        "running_services": CommandGroup(
-            commands={
+                # Older systemd versions have no JSON output for list-units
                 "default": CommandSpec(
-                    args=("systemctl", "list-units", "--type=service", "--state=running", "--no-pager")
+                    args=("systemctl", "list-units", "--type=service", "--all", "--no-pager", "--output=json"),
+                    fallback=(
+                        "systemctl",
+                        "list-units",
+                        "--type=service",
+                        "--all",
+                        "--no-pager",
+                        "--plain",
+                        "--no-legend",
+                    ),
                 ),
             }
         ),
@@ -106,9 +882,19 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
                 "default": CommandSpec(args=("systemctl", "status", "{service_name}", "--no-pager", "--full")),
             }
         ),
-        "service_logs": CommandGroup(
+        "service_properties": CommandGroup(
             commands={
-                "default": CommandSpec(args=("journalctl", "-u", "{service_name}", "-n", "{lines}", "--no-pager")),
+                "default": CommandSpec(script=SERVICE_PROPERTIES_SCRIPT, args=("{units}",)),
+            }
+        ),
+        "triage": CommandGroup(
+            commands={
+                "default": CommandSpec(script=TRIAGE_SCRIPT, args=("{boot_id}", "{slowest}")),
+            }
+        ),
+        "cgroup_stats": CommandGroup(
+            commands={
+                "default": CommandSpec(script=CGROUP_STATS_SCRIPT, args=("{root}", "{interval}")),
             }
         ),
         # === Network ===
@@ -136,11 +922,36 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
             }
         ),
         # === Logs ===
+        "kernel_logs": CommandGroup(
+            commands={
+                "default": CommandSpec(script=KMSG_SCRIPT, args=("{cursor}", "{lines}", "{level}")),
+            }
+        ),
         "journal_logs": CommandGroup(
             commands={
                 "default": CommandSpec(
-                    args=("journalctl", "-n", "{lines}", "--no-pager"),
+                    args=(
+                        "journalctl",
+                        "-n",
+                        "{lines}",
+                        "--no-pager",
+                        "--all",
+                        "--output=json",
+                        "--output-fields=MESSAGE,SYSLOG_IDENTIFIER,SYSLOG_PID,_COMM,_PID,_HOSTNAME",
+                    ),
                     optional_flags={
+                        "cursor": ("--after-cursor", "{cursor}"),
+                        "unit": ("--unit", "{unit}"),
+                        "priority": ("--priority", "{priority}"),
+                        "since": ("--since", "{since}"),
+                        "transport": ("_TRANSPORT={transport}",),
+                    },
+                ),
+                "aggregate": CommandSpec(
+                    script=JOURNAL_AGGREGATE_SCRIPT,
+                    args=("{bucket}", "{samples}"),
+                    optional_flags={
+                        "cursor": ("--after-cursor", "{cursor}"),
                         "unit": ("--unit", "{unit}"),
                         "priority": ("--priority", "{priority}"),
                         "since": ("--since", "{since}"),
@@ -151,7 +962,22 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
         ),
         "read_log_file": CommandGroup(
             commands={
-                "default": CommandSpec(args=("tail", "-n", "{lines}", "{log_path}")),
+                "default": CommandSpec(
+                    script=READ_LOG_FILE_SCRIPT,
+                    args=(
+                        "{log_path}",
+                        "{lines}",
+                        "{if_none_match}",
+                        "{cursor}",
+                        "{max_bytes}",
+                        "{pattern}",
+                        "{invert}",
+                        "{ignore_case}",
+                        "{max_matches}",
+                        "{search_whole_file}",
+                    ),
+                    verbatim=frozenset({"pattern"}),
+                ),
             }
         ),
         # === Processes ===
@@ -190,7 +1016,16 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
         ),
         "list_directories_size": CommandGroup(
             commands={
-                "default": CommandSpec(args=("du", "-b", "--one-file-system", "--max-depth=1", "{path}")),
+                "default": CommandSpec(
+                    script=DU_CHILDREN_SCRIPT,
+                    args=("{jobs}", "{path}"),
+                    fallback=("du", "-b", "--one-file-system", "--max-depth=1", "{path}"),
+                ),
+                "top_n": CommandSpec(
+                    script=DU_CHILDREN_FUNCTION + DU_TOP_N_SCRIPT,
+                    args=("{sort_flags}", "{top_n}", "du_children", "{jobs}", "{path}"),
+                    fallback=("du", "-b", "--one-file-system", "--max-depth=1", "{path}"),
+                ),
             }
         ),
         "list_directories_name": CommandGroup(
@@ -205,6 +1040,35 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
                 "default": CommandSpec(
                     args=("find", "{path}", "-mindepth", "1", "-maxdepth", "1", "-type", "d", "-printf", "%T@\\t%f\\n")
                 ),
+                "top_n": CommandSpec(
+                    script=LISTING_TOP_N_SCRIPT,
+                    args=(
+                        "{sort_flags}",
+                        "{top_n}",
+                        "find",
+                        "{path}",
+                        "-mindepth",
+                        "1",
+                        "-maxdepth",
+                        "1",
+                        "-type",
+                        "d",
+                        "-printf",
+                        "%T@\\t%f\\n",
+                    ),
+                    fallback=(
+                        "find",
+                        "{path}",
+                        "-mindepth",
+                        "1",
+                        "-maxdepth",
+                        "1",
+                        "-type",
+                        "d",
+                        "-printf",
+                        "%T@\\t%f\\n",
+                    ),
+                ),
             }
         ),
         "list_files_size": CommandGroup(
@@ -212,6 +1076,35 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
                 "default": CommandSpec(
                     args=("find", "{path}", "-mindepth", "1", "-maxdepth", "1", "-type", "f", "-printf", "%s\\t%f\\n")
                 ),
+                "top_n": CommandSpec(
+                    script=LISTING_TOP_N_SCRIPT,
+                    args=(
+                        "{sort_flags}",
+                        "{top_n}",
+                        "find",
+                        "{path}",
+                        "-mindepth",
+                        "1",
+                        "-maxdepth",
+                        "1",
+                        "-type",
+                        "f",
+                        "-printf",
+                        "%s\\t%f\\n",
+                    ),
+                    fallback=(
+                        "find",
+                        "{path}",
+                        "-mindepth",
+                        "1",
+                        "-maxdepth",
+                        "1",
+                        "-type",
+                        "f",
+                        "-printf",
+                        "%s\\t%f\\n",
+                    ),
+                ),
             }
         ),
         "list_files_name": CommandGroup(
@@ -226,16 +1119,85 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
                 "default": CommandSpec(
                     args=("find", "{path}", "-mindepth", "1", "-maxdepth", "1", "-type", "f", "-printf", "%T@\\t%f\\n")
                 ),
+                "top_n": CommandSpec(
+                    script=LISTING_TOP_N_SCRIPT,
+                    args=(
+                        "{sort_flags}",
+                        "{top_n}",
+                        "find",
+                        "{path}",
+                        "-mindepth",
+                        "1",
+                        "-maxdepth",
+                        "1",
+                        "-type",
+                        "f",
+                        "-printf",
+                        "%T@\\t%f\\n",
+                    ),
+                    fallback=(
+                        "find",
+                        "{path}",
+                        "-mindepth",
+                        "1",
+                        "-maxdepth",
+                        "1",
+                        "-type",
+                        "f",
+                        "-printf",
+                        "%T@\\t%f\\n",
+                    ),
+                ),
             }
         ),
-        "read_file": CommandGroup(
+        "find_largest_files": CommandGroup(
+            commands={
+                "default": CommandSpec(
+                    script=LARGEST_FILES_SCRIPT,
+                    args=(
+                        "{top_n}",
+                        "{time_budget}",
+                        "find",
+                        "{path}",
+                        "-xdev",
+                        "-maxdepth",
+                        "{max_depth}",
+                        "-type",
+                        "f",
+                        "-printf",
+                        "%s\\t%T@\\t%p\\n",
+                    ),
+                    fallback=(
+                        "find",
+                        "{path}",
+                        "-xdev",
+                        "-maxdepth",
+                        "{max_depth}",
+                        "-type",
+                        "f",
+                        "-printf",
+                        "%s\\t%T@\\t%p\\n",
+                    ),
+                ),
+            }
+        ),
+        "directory_index": CommandGroup(
             commands={
-                "default": CommandSpec(args=("head", "--bytes", "{max_bytes}", "--", "{path}")),
+                "default": CommandSpec(
+                    script=DIRECTORY_SIZES_SCRIPT, args=("{jobs}", "{path}"), verbatim=frozenset({"path"})
+                ),
+                "changes": CommandSpec(
+                    script=DIRECTORY_CHANGES_SCRIPT,
+                    args=("{since}", "{depth}", "{path}"),
+                    verbatim=frozenset({"path"}),
+                ),
             }
         ),
-        "read_file_size": CommandGroup(
+        "read_file": CommandGroup(
             commands={
-                "default": CommandSpec(args=("stat", "--dereference", "--format", "%s", "--", "{path}")),
+                "default": CommandSpec(
+                    script=READ_FILE_RANGE_SCRIPT, args=("{path}", "{offset}", "{length}", "{if_none_match}")
+                ),
             }
         ),
         # === System Info ===
@@ -251,17 +1213,27 @@ COMMANDS: Mapping[str, CommandGroup] = MappingProxyType(
         ),
         "cpu_info": CommandGroup(
             commands={
-                "model": CommandSpec(args=("grep", "-m", "1", "model name", "/proc/cpuinfo")),
-                "logical_cores": CommandSpec(args=("grep", "-c", "^processor", "/proc/cpuinfo")),
-                "physical_cores": CommandSpec(args=("grep", "^core id", "/proc/cpuinfo")),
-                "frequency": CommandSpec(args=("grep", "-m", "1", "cpu MHz", "/proc/cpuinfo")),
-                "load_avg": CommandSpec(args=("cat", "/proc/loadavg")),
-                "top_snapshot": CommandSpec(args=("top", "-bn1")),
+                "default": CommandSpec(script=CPU_INFO_SCRIPT, args=("{interval}",)),
+            }
+        ),
+        "activity_sample": CommandGroup(
+            commands={
+                "default": CommandSpec(script=ACTIVITY_SCRIPT, args=("{interval}",)),
+            }
+        ),
+        "metrics_sample": CommandGroup(
+            commands={
+                "default": CommandSpec(script=METRICS_SCRIPT, args=()),
+            }
+        ),
+        "pressure": CommandGroup(
+            commands={
+                "default": CommandSpec(script=PRESSURE_SCRIPT, args=("{directory}", "{suffix}", "{interval}")),
             }
         ),
         "memory_info": CommandGroup(
             commands={
-                "free": CommandSpec(args=("free", "-b", "-w")),
+                "meminfo": CommandSpec(script=MEMINFO_SCRIPT, args=("{slab_caches}",)),
             }
         ),
         "hardware_info": CommandGroup(
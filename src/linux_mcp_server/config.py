@@ -174,10 +174,22 @@ class Config(BaseSettings):
     # Storage tool safety limits
     max_file_read_bytes: int = Field(default=1024 * 1024, ge=1)
 
+    # Directory size index used by list_directories when ordering by size, off by default
+    directory_size_index: bool = False
+    directory_index_ttl: int = Field(default=60, ge=0)  # Seconds to answer from the index before checking for changes
+    directory_index_max_age: int = Field(default=3600, ge=0)  # Seconds before the whole tree is walked again
+    directory_scan_jobs: int = Field(default=4, ge=1)  # Parallel walkers when sizing directories
+
+    # Background metrics collector, off unless hosts are set
+    collector_hosts: str | None = None  # Comma-separated hosts to sample; "local" is this system
+    collector_interval: int = Field(default=10, ge=1)  # Seconds between samples
+    collector_samples: int = Field(default=8640, ge=2)  # Samples kept per host
+
     # SSH configuration
     ssh_key_path: Path | None = None
     key_passphrase: SecretStr = SecretStr("")
     search_for_ssh_key: bool = False
+    sftp: bool = True  # Read files and list directories over SFTP instead of running commands
 
     # SSH host key verification (security)
     verify_host_keys: bool = True
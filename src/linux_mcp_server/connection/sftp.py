@@ -0,0 +1,180 @@
+"""SFTP file backend on pooled SSH connections.
+
+Reading a file or a directory listing through SFTP reuses the pooled SSH
+connection instead of spawning ``find``, ``stat``, ``tail`` and ``head`` on
+the target. One SFTP session is opened per pooled connection and shared by
+every caller. Large reads are split by asyncssh into parallel block requests,
+so throughput is not bound by a single round trip per block.
+
+Hosts without an SFTP subsystem are remembered per connection, and callers
+fall back to running commands.
+"""
+
+import asyncio
+import logging
+import stat
+import time
+import weakref
+
+from collections.abc import Awaitable
+from pathlib import Path
+from typing import TypeVar
+
+import asyncssh
+
+from linux_mcp_server.audit import log_ssh_command
+from linux_mcp_server.config import CONFIG
+from linux_mcp_server.connection.ssh import _connection_manager
+from linux_mcp_server.execution_context import get_execution_context
+
+
+logger = logging.getLogger("linux-mcp-server")
+
+T = TypeVar("T")
+
+
+class SFTPFileBackend:
+    """File operations on one remote host through a shared SFTP session.
+
+    Errors reported by the server are raised as the matching ``OSError``
+    subclass, e.g. ``FileNotFoundError`` or ``PermissionError``.
+    """
+
+    def __init__(self, host: str, sftp: asyncssh.SFTPClient):
+        self.host = host
+        self._sftp = sftp
+
+    async def _call(self, operation: str, path: Path, awaitable: Awaitable[T]) -> T:
+        start_time = time.time()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=CONFIG.command_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                f"SFTP {operation} timed out after {CONFIG.command_timeout}s on {self.host}: {path}"
+            ) from None
+        except asyncssh.SFTPNoSuchFile as e:
+            raise FileNotFoundError(f"No such file or directory: {path}") from e
+        except asyncssh.SFTPPermissionDenied as e:
+            raise PermissionError(f"Permission denied: {path}") from e
+        except asyncssh.SFTPError as e:
+            raise OSError(f"SFTP {operation} failed for {path}: {e.reason}") from e
+        except asyncssh.Error as e:
+            raise ConnectionError(f"Failed to run SFTP {operation} on {self.host}: {e}") from e
+
+        log_ssh_command(f"sftp {operation} {path}", self.host, exit_code=0, duration=time.time() - start_time)
+        return result
+
+    async def stat(self, path: Path) -> asyncssh.SFTPAttrs:
+        """Return the attributes of path, following symbolic links."""
+        return await self._call("stat", path, self._sftp.stat(str(path)))
+
+    async def statvfs(self, path: Path) -> asyncssh.SFTPVFSAttrs | None:
+        """Return the attributes of the filesystem holding path.
+
+        Returns None when the server does not support the statvfs extension.
+        """
+
+        async def _statvfs() -> asyncssh.SFTPVFSAttrs | None:
+            try:
+                return await self._sftp.statvfs(str(path))
+            except asyncssh.SFTPOpUnsupported:
+                return None
+
+        return await self._call("statvfs", path, _statvfs())
+
+    async def read(self, path: Path, offset: int, length: int) -> bytes:
+        """Read up to length bytes of path starting at offset.
+
+        Fewer bytes are returned at the end of the file. asyncssh issues the
+        block requests for one read in parallel.
+        """
+
+        async def _read() -> bytes:
+            async with self._sftp.open(str(path), "rb") as file:
+                return await file.read(length, offset)
+
+        return await self._call("read", path, _read())
+
+    async def scandir(self, path: Path) -> list[asyncssh.SFTPName]:
+        """Return the entries of a directory, without ``.`` and ``..``.
+
+        Entry attributes describe the entries themselves, not the targets of
+        symbolic links.
+        """
+
+        async def _scandir() -> list[asyncssh.SFTPName]:
+            return [entry async for entry in self._sftp.scandir(str(path)) if entry.filename not in (".", "..")]
+
+        return await self._call("scandir", path, _scandir())
+
+
+class SFTPSessionManager:
+    """Opens and caches one SFTP session per pooled SSH connection."""
+
+    def __init__(self) -> None:
+        # Concurrent callers await the same opening task. A result of None
+        # marks a connection whose server refused the SFTP subsystem.
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncssh.SSHClientConnection, asyncio.Task[asyncssh.SFTPClient | None]
+        ] = weakref.WeakKeyDictionary()
+
+    def clear(self) -> None:
+        """Forget every cached session."""
+        self._sessions.clear()
+
+    async def get_backend(self, host: str) -> SFTPFileBackend | None:
+        """Return a file backend for host, or None if SFTP cannot be used.
+
+        Raises:
+            RuntimeError: If remote execution is not allowed.
+            ConnectionError: If the SSH connection fails.
+        """
+        context = get_execution_context()
+        if context is None:
+            raise RuntimeError("No execution context set cannot execute commands")
+
+        if not context.allow_ssh_default and context.ssh_key_path is None:
+            raise RuntimeError("Remote execution not allowed")
+
+        conn = await _connection_manager.get_connection(host)
+        if conn not in self._sessions:
+            self._sessions[conn] = asyncio.create_task(self._open(conn, host))
+
+        sftp = await self._sessions[conn]
+        return SFTPFileBackend(host, sftp) if sftp is not None else None
+
+    @staticmethod
+    async def _open(conn: asyncssh.SSHClientConnection, host: str) -> asyncssh.SFTPClient | None:
+        try:
+            sftp = await conn.start_sftp_client()
+        except (asyncssh.Error, OSError) as e:
+            logger.info(f"SFTP unavailable on {host}, falling back to commands: {e}")
+            return None
+
+        logger.debug(f"SFTP_SESSION: opened | host={host}")
+        return sftp
+
+
+_session_manager = SFTPSessionManager()
+
+
+async def get_file_backend(host: str | None) -> SFTPFileBackend | None:
+    """Return the SFTP file backend for a remote host.
+
+    Returns None for local execution, when ``CONFIG.sftp`` is disabled, or
+    when the host does not offer SFTP. Callers then run commands instead.
+    """
+    if not host or not CONFIG.sftp:
+        return None
+
+    return await _session_manager.get_backend(host)
+
+
+def is_regular_file(attrs: asyncssh.SFTPAttrs) -> bool:
+    """Return True if the attributes describe a regular file."""
+    return attrs.permissions is not None and stat.S_ISREG(attrs.permissions)
+
+
+def is_directory(attrs: asyncssh.SFTPAttrs) -> bool:
+    """Return True if the attributes describe a directory."""
+    return attrs.permissions is not None and stat.S_ISDIR(attrs.permissions)
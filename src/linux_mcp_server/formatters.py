@@ -5,6 +5,7 @@ human-readable strings for tool output.
 """
 
 from linux_mcp_server.models import ListeningPort
+from linux_mcp_server.models import LogTemplate
 from linux_mcp_server.models import NetworkConnection
 from linux_mcp_server.models import NetworkInterface
 from linux_mcp_server.models import ProcessInfo
@@ -170,25 +171,6 @@ def format_process_detail(
     return "\n".join(lines)
 
 
-def format_services_list(stdout: str, running_count: int | None = None) -> str:
-    """Format service list output.
-
-    Args:
-        stdout: Raw output from systemctl list-units.
-        running_count: Optional count of running services.
-
-    Returns:
-        Formatted string representation.
-    """
-    lines = ["=== System Services ===\n"]
-    lines.append(stdout)
-
-    if running_count is not None:
-        lines.append(f"\n\nSummary: {running_count} services currently running")
-
-    return "\n".join(lines)
-
-
 def format_service_status(stdout: str, service_name: str) -> str:
     """Format service status output.
 
@@ -220,6 +202,29 @@ def format_service_logs(stdout: str, service_name: str, lines_count: int) -> str
     return "\n".join(lines)
 
 
+def format_log_templates(templates: list[LogTemplate], lines_count: int, ungrouped: int, header: str) -> str:
+    """Format log templates with their counts and time ranges.
+
+    Args:
+        templates: Templates, most frequent first.
+        lines_count: Number of lines the templates were mined from.
+        ungrouped: Number of lines that did not fit any template.
+        header: Header text for the output.
+
+    Returns:
+        Formatted string representation.
+    """
+    lines = [header, f"{len(templates)} templates from {lines_count} lines\n"]
+    for template in templates:
+        seen = f" ({template.first_seen} .. {template.last_seen})" if template.first_seen else ""
+        lines.append(f"{template.count:>7}x{seen} {template.template}")
+        lines.extend(f"          e.g. {example}" for example in template.examples[:1])
+
+    if ungrouped:
+        lines.append(f"\n{ungrouped} lines did not fit any template")
+    return "\n".join(lines)
+
+
 def format_disk_usage(stdout: str, disk_io: str | None = None) -> str:
     """Format disk usage output.
 
@@ -0,0 +1,188 @@
+"""Streaming log template mining.
+
+Most of a long log tail is a handful of messages that differ only in
+numbers, addresses and IDs. ``TemplateMiner`` groups lines into templates in
+the style of Drain (He et al., ICWS 2017):
+
+1. A leading timestamp is split off and kept for first/last seen times.
+2. Numbers, hex numbers and IPv4 addresses are masked as ``<*>``.
+3. Lines are routed through a fixed-depth tree keyed by their token count
+   and leading tokens.
+4. A line joins the most similar template in its leaf, or starts a new one.
+   Positions where a line differs from its template become ``<*>``.
+
+Each line is compared with the templates of a single leaf only, so mining is
+linear in the number of lines. Masked lines seen before skip the tree through
+a bounded cache. Memory is bounded by ``max_templates``, ``max_children`` and
+the cache size; lines that would need a template beyond the limit are only
+counted as ungrouped.
+"""
+
+import re
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+
+from linux_mcp_server.models import LogEntries
+from linux_mcp_server.models import LogTemplate
+
+
+WILDCARD = "<*>"
+
+# Number of masked lines remembered with their template
+_CACHE_SIZE = 10_000
+
+# Timestamps at the start of journalctl short, short-iso and syslog lines
+_TIMESTAMP = re.compile(
+    r"(?:\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|[A-Z][a-z]{2} [ \d]\d \d{2}:\d{2}:\d{2})\s+"
+)
+
+# Hex numbers and decimal numbers with their separators, e.g. IPv4
+# addresses, versions and times. Other variable tokens, such as bare hex IDs,
+# become <*> when lines are merged into their template.
+_VARIABLE = re.compile(r"0x[\da-fA-F]+|\d+(?:[.:,]\d+)*")
+
+
+@dataclass
+class _Template:
+    tokens: list[str]
+    count: int = 0
+    first_seen: str | None = None
+    last_seen: str | None = None
+    examples: list[str] = field(default_factory=list)
+
+
+class TemplateMiner:
+    """Group log lines into templates with counts.
+
+    Args:
+        similarity: Minimum fraction of equal tokens for a line to join a
+            template.
+        depth: Number of leading tokens used to route lines in the tree.
+        max_children: Maximum number of distinct tokens per tree node.
+            Further tokens are routed through a wildcard child.
+        max_templates: Maximum number of templates kept.
+        max_examples: Number of raw lines kept as examples per template.
+    """
+
+    def __init__(
+        self,
+        similarity: float = 0.4,
+        depth: int = 2,
+        max_children: int = 100,
+        max_templates: int = 1000,
+        max_examples: int = 3,
+    ) -> None:
+        self.similarity = similarity
+        self.depth = depth
+        self.max_children = max_children
+        self.max_templates = max_templates
+        self.max_examples = max_examples
+        self.lines = 0
+        self.ungrouped = 0
+        self._tree: dict[int, dict] = {}
+        self._templates: list[_Template] = []
+        self._cache: dict[str, _Template] = {}
+
+    def _leaf(self, tokens: list[str]) -> list[_Template]:
+        node = self._tree.setdefault(len(tokens), {})
+        for token in tokens[: self.depth]:
+            if WILDCARD in token or (token not in node and len(node) >= self.max_children):
+                token = WILDCARD
+            node = node.setdefault(token, {})
+        return node.setdefault(None, [])
+
+    def _match(self, leaf: list[_Template], tokens: list[str]) -> _Template | None:
+        best = None
+        best_score = self.similarity * len(tokens)
+        for template in leaf:
+            score = sum(1 for known, token in zip(template.tokens, tokens, strict=True) if known == token)
+            if score >= best_score and (best is None or score > best_score):
+                best, best_score = template, score
+        return best
+
+    def _insert(self, tokens: list[str], timestamp: str | None) -> _Template | None:
+        leaf = self._leaf(tokens)
+        template = self._match(leaf, tokens)
+        if template is not None:
+            template.tokens = [
+                known if known == token else WILDCARD for known, token in zip(template.tokens, tokens, strict=True)
+            ]
+        elif len(self._templates) < self.max_templates:
+            template = _Template(tokens=tokens, first_seen=timestamp)
+            leaf.append(template)
+            self._templates.append(template)
+        return template
+
+    def add(self, line: str) -> None:
+        """Add one log line."""
+        timestamp = None
+        if match := _TIMESTAMP.match(line):
+            timestamp = match.group().rstrip()
+            message = line[match.end() :]
+        else:
+            message = line
+
+        masked = _VARIABLE.sub(WILDCARD, message)
+        template = self._cache.get(masked)
+        if template is None:
+            tokens = masked.split()
+            if not tokens:
+                return
+
+            template = self._insert(tokens, timestamp)
+            if template is None:
+                self.lines += 1
+                self.ungrouped += 1
+                return
+
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+            self._cache[masked] = template
+
+        self.lines += 1
+
+        template.count += 1
+        template.last_seen = timestamp or template.last_seen
+        template.first_seen = template.first_seen or timestamp
+        if len(template.examples) < self.max_examples:
+            template.examples.append(line)
+
+    def templates(self) -> list[LogTemplate]:
+        """Return the templates, most frequent first."""
+        return [
+            LogTemplate(
+                template=" ".join(template.tokens),
+                count=template.count,
+                first_seen=template.first_seen,
+                last_seen=template.last_seen,
+                examples=template.examples,
+            )
+            for template in sorted(self._templates, key=lambda template: template.count, reverse=True)
+        ]
+
+
+def mine_templates(lines: Iterable[str]) -> TemplateMiner:
+    """Mine templates from lines with the default settings."""
+    miner = TemplateMiner()
+    for line in lines:
+        miner.add(line)
+    return miner
+
+
+def compact_log_entries(result: LogEntries) -> LogEntries:
+    """Replace the entries of a log result with their templates.
+
+    ``lines_count`` keeps the number of lines that were mined.
+    """
+    miner = mine_templates(result.entries)
+    return result.model_copy(
+        update={
+            "entries": [],
+            "templates": miner.templates(),
+            "ungrouped": miner.ungrouped,
+            "lines_count": len(result.entries),
+        }
+    )
@@ -0,0 +1,228 @@
+"""Opt-in background collector of lightweight per-host metrics.
+
+Tools only see the system as it is when they are called. The collector
+samples load averages, memory, CPU, network and pressure counters of the
+hosts in ``CONFIG.collector_hosts`` every ``CONFIG.collector_interval``
+seconds, so the recent history can be queried later. Each host is sampled
+with the execution context the authorization policy grants it.
+
+Each host keeps a ``RingBuffer`` of ``CONFIG.collector_samples`` samples: one
+``array("d")`` of timestamps and one per metric, allocated once. Appending
+overwrites the oldest sample, so memory does not grow with uptime. Counters
+such as CPU jiffies and interface bytes are turned into rates between
+consecutive samples of the same host.
+"""
+
+import asyncio
+import logging
+import math
+import time
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Mapping
+
+from linux_mcp_server.commands import get_command
+from linux_mcp_server.config import CONFIG
+from linux_mcp_server.execution_context import ExecutionContext
+from linux_mcp_server.execution_context import use_execution_context
+from linux_mcp_server.parsers import parse_metrics_sample
+from linux_mcp_server.utils import StrEnum
+
+
+logger = logging.getLogger("linux-mcp-server")
+
+# Name of the local system in CONFIG.collector_hosts. Its samples are kept
+# under None, like the host argument of the tools, so that no host name can
+# be mistaken for it.
+LOCAL_HOST = "local"
+
+
+class Metric(StrEnum):
+    LOAD1 = "load1"
+    LOAD5 = "load5"
+    LOAD15 = "load15"
+    CPU_PERCENT = "cpu_percent"
+    MEMORY_AVAILABLE_BYTES = "memory_available_bytes"
+    MEMORY_USED_PERCENT = "memory_used_percent"
+    SWAP_USED_BYTES = "swap_used_bytes"
+    RX_BYTES_PER_SEC = "rx_bytes_per_sec"
+    TX_BYTES_PER_SEC = "tx_bytes_per_sec"
+    PSI_CPU_SOME = "psi_cpu_some"
+    PSI_MEMORY_SOME = "psi_memory_some"
+    PSI_IO_SOME = "psi_io_some"
+
+
+class RingBuffer:
+    """Fixed number of timestamped samples stored column by column.
+
+    Missing values are stored as NaN.
+    """
+
+    def __init__(self, capacity: int, metrics: Iterable[str] = tuple(Metric)) -> None:
+        self.capacity = capacity
+        self.count = 0
+        self._next = 0
+        self.times = array("d", [0.0]) * capacity
+        self.values = {str(metric): array("d", [math.nan]) * capacity for metric in metrics}
+
+    def append(self, timestamp: float, values: Mapping[str, float]) -> None:
+        """Store a sample, overwriting the oldest one when the buffer is full."""
+        index = self._next
+        self.times[index] = timestamp
+        for metric, column in self.values.items():
+            column[index] = values.get(metric, math.nan)
+
+        self._next = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def window(self, start: float, end: float = math.inf) -> tuple[list[float], dict[str, list[float]]]:
+        """Return the timestamps and values of samples from start to end, oldest first."""
+        first = self._next - self.count
+        indexes = [
+            index % self.capacity
+            for index in range(first, self._next)
+            if start <= self.times[index % self.capacity] <= end
+        ]
+        return [self.times[index] for index in indexes], {
+            metric: [column[index] for index in indexes] for metric, column in self.values.items()
+        }
+
+
+def _rate(current: Mapping[str, float], previous: Mapping[str, float], name: str) -> float:
+    elapsed = current.get("uptime", math.nan) - previous.get("uptime", math.nan)
+    delta = current.get(name, math.nan) - previous.get(name, math.nan)
+    # NaN comparisons are False, so missing counters give NaN
+    return delta / elapsed if elapsed > 0 and delta >= 0 else math.nan
+
+
+def derive_metrics(current: Mapping[str, float], previous: Mapping[str, float] | None) -> dict[str, float]:
+    """Compute the metrics of a sample from its counters and the previous ones.
+
+    Rates are NaN for the first sample of a host and after a reboot.
+    """
+    nan = math.nan
+    total = current.get("MemTotal", nan) * 1024
+    available = current.get("MemAvailable", nan) * 1024
+    previous = previous or {}
+    cpu_total = current.get("cpu_total", nan) - previous.get("cpu_total", nan)
+    cpu_busy = current.get("cpu_busy", nan) - previous.get("cpu_busy", nan)
+    return {
+        Metric.LOAD1: current.get("load1", nan),
+        Metric.LOAD5: current.get("load5", nan),
+        Metric.LOAD15: current.get("load15", nan),
+        Metric.CPU_PERCENT: 100 * cpu_busy / cpu_total if cpu_total > 0 and cpu_busy >= 0 else nan,
+        Metric.MEMORY_AVAILABLE_BYTES: available,
+        Metric.MEMORY_USED_PERCENT: 100 * (total - available) / total if total > 0 else nan,
+        Metric.SWAP_USED_BYTES: (current.get("SwapTotal", nan) - current.get("SwapFree", nan)) * 1024,
+        Metric.RX_BYTES_PER_SEC: _rate(current, previous, "rx_bytes"),
+        Metric.TX_BYTES_PER_SEC: _rate(current, previous, "tx_bytes"),
+        Metric.PSI_CPU_SOME: current.get("psi_cpu", nan),
+        Metric.PSI_MEMORY_SOME: current.get("psi_memory", nan),
+        Metric.PSI_IO_SOME: current.get("psi_io", nan),
+    }
+
+
+def downsample(times: list[float], values: list[float], start: float, end: float, points: int) -> list[float | None]:
+    """Average values into points equal buckets from start to end.
+
+    NaN values are ignored; buckets without values are None.
+    """
+    sums = [0.0] * points
+    counts = [0] * points
+    width = (end - start) / points
+    for timestamp, value in zip(times, values, strict=True):
+        if math.isnan(value):
+            continue
+        bucket = min(int((timestamp - start) / width), points - 1) if width > 0 else 0
+        sums[bucket] += value
+        counts[bucket] += 1
+
+    return [total / count if count else None for total, count in zip(sums, counts, strict=True)]
+
+
+class MetricsCollector:
+    """Samples a fixed set of hosts into one ring buffer per host."""
+
+    def __init__(self, hosts: Iterable[str | None], interval: float, capacity: int) -> None:
+        self.interval = interval
+        self.buffers = {host: RingBuffer(capacity) for host in hosts}
+        self._contexts: dict[str | None, ExecutionContext] = {}
+        self._previous: dict[str | None, dict[str, float]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def sample(self, host: str | None) -> None:
+        """Take one sample of host, or of the local system if None, and store it.
+
+        Raises:
+            ConnectionError: If the host cannot be reached.
+            RuntimeError: If the counters cannot be read.
+        """
+        returncode, stdout, stderr = await get_command("metrics_sample").run(host=host)
+        counters = parse_metrics_sample(stdout)
+        if returncode != 0 or "uptime" not in counters:
+            raise RuntimeError(f"Unable to read metrics: {stderr.strip()}")
+
+        previous = self._previous.get(host)
+        # Counters restart from zero after a reboot
+        if previous is not None and counters["uptime"] < previous.get("uptime", 0):
+            previous = None
+        self.buffers[host].append(time.time(), derive_metrics(counters, previous))
+        self._previous[host] = counters
+
+    async def _sample_logged(self, host: str | None) -> None:
+        try:
+            with use_execution_context(self._contexts[host]):
+                await self.sample(host)
+        except Exception as e:
+            logger.warning(f"METRICS_COLLECTOR: sample failed | host={host or LOCAL_HOST} | error={e}")
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.gather(*(self._sample_logged(host) for host in self.buffers))
+            await asyncio.sleep(max(self.interval - (time.monotonic() - started), 0))
+
+    def start(self, contexts: Mapping[str | None, ExecutionContext]) -> None:
+        """Start sampling in a background task.
+
+        Args:
+            contexts: Execution context of every host that may be sampled.
+                Hosts without one are dropped, and nothing is started if no
+                host is left.
+        """
+        if self._task is not None:
+            return
+
+        for host in [host for host in self.buffers if host not in contexts]:
+            logger.warning(f"METRICS_COLLECTOR: host not allowed | host={host or LOCAL_HOST}")
+            del self.buffers[host]
+        self._contexts = {host: contexts[host] for host in self.buffers}
+
+        if self.buffers:
+            hosts = ",".join(host or LOCAL_HOST for host in self.buffers)
+            logger.info(f"METRICS_COLLECTOR: started | hosts={hosts} | interval={self.interval}")
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling and wait for the background task to end."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def _configured_hosts() -> list[str | None]:
+    hosts = (host.strip() for host in (CONFIG.collector_hosts or "").split(","))
+    return list(dict.fromkeys(None if host == LOCAL_HOST else host for host in hosts if host))
+
+
+_collector = MetricsCollector(_configured_hosts(), CONFIG.collector_interval, CONFIG.collector_samples)
+
+
+def get_collector() -> MetricsCollector:
+    """Return the process-wide metrics collector."""
+    return _collector
@@ -78,7 +78,7 @@ class ProcessInfo(BaseModel):
 
 ### Memory models ###
 class MemoryInfo(BaseModel):
-    """Parsed memory information from free command."""
+    """RAM totals in bytes, computed from /proc/meminfo like free."""
 
     total: int
     used: int
@@ -90,18 +90,60 @@ class MemoryInfo(BaseModel):
 
 
 class SwapInfo(BaseModel):
-    """Parsed swap information from free command."""
+    """Swap totals in bytes."""
 
     total: int
     used: int
     free: int
 
 
+class MemoryBreakdown(BaseModel):
+    """Where RAM went, in bytes.
+
+    The categories do not overlap, so together with ``unaccounted`` they add
+    up to the total. ``page_cache`` excludes shared memory, which is listed
+    as ``shmem``. ``unaccounted`` is mostly memory allocated by drivers
+    directly from the page allocator, which /proc/meminfo does not report.
+    """
+
+    free: int = 0
+    anon: int = 0
+    page_cache: int = 0
+    buffers: int = 0
+    shmem: int = 0
+    slab_reclaimable: int = 0
+    slab_unreclaimable: int = 0
+    kernel_stack: int = 0
+    page_tables: int = 0
+    vmalloc: int = 0
+    percpu: int = 0
+    hugetlb: int = 0
+    unaccounted: int = 0
+
+
+class SlabCache(BaseModel):
+    """A kernel slab cache from /proc/slabinfo, with the memory of its slabs."""
+
+    name: str
+    active_objects: int
+    objects: int
+    object_size: int
+    size_bytes: int
+
+
 class SystemMemory(BaseModel):
-    """Combined memory and swap information."""
+    """Combined memory and swap information.
+
+    ``meminfo`` holds every /proc/meminfo field, in bytes except for the
+    HugePages_* page counts. ``slab_caches`` is None unless requested, or
+    when /proc/slabinfo is not readable.
+    """
 
     ram: MemoryInfo
     swap: SwapInfo | None = None
+    breakdown: MemoryBreakdown | None = None
+    meminfo: dict[str, int] = Field(default_factory=dict)
+    slab_caches: list[SlabCache] | None = None
 
 
 ### System models ###
@@ -117,17 +159,144 @@ class SystemInfo(BaseModel):
     boot_time: str = ""
 
 
+class CpuUtilization(BaseModel):
+    """Share of time one CPU, or "cpu" for all of them, spent in each state."""
+
+    cpu: str
+    busy_percent: float
+    user_percent: float
+    system_percent: float
+    iowait_percent: float
+    steal_percent: float
+    idle_percent: float
+
+
+class CpuCore(BaseModel):
+    """One physical core and the logical CPUs that share it.
+
+    ``frequency_mhz`` is the highest current frequency among those CPUs.
+    """
+
+    package: int
+    core: int
+    processors: list[int]
+    frequency_mhz: float | None = None
+
+
 class CpuInfo(BaseModel):
-    """Parsed CPU information."""
+    """Parsed CPU information.
+
+    ``frequency_mhz`` is the mean current frequency of the logical CPUs.
+    ``utilization`` covers the sampled interval, or the time since boot when
+    no interval was sampled. ``cores`` is only filled in on request.
+    """
 
     model: str = ""
     logical_cores: int = 0
     physical_cores: int = 0
+    packages: int = 0
     frequency_mhz: float = 0.0
+    frequency_min_mhz: float = 0.0
+    frequency_max_mhz: float = 0.0
     load_avg_1m: float = 0.0
     load_avg_5m: float = 0.0
     load_avg_15m: float = 0.0
-    cpu_line: str = ""
+    utilization: CpuUtilization | None = None
+    cores: list[CpuCore] | None = None
+
+
+class InterfaceRates(BaseModel):
+    """Traffic of one network interface per second. Errors include drops."""
+
+    interface: str
+    rx_bytes_per_sec: float
+    tx_bytes_per_sec: float
+    rx_packets_per_sec: float
+    tx_packets_per_sec: float
+    rx_errors_per_sec: float
+    tx_errors_per_sec: float
+
+
+class DiskRates(BaseModel):
+    """I/O of one block device per second.
+
+    The await times are the average milliseconds a request took, including
+    queueing, and None without requests of that kind during the interval.
+    """
+
+    device: str
+    read_iops: float
+    write_iops: float
+    read_bytes_per_sec: float
+    write_bytes_per_sec: float
+    read_await_ms: float | None = None
+    write_await_ms: float | None = None
+    utilization_percent: float
+
+
+class SystemActivity(BaseModel):
+    """CPU, network and disk rates over ``interval`` seconds."""
+
+    interval: float
+    cpus: list[CpuUtilization]
+    interfaces: list[InterfaceRates]
+    disks: list[DiskRates]
+
+
+class PressureStall(BaseModel):
+    """Pressure stall information of one resource.
+
+    ``some`` is the share of time at least one task was stalled on the
+    resource, ``full`` the share of time all non-idle tasks were. The
+    averages are percentages over 10, 60 and 300 seconds and ``total_usec``
+    the stall time since boot. ``stall_percent`` is the share of the
+    sampling interval spent stalled, only set when two samples were taken.
+    """
+
+    resource: str
+    kind: str
+    avg10: float
+    avg60: float
+    avg300: float
+    total_usec: int
+    stall_percent: float | None = None
+
+
+class PressureInfo(BaseModel):
+    """Pressure of the whole system, or of one cgroup when ``cgroup`` is set."""
+
+    cgroup: str | None = None
+    interval: float | None = None
+    pressures: list[PressureStall]
+
+
+class MetricSeries(BaseModel):
+    """Downsampled values of one collected metric with statistics.
+
+    ``values`` holds one average per timestamp of the history, None where no
+    sample was taken. The statistics are computed over every sample in the
+    window, so short peaks are not averaged away.
+    """
+
+    metric: str
+    values: list[float | None]
+    samples: int = 0
+    min: float | None = None
+    max: float | None = None
+    mean: float | None = None
+    p95: float | None = None
+    last: float | None = None
+
+
+class MetricsHistory(BaseModel):
+    """Metrics collected in the background for one host over a time window."""
+
+    host: str
+    interval: int
+    start: datetime
+    end: datetime
+    timestamps: list[datetime]
+    series: list[MetricSeries]
 
 
 class FilesystemInfo(BaseModel):
@@ -186,14 +355,208 @@ class NodeEntry(BaseModel):
 class StorageNodes(BaseModel):
     nodes: list[NodeEntry]
     total: int = Field(default_factory=field_length("nodes"))
+    # Seconds since cached sizes were last checked against the target, when served from the size index
+    index_age: float | None = None
+
+
+class LargestFiles(BaseModel):
+    """Largest files under a path and how much of the tree was walked.
+
+    ``complete`` is False when the time budget ran out before the walk
+    finished, in which case ``files`` only covers the ``scanned`` entries.
+    """
+
+    files: list[NodeEntry]
+    total: int = Field(default_factory=field_length("files"))
+    scanned: int = 0
+    complete: bool = True
+
+
+class FileContent(BaseModel):
+    """A byte range of a file.
+
+    ``next_offset`` is the offset to pass to read the following chunk, or
+    None once the end of the file was reached. ``size`` is 0 for most files
+    under /proc and /sys, which are read until no more bytes come back.
+    ``unchanged`` is set, with empty content, when the file still matches the
+    fingerprint the caller passed in. ``fingerprint`` is empty for empty files
+    and files on pseudo filesystems, whose changes it would not reflect.
+    """
+
+    path: Path
+    content: str
+    offset: int
+    length: int
+    size: int
+    next_offset: int | None = None
+    fingerprint: str = ""
+    unchanged: bool = False
+
+
+### Service models ###
+class ServiceUnit(BaseModel):
+    """A systemd service from ``systemctl list-units``."""
+
+    unit: str
+    load: str
+    active: str
+    sub: str
+    description: str = ""
+
+
+class ServiceUnits(BaseModel):
+    """A page of the services matching the filters.
+
+    ``total``, ``active_states`` and ``sub_states`` count every service on
+    the host, regardless of the filters. ``next_offset`` is the offset of
+    the following page, or None on the last page.
+    """
+
+    services: list[ServiceUnit]
+    total: int
+    matched: int
+    active_states: dict[str, int] = Field(default_factory=dict)
+    sub_states: dict[str, int] = Field(default_factory=dict)
+    offset: int = 0
+    next_offset: int | None = None
+
+
+class ServiceState(BaseModel):
+    """Selected properties of a systemd unit from ``systemctl show``.
+
+    Numeric properties are None when systemd does not track them, e.g. the
+    memory of a unit without memory accounting. ``main_pid`` is None when
+    the unit has no main process.
+    """
+
+    unit: str
+    description: str = ""
+    load_state: str = ""
+    active_state: str = ""
+    sub_state: str = ""
+    unit_file_state: str = ""
+    result: str = ""
+    active_since: str = ""
+    main_pid: int | None = None
+    exit_status: int | None = None
+    restarts: int | None = None
+    memory_bytes: int | None = None
+    cpu_usage_ns: int | None = None
+    tasks: int | None = None
+
+
+class ServiceStates(BaseModel):
+    services: list[ServiceState]
+    total: int = Field(default_factory=field_length("services"))
+
+
+class UnitTiming(BaseModel):
+    """Time a unit took to start, from ``systemd-analyze blame``."""
+
+    unit: str
+    seconds: float
+
+
+class ChainUnit(BaseModel):
+    """A unit on the boot critical chain from ``systemd-analyze critical-chain``.
+
+    ``active_at`` is when the unit became active, in seconds since boot, and
+    ``start_seconds`` how long it took to start, when reported.
+    """
+
+    unit: str
+    active_at: float | None = None
+    start_seconds: float | None = None
+
+
+class TriageSummary(BaseModel):
+    """Failed units and what made the current boot slow.
+
+    ``boot_cached`` is True when the boot timings were served from the cache
+    of an earlier call during the same boot.
+    """
+
+    boot_id: str
+    failed: list[ServiceUnit]
+    slowest: list[UnitTiming] = Field(default_factory=list)
+    critical_chain: list[ChainUnit] = Field(default_factory=list)
+    boot_cached: bool = False
+
+
+class UnitResources(BaseModel):
+    """Resource usage of one cgroup from its cgroup v2 accounting files.
+
+    Values are None when the controller is not enabled for the cgroup. The
+    rates are only set when two samples were taken; ``cpu_percent`` is
+    relative to one CPU, so busy multi-threaded units exceed 100.
+    """
+
+    unit: str
+    memory_bytes: int | None = None
+    memory_anon_bytes: int | None = None
+    memory_file_bytes: int | None = None
+    cpu_usage_usec: int | None = None
+    io_read_bytes: int | None = None
+    io_write_bytes: int | None = None
+    pids: int | None = None
+    cpu_percent: float | None = None
+    io_read_bytes_per_sec: float | None = None
+    io_write_bytes_per_sec: float | None = None
+
+
+class UnitResourceUsage(BaseModel):
+    """Units of a slice sorted by one metric.
+
+    ``total`` counts every unit of the slice, ``interval`` is the measured
+    time between the two samples, or None for a single sample.
+    """
+
+    slice: str
+    units: list[UnitResources]
+    total: int
+    interval: float | None = None
 
 
 ### Log models ###
+class MessageSample(BaseModel):
+    """A log message and how often it occurred."""
+
+    message: str
+    count: int
+
+
+class JournalGroup(BaseModel):
+    """Journal entries of one unit and priority within a time bucket."""
+
+    start: datetime
+    unit: str
+    priority: int | None = None
+    count: int
+    samples: list[MessageSample] = Field(default_factory=list)
+
+
+class LogTemplate(BaseModel):
+    """Log lines that differ only in the positions marked ``<*>``."""
+
+    template: str
+    count: int
+    first_seen: str | None = None
+    last_seen: str | None = None
+    examples: list[str] = Field(default_factory=list)
+
+
 class LogEntries(BaseModel):
     entries: list[str]
     unit: str = ""
     path: Path | None = None
     lines_count: int = Field(default_factory=field_length("entries"))
+    fingerprint: str | None = None
+    cursor: str | None = None
+    unchanged: bool = False
+    matches: int | None = None
+    groups: list[JournalGroup] | None = None
+    templates: list[LogTemplate] | None = None
+    ungrouped: int = 0
 
     @field_serializer("unit", "path")
     def serialize_empty_as_null(self, value: str | Path | None) -> str | None:
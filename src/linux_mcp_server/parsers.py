@@ -4,18 +4,101 @@ This module provides functions to parse raw command output into
 structured data that can be used by formatters.
 """
 
+import json
+import re
+import typing as t
+
+from collections.abc import Iterator
+from datetime import datetime
+from datetime import timezone
 from pathlib import Path
 
+from linux_mcp_server.models import ChainUnit
+from linux_mcp_server.models import CpuCore
 from linux_mcp_server.models import CpuInfo
+from linux_mcp_server.models import JournalGroup
 from linux_mcp_server.models import ListeningPort
+from linux_mcp_server.models import MemoryBreakdown
 from linux_mcp_server.models import MemoryInfo
+from linux_mcp_server.models import MessageSample
 from linux_mcp_server.models import NetworkConnection
 from linux_mcp_server.models import NetworkInterface
 from linux_mcp_server.models import NodeEntry
+from linux_mcp_server.models import PressureStall
 from linux_mcp_server.models import ProcessInfo
+from linux_mcp_server.models import ServiceState
+from linux_mcp_server.models import ServiceUnit
+from linux_mcp_server.models import SlabCache
 from linux_mcp_server.models import SwapInfo
 from linux_mcp_server.models import SystemInfo
 from linux_mcp_server.models import SystemMemory
+from linux_mcp_server.models import UnitResources
+from linux_mcp_server.models import UnitTiming
+
+
+# (size, modified, name) row produced by the listing parsers
+ListingRow: t.TypeAlias = tuple[int, float, str]
+
+
+class LogSegment(t.NamedTuple):
+    """Bytes START..END of a log file, identified by inode.
+
+    ``rotated`` marks the unread rest of a file that was rotated away. The
+    data of the current file's segment may be shorter than END - START when
+    only its last lines were requested.
+    """
+
+    rotated: bool
+    inode: int
+    start: int
+    end: int
+    data: bytes
+
+
+class LogMatches(t.NamedTuple):
+    """Lines of a log file segment that matched a pattern.
+
+    ``matches`` counts every match found, which may be more than the lines
+    kept. ``consumed`` is the number of bytes after START that were read.
+    """
+
+    rotated: bool
+    inode: int
+    start: int
+    end: int
+    matches: int
+    consumed: int
+    lines: list[bytes]
+
+
+class DirectoryScan(t.NamedTuple):
+    """Results of a walk for the directory size index.
+
+    ``started`` is the target's clock when the walk started, or None if it
+    was not reported. ``directories`` and ``summaries`` map paths to (size,
+    mtime) tuples with own sizes and subtree totals respectively.
+    ``children`` lists the subdirectories of directories walked in "own"
+    mode, and ``links`` maps "DEV:INODE" to (directory, size) tuples.
+    """
+
+    started: float | None
+    directories: dict[str, tuple[int, float]]
+    summaries: dict[str, tuple[int, float]]
+    children: set[str]
+    links: dict[str, tuple[str, int]]
+
+
+class ActivitySample(t.NamedTuple):
+    """Raw CPU, network and disk counters read at one point in time.
+
+    ``uptime`` is the target's uptime in seconds. Counters are keyed by CPU,
+    interface and disk name, in the order of their source file.
+    """
+
+    uptime: float
+    cpus: dict[str, list[int]]
+    interfaces: dict[str, list[int]]
+    disks: dict[str, list[int]]
 
 
 def parse_ss_connections(stdout: str) -> list[NetworkConnection]:
@@ -177,42 +260,113 @@ def parse_os_release(stdout: str) -> dict[str, str]:
     return result
 
 
-def parse_free_output(stdout: str) -> SystemMemory:
-    """Parse free -b -w output into SystemMemory object.
+def parse_meminfo(stdout: str) -> dict[str, int]:
+    """Parse /proc/meminfo into a dictionary.
 
     Args:
-        stdout: Raw output from free -b -w command.
+        stdout: Raw content of /proc/meminfo.
 
     Returns:
-        SystemMemory object containing RAM and swap info.
+        Dictionary mapping field names to values in bytes. Fields without a
+        kB unit, the HugePages_* page counts, are kept as they are.
     """
-    ram = MemoryInfo(total=0, used=0, free=0)
+    meminfo = {}
+    for line in stdout.splitlines():
+        name, _, value = line.partition(":")
+        parts = value.split()
+        if not parts or not parts[0].isdigit():
+            continue
+        meminfo[name.strip()] = int(parts[0]) * (1024 if parts[1:] == ["kB"] else 1)
+
+    return meminfo
+
+
+def parse_system_memory(meminfo: dict[str, int]) -> SystemMemory:
+    """Build memory totals and their breakdown from /proc/meminfo fields.
+
+    RAM totals follow free from procps-ng 4: ``cached`` includes reclaimable
+    slab and ``used`` is everything that is not available.
+
+    Args:
+        meminfo: Fields from ``parse_meminfo``.
+
+    Returns:
+        SystemMemory object without slab caches.
+
+    Raises:
+        KeyError: If MemTotal or MemFree is missing.
+    """
+    total = meminfo["MemTotal"]
+    free = meminfo["MemFree"]
+    buffers = meminfo.get("Buffers", 0)
+    cached = meminfo.get("Cached", 0)
+    shmem = meminfo.get("Shmem", 0)
+    available = meminfo.get("MemAvailable", free)
+    hugetlb = meminfo.get("Hugetlb", meminfo.get("HugePages_Total", 0) * meminfo.get("Hugepagesize", 0))
+
+    breakdown = MemoryBreakdown(
+        free=free,
+        anon=meminfo.get("AnonPages", 0),
+        page_cache=max(cached - shmem, 0),
+        buffers=buffers,
+        shmem=shmem,
+        slab_reclaimable=meminfo.get("SReclaimable", 0),
+        slab_unreclaimable=meminfo.get("SUnreclaim", 0),
+        kernel_stack=meminfo.get("KernelStack", 0),
+        page_tables=meminfo.get("PageTables", 0),
+        vmalloc=meminfo.get("VmallocUsed", 0),
+        percpu=meminfo.get("Percpu", 0),
+        hugetlb=hugetlb,
+    )
+    breakdown.unaccounted = max(total - sum(breakdown.model_dump().values()), 0)
+
     swap = None
+    if "SwapTotal" in meminfo:
+        swap_free = meminfo.get("SwapFree", 0)
+        swap = SwapInfo(total=meminfo["SwapTotal"], used=meminfo["SwapTotal"] - swap_free, free=swap_free)
+
+    return SystemMemory(
+        ram=MemoryInfo(
+            total=total,
+            used=total - available,
+            free=free,
+            shared=shmem,
+            buffers=buffers,
+            cached=cached + meminfo.get("SReclaimable", 0),
+            available=available,
+        ),
+        swap=swap,
+        breakdown=breakdown,
+        meminfo=meminfo,
+    )
 
-    lines = stdout.strip().split("\n")
-    for line in lines:
-        if line.startswith("Mem:"):
-            parts = line.split()
-            if len(parts) >= 4:
-                ram = MemoryInfo(
-                    total=int(parts[1]),
-                    used=int(parts[2]),
-                    free=int(parts[3]),
-                    shared=int(parts[4]) if len(parts) > 4 else 0,
-                    buffers=int(parts[5]) if len(parts) > 5 else 0,
-                    cached=int(parts[6]) if len(parts) > 6 else 0,
-                    available=int(parts[7]) if len(parts) > 7 else int(parts[3]),
-                )
-        elif line.startswith("Swap:"):
-            parts = line.split()
-            if len(parts) >= 4:
-                swap = SwapInfo(
-                    total=int(parts[1]),
-                    used=int(parts[2]),
-                    free=int(parts[3]),
-                )
 
-    return SystemMemory(ram=ram, swap=swap)
+def parse_slab_caches(stdout: str) -> list[SlabCache]:
+    """Parse the slab cache lines of the memory_info command.
+
+    Args:
+        stdout: "NAME ACTIVE_OBJS NUM_OBJS OBJSIZE BYTES" lines.
+
+    Returns:
+        List of slab caches in output order. Malformed lines are skipped.
+    """
+    caches = []
+    for line in stdout.splitlines():
+        parts = line.split()
+        if len(parts) != 5 or not all(part.isdigit() for part in parts[1:]):
+            continue
+        name, active, objects, size, total = parts
+        caches.append(
+            SlabCache(
+                name=name,
+                active_objects=int(active),
+                objects=int(objects),
+                object_size=int(size),
+                size_bytes=int(total),
+            )
+        )
+
+    return caches
 
 
 def parse_proc_net_dev(stdout: str) -> dict[str, NetworkInterface]:
@@ -339,73 +493,100 @@ def _parse_load_avg(load_avg_str: str) -> tuple[float, float, float]:
     return 0.0, 0.0, 0.0
 
 
-def _count_physical_cores(physical_cores_str: str) -> int:
-    """Count unique physical core IDs."""
-    core_ids = set()
-    for line in physical_cores_str.strip().split("\n"):
-        if ":" in line:
-            core_id = line.split(":", 1)[1].strip()
-            core_ids.add(core_id)
-    return len(core_ids)
+def parse_cpuinfo(stdout: str) -> list[dict[str, str]]:
+    """Parse /proc/cpuinfo into one dictionary of fields per logical CPU.
+
+    Blocks are separated by blank lines. Lines before the first "processor"
+    field, such as the machine-wide header on s390x, are kept in the first
+    block.
+    """
+    processors: list[dict[str, str]] = []
+    fields: dict[str, str] = {}
+    for line in stdout.splitlines():
+        key, colon, value = line.partition(":")
+        key = key.strip()
+        if not colon:
+            if fields and not key:
+                processors.append(fields)
+                fields = {}
+            continue
+        fields[key] = value.strip()
+    if fields:
+        processors.append(fields)
+
+    return processors
 
 
-def _extract_cpu_line(top_snapshot: str) -> str:
-    """Extract CPU usage line from top snapshot."""
-    for line in top_snapshot.split("\n"):
-        if "Cpu(s):" in line or "%Cpu" in line:
-            return line.strip()
-    return ""
+def _to_int(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
 
 
-def parse_cpu_info(results: dict[str, str]) -> CpuInfo:
-    """Parse CPU info command results into CpuInfo object.
+def _to_float(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_cpu_info(cpuinfo: str, load_avg: str = "") -> CpuInfo:
+    """Parse /proc/cpuinfo and /proc/loadavg in one pass over the CPUs.
+
+    Physical cores are the distinct "physical id" and "core id" pairs, so
+    cores of different packages with the same ID are counted separately.
+    Architectures without these fields report no cores or packages.
 
     Args:
-        results: Dictionary of command name to output.
+        cpuinfo: Content of /proc/cpuinfo.
+        load_avg: Content of /proc/loadavg.
 
     Returns:
-        CpuInfo object.
+        CpuInfo object with the per-core topology in ``cores``.
     """
     model = ""
     logical_cores = 0
-    physical_cores = 0
-    frequency_mhz = 0.0
-    load_avg_1m, load_avg_5m, load_avg_15m = 0.0, 0.0, 0.0
-    cpu_line = ""
-
-    if "model" in results and ":" in results["model"]:
-        model = results["model"].split(":", 1)[1].strip()
+    packages: set[int] = set()
+    cores: dict[tuple[int, int], CpuCore] = {}
+    frequencies: list[float] = []
 
-    if "logical_cores" in results:
-        try:
-            logical_cores = int(results["logical_cores"].strip())
-        except ValueError:
-            pass
+    for fields in parse_cpuinfo(cpuinfo):
+        processor = _to_int(fields.get("processor"))
+        if processor is None:
+            continue
 
-    if "physical_cores" in results:
-        physical_cores = _count_physical_cores(results["physical_cores"])
+        logical_cores += 1
+        model = model or fields.get("model name", "")
+        frequency = _to_float(fields.get("cpu MHz"))
+        if frequency is not None:
+            frequencies.append(frequency)
 
-    if "frequency" in results and ":" in results["frequency"]:
-        try:
-            frequency_mhz = float(results["frequency"].split(":", 1)[1].strip())
-        except ValueError:
-            pass
+        core_id = _to_int(fields.get("core id"))
+        if core_id is None:
+            continue
 
-    if "load_avg" in results:
-        load_avg_1m, load_avg_5m, load_avg_15m = _parse_load_avg(results["load_avg"])
+        package = _to_int(fields.get("physical id")) or 0
+        packages.add(package)
+        core = cores.setdefault((package, core_id), CpuCore(package=package, core=core_id, processors=[]))
+        core.processors.append(processor)
+        if frequency is not None:
+            core.frequency_mhz = max(core.frequency_mhz or 0.0, frequency)
 
-    if "top_snapshot" in results:
-        cpu_line = _extract_cpu_line(results["top_snapshot"])
+    load_avg_1m, load_avg_5m, load_avg_15m = _parse_load_avg(load_avg)
 
     return CpuInfo(
         model=model,
         logical_cores=logical_cores,
-        physical_cores=physical_cores,
-        frequency_mhz=frequency_mhz,
+        physical_cores=len(cores),
+        packages=len(packages),
+        frequency_mhz=round(sum(frequencies) / len(frequencies), 3) if frequencies else 0.0,
+        frequency_min_mhz=min(frequencies, default=0.0),
+        frequency_max_mhz=max(frequencies, default=0.0),
         load_avg_1m=load_avg_1m,
         load_avg_5m=load_avg_5m,
         load_avg_15m=load_avg_15m,
-        cpu_line=cpu_line,
+        cores=sorted(cores.values(), key=lambda core: (core.package, core.core)),
     )
 
 
@@ -441,36 +622,517 @@ def parse_proc_status(stdout: str) -> dict[str, str]:
     return result
 
 
-def parse_service_count(stdout: str) -> int:
-    """Count services from systemctl list-units output.
+def parse_service_units(stdout: str) -> list[ServiceUnit]:
+    """Parse ``systemctl list-units`` output into services.
 
     Args:
-        stdout: Raw output from systemctl list-units command.
+        stdout: JSON output of ``--output=json``, or the plain text table of
+            ``--plain --no-legend``.
 
     Returns:
-        Number of services found.
+        List of services in output order.
+
+    Raises:
+        ValueError: If JSON output is malformed.
     """
-    count = 0
-    for line in stdout.split("\n"):
-        if ".service" in line:
-            count += 1
-    return count
+    if stdout.lstrip().startswith("["):
+        return [
+            ServiceUnit(
+                unit=item["unit"],
+                load=item["load"],
+                active=item["active"],
+                sub=item["sub"],
+                description=item.get("description") or "",
+            )
+            for item in json.loads(stdout)
+        ]
+
+    services = []
+    for line in stdout.splitlines():
+        fields = line.split(None, 4)
+        # Without --plain, failed units are marked with a bullet
+        if fields and fields[0] in ("●", "*"):
+            fields = line.split(None, 5)[1:]
+        # Headers and legends have no unit name with a type suffix
+        if len(fields) < 4 or "." not in fields[0]:
+            continue
+        services.append(
+            ServiceUnit(
+                unit=fields[0],
+                load=fields[1],
+                active=fields[2],
+                sub=fields[3],
+                description=fields[4].strip() if len(fields) > 4 else "",
+            )
+        )
+    return services
 
 
-def parse_directory_listing(
+# Seconds per unit of the time spans printed by systemd, e.g. "1min 2.345s"
+_TIMESPAN_UNITS = {
+    "y": 31_557_600.0,
+    "month": 2_629_800.0,
+    "w": 604_800.0,
+    "d": 86_400.0,
+    "h": 3_600.0,
+    "min": 60.0,
+    "s": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+    "µs": 1e-6,
+}
+_TIMESPAN_PART = re.compile(r"(\d+(?:\.\d+)?)(month|min|ms|us|µs|[ywdhs])")
+_CHAIN_LINE = re.compile(r"(\S+) @(.+?)(?: \+(.+))?$")
+
+
+def parse_timespan(text: str) -> float | None:
+    """Convert a systemd time span such as "1min 2.345s" to seconds.
+
+    Returns:
+        Seconds, or None if the text is not a time span.
+    """
+    parts = text.split()
+    seconds = 0.0
+    for part in parts:
+        match = _TIMESPAN_PART.fullmatch(part)
+        if not match:
+            return None
+        seconds += float(match.group(1)) * _TIMESPAN_UNITS[match.group(2)]
+    return round(seconds, 6) if parts else None
+
+
+def split_sections(stdout: str) -> dict[str, str]:
+    """Split output into sections introduced by "@@ NAME" lines.
+
+    Text after the name on the marker line becomes the start of the section.
+    """
+    sections: dict[str, list[str]] = {}
+    current: list[str] = []
+    for line in stdout.splitlines():
+        if line.startswith("@@ "):
+            name, _, rest = line[3:].partition(" ")
+            current = sections.setdefault(name, [rest] if rest else [])
+        else:
+            current.append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def parse_systemd_blame(stdout: str) -> list[UnitTiming]:
+    """Parse ``systemd-analyze blame`` output, slowest unit first."""
+    timings = []
+    for line in stdout.splitlines():
+        timespan, _, unit = line.strip().rpartition(" ")
+        seconds = parse_timespan(timespan)
+        if seconds is not None and unit:
+            timings.append(UnitTiming(unit=unit, seconds=seconds))
+    return timings
+
+
+def parse_critical_chain(stdout: str) -> list[ChainUnit]:
+    """Parse ``systemd-analyze critical-chain`` output, from the target down.
+
+    The tree drawing and the explanatory header lines are skipped.
+    """
+    chain = []
+    for line in stdout.splitlines():
+        match = _CHAIN_LINE.match(line.lstrip(" └├─│|`-"))
+        if match:
+            unit, active_at, start = match.groups()
+            chain.append(
+                ChainUnit(
+                    unit=unit,
+                    active_at=parse_timespan(active_at),
+                    start_seconds=parse_timespan(start) if start else None,
+                )
+            )
+    return chain
+
+
+# systemctl show property names and the ServiceState fields they fill
+_SERVICE_TEXT_PROPERTIES = {
+    "Id": "unit",
+    "Description": "description",
+    "LoadState": "load_state",
+    "ActiveState": "active_state",
+    "SubState": "sub_state",
+    "UnitFileState": "unit_file_state",
+    "Result": "result",
+    "ActiveEnterTimestamp": "active_since",
+}
+_SERVICE_NUMBER_PROPERTIES = {
+    "MainPID": "main_pid",
+    "ExecMainStatus": "exit_status",
+    "NRestarts": "restarts",
+    "MemoryCurrent": "memory_bytes",
+    "CPUUsageNSec": "cpu_usage_ns",
+    "TasksCurrent": "tasks",
+}
+
+# Older systemd versions print untracked counters as UINT64_MAX
+_UNSET = 2**64 - 1
+
+
+def parse_systemctl_show(stdout: str) -> list[ServiceState]:
+    """Parse ``systemctl show`` output for several units.
+
+    Args:
+        stdout: KEY=VALUE lines, one block per unit, blocks separated by
+            blank lines.
+
+    Returns:
+        List of unit states in output order. Blocks without an Id are skipped.
+    """
+    services = []
+    fields: dict[str, t.Any] = {}
+    for line in stdout.splitlines() + [""]:
+        if not line:
+            if fields.get("unit"):
+                services.append(ServiceState(**fields))
+            fields = {}
+            continue
+
+        key, _, value = line.partition("=")
+        if key in _SERVICE_TEXT_PROPERTIES:
+            fields[_SERVICE_TEXT_PROPERTIES[key]] = value
+        elif key in _SERVICE_NUMBER_PROPERTIES and value.isdigit() and int(value) != _UNSET:
+            # MainPID is 0 when the unit has no main process
+            if key != "MainPID" or value != "0":
+                fields[_SERVICE_NUMBER_PROPERTIES[key]] = int(value)
+
+    return services
+
+
+def parse_cgroup_samples(stdout: str) -> list[tuple[float, dict[str, UnitResources]]]:
+    """Parse the output of the cgroup_stats command.
+
+    Args:
+        stdout: One or more samples, each an "@@ sample UPTIME" line followed
+            by "UNIT MEMORY ANON FILE CPU_USEC READ_BYTES WRITE_BYTES PIDS"
+            lines with "-" for missing values.
+
+    Returns:
+        List of (uptime, units by name) tuples in sample order.
+
+    Raises:
+        ValueError: If a line is malformed or appears before the first sample.
+    """
+    samples: list[tuple[float, dict[str, UnitResources]]] = []
+    for line in stdout.splitlines():
+        if line.startswith("@@ sample "):
+            samples.append((float(line.split()[2]), {}))
+            continue
+        if not line:
+            continue
+
+        unit, *values = line.split(" ")
+        if not samples or len(values) != 7:
+            raise ValueError(f"Unexpected cgroup stats line: {line!r}")
+
+        memory, anon, file, cpu, read, write, pids = (None if value == "-" else int(value) for value in values)
+        samples[-1][1][unit] = UnitResources(
+            unit=unit,
+            memory_bytes=memory,
+            memory_anon_bytes=anon,
+            memory_file_bytes=file,
+            cpu_usage_usec=cpu,
+            io_read_bytes=read,
+            io_write_bytes=write,
+            pids=pids,
+        )
+
+    return samples
+
+
+def parse_activity_samples(stdout: str) -> list[ActivitySample]:
+    """Parse the output of the activity_sample command.
+
+    Keeps the first 8 counters of each /proc/stat CPU line (user to steal,
+    guest time is already part of user), all 16 of each /proc/net/dev
+    interface and the first 11 of each /proc/diskstats device, which every
+    kernel reports.
+
+    Args:
+        stdout: Samples, each an "@@ sample UPTIME" line followed by the
+            "@@ stat", "@@ net" and "@@ disk" sections.
+
+    Returns:
+        List of samples in output order.
+
+    Raises:
+        ValueError: If a line is malformed or appears before the first sample.
+    """
+    samples: list[ActivitySample] = []
+    section = ""
+    for line in stdout.splitlines():
+        if line.startswith("@@ sample "):
+            samples.append(ActivitySample(float(line.split()[2]), {}, {}, {}))
+            section = ""
+        elif line.startswith("@@ "):
+            section = line[3:]
+        elif not line.strip():
+            continue
+        elif not samples:
+            raise ValueError(f"Unexpected activity line before the first sample: {line!r}")
+        elif section == "stat":
+            name, *counters = line.split()
+            samples[-1].cpus[name] = [int(counter) for counter in counters[:8]]
+        elif section == "net":
+            name, _, counters = line.partition(":")
+            values = counters.split()
+            if len(values) >= 16:
+                samples[-1].interfaces[name.strip()] = [int(value) for value in values[:16]]
+        elif section == "disk":
+            fields = line.split()
+            if len(fields) >= 14:
+                samples[-1].disks[fields[2]] = [int(value) for value in fields[3:14]]
+
+    return samples
+
+
+def parse_metrics_sample(stdout: str) -> dict[str, float]:
+    """Parse the "NAME VALUE" lines of the metrics_sample command.
+
+    Lines that are not a name followed by a number are skipped.
+
+    Args:
+        stdout: Raw output of the metrics_sample command.
+
+    Returns:
+        Dictionary mapping counter names to values.
+    """
+    counters = {}
+    for line in stdout.splitlines():
+        name, _, value = line.partition(" ")
+        try:
+            counters[name] = float(value)
+        except ValueError:
+            continue
+
+    return counters
+
+
+def parse_pressure_samples(stdout: str) -> list[tuple[float, list[PressureStall]]]:
+    """Parse the output of the pressure command.
+
+    Args:
+        stdout: One or more samples, each an "@@ sample UPTIME" line followed
+            by "RESOURCE some|full avg10=A avg60=B avg300=C total=USEC" lines.
+
+    Returns:
+        List of (uptime, stalls) tuples in sample order.
+
+    Raises:
+        ValueError: If a line is malformed or appears before the first sample.
+        KeyError: If a line lacks one of the averages or the total.
+    """
+    samples: list[tuple[float, list[PressureStall]]] = []
+    for line in stdout.splitlines():
+        if line.startswith("@@ sample "):
+            samples.append((float(line.split()[2]), []))
+            continue
+        if not line:
+            continue
+
+        resource, kind, *fields = line.split()
+        values = dict(field.split("=", 1) for field in fields)
+        if not samples:
+            raise ValueError(f"Unexpected pressure line before the first sample: {line!r}")
+
+        samples[-1][1].append(
+            PressureStall(
+                resource=resource,
+                kind=kind,
+                avg10=float(values["avg10"]),
+                avg60=float(values["avg60"]),
+                avg300=float(values["avg300"]),
+                total_usec=int(values["total"]),
+            )
+        )
+
+    return samples
+
+
+def _journal_field(value: t.Any) -> str:
+    # journalctl exports binary field values as arrays of byte values
+    if isinstance(value, list):
+        return bytes(value).decode("utf-8", errors="replace")
+    return "" if value is None else str(value)
+
+
+# Longer journal messages are cut on the client with a marker
+MAX_JOURNAL_MESSAGE_CHARS = 4096
+
+
+def _journal_message(value: t.Any) -> str:
+    message = _journal_field(value)
+    if len(message) <= MAX_JOURNAL_MESSAGE_CHARS:
+        return message
+    return f"{message[:MAX_JOURNAL_MESSAGE_CHARS]}... [truncated {len(message) - MAX_JOURNAL_MESSAGE_CHARS} characters]"
+
+
+def iter_journal_json(stdout: str) -> Iterator[tuple[str, str]]:
+    """Parse ``journalctl -o json`` output into cursors and log lines.
+
+    Entries are decoded one line at a time, so callers can stop early or
+    keep only what they need. Lines are rendered like ``-o short-iso`` in
+    UTC: ``TIMESTAMP HOST IDENTIFIER[PID]: MESSAGE``. Messages longer than
+    ``MAX_JOURNAL_MESSAGE_CHARS`` are cut and end with a truncation marker.
+    Lines that are not JSON objects, such as "-- No entries --", are skipped.
+
+    Args:
+        stdout: Raw output from journalctl with one JSON object per line.
+
+    Yields:
+        (cursor, line) tuples in journal order.
+    """
+    for _, cursor, line in iter_journal_records(stdout):
+        yield cursor, line
+
+
+def iter_journal_records(stdout: str) -> Iterator[tuple[int, str, str]]:
+    """Parse ``journalctl -o json`` output like ``iter_journal_json``.
+
+    The entries also carry their realtime timestamp in microseconds, so
+    several journal streams can be merged in time order.
+
+    Args:
+        stdout: Raw output from journalctl with one JSON object per line.
+
+    Yields:
+        (timestamp, cursor, line) tuples in journal order.
+    """
+    start = 0
+    while start < len(stdout):
+        end = stdout.find("\n", start)
+        if end < 0:
+            end = len(stdout)
+        line = stdout[start:end]
+        start = end + 1
+        if not line.startswith("{"):
+            continue
+
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+        realtime = int(entry.get("__REALTIME_TIMESTAMP", 0))
+        timestamp = datetime.fromtimestamp(realtime // 1_000_000, tz=timezone.utc)
+        ident = _journal_field(entry.get("SYSLOG_IDENTIFIER") or entry.get("_COMM")) or "unknown"
+        pid = _journal_field(entry.get("SYSLOG_PID") or entry.get("_PID"))
+        yield (
+            realtime,
+            entry.get("__CURSOR", ""),
+            f"{timestamp:%Y-%m-%dT%H:%M:%S%z} {_journal_field(entry.get('_HOSTNAME'))} "
+            f"{ident}{f'[{pid}]' if pid else ''}: {_journal_message(entry.get('MESSAGE'))}",
+        )
+
+
+def _json_unescape(raw: str) -> str:
+    try:
+        return json.loads(f'"{raw}"')
+    except json.JSONDecodeError:
+        pass
+    # The value may have been cut in the middle of an escape sequence
+    cut = raw[: raw.rfind("\\")]
+    try:
+        return json.loads(f'"{cut}"')
+    except json.JSONDecodeError:
+        return raw
+
+
+def parse_journal_aggregate(stdout: str) -> tuple[int, int, list[JournalGroup]]:
+    """Parse the output of the journal aggregation script.
+
+    Args:
+        stdout: A "T TOTAL UNGROUPED" line followed by tab-separated "G" group
+            lines, each followed by the "S" sample lines of that group.
+
+    Returns:
+        Tuple of (total entries, entries not counted in any group, groups).
+
+    Raises:
+        ValueError: If the output does not start with the totals line or a
+            line is malformed.
+    """
+    lines = iter(stdout.splitlines())
+    marker, total, ungrouped = next(lines, "").split(" ")
+    if marker != "T":
+        raise ValueError("Missing totals in journal aggregate")
+
+    groups: list[JournalGroup] = []
+    for line in lines:
+        kind, *fields = line.split("\t")
+        if kind == "G":
+            start, unit, priority, count = fields
+            groups.append(
+                JournalGroup(
+                    start=datetime.fromtimestamp(int(start), tz=timezone.utc),
+                    unit=_json_unescape(unit),
+                    priority=int(priority) if priority else None,
+                    count=int(count),
+                )
+            )
+        elif kind == "S" and groups:
+            count, message = fields
+            groups[-1].samples.append(MessageSample(message=_json_unescape(message), count=int(count)))
+        else:
+            raise ValueError(f"Unexpected journal aggregate line: {line!r}")
+
+    return int(total), int(ungrouped), groups
+
+
+# Names of the syslog levels 0-7 used by printk
+KERNEL_LEVELS = ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug")
+
+
+def parse_kmsg_records(stdout: str) -> tuple[list[str], int | None]:
+    """Parse ``/dev/kmsg`` records into dmesg-style lines.
+
+    Each record is parsed from its raw form
+    ``PRIORITY,SEQUENCE,MICROSECONDS,FLAGS;MESSAGE`` in a single pass and
+    rendered as ``[SECONDS.MICROSECONDS] LEVEL: MESSAGE``. Indented
+    dictionary lines and malformed records are skipped.
+
+    Args:
+        stdout: Raw records, one per line.
+
+    Returns:
+        Tuple of (lines, sequence) where sequence is the sequence number of
+        the last record, or None if there were no records.
+    """
+    lines = []
+    sequence = None
+    for record in stdout.splitlines():
+        header, separator, message = record.partition(";")
+        fields = header.split(",", 3)
+        if not separator or len(fields) < 3 or not all(field.isdigit() for field in fields[:3]):
+            continue
+
+        level = KERNEL_LEVELS[int(fields[0]) & 7]
+        seconds, microseconds = divmod(int(fields[2]), 1_000_000)
+        lines.append(f"[{seconds:5d}.{microseconds:06d}] {level}: {message}")
+        sequence = int(fields[1])
+
+    return lines, sequence
+
+
+def iter_directory_listing(
     stdout: str,
     sort_by: str,
-) -> list[NodeEntry]:
-    """Parse directory listing output into NodeEntry objects.
+) -> Iterator[ListingRow]:
+    """Parse directory listing output into lightweight rows.
+
+    Rows are produced lazily so callers that only need a few entries, such as
+    a top-N selection, never build a model object for every directory.
 
     Args:
         stdout: Raw output from find/du command.
         sort_by: Sort field - "size", "name", or "modified".
 
-    Returns:
-        List of NodeEntry objects.
+    Yields:
+        (size, modified, name) tuples.
     """
-    entries = []
     lines = stdout.strip().split("\n")
     last = len(lines)
 
@@ -481,45 +1143,39 @@ def parse_directory_listing(
         if sort_by == "size":
             # Format: SIZE\tNAME (from du -b)
             size, path = line.split("\t", 1)
-            size = int(size)
-            path = Path(path)
             # Omit the last line since it containers the parent directory
             if idx < last:
-                entries.append(NodeEntry(size=size, name=path.name))
+                yield int(size), 0.0, Path(path).name
         elif sort_by == "modified":
             # Format: TIMESTAMP\tNAME (from find -printf "%T@\t%f\n")
             parts = line.split("\t", 1)
             if len(parts) == 2:
                 try:
-                    modified = float(parts[0])
-                    name = parts[1]
-                    entries.append(NodeEntry(modified=modified, name=name))
+                    yield 0, float(parts[0]), parts[1]
                 except ValueError:
                     continue
         else:
             # Format: NAME (from find -printf "%f\n")
-            entries.append(NodeEntry(name=line.strip()))
-
-    return entries
+            yield 0, 0.0, line.strip()
 
 
-def parse_file_listing(
+def iter_file_listing(
     stdout: str,
     sort_by: str,
-) -> list[NodeEntry]:
-    """Parse file listing output into NodeEntry objects.
+) -> Iterator[ListingRow]:
+    """Parse file listing output into lightweight rows.
+
+    Rows are produced lazily so callers that only need a few entries, such as
+    a top-N selection, never build a model object for every file.
 
     Args:
         stdout: Raw output from find command.
         sort_by: Sort field - "size", "name", or "modified".
 
-    Returns:
-        List of NodeEntry objects.
+    Yields:
+        (size, modified, name) tuples.
     """
-    entries = []
-    lines = stdout.strip().split("\n")
-
-    for line in lines:
+    for line in stdout.strip().split("\n"):
         if not line.strip():
             continue
 
@@ -528,9 +1184,7 @@ def parse_file_listing(
             parts = line.split("\t", 1)
             if len(parts) == 2:
                 try:
-                    size = int(parts[0])
-                    name = parts[1]
-                    entries.append(NodeEntry(size=size, name=name))
+                    yield int(parts[0]), 0.0, parts[1]
                 except ValueError:
                     continue
         elif sort_by == "modified":
@@ -538,13 +1192,213 @@ def parse_file_listing(
             parts = line.split("\t", 1)
             if len(parts) == 2:
                 try:
-                    modified = float(parts[0])
-                    name = parts[1]
-                    entries.append(NodeEntry(modified=modified, name=name))
+                    yield 0, float(parts[0]), parts[1]
                 except ValueError:
                     continue
         else:
             # Format: NAME (from find -printf "%f\n")
-            entries.append(NodeEntry(name=line.strip()))
+            yield 0, 0.0, line.strip()
+
+
+def parse_directory_listing(
+    stdout: str,
+    sort_by: str,
+) -> list[NodeEntry]:
+    """Parse directory listing output into NodeEntry objects.
+
+    Args:
+        stdout: Raw output from find/du command.
+        sort_by: Sort field - "size", "name", or "modified".
+
+    Returns:
+        List of NodeEntry objects.
+    """
+    return [
+        NodeEntry(size=size, modified=modified, name=name)
+        for size, modified, name in iter_directory_listing(stdout, sort_by)
+    ]
+
+
+def parse_file_listing(
+    stdout: str,
+    sort_by: str,
+) -> list[NodeEntry]:
+    """Parse file listing output into NodeEntry objects.
+
+    Args:
+        stdout: Raw output from find command.
+        sort_by: Sort field - "size", "name", or "modified".
+
+    Returns:
+        List of NodeEntry objects.
+    """
+    return [
+        NodeEntry(size=size, modified=modified, name=name)
+        for size, modified, name in iter_file_listing(stdout, sort_by)
+    ]
+
+
+def parse_largest_files(stdout: str) -> tuple[list[ListingRow], int, int | None]:
+    """Parse the output of the find_largest_files command.
+
+    Entries have the form SIZE\\tTIMESTAMP\\tPATH. The target-side script adds
+    a "scanned" line with the number of entries it walked and a "status" line
+    with find's exit code. The plain find fallback has neither.
+
+    Args:
+        stdout: Raw output from the find_largest_files command.
+
+    Returns:
+        Tuple of (rows, scanned, status). When the trailer is missing, scanned
+        is the number of rows and status is None.
+    """
+    rows = []
+    scanned = None
+    status = None
+
+    for line in stdout.splitlines():
+        parts = line.split("\t", 2)
+        if len(parts) == 2 and parts[0] in ("scanned", "status"):
+            try:
+                value = int(parts[1])
+            except ValueError:
+                continue
+            if parts[0] == "scanned":
+                scanned = value
+            else:
+                status = value
+        elif len(parts) == 3:
+            try:
+                rows.append((int(parts[0]), float(parts[1]), parts[2]))
+            except ValueError:
+                continue
+
+    return rows, len(rows) if scanned is None else scanned, status
+
+
+def parse_directory_scan(stdout: str) -> DirectoryScan:
+    """Parse the output of the directory_index commands.
+
+    A file with several links found in more than one directory is assigned to
+    the directory with the smallest path, so it is counted once whichever
+    walker saw it first.
+
+    Args:
+        stdout: "t\tTIME", "d\tSIZE\tMTIME\tPATH", "s\tSIZE\tMTIME\tPATH",
+            "c\tPATH" and "l\tDEV:INODE\tSIZE\tDIRECTORY" lines.
+
+    Returns:
+        DirectoryScan with the parsed lines. Malformed lines are skipped.
+    """
+    scan = DirectoryScan(started=None, directories={}, summaries={}, children=set(), links={})
+    for line in stdout.splitlines():
+        kind, _, rest = line.partition("\t")
+        try:
+            if kind == "t":
+                scan = scan._replace(started=float(rest))
+            elif kind == "c":
+                scan.children.add(rest)
+            elif kind in ("d", "s", "l"):
+                first, second, path = rest.split("\t", 2)
+                if kind == "l":
+                    link = (path, int(second))
+                    scan.links[first] = min(scan.links.get(first, link), link)
+                else:
+                    sizes = scan.directories if kind == "d" else scan.summaries
+                    sizes[path] = (int(first), float(second))
+        except ValueError:
+            continue
+
+    return scan
+
+
+def parse_read_file_output(stdout: bytes) -> tuple[int, int, str, bytes]:
+    """Split the output of the read_file command.
+
+    Args:
+        stdout: Raw output starting with a "SIZE OFFSET FINGERPRINT" header line.
+
+    Returns:
+        Tuple of (file size, start offset, fingerprint, data). The fingerprint
+        is empty for files that have none, reported as "-".
+
+    Raises:
+        ValueError: If the header line is missing or malformed.
+    """
+    header, _, data = stdout.partition(b"\n")
+    size, offset, fingerprint = header.decode("ascii").split()
+    return int(size), int(offset), "" if fingerprint == "-" else fingerprint, data
 
-    return entries
+
+def parse_log_file_output(stdout: bytes) -> tuple[str, list[LogSegment]]:
+    """Split the output of the read_log_file command.
+
+    Args:
+        stdout: Raw output with a fingerprint line followed by segments, each
+            with a "KIND INODE START END" header line.
+
+    Returns:
+        Tuple of (fingerprint, segments). Segments are empty when the
+        fingerprint matched the one passed to the command.
+
+    Raises:
+        ValueError: If a segment header is malformed or a rotated segment is
+            shorter than its header says.
+    """
+    fingerprint, _, rest = stdout.partition(b"\n")
+    segments = []
+    while rest:
+        header, _, rest = rest.partition(b"\n")
+        kind, inode, start, end = header.decode("ascii").split()
+        if kind == "R":
+            length = int(end) - int(start)
+            if len(rest) < length:
+                raise ValueError("Rotated log segment is truncated")
+            data, rest = rest[:length], rest[length:]
+        elif kind == "C":
+            data, rest = rest, b""
+        else:
+            raise ValueError(f"Unknown log segment kind: {kind}")
+
+        segments.append(LogSegment(kind == "R", int(inode), int(start), int(end), data))
+
+    return fingerprint.decode("ascii", errors="replace"), segments
+
+
+def parse_log_matches_output(stdout: bytes) -> tuple[str, list[LogMatches]]:
+    """Split the output of the read_log_file command run with a pattern.
+
+    Args:
+        stdout: Raw output with a fingerprint line followed by segments, each
+            with a "KIND INODE START END" header line, a "M MATCHES CONSUMED
+            COUNT" line and COUNT matching lines.
+
+    Returns:
+        Tuple of (fingerprint, segments). Segments are empty when the
+        fingerprint matched the one passed to the command.
+
+    Raises:
+        ValueError: If a header is malformed or a segment has fewer lines
+            than its header says.
+    """
+    fingerprint, _, rest = stdout.partition(b"\n")
+    segments = []
+    while rest:
+        header, _, rest = rest.partition(b"\n")
+        kind, inode, start, end = header.decode("ascii").split()
+        if kind not in ("R", "C"):
+            raise ValueError(f"Unknown log segment kind: {kind}")
+
+        summary, _, rest = rest.partition(b"\n")
+        marker, matches, consumed, count = summary.decode("ascii").split()
+        if marker != "M":
+            raise ValueError("Missing match summary in log segment")
+
+        lines = rest.split(b"\n", int(count))
+        if len(lines) <= int(count):
+            raise ValueError("Log segment has fewer lines than its match summary")
+        rest = lines.pop()
+
+        segments.append(LogMatches(kind == "R", int(inode), int(start), int(end), int(matches), int(consumed), lines))
+
+    return fingerprint.decode("ascii", errors="replace"), segments
@@ -1,8 +1,10 @@
 """Core MCP server for Linux diagnostics using FastMCP."""
 
 import logging
+import os
 import sys
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from importlib import resources
 from pathlib import Path
@@ -13,6 +15,7 @@ from fastmcp.exceptions import NotFoundError
 from fastmcp.resources import ResourceContent
 from fastmcp.resources import ResourceResult
 from fastmcp.server.dependencies import get_access_token
+from fastmcp.server.lifespan import lifespan
 from fastmcp.server.middleware import Middleware
 from fastmcp.server.middleware import MiddlewareContext
 from fastmcp.server.middleware.middleware import CallNext
@@ -25,6 +28,7 @@ import linux_mcp_server
 from linux_mcp_server.auth import create_auth_provider
 from linux_mcp_server.auth_policy import evaluate_policy
 from linux_mcp_server.auth_policy import PolicyAction
+from linux_mcp_server.auth_policy import SSHKeyConfig
 from linux_mcp_server.config import CONFIG
 from linux_mcp_server.config import Toolset
 from linux_mcp_server.config import Transport
@@ -34,8 +38,10 @@ from linux_mcp_server.mcp_app import hide_app_tools_for_client
 from linux_mcp_server.mcp_app import MCP_APP_MIME_TYPE
 from linux_mcp_server.mcp_app import RUN_SCRIPT_APP_URI
 from linux_mcp_server.mcp_app import use_mcp_app_for_client
+from linux_mcp_server.metrics_collector import get_collector
 from linux_mcp_server.toolset import get_toolset
 from linux_mcp_server.toolset import Toolset as ToolsetInfo
+from linux_mcp_server.utils.decorators import CONTAINER_ENV_VARS
 
 
 def monkeypatch_fastmcp_for_app_visibility():
@@ -190,7 +196,67 @@ _check_gatekeeper_model()
 # Create auth provider if configured
 auth_provider = create_auth_provider()
 
-mcp = FastMCP("linux-mcp-server", version=linux_mcp_server.__version__, auth=auth_provider)
+
+def _policy_execution_context(action: PolicyAction, ssh_key_config: SSHKeyConfig | None) -> ExecutionContext:
+    """Return the ExecutionContext granted by a policy action other than DENY."""
+    match action:
+        case PolicyAction.LOCAL:
+            return ExecutionContext(allow_local=True)
+        case PolicyAction.SSH_DEFAULT:
+            return ExecutionContext(allow_ssh_default=True)
+        case PolicyAction.SSH_KEY:
+            if not ssh_key_config:
+                raise RuntimeError("Policy validation error: SSH_KEY action requires ssh_key configuration.")
+            logger.debug(f"SSH key override: path={ssh_key_config.path}, user={ssh_key_config.user}")
+            return ExecutionContext(
+                ssh_key_path=Path(ssh_key_config.path),
+                ssh_key_user=ssh_key_config.user,
+            )
+        case _:  # pragma: no cover
+            raise RuntimeError(f"Unexpected policy action: {action}")
+
+
+async def _collector_contexts(server: FastMCP, hosts: Iterable[str | None]) -> dict[str | None, ExecutionContext]:
+    """Return the ExecutionContext of every collector host that may be sampled.
+
+    Samples are served by get_metrics_history, so hosts are authorized like
+    calls of that tool. The collector acts for no user in particular, so only
+    rules for all users apply. Like the tools, the local system is never
+    sampled in a container.
+    """
+    tool = await server.get_tool("get_metrics_history")
+    contexts: dict[str | None, ExecutionContext] = {}
+    for host in hosts:
+        if host is None and os.environ.get("container") in CONTAINER_ENV_VARS:
+            continue
+
+        if CONFIG.transport == Transport.stdio and CONFIG.policy_path is None:
+            contexts[host] = ExecutionContext(allow_local=True, allow_ssh_default=True)
+        elif tool is not None:
+            action, ssh_key_config = evaluate_policy(tool, host, {})
+            if action != PolicyAction.DENY:
+                contexts[host] = _policy_execution_context(action, ssh_key_config)
+
+    return contexts
+
+
+@lifespan
+async def metrics_collector_lifespan(server: FastMCP):
+    """Sample the configured hosts in the background while the server runs."""
+    collector = get_collector()
+    collector.start(await _collector_contexts(server, collector.buffers))
+    try:
+        yield {}
+    finally:
+        await collector.stop()
+
+
+mcp = FastMCP(
+    "linux-mcp-server",
+    version=linux_mcp_server.__version__,
+    auth=auth_provider,
+    lifespan=metrics_collector_lifespan,
+)
 
 
 @mcp.resource(
@@ -303,25 +369,8 @@ class AuthorizationMiddleware(Middleware):
         # Log the authorized action
         log_level(f"Authorized: tool={tool.name}, host={target_host or 'local'}, action={action.value}, user={email}")
 
-        # Build ExecutionContext based on policy action
-        match action:
-            case PolicyAction.LOCAL:
-                exec_context = ExecutionContext(allow_local=True)
-            case PolicyAction.SSH_DEFAULT:
-                exec_context = ExecutionContext(allow_ssh_default=True)
-            case PolicyAction.SSH_KEY:
-                if not ssh_key_config:
-                    raise RuntimeError("Policy validation error: SSH_KEY action requires ssh_key configuration.")
-                logger.debug(f"SSH key override: path={ssh_key_config.path}, user={ssh_key_config.user}")
-                exec_context = ExecutionContext(
-                    ssh_key_path=Path(ssh_key_config.path),
-                    ssh_key_user=ssh_key_config.user,
-                )
-            case _:  # pragma: no cover
-                raise RuntimeError(f"Unexpected policy action: {action}")
-
-        # Execute with the appropriate ExecutionContext
-        with use_execution_context(exec_context):
+        # Execute with the ExecutionContext of the policy action
+        with use_execution_context(_policy_execution_context(action, ssh_key_config)):
             return await call_next(context)
 
 
@@ -0,0 +1,304 @@
+"""Cached, incrementally refreshed directory size index.
+
+``du`` walks every file under a directory on each call, which takes minutes
+on large volumes. The index walks a root once, optionally with one process
+per first-level subdirectory, and stores for every directory under it its
+own apparent size (the directory entry plus the files directly inside it)
+and its mtime. Sizes of the root's children are sums of own sizes.
+
+Within ``CONFIG.directory_index_ttl`` seconds of the last check, queries are
+answered from the index without touching the target. After that, the target
+lists only the directories whose mtime or ctime changed since the last walk
+started, by its own clock, and rescans just those. New, removed and renamed
+entries change the mtime of their directory, so an unchanged tree costs one
+walk over the directories and no transfer beyond a timestamp.
+
+A file that grows in place does not change its directory, so the whole tree
+is walked again once it is ``CONFIG.directory_index_max_age`` seconds old.
+Files with several hard links are counted once, like ``du``.
+
+Trees with more than ``MAX_INDEXED_DIRECTORIES`` directories are folded:
+directories below the deepest level that fits are summed into their
+ancestor at that level, which keeps the total of its subtree and is walked
+in full when anything below it changes.
+
+The index is off unless ``CONFIG.directory_size_index`` is set.
+"""
+
+import asyncio
+import posixpath
+import time
+
+from collections import Counter
+from collections import defaultdict
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from fastmcp.exceptions import ToolError
+
+from linux_mcp_server.commands import get_command
+from linux_mcp_server.config import CONFIG
+from linux_mcp_server.execution_context import get_execution_context
+from linux_mcp_server.parsers import DirectoryScan
+from linux_mcp_server.parsers import ListingRow
+from linux_mcp_server.parsers import parse_directory_scan
+
+
+# Number of roots kept in the index; the least recently used is evicted
+MAX_INDEXED_TREES = 16
+
+# Trees with more directories than this keep only subtree totals below the
+# deepest level that fits
+MAX_INDEXED_DIRECTORIES = 500_000
+
+# Walk the whole tree again instead of walking more new subdirectories than this
+MAX_NEW_SUBTREES = 32
+
+# Filesystem timestamps come from a coarse clock that can lag the one date
+# reads, so changes are looked for from slightly before the walk started
+CLOCK_SLACK = 1.0
+
+IndexKey = tuple[str, str, str, str]
+
+
+@dataclass
+class DirectoryTree:
+    """Own size and mtime of every directory under a root.
+
+    ``links`` maps the device and inode of files with several hard links to
+    the directory they are counted in and their size. When ``depth`` is set,
+    directories that many levels below the root hold the total size of their
+    subtree, which is not indexed further. ``since`` is the target's clock
+    from which changes are looked for.
+    """
+
+    root: str
+    since: float | None = None
+    directories: dict[str, tuple[int, float]] = field(default_factory=dict)
+    links: dict[str, tuple[str, int]] = field(default_factory=dict)
+    depth: int | None = None
+    built_at: float = field(default_factory=time.monotonic)
+    checked_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def _prefix(self) -> str:
+        return self.root.rstrip("/") + "/"
+
+    def _depth(self, path: str) -> int:
+        return 0 if path == self.root else path[len(self._prefix) :].count("/") + 1
+
+    def child_rows(self) -> list[ListingRow]:
+        """Return (size, modified, name) rows for the direct children of the root."""
+        prefix = self._prefix
+        own_sizes = [(path, size) for path, (size, _) in self.directories.items()]
+        own_sizes.extend(self.links.values())
+
+        sizes: defaultdict[str, int] = defaultdict(int)
+        for path, size in own_sizes:
+            if path != self.root and path.startswith(prefix):
+                sizes[path[len(prefix) :].split("/", 1)[0]] += size
+
+        return [(size, self.directories.get(prefix + name, (0, 0.0))[1], name) for name, size in sizes.items()]
+
+    def merge(self, scan: DirectoryScan) -> None:
+        """Add the directories and links of a walk below the root."""
+        self.directories.update(scan.directories)
+        self.directories.update(scan.summaries)
+        for key, link in scan.links.items():
+            self.links[key] = min(self.links.get(key, link), link)
+
+    def apply(self, scan: DirectoryScan) -> list[str]:
+        """Replace what the rescanned directories held with the scan results.
+
+        Subdirectories that a rescanned directory no longer lists are dropped
+        with everything below them, and a rescanned summary replaces its
+        whole subtree.
+
+        Returns:
+            Subdirectories listed by the scan that are not indexed yet, such
+            as directories moved in from elsewhere, which need a full walk.
+        """
+        vanished = {
+            path
+            for path in self.directories
+            if path != self.root and posixpath.dirname(path) in scan.directories and path not in scan.children
+        }
+        below = tuple(path.rstrip("/") + "/" for path in (*vanished, *scan.summaries))
+        replaced = scan.directories.keys() | scan.summaries.keys()
+
+        self.directories = {
+            path: entry
+            for path, entry in self.directories.items()
+            if path not in vanished and not path.startswith(below)
+        }
+        self.links = {
+            key: (path, size)
+            for key, (path, size) in self.links.items()
+            if path not in vanished and path not in replaced and not path.startswith(below)
+        }
+        self.merge(scan)
+
+        return sorted(child for child in scan.children if child not in self.directories)
+
+    def fold(self, depth: int) -> None:
+        """Sum directories deeper than depth into their ancestor at that depth."""
+        prefix = self._prefix
+
+        def ancestor(path: str) -> str:
+            if self._depth(path) <= depth:
+                return path
+            return prefix + "/".join(path[len(prefix) :].split("/")[:depth])
+
+        directories: dict[str, tuple[int, float]] = {}
+        extra: defaultdict[str, int] = defaultdict(int)
+        for path, entry in self.directories.items():
+            top = ancestor(path)
+            if top == path:
+                directories[path] = entry
+            else:
+                extra[top] += entry[0]
+        for path, size in extra.items():
+            own, mtime = directories.get(path, (0, 0.0))
+            directories[path] = (own + size, mtime)
+
+        self.directories = directories
+        self.links = {key: (ancestor(path), size) for key, (path, size) in self.links.items()}
+        self.depth = depth if self.depth is None else min(self.depth, depth)
+
+    def fit(self, limit: int) -> None:
+        """Fold the tree to the deepest level at which it holds at most limit directories."""
+        if len(self.directories) <= limit:
+            return
+
+        counts = Counter(self._depth(path) for path in self.directories)
+        depth = total = 0
+        for level in sorted(counts):
+            total += counts[level]
+            if total > limit:
+                break
+            depth = level
+        # The root and its children are always kept
+        self.fold(max(depth, 1))
+
+
+class DirectorySizeIndex:
+    """Per-host cache of directory trees used by list_directories."""
+
+    def __init__(self) -> None:
+        self._trees: OrderedDict[IndexKey, DirectoryTree] = OrderedDict()
+        self._locks: defaultdict[IndexKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def clear(self) -> None:
+        """Drop every cached tree."""
+        self._trees.clear()
+        self._locks.clear()
+
+    @staticmethod
+    def _key(host: str | None, path: Path) -> IndexKey:
+        # Different SSH identities may see different parts of the same tree
+        context = get_execution_context()
+        user = (context.ssh_key_user or "") if context else ""
+        key_path = str(context.ssh_key_path or "") if context else ""
+        return host or "", user, key_path, str(path)
+
+    async def child_sizes(
+        self,
+        path: Path,
+        host: str | None = None,
+        refresh: bool = False,
+    ) -> tuple[list[ListingRow], float]:
+        """Return rows for the direct children of path and the index age.
+
+        Args:
+            path: Directory whose children are sized.
+            host: Optional remote host address.
+            refresh: Walk the whole tree again instead of rescanning changes.
+
+        Returns:
+            Tuple of (rows, age) where age is the number of seconds since the
+            sizes were last checked against the target.
+
+        Raises:
+            ToolError: If the directory cannot be scanned.
+        """
+        key = self._key(host, path)
+        async with self._locks[key]:
+            tree = self._trees.get(key)
+            now = time.monotonic()
+            if tree is None or refresh or now - tree.built_at >= CONFIG.directory_index_max_age:
+                tree = await self._build(path, host)
+            elif now - tree.checked_at >= CONFIG.directory_index_ttl:
+                tree = await self._update(tree, host)
+            else:
+                self._trees.move_to_end(key)
+                return tree.child_rows(), now - tree.checked_at
+
+            self._store(key, tree)
+            return tree.child_rows(), 0.0
+
+    def _store(self, key: IndexKey, tree: DirectoryTree) -> None:
+        self._trees[key] = tree
+        self._trees.move_to_end(key)
+        while len(self._trees) > MAX_INDEXED_TREES:
+            evicted, _ = self._trees.popitem(last=False)
+            self._locks.pop(evicted, None)
+
+    async def _build(self, path: Path, host: str | None) -> DirectoryTree:
+        checked_at = time.monotonic()
+        returncode, stdout, stderr = await get_command("directory_index").run(
+            host=host, jobs=CONFIG.directory_scan_jobs, path=path
+        )
+        scan = parse_directory_scan(stdout)
+        # find exits with code 1 for unreadable subdirectories, which still leaves valid results
+        if returncode != 0 and not scan.directories:
+            raise ToolError(f"Error running command: command failed with return code {returncode}: {stderr}")
+
+        tree = DirectoryTree(
+            root=str(path),
+            since=None if scan.started is None else scan.started - CLOCK_SLACK,
+            built_at=checked_at,
+            checked_at=checked_at,
+        )
+        tree.merge(scan)
+        tree.fit(MAX_INDEXED_DIRECTORIES)
+        return tree
+
+    async def _update(self, tree: DirectoryTree, host: str | None) -> DirectoryTree:
+        if tree.since is None:
+            return await self._build(Path(tree.root), host)
+
+        checked_at = time.monotonic()
+        returncode, stdout, _ = await get_command("directory_index", "changes").run(
+            host=host, since=f"{tree.since:.6f}", depth=tree.depth or 0, path=tree.root
+        )
+        scan = parse_directory_scan(stdout)
+        # The root is gone or the check could not run; a new walk reports why
+        if returncode != 0 or scan.started is None:
+            return await self._build(Path(tree.root), host)
+
+        missing = tree.apply(scan)
+        if len(missing) > MAX_NEW_SUBTREES:
+            return await self._build(Path(tree.root), host)
+
+        results = await asyncio.gather(
+            *(get_command("directory_index").run(host=host, jobs=1, path=child) for child in missing)
+        )
+        for _, stdout, _ in results:
+            tree.merge(parse_directory_scan(stdout))
+        if missing and tree.depth is not None:
+            tree.fold(tree.depth)
+        tree.fit(MAX_INDEXED_DIRECTORIES)
+
+        tree.since = scan.started - CLOCK_SLACK
+        tree.checked_at = checked_at
+        return tree
+
+
+_directory_index = DirectorySizeIndex()
+
+
+def get_directory_index() -> DirectorySizeIndex:
+    """Return the process-wide directory size index."""
+    return _directory_index
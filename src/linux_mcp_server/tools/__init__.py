@@ -1,6 +1,7 @@
 # Arbitrary script execution
 # logs
 from linux_mcp_server.tools.logs import get_journal_logs
+from linux_mcp_server.tools.logs import get_kernel_logs
 from linux_mcp_server.tools.logs import read_log_file
 
 # network
@@ -21,10 +22,14 @@ from linux_mcp_server.tools.run_script import validate_script
 
 # services
 from linux_mcp_server.tools.services import get_service_logs
+from linux_mcp_server.tools.services import get_service_states
 from linux_mcp_server.tools.services import get_service_status
+from linux_mcp_server.tools.services import get_triage_summary
+from linux_mcp_server.tools.services import get_unit_resources
 from linux_mcp_server.tools.services import list_services
 
 # storage
+from linux_mcp_server.tools.storage import find_largest_files
 from linux_mcp_server.tools.storage import list_block_devices
 from linux_mcp_server.tools.storage import list_directories
 from linux_mcp_server.tools.storage import list_files
@@ -35,24 +40,35 @@ from linux_mcp_server.tools.system_info import get_cpu_information
 from linux_mcp_server.tools.system_info import get_disk_usage
 from linux_mcp_server.tools.system_info import get_hardware_information
 from linux_mcp_server.tools.system_info import get_memory_information
+from linux_mcp_server.tools.system_info import get_metrics_history
+from linux_mcp_server.tools.system_info import get_pressure_information
+from linux_mcp_server.tools.system_info import get_system_activity
 from linux_mcp_server.tools.system_info import get_system_information
 
 
 __all__ = [
     "execute_script",
+    "find_largest_files",
     "get_cpu_information",
     "get_disk_usage",
     "get_execution_details",
     "get_hardware_information",
     "get_journal_logs",
+    "get_kernel_logs",
     "get_listening_ports",
     "get_memory_information",
+    "get_metrics_history",
     "get_network_connections",
     "get_network_interfaces",
+    "get_pressure_information",
     "get_process_info",
     "get_service_logs",
+    "get_service_states",
     "get_service_status",
+    "get_system_activity",
     "get_system_information",
+    "get_triage_summary",
+    "get_unit_resources",
     "list_block_devices",
     "list_directories",
     "list_files",
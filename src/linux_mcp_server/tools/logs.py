@@ -7,20 +7,41 @@ from pathlib import Path
 from fastmcp.exceptions import ToolError
 from mcp.types import ToolAnnotations
 from pydantic import Field
+from pydantic.functional_validators import AfterValidator
 from pydantic.functional_validators import BeforeValidator
 
 from linux_mcp_server.audit import log_tool_call
 from linux_mcp_server.commands import get_command
 from linux_mcp_server.config import CONFIG
+from linux_mcp_server.log_templates import compact_log_entries
 from linux_mcp_server.models import LogEntries
+from linux_mcp_server.parsers import iter_journal_json
+from linux_mcp_server.parsers import LogSegment
+from linux_mcp_server.parsers import parse_journal_aggregate
+from linux_mcp_server.parsers import parse_kmsg_records
+from linux_mcp_server.parsers import parse_log_file_output
+from linux_mcp_server.parsers import parse_log_matches_output
 from linux_mcp_server.server import mcp
 from linux_mcp_server.utils import StrEnum
 from linux_mcp_server.utils.decorators import disallow_local_execution_in_containers
 from linux_mcp_server.utils.types import Host
-from linux_mcp_server.utils.validation import is_empty_output
+from linux_mcp_server.utils.validation import validate_log_pattern
 from linux_mcp_server.utils.validation import validate_path
 
 
+# Cursor returned and accepted by read_log_file, "INODE:OFFSET"
+LOG_CURSOR_PATTERN = r"^\d+:\d+$"
+
+# Fingerprint returned and accepted by read_log_file, "INODE-SIZE-MTIME"
+LOG_FINGERPRINT_PATTERN = r"^\d+-\d+--?\d+$"
+
+# Journal cursor as printed by journalctl, e.g. "s=...;i=...;b=...;m=...;t=...;x=..."
+JOURNAL_CURSOR_PATTERN = r"^[a-z]=[0-9a-f]+(;[a-z]=[0-9a-f]+)*$"
+
+# Kernel log cursor, the sequence number of the last /dev/kmsg record returned
+KERNEL_CURSOR_PATTERN = r"^\d+$"
+
+
 class Transport(StrEnum):
     """Valid journalctl transport types for filtering journal entries.
 
@@ -49,6 +70,7 @@ async def _get_journal_logs(
     priority: str | None = None,
     since: str | None = None,
     transport: Transport | None = None,
+    cursor: str | None = None,
 ) -> tuple[int, str, str]:
     """Execute journalctl command with optional filters.
 
@@ -59,6 +81,7 @@ async def _get_journal_logs(
         priority: Filter by priority level.
         since: Filter entries since specified time.
         transport: Filter by journal transport.
+        cursor: Only retrieve entries after this journal cursor.
 
     Returns:
         Tuple of (returncode, stdout, stderr) from the command execution.
@@ -75,6 +98,7 @@ async def _get_journal_logs(
         priority=priority,
         since=since,
         transport=transport,
+        cursor=cursor,
     )
 
 
@@ -112,7 +136,45 @@ async def get_journal_logs(
         Transport | None,
         "Filter by journal transport (e.g., 'audit' for audit logs, 'kernel' for kernel messages, 'syslog' for syslog messages)",
     ] = None,
-    lines: t.Annotated[int, Field(description="Number of log lines to retrieve. Default: 100", ge=1, le=10_000)] = 100,
+    lines: t.Annotated[
+        int,
+        Field(
+            description="Number of entries to retrieve: the newest entries, or with a cursor the oldest entries "
+            "after it. Default: 100",
+            ge=1,
+            le=10_000,
+        ),
+    ] = 100,
+    cursor: t.Annotated[
+        str | None,
+        Field(
+            description="Cursor returned by an earlier call. Only entries after it are returned, so repeated "
+            "calls page forward through the journal without overlap.",
+            pattern=JOURNAL_CURSOR_PATTERN,
+        ),
+    ] = None,
+    aggregate_seconds: t.Annotated[
+        int | None,
+        Field(
+            description="Instead of entries, count the matching entries per time bucket of this many seconds, "
+            "systemd unit and priority. Counts cover every entry matching the filters, not only the last lines, "
+            "so combine with since.",
+            examples=[60, 300, 3600],
+            ge=1,
+            le=31 * 24 * 3600,
+        ),
+    ] = None,
+    top_messages: t.Annotated[
+        int,
+        Field(description="Number of most frequent messages to sample per group when aggregating", ge=0, le=20),
+    ] = 3,
+    compact: t.Annotated[
+        bool,
+        Field(
+            description="Return message templates with counts, first and last timestamps and a few examples "
+            "instead of the raw lines. Variable parts such as numbers are shown as <*>."
+        ),
+    ] = False,
     host: Host = None,
 ) -> LogEntries:
     """Get systemd journal logs.
@@ -121,49 +183,227 @@ async def get_journal_logs(
     priority level, time range, and transport. Returns timestamped log messages.
 
     To get audit logs, use transport='audit'.
+
+    Every result carries the cursor of its last entry. Pass it back with the
+    same filters to continue after it.
+
+    Set aggregate_seconds to learn which units log what and when without
+    transferring the entries: they are counted on the target and only the
+    groups, each with a few sample messages, are returned. Set compact to
+    summarize repetitive entries as templates.
     """
+    if aggregate_seconds is not None:
+        return await _aggregate_journal_logs(
+            aggregate_seconds,
+            top_messages,
+            host=host,
+            unit=unit,
+            priority=priority,
+            since=since,
+            transport=transport,
+            cursor=cursor,
+        )
+
     returncode, stdout, stderr = await _get_journal_logs(
-        lines=lines, host=host, unit=unit, priority=priority, since=since, transport=transport
+        lines=lines, host=host, unit=unit, priority=priority, since=since, transport=transport, cursor=cursor
     )
 
     if returncode != 0:
         raise ToolError(f"Error reading journal logs: {stderr}")
 
-    if is_empty_output(stdout):
-        raise ToolError("No journal entries found matching the criteria.")
+    entries = []
+    last_cursor = cursor
+    for entry_cursor, line in iter_journal_json(stdout):
+        entries.append(line)
+        last_cursor = entry_cursor or last_cursor
 
-    entries = [line for line in stdout.strip().splitlines() if line]
+    # Reaching the end of the journal is not an error when paging
+    if not entries and cursor is None:
+        raise ToolError("No journal entries found matching the criteria.")
 
-    return LogEntries(
+    result = LogEntries(
         entries=entries,
         unit=unit,
+        cursor=last_cursor,
     )
+    return compact_log_entries(result) if compact else result
+
+
+async def _aggregate_journal_logs(
+    bucket: int,
+    samples: int,
+    host: Host | None = None,
+    unit: str | None = None,
+    priority: str | None = None,
+    since: str | None = None,
+    transport: Transport | None = None,
+    cursor: str | None = None,
+) -> LogEntries:
+    """Count journal entries on the target by time bucket, unit and priority.
+
+    Raises:
+        ToolError: If journalctl fails or its output cannot be parsed.
+    """
+    cmd = get_command("journal_logs", "aggregate")
+    returncode, stdout, stderr = await cmd.run(
+        host=host,
+        bucket=bucket,
+        samples=samples,
+        unit=unit,
+        priority=priority,
+        since=since,
+        transport=transport,
+        cursor=cursor,
+    )
+
+    if returncode != 0:
+        raise ToolError(f"Error reading journal logs: {stderr}")
+
+    try:
+        total, ungrouped, groups = parse_journal_aggregate(stdout)
+    except ValueError:
+        raise ToolError("Unexpected output aggregating journal logs") from None
+
+    groups.sort(key=lambda group: (group.start, -group.count, group.unit))
+    return LogEntries(entries=[], unit=unit or "", matches=total, groups=groups, ungrouped=ungrouped)
 
 
 @mcp.tool(
-    title="Read log file",
-    description="Read a specific log file.",
-    tags={"fixed", "files", "logs", "troubleshooting"},
+    title="Get kernel logs",
+    description="Get kernel log buffer messages (dmesg), optionally only those newer than a cursor.",
+    tags={"fixed", "kernel", "logs", "troubleshooting"},
     annotations=ToolAnnotations(readOnlyHint=True),
 )
 @log_tool_call
 @disallow_local_execution_in_containers
-async def read_log_file(
-    log_path: t.Annotated[
-        Path,
-        BeforeValidator(validate_path),
+async def get_kernel_logs(
+    level: t.Annotated[
+        int,
         Field(
-            description="Absolute path to the log file (must be in allowed list)",
-            examples=["/var/log/messages", "/var/log/secure", "/var/log/audit/audit.log", "/var/log/dnf.log"],
+            description="Only return messages of this syslog level or more severe: 0 emerg, 1 alert, 2 crit, "
+            "3 err, 4 warning, 5 notice, 6 info, 7 debug",
+            ge=0,
+            le=7,
         ),
-    ],
-    lines: t.Annotated[int, Field(description="Number of lines to retrieve from the end.", ge=1, le=10_000)] = 100,
+    ] = 7,
+    lines: t.Annotated[
+        int,
+        Field(
+            description="Number of messages to retrieve: the newest messages, or with a cursor the oldest messages "
+            "after it. Default: 100",
+            ge=1,
+            le=10_000,
+        ),
+    ] = 100,
+    cursor: t.Annotated[
+        str | None,
+        Field(
+            description="Cursor returned by an earlier call. Only messages after it are returned, so repeated calls "
+            "page forward through the kernel log without overlap.",
+            pattern=KERNEL_CURSOR_PATTERN,
+        ),
+    ] = None,
     host: Host = None,
 ) -> LogEntries:
-    """Read a specific log file.
+    """Get kernel log buffer messages.
+
+    Reads the records of /dev/kmsg, which works without journald and
+    needs the same privileges as dmesg. The returned cursor is the sequence
+    number of the last message; pass it back to get only newer messages.
+    Records are selected on the target, so a cursor also limits what is
+    transferred. A cursor from before a reboot returns the oldest messages
+    of the current boot.
+    """
+    cmd = get_command("kernel_logs")
+    returncode, stdout, stderr = await cmd.run(host=host, cursor=cursor or "", lines=lines, level=level)
 
-    Retrieves the last N lines from a log file. The file path must be in the
-    allowed list configured via LINUX_MCP_ALLOWED_LOG_PATHS environment variable.
+    if returncode != 0:
+        raise ToolError(f"Error reading kernel logs: {stderr}")
+
+    entries, sequence = parse_kmsg_records(stdout)
+    return LogEntries(entries=entries, cursor=str(sequence) if sequence is not None else cursor)
+
+
+def _last_lines(segment: LogSegment) -> tuple[list[str], str]:
+    """Return the entries of a last-lines read and the cursor after them.
+
+    A trailing line without a newline may still be being written, so the
+    cursor points at its start and it is returned again once complete.
+    """
+    data = segment.data
+    # tail returned the whole byte window, so the first line may start mid-line
+    if segment.start > 0 and len(data) == segment.end - segment.start:
+        data = data.partition(b"\n")[2] or data
+
+    partial = len(data) - data.rfind(b"\n") - 1
+    entries = [line for line in data.decode("utf-8", errors="replace").splitlines() if line]
+    return entries, f"{segment.inode}:{segment.end - partial}"
+
+
+def _lines_after_cursor(segments: list[LogSegment], lines: int, max_bytes: int) -> tuple[list[str], str]:
+    """Return up to lines complete lines from the segments and the cursor after them.
+
+    The unread rest of a rotated file ends with its last line even without a
+    newline. A single line longer than max_bytes is returned in pieces so the
+    cursor always moves forward.
+    """
+    entries: list[bytes] = []
+    cursor = ""
+    for segment in segments:
+        *complete, partial = segment.data.split(b"\n")
+        pieces = [line + b"\n" for line in complete]
+        if partial and ((segment.rotated and len(segment.data) < max_bytes) or len(partial) >= max_bytes):
+            pieces.append(partial)
+
+        offset = segment.start
+        for piece in pieces[: lines - len(entries)]:
+            entries.append(piece)
+            offset += len(piece)
+
+        cursor = f"{segment.inode}:{offset}"
+        if len(entries) >= lines or (segment.rotated and offset < segment.end):
+            break
+
+    return [line for piece in entries if (line := piece.decode("utf-8", errors="replace").rstrip("\r\n"))], cursor
+
+
+def _matching_entries(stdout: bytes, log_path: Path, cursor: str | None, if_none_match: str | None) -> LogEntries:
+    """Build the result of a pattern search from the read_log_file output.
+
+    A rotated segment that was not read to its end stopped at the match limit,
+    so the segments after it are left for the next read.
+
+    Raises:
+        ToolError: If the output is malformed.
+    """
+    try:
+        fingerprint, segments = parse_log_matches_output(stdout)
+    except ValueError:
+        raise ToolError(f"Unexpected output reading log file: {log_path}") from None
+
+    if not segments and fingerprint == if_none_match:
+        return LogEntries(entries=[], path=log_path, fingerprint=fingerprint, cursor=cursor, unchanged=True)
+
+    entries: list[str] = []
+    matches = 0
+    for segment in segments:
+        entries.extend(line for raw in segment.lines if (line := raw.decode("utf-8", errors="replace").rstrip("\r")))
+        matches += segment.matches
+        cursor = f"{segment.inode}:{segment.start + segment.consumed}"
+        if segment.rotated and segment.start + segment.consumed < segment.end:
+            break
+
+    return LogEntries(entries=entries, path=log_path, fingerprint=fingerprint, cursor=cursor, matches=matches)
+
+
+def _resolve_allowed_log_path(log_path: Path, host: Host | None) -> str:
+    """Check log_path against the allowed log paths and return the path to read.
+
+    Local paths are resolved before the check and must be existing files.
+    Remote paths are compared as given.
+
+    Raises:
+        ToolError: If the path is not allowed or is not a readable local file.
     """
     # Get allowed log paths from environment variable
     allowed_paths_env = CONFIG.allowed_log_paths
@@ -196,26 +436,155 @@ async def read_log_file(
         if not requested_path.is_file():
             raise ToolError(f"Path is not a file: {log_path}")
 
-        log_path_str = str(requested_path)
-    else:
-        # For remote execution, check against allowlist without resolving
-        if log_path not in allowed_paths:
-            raise ToolError(f"Access to log file '{log_path}' is not allowed.")
+        return str(requested_path)
 
-        log_path_str = str(log_path)
+    # For remote execution, check against allowlist without resolving
+    if log_path not in allowed_paths:
+        raise ToolError(f"Access to log file '{log_path}' is not allowed.")
+
+    return str(log_path)
+
+
+@mcp.tool(
+    title="Read log file",
+    description="Read a specific log file.",
+    tags={"fixed", "files", "logs", "troubleshooting"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def read_log_file(
+    log_path: t.Annotated[
+        Path,
+        BeforeValidator(validate_path),
+        Field(
+            description="Absolute path to the log file (must be in allowed list)",
+            examples=["/var/log/messages", "/var/log/secure", "/var/log/audit/audit.log", "/var/log/dnf.log"],
+        ),
+    ],
+    lines: t.Annotated[
+        int,
+        Field(
+            description="Number of lines to retrieve: the last lines of the file, or with a cursor the "
+            "oldest lines appended since it. Ignored when a pattern is given.",
+            ge=1,
+            le=10_000,
+        ),
+    ] = 100,
+    cursor: t.Annotated[
+        str | None,
+        Field(
+            description="Cursor returned by an earlier read of this log file. Only lines appended since then "
+            "are returned, including the rest of the file if it was rotated.",
+            pattern=LOG_CURSOR_PATTERN,
+        ),
+    ] = None,
+    max_bytes: t.Annotated[
+        int | None,
+        Field(description="Maximum number of bytes to read (default and maximum: the configured read limit)", gt=0),
+    ] = None,
+    if_none_match: t.Annotated[
+        str | None,
+        Field(
+            description="Fingerprint returned by an earlier read of this log file. If the file has not changed "
+            "since, no entries are returned and unchanged is true.",
+            pattern=LOG_FINGERPRINT_PATTERN,
+        ),
+    ] = None,
+    pattern: t.Annotated[
+        str,
+        AfterValidator(validate_log_pattern),
+        Field(
+            description="POSIX extended regular expression. Only matching lines are returned, filtered on the "
+            "target so other lines are never transferred. Interval expressions such as {3} are not supported.",
+            examples=["error|fail", "sshd\\[[0-9]+\\]", "^Jan +5 "],
+        ),
+    ] = "",
+    ignore_case: t.Annotated[bool, Field(description="Match the pattern case-insensitively (ASCII only)")] = False,
+    invert: t.Annotated[bool, Field(description="Return the lines that do not match the pattern")] = False,
+    max_matches: t.Annotated[
+        int,
+        Field(
+            description="Maximum number of matching lines to return: the last matches, or with a cursor the "
+            "oldest matches since it. Default: 100",
+            ge=1,
+            le=10_000,
+        ),
+    ] = 100,
+    search_whole_file: t.Annotated[
+        bool,
+        Field(
+            description="Search the whole file instead of its last max_bytes. Only applies to pattern searches "
+            "without a cursor."
+        ),
+    ] = False,
+    compact: t.Annotated[
+        bool,
+        Field(
+            description="Return message templates with counts, first and last timestamps and a few examples "
+            "instead of the raw lines. Variable parts such as numbers are shown as <*>."
+        ),
+    ] = False,
+    host: Host = None,
+) -> LogEntries:
+    """Read a specific log file.
+
+    Retrieves the last N lines from a log file. The file path must be in the
+    allowed list configured via LINUX_MCP_ALLOWED_LOG_PATHS environment variable.
+
+    Every result carries a cursor (inode and byte offset) to pass back to
+    read only what was appended since, and a fingerprint of the file that can
+    be passed back as if_none_match to skip re-reading an unchanged log. At
+    most max_bytes are read per call; keep following the cursor to catch up.
+
+    With a pattern, lines are filtered on the target and only matching lines
+    are returned, along with the number of matches found in the bytes read.
+    Set compact to summarize repetitive lines as templates.
+    """
+    log_path_str = _resolve_allowed_log_path(log_path, host)
+    limit = CONFIG.max_file_read_bytes
+    max_bytes = limit if max_bytes is None else min(max_bytes, limit)
 
     cmd = get_command("read_log_file")
-    returncode, stdout, stderr = await cmd.run(host=host, lines=lines, log_path=log_path_str)
+    returncode, stdout, stderr = await cmd.run_bytes(
+        host=host,
+        lines=lines,
+        log_path=log_path_str,
+        if_none_match=if_none_match or "",
+        cursor=cursor or "",
+        max_bytes=max_bytes,
+        pattern=pattern,
+        invert=int(invert),
+        ignore_case=int(ignore_case),
+        max_matches=max_matches,
+        search_whole_file=int(search_whole_file),
+    )
 
     if returncode != 0:
-        if "Permission denied" in stderr:
+        error = stderr.decode("utf-8", errors="replace")
+        if "Permission denied" in error:
             raise ToolError(f"Permission denied reading log file: {log_path}")
 
-        raise ToolError(f"Error reading log file: {stderr}")
+        raise ToolError(f"Error reading log file: {error}")
+
+    if pattern:
+        result = _matching_entries(stdout, log_path, cursor, if_none_match)
+        return compact_log_entries(result) if compact else result
 
-    if is_empty_output(stdout):
-        raise ToolError(f"Log file is empty: {log_path}")
+    try:
+        fingerprint, segments = parse_log_file_output(stdout)
+    except ValueError:
+        raise ToolError(f"Unexpected output reading log file: {log_path}") from None
 
-    entries = [line for line in stdout.strip().splitlines() if line]
+    if not segments and fingerprint == if_none_match:
+        return LogEntries(entries=[], path=log_path, fingerprint=fingerprint, cursor=cursor, unchanged=True)
+
+    if cursor is None:
+        entries, next_cursor = _last_lines(segments[-1])
+        if not entries:
+            raise ToolError(f"Log file is empty: {log_path}")
+    else:
+        entries, next_cursor = _lines_after_cursor(segments, lines, max_bytes)
 
-    return LogEntries(entries=entries, path=log_path)
+    result = LogEntries(entries=entries, path=log_path, fingerprint=fingerprint, cursor=next_cursor)
+    return compact_log_entries(result) if compact else result
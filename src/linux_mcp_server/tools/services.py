@@ -1,53 +1,134 @@
 """Service management tools."""
 
+import asyncio
+import heapq
 import typing as t
 
+from collections import Counter
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+
+from fastmcp.exceptions import ToolError
 from mcp.types import ToolAnnotations
 from pydantic import Field
 
 from linux_mcp_server.audit import log_tool_call
 from linux_mcp_server.commands import get_command
+from linux_mcp_server.execution_context import get_execution_context
+from linux_mcp_server.formatters import format_log_templates
 from linux_mcp_server.formatters import format_service_logs
 from linux_mcp_server.formatters import format_service_status
-from linux_mcp_server.formatters import format_services_list
-from linux_mcp_server.parsers import parse_service_count
+from linux_mcp_server.log_templates import mine_templates
+from linux_mcp_server.models import ServiceStates
+from linux_mcp_server.models import ServiceUnits
+from linux_mcp_server.models import TriageSummary
+from linux_mcp_server.models import UnitResources
+from linux_mcp_server.models import UnitResourceUsage
+from linux_mcp_server.parsers import iter_journal_records
+from linux_mcp_server.parsers import parse_cgroup_samples
+from linux_mcp_server.parsers import parse_critical_chain
+from linux_mcp_server.parsers import parse_service_units
+from linux_mcp_server.parsers import parse_systemctl_show
+from linux_mcp_server.parsers import parse_systemd_blame
+from linux_mcp_server.parsers import split_sections
 from linux_mcp_server.server import mcp
+from linux_mcp_server.utils import StrEnum
 from linux_mcp_server.utils.decorators import disallow_local_execution_in_containers
 from linux_mcp_server.utils.types import Host
-from linux_mcp_server.utils.validation import is_empty_output
+
+
+# Maximum number of services whose logs are merged in one call
+MAX_LOG_SERVICES = 10
+
+# Maximum number of services whose state is read in one call
+MAX_STATE_SERVICES = 200
+
+# Number of slowest units read from systemd-analyze blame and cached per boot
+MAX_SLOWEST_UNITS = 50
+
+# Number of hosts whose boot timings are cached; the least recently used is evicted
+MAX_CACHED_BOOTS = 64
+
+# Longest pause between the two samples of get_unit_resources, well below the command timeout
+MAX_SAMPLE_INTERVAL = 10
+
+# A slice under /sys/fs/cgroup, optionally nested, e.g. "user.slice/user-1000.slice"
+SLICE_PATTERN = r"^[\w@:.-]+\.slice(/[\w@:.-]+\.slice)*$"
+
+# Boot timings of the current boot per host, keyed like the directory size index
+_boot_timings: OrderedDict[tuple[str, str, str], TriageSummary] = OrderedDict()
+
+
+class ResourceMetric(StrEnum):
+    MEMORY = "memory"
+    CPU = "cpu"
+    IO = "io"
+    PIDS = "pids"
 
 
 @mcp.tool(
     title="List services",
-    description="List all systemd services.",
+    description="List systemd services with their load, active and sub state, filtered and paged.",
     tags={"fixed", "services", "systemd"},
     annotations=ToolAnnotations(readOnlyHint=True),
 )
 @log_tool_call
 @disallow_local_execution_in_containers
 async def list_services(
+    state: t.Annotated[
+        str,
+        Field(description="Only list services in this active state", examples=["active", "inactive", "failed"]),
+    ] = "",
+    sub_state: t.Annotated[
+        str,
+        Field(description="Only list services in this sub state", examples=["running", "exited", "dead", "failed"]),
+    ] = "",
+    pattern: t.Annotated[
+        str,
+        Field(description="Only list services whose unit name matches this glob", examples=["ssh*", "*-getty@*"]),
+    ] = "",
+    offset: t.Annotated[int, Field(description="Number of matching services to skip", ge=0)] = 0,
+    limit: t.Annotated[
+        int, Field(description="Maximum number of services to return (1-1000). Default: 200", ge=1, le=1000)
+    ] = 200,
     host: Host = None,
-) -> str:
-    """List all systemd services.
+) -> ServiceUnits:
+    """List systemd services.
 
     Retrieves all systemd service units with their load state, active state,
-    sub-state, and description. Also includes a count of currently running services.
+    sub-state, and description in a single systemctl call. Counts per
+    active and sub state cover every service, so the number of running or
+    failed services is known without listing them. Follow next_offset to
+    page through the matching services.
     """
     cmd = get_command("list_services")
     returncode, stdout, stderr = await cmd.run(host=host)
 
     if returncode != 0:
-        return f"Error listing services: {stderr}"
-
-    # Get running services count
-    running_cmd = get_command("running_services")
-    returncode_summary, stdout_summary, _ = await running_cmd.run(host=host)
+        raise ToolError(f"Error listing services: {stderr}")
 
-    running_count = None
-    if returncode_summary == 0:
-        running_count = parse_service_count(stdout_summary)
+    try:
+        services = parse_service_units(stdout)
+    except (ValueError, KeyError, TypeError):
+        raise ToolError("Unexpected output listing services") from None
 
-    return format_services_list(stdout, running_count)
+    matched = [
+        service
+        for service in services
+        if (not state or service.active == state)
+        and (not sub_state or service.sub == sub_state)
+        and (not pattern or fnmatchcase(service.unit, pattern))
+    ]
+    end = offset + limit
+    return ServiceUnits(
+        services=matched[offset:end],
+        total=len(services),
+        matched=len(matched),
+        active_states=dict(Counter(service.active for service in services)),
+        sub_states=dict(Counter(service.sub for service in services)),
+        offset=offset,
+        next_offset=end if end < len(matched) else None,
+    )
 
 
 @mcp.tool(
@@ -73,10 +154,7 @@ async def get_service_status(
     Retrieves detailed service information including active/enabled state,
     main PID, memory usage, CPU time, and recent log entries from the journal.
     """
-    # Ensure service name has .service suffix if not present
-    if not service_name.endswith(".service") and "." not in service_name:
-        service_name = f"{service_name}.service"
-
+    service_name = _service_unit(service_name)
     cmd = get_command("service_status")
     _, stdout, stderr = await cmd.run(host=host, service_name=service_name)
 
@@ -90,9 +168,48 @@ async def get_service_status(
     return format_service_status(stdout, service_name)
 
 
+@mcp.tool(
+    title="Get service states",
+    description="Get the state, main PID, restarts, memory and CPU usage of several systemd units in one call.",
+    tags={"fixed", "services", "systemd"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def get_service_states(
+    service_names: t.Annotated[
+        list[str],
+        Field(
+            description="Names of the systemd units. Names without a unit type are taken as services.",
+            examples=[["sshd", "NetworkManager", "crond"], ["nginx", "php-fpm", "mariadb", "docker.socket"]],
+            min_length=1,
+            max_length=MAX_STATE_SERVICES,
+        ),
+    ],
+    host: Host = None,
+) -> ServiceStates:
+    """Get the state of several systemd units.
+
+    Reads selected properties of every unit with a single ``systemctl show``
+    call, without the journal lines that get_service_status includes.
+    Units that do not exist are returned with load_state "not-found".
+    """
+    units = list(dict.fromkeys(_service_unit(name) for name in service_names))
+    if any("\n" in unit for unit in units):
+        raise ToolError("Service names must not contain newlines")
+
+    cmd = get_command("service_properties")
+    returncode, stdout, stderr = await cmd.run(host=host, units="\n".join(units))
+
+    if returncode != 0:
+        raise ToolError(f"Error getting service states: {stderr}")
+
+    return ServiceStates(services=parse_systemctl_show(stdout))
+
+
 @mcp.tool(
     title="Get service logs",
-    description="Get recent logs for a specific systemd service.",
+    description="Get recent logs for one or more systemd services, merged in time order.",
     tags={"fixed", "logs", "services", "systemd", "troubleshooting"},
     annotations=ToolAnnotations(readOnlyHint=True),
 )
@@ -100,33 +217,276 @@ async def get_service_status(
 @disallow_local_execution_in_containers
 async def get_service_logs(
     service_name: t.Annotated[
-        str,
+        str | t.Annotated[list[str], Field(min_length=1, max_length=MAX_LOG_SERVICES)],
         Field(
-            description="Name of the systemd service",
-            examples=["sshd", "NetworkManager", "auditd", "rsyslog", "crond", "firewalld"],
+            description="Name of the systemd service, or a list of services whose logs are merged in time order",
+            examples=["sshd", "NetworkManager", "auditd", "rsyslog", "crond", "firewalld", ["nginx", "php-fpm"]],
         ),
     ],
-    lines: t.Annotated[int, Field(description="Number of log lines to retrieve.", ge=1, le=10_000)] = 50,
+    lines: t.Annotated[
+        int, Field(description="Number of log lines to retrieve, per service when several are given.", ge=1, le=10_000)
+    ] = 50,
+    compact: t.Annotated[
+        bool,
+        Field(
+            description="Return message templates with counts and first and last timestamps instead of the raw "
+            "lines. Variable parts such as numbers are shown as <*>."
+        ),
+    ] = False,
     host: Host = None,
 ) -> str:
-    """Get recent logs for a specific systemd service.
+    """Get recent logs for one or more systemd services.
 
     Retrieves journal entries for the specified service unit, including
-    timestamps, priority levels, and log messages.
+    timestamps, priority levels, and log messages. With compact, repetitive
+    lines are summarized as templates.
+
+    Given several services, the last lines of each are read concurrently
+    and merged into one time-ordered result.
     """
+    if isinstance(service_name, str):
+        service_name = [service_name]
+    service_names = list(dict.fromkeys(_service_unit(name) for name in service_name))
+    return await _service_logs(service_names, lines, compact, host)
+
+
+def _service_unit(service_name: str) -> str:
     # Ensure service name has .service suffix if not present
     if not service_name.endswith(".service") and "." not in service_name:
-        service_name = f"{service_name}.service"
+        return f"{service_name}.service"
+    return service_name
+
 
-    cmd = get_command("service_logs")
-    returncode, stdout, stderr = await cmd.run(host=host, service_name=service_name, lines=lines)
+def _format_templates(lines: t.Iterable[str], header: str) -> str:
+    miner = mine_templates(lines)
+    return format_log_templates(miner.templates(), miner.lines, miner.ungrouped, header)
+
+
+async def _service_logs(service_names: list[str], lines: int, compact: bool, host: Host | None = None) -> str:
+    """Read the last lines of each service concurrently and merge them by timestamp.
+
+    journalctl caps ``-n`` across all units given with repeated ``-u`` flags,
+    so a chatty service would crowd out the others. Each service is read
+    with its own cap instead, and the streams, each already in time order,
+    are merged with a heap. A single service takes the same path, so its
+    lines are rendered exactly like those of a merged result.
+    """
+    cmd = get_command("journal_logs")
+    results = await asyncio.gather(*(cmd.run(host=host, lines=lines, unit=name) for name in service_names))
+
+    streams = []
+    errors = []
+    for name, (returncode, stdout, stderr) in zip(service_names, results, strict=True):
+        if returncode != 0:
+            errors.append(f"Error getting logs for {name}: {stderr.strip()}")
+        else:
+            streams.append(iter_journal_records(stdout))
+
+    names = ", ".join(service_names)
+    merged = [line for _, _, line in heapq.merge(*streams, key=lambda record: record[0])]
+    if not merged:
+        if errors:
+            return "\n".join(errors)
+        if len(service_names) == 1:
+            return f"No log entries found for service '{names}'."
+        return f"No log entries found for services {names}."
+
+    subject = names if len(service_names) == 1 else f"each of {names}"
+    if compact:
+        output = _format_templates(merged, f"=== Log templates of the last {lines} entries for {subject} ===\n")
+    else:
+        output = format_service_logs("\n".join(merged), subject, lines)
+
+    return "\n\n".join([output, *errors])
+
+
+def _boot_key(host: str | None) -> tuple[str, str, str]:
+    # Different SSH identities may be allowed to see different units
+    context = get_execution_context()
+    user = (context.ssh_key_user or "") if context else ""
+    key_path = str(context.ssh_key_path or "") if context else ""
+    return host or "", user, key_path
+
+
+@mcp.tool(
+    title="Triage failed units and slow boot",
+    description="Summarize failed systemd units, the slowest units of the current boot and its critical chain "
+    "in one call.",
+    tags={"fixed", "services", "systemd", "troubleshooting"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def get_triage_summary(
+    slowest: t.Annotated[
+        int, Field(description="Number of slowest units of the boot to return (0-50). Default: 10", ge=0, le=50)
+    ] = 10,
+    refresh: t.Annotated[
+        bool, Field(description="Read the boot timings again instead of using the ones cached for this boot")
+    ] = False,
+    host: Host = None,
+) -> TriageSummary:
+    """Summarize what failed and what made boot slow.
+
+    Runs systemctl --failed, systemd-analyze blame and systemd-analyze
+    critical-chain in a single execution on the target. The boot timings
+    only change on reboot, so they are cached per host and boot ID, and
+    later calls during the same boot only read the failed units.
+    """
+    key = _boot_key(host)
+    cached = None if refresh else _boot_timings.get(key)
+
+    cmd = get_command("triage")
+    returncode, stdout, stderr = await cmd.run(
+        host=host, boot_id=cached.boot_id if cached else "", slowest=MAX_SLOWEST_UNITS
+    )
+
+    if returncode != 0:
+        raise ToolError(f"Error listing failed units: {stderr}")
+
+    sections = split_sections(stdout)
+    try:
+        failed = parse_service_units(sections.get("failed", ""))
+    except (ValueError, KeyError, TypeError):
+        raise ToolError("Unexpected output listing failed units") from None
+
+    boot_id = sections.get("boot", "")
+    if cached is not None and "blame" not in sections:
+        timings = cached
+        _boot_timings.move_to_end(key)
+    else:
+        timings = TriageSummary(
+            boot_id=boot_id,
+            failed=[],
+            slowest=parse_systemd_blame(sections.get("blame", "")),
+            critical_chain=parse_critical_chain(sections.get("chain", "")),
+        )
+        # Timings are missing until boot has finished, so only complete ones are kept
+        if timings.slowest or timings.critical_chain:
+            _boot_timings[key] = timings
+            _boot_timings.move_to_end(key)
+            while len(_boot_timings) > MAX_CACHED_BOOTS:
+                _boot_timings.popitem(last=False)
+
+    return TriageSummary(
+        boot_id=boot_id,
+        failed=failed,
+        slowest=timings.slowest[:slowest],
+        critical_chain=timings.critical_chain,
+        boot_cached=timings is cached,
+    )
+
+
+def _rate(before: int | None, after: int | None, interval: float) -> float | None:
+    # Counters go backwards when a unit restarts between the samples
+    if before is None or after is None or after < before:
+        return None
+    return (after - before) / interval
+
+
+def _with_rates(first: UnitResources | None, second: UnitResources, interval: float) -> UnitResources:
+    if first is None or interval <= 0:
+        return second
+
+    cpu = _rate(first.cpu_usage_usec, second.cpu_usage_usec, interval)
+    return second.model_copy(
+        update={
+            "cpu_percent": None if cpu is None else round(cpu / 10_000, 2),
+            "io_read_bytes_per_sec": _rate(first.io_read_bytes, second.io_read_bytes, interval),
+            "io_write_bytes_per_sec": _rate(first.io_write_bytes, second.io_write_bytes, interval),
+        }
+    )
+
+
+def _resource_value(unit: UnitResources, metric: ResourceMetric, sampled: bool) -> float | None:
+    match metric:
+        case ResourceMetric.CPU:
+            return unit.cpu_percent if sampled else unit.cpu_usage_usec
+        case ResourceMetric.IO:
+            read, write = (
+                (unit.io_read_bytes_per_sec, unit.io_write_bytes_per_sec)
+                if sampled
+                else (unit.io_read_bytes, unit.io_write_bytes)
+            )
+            return None if read is None and write is None else (read or 0) + (write or 0)
+        case ResourceMetric.PIDS:
+            return unit.pids
+        case _:
+            return unit.memory_bytes
+
+
+@mcp.tool(
+    title="Get unit resource usage",
+    description="Get memory, CPU, I/O and task usage of the units of a systemd slice from cgroup v2, sorted by "
+    "one metric, optionally with CPU and I/O rates over a sampling interval.",
+    tags={"fixed", "services", "systemd", "performance"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def get_unit_resources(
+    slice_name: t.Annotated[
+        str,
+        Field(
+            description="Slice whose units are read, relative to /sys/fs/cgroup",
+            examples=["system.slice", "user.slice/user-1000.slice"],
+            pattern=SLICE_PATTERN,
+        ),
+    ] = "system.slice",
+    sort_by: t.Annotated[
+        ResourceMetric,
+        Field(description="Metric to sort by, highest first. cpu and io sort by rate when sampled"),
+    ] = ResourceMetric.MEMORY,
+    interval: t.Annotated[
+        float,
+        Field(
+            description="Seconds between two samples used to compute CPU and I/O rates (0-10). "
+            "Default: 0, a single sample without rates",
+            ge=0,
+            le=MAX_SAMPLE_INTERVAL,
+        ),
+    ] = 0,
+    limit: t.Annotated[
+        int, Field(description="Maximum number of units to return (1-500). Default: 20", ge=1, le=500)
+    ] = 20,
+    host: Host = None,
+) -> UnitResourceUsage:
+    """Get per-unit resource usage of a systemd slice.
+
+    Reads memory.current, memory.stat, cpu.stat, io.stat and pids.current of
+    every unit under the slice with one awk pass, and with an interval a
+    second pass in the same execution. Rates use the target's uptime, so
+    they are not skewed by connection latency. Requires the unified cgroup
+    v2 hierarchy.
+    """
+    cmd = get_command("cgroup_stats")
+    returncode, stdout, stderr = await cmd.run(host=host, root=f"/sys/fs/cgroup/{slice_name}", interval=f"{interval:g}")
 
     if returncode != 0:
-        if "not found" in stderr.lower() or "no entries" in stderr.lower():
-            return f"No logs found for service '{service_name}'. The service may not exist or has no log entries."
-        return f"Error getting service logs: {stderr}"
+        raise ToolError(f"Error reading resource usage of {slice_name}: {stderr}")
+
+    try:
+        samples = parse_cgroup_samples(stdout)
+    except ValueError:
+        raise ToolError(f"Unexpected output reading resource usage of {slice_name}") from None
+
+    if not samples:
+        raise ToolError(f"Unexpected output reading resource usage of {slice_name}")
+
+    elapsed = None
+    uptime, units = samples[-1]
+    if len(samples) > 1:
+        first_uptime, first_units = samples[0]
+        elapsed = round(uptime - first_uptime, 3)
+        units = {name: _with_rates(first_units.get(name), unit, elapsed) for name, unit in units.items()}
 
-    if is_empty_output(stdout):
-        return f"No log entries found for service '{service_name}'."
+    def sort_key(unit: UnitResources) -> tuple[bool, float]:
+        value = _resource_value(unit, sort_by, elapsed is not None)
+        return value is not None, value or 0
 
-    return format_service_logs(stdout, service_name, lines)
+    return UnitResourceUsage(
+        slice=slice_name,
+        units=heapq.nlargest(limit, units.values(), key=sort_key),
+        total=len(units),
+        interval=elapsed,
+    )
@@ -1,10 +1,12 @@
 """Storage and hardware tools."""
 
-import os
+import asyncio
+import heapq
 import typing as t
 
 from pathlib import Path
 
+from asyncssh import SFTPAttrs
 from fastmcp.exceptions import ToolError
 from mcp.types import ToolAnnotations
 from pydantic import Field
@@ -13,14 +15,24 @@ from pydantic.functional_validators import BeforeValidator
 from linux_mcp_server.audit import log_tool_call
 from linux_mcp_server.commands import CommandSpec
 from linux_mcp_server.commands import get_command
+from linux_mcp_server.commands import NOT_A_FILE_EXIT_CODE
 from linux_mcp_server.config import CONFIG
+from linux_mcp_server.connection.sftp import get_file_backend
+from linux_mcp_server.connection.sftp import is_directory
+from linux_mcp_server.connection.sftp import is_regular_file
+from linux_mcp_server.connection.sftp import SFTPFileBackend
 from linux_mcp_server.models import BlockDevices
+from linux_mcp_server.models import FileContent
+from linux_mcp_server.models import LargestFiles
 from linux_mcp_server.models import NodeEntry
 from linux_mcp_server.models import StorageNodes
-from linux_mcp_server.parsers import parse_directory_listing
-from linux_mcp_server.parsers import parse_file_listing
+from linux_mcp_server.parsers import iter_directory_listing
+from linux_mcp_server.parsers import iter_file_listing
+from linux_mcp_server.parsers import ListingRow
+from linux_mcp_server.parsers import parse_largest_files
+from linux_mcp_server.parsers import parse_read_file_output
 from linux_mcp_server.server import mcp
-from linux_mcp_server.utils import format_bytes
+from linux_mcp_server.size_index import get_directory_index
 from linux_mcp_server.utils import StrEnum
 from linux_mcp_server.utils.decorators import disallow_local_execution_in_containers
 from linux_mcp_server.utils.types import Host
@@ -28,6 +40,19 @@ from linux_mcp_server.utils.validation import is_successful_output
 from linux_mcp_server.utils.validation import validate_path
 
 
+# Seconds kept between the end of a tree walk and the command timeout, leaving
+# time to select and transfer the results
+WALK_BUDGET_MARGIN = 5
+
+# Exit code of timeout(1) when the command ran out of time
+TIMEOUT_EXIT_CODE = 124
+
+# Fingerprint returned and accepted by read_file: "INODE-SIZE-MTIME" with the
+# mtime in nanoseconds from the read_file command, or "SIZE-MTIME" with whole
+# seconds over SFTP, which reports neither; mtimes before 1970 are negative
+FILE_FINGERPRINT_PATTERN = r"^(\d+-\d+--?\d+\.\d+|\d+--?\d+)$"
+
+
 class OrderBy(StrEnum):
     SIZE = "size"
     NAME = "name"
@@ -39,16 +64,85 @@ class SortBy(StrEnum):
     DESCENDING = "descending"
 
 
-def attr_sorter(order_by: OrderBy):
-    """Sort based on the given attribute in a case-insensitive manner"""
+def row_sort_key(order_by: OrderBy, sort: SortBy = SortBy.ASCENDING) -> t.Callable[[ListingRow], t.Any]:
+    """Return a sort key for listing rows, comparing names case-insensitively.
+
+    Rows that tie on size or modification time are ordered by name, ascending
+    in both directions like ``sort -k 2`` on the target, so a top_n cutoff
+    keeps the same rows on every path. Size and time keys are negated for a
+    descending sort; name keys are sorted in reverse instead.
+    """
+    sign = -1 if sort == SortBy.DESCENDING else 1
+    match order_by:
+        case OrderBy.SIZE:
+            return lambda row: (sign * row[0], row[2])
+        case OrderBy.MODIFIED:
+            return lambda row: (sign * row[1], row[2])
+        case _:
+            return lambda row: (row[2].casefold(), row[2])
+
+
+def select_rows(
+    rows: t.Iterable[ListingRow],
+    order_by: OrderBy,
+    sort: SortBy,
+    top_n: int | None,
+) -> list[ListingRow]:
+    """Order listing rows and keep at most top_n of them.
+
+    Unbounded listings are fully sorted. When top_n is set, a heap selection
+    streams over the rows and only ever holds top_n of them, which keeps a
+    top-20 query over millions of entries cheap. Both paths return the same
+    entries in the same order, ties included.
+    """
+    key = row_sort_key(order_by, sort)
+    reverse = order_by == OrderBy.NAME and sort == SortBy.DESCENDING
+
+    if top_n is None:
+        return sorted(rows, key=key, reverse=reverse)
+
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(top_n, rows, key=key)
+
+
+def _listing_command(name: str, order_by: OrderBy, top_n: int | None) -> CommandSpec:
+    """Return the listing command, sorting and limiting on the target when possible.
 
-    def _attr_sorter(obj):
-        try:
-            return getattr(obj, order_by).casefold()
-        except AttributeError:
-            return getattr(obj, order_by)
+    Name ordering always runs the plain listing because the target's collation
+    does not match the case-insensitive name ordering used here.
+    """
+    if top_n is not None and order_by != OrderBy.NAME:
+        return get_command(f"{name}_{order_by}", "top_n")
+
+    return get_command(f"{name}_{order_by}")
+
+
+async def _sftp_listing_rows(
+    backend: SFTPFileBackend,
+    path: Path,
+    order_by: OrderBy,
+    entry_filter: t.Callable[[SFTPAttrs], bool],
+) -> list[ListingRow]:
+    """List the entries of path over SFTP as (size, modified, name) rows.
 
-    return _attr_sorter
+    Like the find listings, rows only carry the field they are ordered by:
+    the size of regular files when ordering by size, the mtime when ordering
+    by modification time, and neither when ordering by name.
+    """
+    try:
+        entries = await backend.scandir(path)
+    except OSError as e:
+        raise ToolError(f"Error listing {path}: {e}") from None
+
+    return [
+        (
+            (entry.attrs.size or 0) if order_by == OrderBy.SIZE and is_regular_file(entry.attrs) else 0,
+            float(entry.attrs.mtime or 0) if order_by == OrderBy.MODIFIED else 0.0,
+            entry.filename,
+        )
+        for entry in entries
+        if entry_filter(entry.attrs)
+    ]
 
 
 async def _list_resources(
@@ -58,20 +152,31 @@ async def _list_resources(
     sort: SortBy,
     top_n: int | None,
     host: Host | None,
-    parser: t.Callable[[str, OrderBy], list[NodeEntry]],
+    parser: t.Callable[[str, OrderBy], t.Iterable[ListingRow]],
+    entry_filter: t.Callable[[SFTPAttrs], bool] | None = None,
 ):
-    returncode, stdout, stderr = await command.run(host=host, path=path)
+    # Listings that need no recursive sizes are read over SFTP when available,
+    # unless a top_n selection is sorted and limited on the target, which
+    # transfers only the selected entries
+    pushed_down = top_n is not None and order_by != OrderBy.NAME
+    if entry_filter is not None and not pushed_down and (backend := await get_file_backend(host)) is not None:
+        rows = select_rows(await _sftp_listing_rows(backend, path, order_by, entry_filter), order_by, sort, top_n)
+        return StorageNodes(nodes=[NodeEntry(size=size, modified=modified, name=name) for size, modified, name in rows])
+
+    sort_flags = "-nr" if sort == SortBy.DESCENDING else "-n"
+    returncode, stdout, stderr = await command.run(
+        host=host, path=path, sort_flags=sort_flags, top_n=top_n, jobs=CONFIG.directory_scan_jobs
+    )
 
     # The du command will exit with code 1 even if it gets some valid results.
     # Only error in the case where we got non-zero exit code and no data in stdout.
     if returncode != 0 and not stdout:
         raise ToolError(f"Error running command: command failed with return code {returncode}: {stderr}")
 
-    entries = parser(stdout, order_by)
-
-    reverse = sort == SortBy.DESCENDING
-    entries = sorted(entries, key=attr_sorter(order_by), reverse=reverse)
-    entries = entries[:top_n]
+    # Rows may already be sorted and limited on the target, but the fallback
+    # returns the full listing, and ties need the same order either way.
+    rows = select_rows(parser(stdout, order_by), order_by, sort, top_n)
+    entries = [NodeEntry(size=size, modified=modified, name=name) for size, modified, name in rows]
 
     return StorageNodes(nodes=entries)
 
@@ -128,21 +233,39 @@ async def list_directories(
             le=1_000,
         ),
     ] = None,
+    refresh: t.Annotated[
+        bool,
+        Field(
+            description="Recompute directory sizes instead of using cached ones. Only applies when the "
+            "directory size index is enabled."
+        ),
+    ] = False,
     host: Host = None,
 ) -> StorageNodes:
     """List directories under a specified path.
 
     Retrieves subdirectories with their size (when ordered by size) or
     modification time, supporting flexible sorting and result limiting.
+    When the directory size index is enabled, sizes come from a per-host
+    cache and the result reports how old it is.
     """
+    if order_by == OrderBy.SIZE and CONFIG.directory_size_index:
+        rows, age = await get_directory_index().child_sizes(path, host=host, refresh=refresh)
+        entries = [
+            NodeEntry(size=size, modified=modified, name=name)
+            for size, modified, name in select_rows(rows, order_by, sort, top_n)
+        ]
+        return StorageNodes(nodes=entries, index_age=round(age, 1))
+
     return await _list_resources(
         path=path,
-        command=get_command(f"list_directories_{order_by}"),
+        command=_listing_command("list_directories", order_by, top_n),
         order_by=order_by,
         sort=sort,
         top_n=top_n,
         host=host,
-        parser=parse_directory_listing,
+        parser=iter_directory_listing,
+        entry_filter=None if order_by == OrderBy.SIZE else is_directory,
     )
 
 
@@ -182,18 +305,155 @@ async def list_files(
     """
     return await _list_resources(
         path=path,
-        command=get_command(f"list_files_{order_by}"),
+        command=_listing_command("list_files", order_by, top_n),
         order_by=order_by,
         sort=sort,
         top_n=top_n,
         host=host,
-        parser=parse_file_listing,
+        parser=iter_file_listing,
+        entry_filter=is_regular_file,
+    )
+
+
+@mcp.tool(
+    title="Find largest files",
+    description="Recursively find the largest files under a path without crossing filesystem boundaries.",
+    tags={"fixed", "files", "filesystem", "storage"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def find_largest_files(
+    path: t.Annotated[
+        Path,
+        BeforeValidator(validate_path),
+        Field(
+            description="Absolute path to the directory tree to search",
+            examples=["/var", "/var/log", "/home", "/opt", "/tmp"],
+        ),
+    ],
+    top_n: t.Annotated[
+        int,
+        Field(description="Number of largest files to return (1-1000, default: 50)", gt=0, le=1_000),
+    ] = 50,
+    max_depth: t.Annotated[
+        int,
+        Field(description="Maximum directory depth to descend (1-100, default: 20)", gt=0, le=100),
+    ] = 20,
+    time_budget: t.Annotated[
+        int | None,
+        Field(
+            description="Seconds to spend walking the tree before returning partial results "
+            "(default and maximum: just under the command timeout)",
+            gt=0,
+        ),
+    ] = None,
+    host: Host = None,
+) -> LargestFiles:
+    """Find the largest files in a directory tree.
+
+    Walks the tree on the target, staying on the filesystem of the starting
+    path, and keeps only the top_n largest files while walking. If the time
+    budget runs out, the largest files seen so far are returned with
+    ``complete`` set to False.
+    """
+    budget = max(1, CONFIG.command_timeout - WALK_BUDGET_MARGIN)
+    if time_budget is not None:
+        budget = min(budget, time_budget)
+
+    returncode, stdout, stderr = await get_command("find_largest_files").run(
+        host=host, path=path, top_n=top_n, max_depth=max_depth, time_budget=budget
+    )
+    rows, scanned, status = parse_largest_files(stdout)
+    if status is None:
+        # Plain find fallback, without a time budget
+        status = returncode
+
+    # find exits with code 1 for unreadable subdirectories, which still leaves
+    # valid results. Only error when nothing was found.
+    if status not in (0, TIMEOUT_EXIT_CODE) and not rows:
+        raise ToolError(f"Error running command: command failed with return code {status}: {stderr}")
+
+    files = [
+        NodeEntry(size=size, modified=modified, name=name)
+        for size, modified, name in select_rows(rows, OrderBy.SIZE, SortBy.DESCENDING, top_n)
+    ]
+
+    return LargestFiles(files=files, scanned=scanned, complete=status != TIMEOUT_EXIT_CODE)
+
+
+def _trim_partial_utf8(data: bytes) -> bytes:
+    """Drop an incomplete UTF-8 sequence at the end of a chunk.
+
+    The dropped bytes start the next chunk instead, so multi-byte characters
+    are never split across two reads. A chunk holding only part of one
+    character is returned as is, so the next offset always advances.
+    """
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            # Lead byte: 110xxxxx starts 2 bytes, 1110xxxx 3, 11110xxx 4
+            needed = 2 if byte & 0xE0 == 0xC0 else 3 if byte & 0xF0 == 0xE0 else 4 if byte & 0xF8 == 0xF0 else 1
+            return data[:-back] if back < needed and back < len(data) else data
+    return data
+
+
+async def _sftp_read_range(
+    backend: SFTPFileBackend, path: Path, offset: int, length: int, if_none_match: str | None
+) -> tuple[int, int, str, bytes]:
+    """Read a byte range over SFTP, returning (size, start offset, fingerprint, data).
+
+    SFTP reports neither the inode nor sub-second mtimes, so the fingerprint
+    is "SIZE-MTIME" and never matches one from the read_file command. Like
+    the command, empty files and files on filesystems without blocks get no
+    fingerprint. No data is read when it matches if_none_match.
+    """
+    try:
+        attrs, filesystem = await asyncio.gather(backend.stat(path), backend.statvfs(path))
+        if not is_regular_file(attrs):
+            raise ToolError(f"Path is not a file: {path}")
+
+        size = attrs.size or 0
+        start = offset if offset >= 0 else max(0, size + offset)
+        volatile = size == 0 or filesystem is None or filesystem.blocks == 0
+        fingerprint = "" if volatile else f"{size}-{attrs.mtime or 0}"
+        if fingerprint == if_none_match:
+            return size, start, fingerprint, b""
+
+        return size, start, fingerprint, await backend.read(path, start, length)
+    except FileNotFoundError:
+        raise ToolError(f"Path is not a file: {path}") from None
+    except OSError as e:
+        raise ToolError(f"Error reading {path}: {e}") from None
+
+
+async def _command_read_range(
+    path: Path, offset: int, length: int, if_none_match: str | None, host: Host
+) -> tuple[int, int, str, bytes]:
+    """Read a byte range with the read_file command, returning (size, start offset, fingerprint, data)."""
+    returncode, stdout, stderr = await get_command("read_file").run_bytes(
+        host=host, path=path, offset=offset, length=length, if_none_match=if_none_match or ""
     )
 
+    if returncode == NOT_A_FILE_EXIT_CODE:
+        raise ToolError(f"Path is not a file: {path}")
+
+    if returncode != 0:
+        raise ToolError(
+            f"Error running command: command failed with return code {returncode}: "
+            f"{stderr.decode('utf-8', errors='replace')}"
+        )
+
+    try:
+        return parse_read_file_output(stdout)
+    except ValueError:
+        raise ToolError(f"Unexpected output reading {path}") from None
+
 
 @mcp.tool(
     title="Read file",
-    description="Read the contents of a text file up to a safe size limit.",
+    description="Read a text file, or a byte range of it, in chunks up to a safe size limit. "
+    "Follow next_offset to page through large files.",
     tags={"fixed", "files", "filesystem", "storage"},
     annotations=ToolAnnotations(readOnlyHint=True),
 )
@@ -208,40 +468,65 @@ async def read_file(
             examples=["/etc/hosts", "/etc/resolv.conf", "/etc/os-release", "/proc/cpuinfo"],
         ),
     ],
+    offset: t.Annotated[
+        int,
+        Field(
+            description="Byte offset to start reading at. Negative values count back from the end of the file, "
+            "e.g. -4096 reads the last 4 KiB (default: 0)",
+            examples=[0, 1048576, -4096],
+        ),
+    ] = 0,
+    length: t.Annotated[
+        int | None,
+        Field(description="Maximum number of bytes to return (default and maximum: the configured read limit)", gt=0),
+    ] = None,
+    if_none_match: t.Annotated[
+        str | None,
+        Field(
+            description="Fingerprint returned by an earlier read of this file. If the file has not changed "
+            "since, no content is returned and unchanged is true.",
+            pattern=FILE_FINGERPRINT_PATTERN,
+        ),
+    ] = None,
     host: Host = None,
-) -> str:
+) -> FileContent:
     """Read the contents of a file.
 
-    Retrieves the full contents of a text file when it fits within the
-    configured safety limit. The path must be absolute, must refer to a
-    regular file, and binary files may not display correctly.
+    Returns up to the configured safety limit of bytes starting at offset,
+    together with the file size and the offset of the next chunk, so files
+    of any size can be read in bounded pages. The path must be absolute and
+    must refer to a regular file. Binary files may not display correctly.
+
+    Results carry a fingerprint of the file (inode, size and mtime).
+    Passing it back as if_none_match skips transferring content that has not
+    changed. Empty files and files under /proc and /sys have no fingerprint.
     """
     limit = CONFIG.max_file_read_bytes
-    limit_text = format_bytes(limit)
+    length = limit if length is None else min(length, limit)
 
-    if not host:
-        if not os.path.isfile(path):
-            raise ToolError(f"Path is not a file: {path}")
-        file_size = path.stat().st_size
-        if file_size > limit:
-            raise ToolError(f"File is too large ({format_bytes(file_size)} > {limit_text}): {path}")
+    backend = await get_file_backend(host)
+    if backend is not None:
+        size, start, fingerprint, data = await _sftp_read_range(backend, path, offset, length, if_none_match)
     else:
-        rc, out, _ = await get_command("read_file_size").run(host=host, path=path)
-        if rc == 0:
-            try:
-                remote_size = int(out.strip())
-                if remote_size > limit:
-                    raise ToolError(f"File is too large ({format_bytes(remote_size)} > {limit_text}): {path}")
-            except ValueError:
-                pass
-
-    cmd = get_command("read_file")
-    returncode, stdout, stderr = await cmd.run_bytes(host=host, path=path, max_bytes=limit + 1)
+        size, start, fingerprint, data = await _command_read_range(path, offset, length, if_none_match, host)
 
-    if returncode != 0:
-        raise ToolError(f"Error running command: command failed with return code {returncode}: {stderr}")
+    if fingerprint == if_none_match:
+        return FileContent(
+            path=path, content="", offset=start, length=0, size=size, fingerprint=fingerprint, unchanged=True
+        )
 
-    if len(stdout) > limit:
-        raise ToolError(f"File is too large (> {limit_text}): {path}")
+    end = start + len(data)
+    at_end = len(data) < length or 0 < size <= end
+    if not at_end:
+        data = _trim_partial_utf8(data)
+        end = start + len(data)
 
-    return stdout.decode("utf-8", errors="replace")
+    return FileContent(
+        path=path,
+        content=data.decode("utf-8", errors="replace"),
+        offset=start,
+        length=len(data),
+        size=size,
+        next_offset=None if at_end else end,
+        fingerprint=fingerprint,
+    )
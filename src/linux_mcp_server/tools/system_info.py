@@ -1,26 +1,60 @@
 """System information tools."""
 
 import json
+import math
+import time
+import typing as t
+
+from datetime import datetime
+from datetime import timezone
 
 from fastmcp.exceptions import ToolError
 from mcp.types import ToolAnnotations
+from pydantic import Field
 
 from linux_mcp_server.audit import log_tool_call
 from linux_mcp_server.commands import get_command
 from linux_mcp_server.commands import get_command_group
+from linux_mcp_server.metrics_collector import downsample
+from linux_mcp_server.metrics_collector import get_collector
+from linux_mcp_server.metrics_collector import LOCAL_HOST
+from linux_mcp_server.metrics_collector import Metric
 from linux_mcp_server.models import CpuInfo
+from linux_mcp_server.models import CpuUtilization
+from linux_mcp_server.models import DiskRates
 from linux_mcp_server.models import DiskUsage
+from linux_mcp_server.models import InterfaceRates
+from linux_mcp_server.models import MetricSeries
+from linux_mcp_server.models import MetricsHistory
+from linux_mcp_server.models import PressureInfo
+from linux_mcp_server.models import PressureStall
+from linux_mcp_server.models import SystemActivity
 from linux_mcp_server.models import SystemInfo
 from linux_mcp_server.models import SystemMemory
+from linux_mcp_server.parsers import parse_activity_samples
 from linux_mcp_server.parsers import parse_cpu_info
-from linux_mcp_server.parsers import parse_free_output
+from linux_mcp_server.parsers import parse_meminfo
+from linux_mcp_server.parsers import parse_pressure_samples
+from linux_mcp_server.parsers import parse_slab_caches
 from linux_mcp_server.parsers import parse_system_info
+from linux_mcp_server.parsers import parse_system_memory
+from linux_mcp_server.parsers import split_sections
 from linux_mcp_server.server import mcp
 from linux_mcp_server.utils.decorators import disallow_local_execution_in_containers
 from linux_mcp_server.utils.types import Host
 from linux_mcp_server.utils.validation import is_successful_output
 
 
+# Longest pause between two samples, well below the command timeout
+MAX_SAMPLE_INTERVAL = 10
+
+# A cgroup path relative to /sys/fs/cgroup, e.g. "system.slice/sshd.service"
+CGROUP_PATTERN = r"^[\w@:.-]+(/[\w@:.-]+)*$"
+
+# Size of the sectors counted in /proc/diskstats, whatever the device's own sector size
+DISKSTATS_SECTOR_BYTES = 512
+
+
 @mcp.tool(
     title="Get system information",
     description="Get basic system information such as operating system, distribution, kernel version, uptime, and last boot time.",
@@ -52,59 +86,116 @@ async def get_system_information(
 
 @mcp.tool(
     title="Get CPU information",
-    description="Get CPU information.",
+    description="Get CPU model, logical and physical core counts, packages, current frequencies, load averages "
+    "and CPU utilization over a short interval. Optionally list every physical core with its logical CPUs "
+    "and frequency.",
     tags={"fixed", "cpu", "hardware", "performance", "system"},
     annotations=ToolAnnotations(readOnlyHint=True),
 )
 @log_tool_call
 @disallow_local_execution_in_containers
 async def get_cpu_information(
+    interval: t.Annotated[
+        float,
+        Field(
+            description="Seconds over which CPU utilization is measured (0-10). 0 reports the average since boot. "
+            "Default: 0.5",
+            ge=0,
+            le=MAX_SAMPLE_INTERVAL,
+        ),
+    ] = 0.5,
+    per_core: t.Annotated[
+        bool,
+        Field(description="List every physical core with its logical CPUs and frequency. Default: false"),
+    ] = False,
     host: Host = None,
 ) -> CpuInfo:
     """Get CPU information.
 
-    Retrieves CPU model, core counts (logical and physical), frequency,
-    and current load averages (1, 5, and 15 minute).
+    Retrieves CPU model, core counts (logical and physical), packages,
+    frequencies, load averages (1, 5, and 15 minute) and utilization.
+    /proc/cpuinfo and /proc/loadavg are read once, and the aggregate line of
+    /proc/stat before and after the interval, in a single execution.
     """
-    group = get_command_group("cpu_info")
-    results = {}
+    cmd = get_command("cpu_info")
 
-    # Execute all commands in the group
-    for name, cmd in group.commands.items():
-        returncode, stdout, _ = await cmd.run(host=host)
-        if is_successful_output(returncode, stdout):
-            results[name] = stdout
+    try:
+        returncode, stdout, _ = await cmd.run(host=host, interval=f"{interval:g}")
+    except Exception as e:
+        raise ToolError(f"Error gathering CPU information: {str(e)}") from e
+
+    if not is_successful_output(returncode, stdout):
+        return CpuInfo()
+
+    sections = split_sections(stdout)
+    info = parse_cpu_info(sections.get("cpuinfo", ""), sections.get("loadavg", ""))
 
-    return parse_cpu_info(results)
+    try:
+        samples = parse_activity_samples(stdout)
+    except ValueError:
+        samples = []
+
+    if samples and "cpu" in samples[-1].cpus:
+        before = samples[0].cpus if len(samples) > 1 else {"cpu": [0] * 8}
+        delta = _counter_deltas(before, samples[-1].cpus).get("cpu", [])
+        if len(delta) == 8:
+            info.utilization = _cpu_utilization("cpu", delta)
+
+    if not per_core:
+        info.cores = None
+
+    return info
 
 
 @mcp.tool(
     title="Get memory information",
-    description="Get detailed memory including physical and swap.",
+    description="Get detailed memory including physical and swap, a breakdown of where RAM went (page cache, "
+    "slab, shared memory, kernel stacks, huge pages, ...) and optionally the largest kernel slab caches.",
     tags={"fixed", "hardware", "memory", "performance", "system"},
     annotations=ToolAnnotations(readOnlyHint=True),
 )
 @log_tool_call
 @disallow_local_execution_in_containers
 async def get_memory_information(
+    slab_caches: t.Annotated[
+        int,
+        Field(
+            description="Number of largest kernel slab caches to list (0-100). Reading them usually requires root. "
+            "Default: 0",
+            ge=0,
+            le=100,
+        ),
+    ] = 0,
     host: Host = None,
 ) -> SystemMemory:
     """Get memory information.
 
-    Retrieves physical RAM and swap usage including total, used, free,
-    shared, buffers, cached, and available memory.
+    Reads /proc/meminfo and returns RAM and swap totals like free, every
+    meminfo field, and a breakdown of where RAM went: page cache, anonymous
+    memory, shared memory, slab, kernel stacks, page tables, vmalloc, per-CPU
+    allocations and huge pages. With slab_caches, the largest caches of
+    /proc/slabinfo are selected on the target in the same execution.
     """
-    # Execute free command
-    free_cmd = get_command("memory_info", "free")
+    cmd = get_command("memory_info", "meminfo")
 
     try:
-        returncode, stdout, stderr = await free_cmd.run(host=host)
+        returncode, stdout, stderr = await cmd.run(host=host, slab_caches=slab_caches)
     except Exception as e:
         raise ToolError(f"Error gathering memory information: {str(e)}") from e
 
     if not is_successful_output(returncode, stdout):
         raise ToolError(f"Unable to retrieve memory information: {stderr}")
-    return parse_free_output(stdout)
+
+    sections = split_sections(stdout)
+    try:
+        memory = parse_system_memory(parse_meminfo(sections.get("meminfo", "")))
+    except KeyError:
+        raise ToolError("Unexpected output reading memory information") from None
+
+    if "slabinfo" in sections:
+        memory.slab_caches = parse_slab_caches(sections["slabinfo"])
+
+    return memory
 
 
 @mcp.tool(
@@ -174,3 +265,263 @@ async def get_hardware_information(
             raise ToolError(f"Error gathering hardware information: {str(e)}") from e
 
     return results
+
+
+def _counter_deltas(before: dict[str, list[int]], after: dict[str, list[int]]) -> dict[str, list[int]]:
+    """Subtract the counter vectors of two samples for names present in both.
+
+    Counters that went backwards, e.g. after a device was re-added, count as
+    unchanged.
+    """
+    return {
+        name: [max(new - old, 0) for old, new in zip(before[name], counters, strict=False)]
+        for name, counters in after.items()
+        if name in before
+    }
+
+
+def _cpu_utilization(name: str, delta: list[int]) -> CpuUtilization | None:
+    total = sum(delta)
+    if total == 0:
+        return None
+
+    user, nice, system, idle, iowait, irq, softirq, steal = (100 * value / total for value in delta)
+    return CpuUtilization(
+        cpu=name,
+        busy_percent=round(100 - idle - iowait, 2),
+        user_percent=round(user + nice, 2),
+        system_percent=round(system + irq + softirq, 2),
+        iowait_percent=round(iowait, 2),
+        steal_percent=round(steal, 2),
+        idle_percent=round(idle, 2),
+    )
+
+
+def _interface_rates(name: str, delta: list[int], interval: float) -> InterfaceRates:
+    rate = [round(value / interval, 2) for value in delta]
+    return InterfaceRates(
+        interface=name,
+        rx_bytes_per_sec=rate[0],
+        tx_bytes_per_sec=rate[8],
+        rx_packets_per_sec=rate[1],
+        tx_packets_per_sec=rate[9],
+        rx_errors_per_sec=round(rate[2] + rate[3], 2),
+        tx_errors_per_sec=round(rate[10] + rate[11], 2),
+    )
+
+
+def _disk_rates(name: str, delta: list[int], interval: float) -> DiskRates:
+    reads, _, sectors_read, read_ms, writes, _, sectors_written, write_ms, _, io_ms, _ = delta
+    return DiskRates(
+        device=name,
+        read_iops=round(reads / interval, 2),
+        write_iops=round(writes / interval, 2),
+        read_bytes_per_sec=round(sectors_read * DISKSTATS_SECTOR_BYTES / interval, 2),
+        write_bytes_per_sec=round(sectors_written * DISKSTATS_SECTOR_BYTES / interval, 2),
+        read_await_ms=round(read_ms / reads, 2) if reads else None,
+        write_await_ms=round(write_ms / writes, 2) if writes else None,
+        utilization_percent=round(min(100 * io_ms / (interval * 1000), 100.0), 2),
+    )
+
+
+@mcp.tool(
+    title="Get system activity",
+    description="Sample CPU, network and disk counters twice, an interval apart, and report per-CPU utilization, "
+    "per-interface traffic rates and per-disk IOPS, throughput, await and utilization.",
+    tags={"fixed", "cpu", "disk", "network", "performance", "system"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def get_system_activity(
+    interval: t.Annotated[
+        float,
+        Field(description="Seconds between the two samples (0.1-10). Default: 1", ge=0.1, le=MAX_SAMPLE_INTERVAL),
+    ] = 1,
+    host: Host = None,
+) -> SystemActivity:
+    """Get current CPU, network and disk activity.
+
+    Reads /proc/stat, /proc/net/dev and /proc/diskstats twice in a single
+    execution on the target, so both samples come over one connection and
+    the interval is measured with the target's uptime. Disks that have never
+    completed any I/O, such as unused loop devices, are left out.
+    """
+    cmd = get_command("activity_sample")
+    returncode, stdout, stderr = await cmd.run(host=host, interval=f"{interval:g}")
+
+    if returncode != 0:
+        raise ToolError(f"Error sampling system activity: {stderr}")
+
+    try:
+        samples = parse_activity_samples(stdout)
+    except ValueError:
+        raise ToolError("Unexpected output sampling system activity") from None
+
+    if len(samples) != 2 or samples[1].uptime <= samples[0].uptime:
+        raise ToolError("Unexpected output sampling system activity")
+
+    first, second = samples
+    elapsed = second.uptime - first.uptime
+    cpus = [
+        utilization
+        for name, delta in _counter_deltas(first.cpus, second.cpus).items()
+        if len(delta) == 8 and (utilization := _cpu_utilization(name, delta)) is not None
+    ]
+    interfaces = [
+        _interface_rates(name, delta, elapsed)
+        for name, delta in _counter_deltas(first.interfaces, second.interfaces).items()
+    ]
+    disks = [
+        _disk_rates(name, delta, elapsed)
+        for name, delta in _counter_deltas(first.disks, second.disks).items()
+        if second.disks[name][0] or second.disks[name][4]
+    ]
+
+    return SystemActivity(interval=round(elapsed, 3), cpus=cpus, interfaces=interfaces, disks=disks)
+
+
+def _metric_series(
+    metric: str, times: list[float], values: list[float], start: float, end: float, points: int
+) -> MetricSeries:
+    finite = sorted(round(value, 2) for value in values if not math.isnan(value))
+    last = next((round(value, 2) for value in reversed(values) if not math.isnan(value)), None)
+    return MetricSeries(
+        metric=metric,
+        values=[None if value is None else round(value, 2) for value in downsample(times, values, start, end, points)],
+        samples=len(finite),
+        min=finite[0] if finite else None,
+        max=finite[-1] if finite else None,
+        mean=round(sum(finite) / len(finite), 2) if finite else None,
+        # Nearest-rank percentile
+        p95=finite[math.ceil(0.95 * len(finite)) - 1] if finite else None,
+        last=last,
+    )
+
+
+@mcp.tool(
+    title="Get metrics history",
+    description="Get load, CPU, memory, network and pressure metrics collected in the background over a recent "
+    "time window, downsampled, with min, max, mean, 95th percentile and last value. Only hosts configured in "
+    "LINUX_MCP_COLLECTOR_HOSTS are collected.",
+    tags={"fixed", "cpu", "memory", "network", "performance", "system"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def get_metrics_history(
+    metrics: t.Annotated[
+        list[Metric] | None,
+        Field(description="Metrics to return. Default: all"),
+    ] = None,
+    minutes: t.Annotated[
+        int, Field(description="Length of the window ending now, in minutes (1-1440). Default: 60", ge=1, le=1440)
+    ] = 60,
+    points: t.Annotated[
+        int, Field(description="Number of averaged points per metric (1-500). Default: 60", ge=1, le=500)
+    ] = 60,
+    host: Host = None,
+) -> MetricsHistory:
+    """Get the recent history of collected metrics.
+
+    Answers from the in-memory ring buffers of the background collector
+    without running anything on the target. CPU and network rates are
+    computed between consecutive samples, pressure values are the "some"
+    10 second averages.
+    """
+    # Samples of the local system are kept under None, so host="local" is a remote host
+    name = host or LOCAL_HOST
+    buffer = get_collector().buffers.get(host)
+    if buffer is None:
+        raise ToolError(f"Metrics are not collected for {name}. Add it to LINUX_MCP_COLLECTOR_HOSTS.")
+
+    end = time.time()
+    start = end - minutes * 60
+    times, columns = buffer.window(start, end)
+    width = (end - start) / points
+    return MetricsHistory(
+        host=name,
+        interval=get_collector().interval,
+        start=datetime.fromtimestamp(start, tz=timezone.utc),
+        end=datetime.fromtimestamp(end, tz=timezone.utc),
+        timestamps=[datetime.fromtimestamp(start + index * width, tz=timezone.utc) for index in range(points)],
+        series=[
+            _metric_series(metric, times, columns[metric], start, end, points)
+            for metric in dict.fromkeys(metrics or Metric)
+        ],
+    )
+
+
+def _with_stall_rate(stall: PressureStall, total_before: int | None, interval: float) -> PressureStall:
+    if total_before is None or stall.total_usec < total_before:
+        return stall
+
+    stalled = 100 * (stall.total_usec - total_before) / (interval * 1_000_000)
+    return stall.model_copy(update={"stall_percent": round(min(stalled, 100.0), 2)})
+
+
+@mcp.tool(
+    title="Get pressure stall information",
+    description="Get CPU, memory, I/O and IRQ pressure (PSI) of the system or of one cgroup: the share of time "
+    "tasks were stalled waiting for each resource, averaged over 10, 60 and 300 seconds, and the current stall "
+    "rate over a short sampling interval.",
+    tags={"fixed", "cpu", "memory", "performance", "system", "troubleshooting"},
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+@log_tool_call
+@disallow_local_execution_in_containers
+async def get_pressure_information(
+    cgroup: t.Annotated[
+        str | None,
+        Field(
+            description="cgroup to read instead of the whole system, relative to /sys/fs/cgroup. Requires cgroup v2",
+            examples=["system.slice", "system.slice/sshd.service"],
+            pattern=CGROUP_PATTERN,
+        ),
+    ] = None,
+    interval: t.Annotated[
+        float,
+        Field(
+            description="Seconds between two samples used to compute the current stall rate (0-10). "
+            "0 reads the averages only. Default: 1",
+            ge=0,
+            le=MAX_SAMPLE_INTERVAL,
+        ),
+    ] = 1,
+    host: Host = None,
+) -> PressureInfo:
+    """Get pressure stall information.
+
+    Reads every pressure file of /proc/pressure, or of the cgroup, with
+    one awk process per sample, and both samples in a single execution on
+    the target. The stall rate is the growth of the total stall time over
+    the target's uptime difference. Load averages count runnable and
+    blocked tasks regardless of the number of CPUs, while pressure shows how
+    much work was actually delayed.
+    """
+    if cgroup and any(part in (".", "..") for part in cgroup.split("/")):
+        raise ToolError(f"Invalid cgroup: {cgroup}")
+
+    directory, suffix = (f"/sys/fs/cgroup/{cgroup}", ".pressure") if cgroup else ("/proc/pressure", "")
+    cmd = get_command("pressure")
+    returncode, stdout, stderr = await cmd.run(host=host, directory=directory, suffix=suffix, interval=f"{interval:g}")
+
+    if returncode != 0:
+        raise ToolError(f"Error reading pressure stall information: {stderr}")
+
+    try:
+        samples = parse_pressure_samples(stdout)
+    except (ValueError, KeyError):
+        raise ToolError("Unexpected output reading pressure stall information") from None
+
+    if not samples:
+        raise ToolError("Unexpected output reading pressure stall information")
+
+    uptime, pressures = samples[-1]
+    elapsed = None
+    if len(samples) > 1 and uptime > samples[0][0]:
+        elapsed = uptime - samples[0][0]
+        before = {(stall.resource, stall.kind): stall.total_usec for stall in samples[0][1]}
+        pressures = [_with_stall_rate(stall, before.get((stall.resource, stall.kind)), elapsed) for stall in pressures]
+
+    return PressureInfo(cgroup=cgroup, interval=None if elapsed is None else round(elapsed, 3), pressures=pressures)
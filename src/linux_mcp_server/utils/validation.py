@@ -1,6 +1,13 @@
+import re
+import warnings
+
 from pathlib import Path
 
 
+# Longest pattern accepted by validate_log_pattern
+MAX_PATTERN_LENGTH = 512
+
+
 class PathValidationError(ValueError):
     """Raised when path validation fails.
 
@@ -60,6 +67,58 @@ def validate_path(path: str) -> Path:
     return Path(path)
 
 
+def validate_log_pattern(pattern: str) -> str:
+    """Validate a POSIX extended regular expression used to filter log lines.
+
+    The pattern is matched by awk on the target, so only syntax that means
+    the same in every awk is accepted:
+    - Rejects patterns longer than MAX_PATTERN_LENGTH characters
+    - Rejects newlines, carriage returns, and null bytes
+    - Rejects backreferences, Perl-style shorthands such as ``\\d``, and
+      ``(?`` groups
+    - Rejects interval expressions such as ``{3}``, which mawk matches
+      literally; escaped braces are literal everywhere and allowed
+    - Requires the pattern to compile as a regular expression
+
+    Args:
+        pattern: The pattern to validate. An empty pattern disables filtering.
+
+    Returns:
+        The validated pattern.
+
+    Raises:
+        ValueError: If the pattern fails any validation check.
+    """
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise ValueError(f"Pattern is longer than {MAX_PATTERN_LENGTH} characters")
+
+    if any(c in pattern for c in ["\n", "\r", "\x00"]):
+        raise ValueError(f"Pattern contains invalid characters: {pattern!r}")
+
+    for escape in re.finditer(r"\\(.)", pattern):
+        if escape.group(1).isalnum() and escape.group(1) != "t":
+            raise ValueError(f"Unsupported escape sequence in pattern: \\{escape.group(1)}")
+
+    if "(?" in pattern:
+        raise ValueError("Pattern groups starting with '(?' are not supported")
+
+    if interval := re.search(r"(?<!\\)\{(\d+(,\d*)?|,\d+)\}", pattern):
+        raise ValueError(
+            f"Interval expressions such as {interval.group()} are not supported by every awk: "
+            "repeat the expression instead, e.g. [0-9][0-9][0-9] for [0-9]{3}"
+        )
+
+    try:
+        # Python warns about POSIX bracket expressions such as [[:digit:]]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid pattern: {e}") from None
+
+    return pattern
+
+
 def is_empty_output(stdout: str | None) -> bool:
     """Check if command output is empty or whitespace-only.
 
@@ -0,0 +1,127 @@
+import stat
+
+from pathlib import Path
+
+import asyncssh
+import pytest
+
+from linux_mcp_server.connection.sftp import get_file_backend
+from linux_mcp_server.connection.sftp import is_directory
+from linux_mcp_server.connection.sftp import is_regular_file
+from linux_mcp_server.connection.sftp import SFTPFileBackend
+from linux_mcp_server.connection.sftp import SFTPSessionManager
+from linux_mcp_server.connection.ssh import SSHConnectionManager
+from linux_mcp_server.execution_context import ExecutionContext
+from linux_mcp_server.execution_context import use_execution_context
+
+
+@pytest.fixture
+def mock_sftp(mocker):
+    return mocker.AsyncMock(asyncssh.SFTPClient, name="sftp")
+
+
+@pytest.fixture
+def mock_connection(mocker, mock_sftp):
+    mock_connection = mocker.AsyncMock(asyncssh.SSHClientConnection, name="connection")
+    mock_connection.start_sftp_client = mocker.AsyncMock(return_value=mock_sftp)
+    return mock_connection
+
+
+@pytest.fixture
+def session_manager(mocker, mock_connection):
+    mock_manager = mocker.Mock(spec=SSHConnectionManager)
+    mock_manager.get_connection = mocker.AsyncMock(return_value=mock_connection)
+    mocker.patch("linux_mcp_server.connection.sftp._connection_manager", mock_manager)
+    mocker.patch("linux_mcp_server.connection.sftp._session_manager", SFTPSessionManager())
+
+    with use_execution_context(ExecutionContext(allow_ssh_default=True)):
+        yield
+
+
+async def test_get_file_backend_shares_session(session_manager, mock_connection):
+    first = await get_file_backend("host1")
+    second = await get_file_backend("host1")
+
+    assert isinstance(first, SFTPFileBackend)
+    assert isinstance(second, SFTPFileBackend)
+    mock_connection.start_sftp_client.assert_called_once()
+
+
+async def test_get_file_backend_unavailable(session_manager, mock_connection):
+    mock_connection.start_sftp_client.side_effect = asyncssh.ChannelOpenError(1, "subsystem request failed")
+
+    assert await get_file_backend("host1") is None
+    assert await get_file_backend("host1") is None
+    mock_connection.start_sftp_client.assert_called_once()
+
+
+async def test_get_file_backend_local_or_disabled(session_manager, mocker, mock_connection):
+    assert await get_file_backend(None) is None
+
+    mocker.patch("linux_mcp_server.connection.sftp.CONFIG.sftp", False)
+    assert await get_file_backend("host1") is None
+
+    mock_connection.start_sftp_client.assert_not_called()
+
+
+async def test_get_file_backend_remote_not_allowed(session_manager):
+    with use_execution_context(ExecutionContext(allow_ssh_default=False)):
+        with pytest.raises(RuntimeError, match="Remote execution not allowed"):
+            await get_file_backend("host1")
+
+
+async def test_backend_read(mocker, mock_sftp):
+    mock_file = mocker.AsyncMock(asyncssh.SFTPClientFile)
+    mock_file.read.return_value = b"data"
+    mock_sftp.open = mocker.MagicMock()
+    mock_sftp.open.return_value.__aenter__.return_value = mock_file
+
+    data = await SFTPFileBackend("host1", mock_sftp).read(Path("/etc/hosts"), 10, 4)
+
+    assert data == b"data"
+    mock_sftp.open.assert_called_once_with("/etc/hosts", "rb")
+    mock_file.read.assert_awaited_once_with(4, 10)
+
+
+async def test_backend_scandir_skips_dot_entries(mocker, mock_sftp):
+    async def scandir(path):
+        for name in (".", "..", "a.txt", "b"):
+            yield asyncssh.SFTPName(name, attrs=asyncssh.SFTPAttrs())
+
+    mock_sftp.scandir = scandir
+
+    entries = await SFTPFileBackend("host1", mock_sftp).scandir(Path("/srv"))
+
+    assert [entry.filename for entry in entries] == ["a.txt", "b"]
+
+
+async def test_backend_statvfs_unsupported(mock_sftp):
+    mock_sftp.statvfs.side_effect = asyncssh.SFTPOpUnsupported("statvfs not supported")
+
+    assert await SFTPFileBackend("host1", mock_sftp).statvfs(Path("/proc/loadavg")) is None
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    (
+        (asyncssh.SFTPNoSuchFile("no such file"), FileNotFoundError),
+        (asyncssh.SFTPPermissionDenied("denied"), PermissionError),
+        (asyncssh.SFTPFailure("failure"), OSError),
+        (asyncssh.ConnectionLost("lost"), ConnectionError),
+    ),
+)
+async def test_backend_error_mapping(mock_sftp, error, expected):
+    mock_sftp.stat.side_effect = error
+
+    with pytest.raises(expected):
+        await SFTPFileBackend("host1", mock_sftp).stat(Path("/srv"))
+
+
+def test_file_type_helpers():
+    regular = asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o644)
+    directory = asyncssh.SFTPAttrs(permissions=stat.S_IFDIR | 0o755)
+    unknown = asyncssh.SFTPAttrs()
+
+    assert is_regular_file(regular) and not is_directory(regular)
+    assert is_directory(directory) and not is_regular_file(directory)
+    assert not is_regular_file(unknown) and not is_directory(unknown)
@@ -4,14 +4,21 @@ tools_list = [
     "get_system_information",
     "get_cpu_information",
     "get_memory_information",
+    "get_system_activity",
+    "get_metrics_history",
+    "get_pressure_information",
     "get_disk_usage",
     "get_hardware_information",
     "list_services",
+    "get_service_states",
     "get_service_status",
+    "get_triage_summary",
+    "get_unit_resources",
     "get_service_logs",
     "list_processes",
     "get_process_info",
     "get_journal_logs",
+    "get_kernel_logs",
     "read_log_file",
     "get_network_interfaces",
     "get_network_connections",
@@ -19,6 +26,7 @@ tools_list = [
     "list_block_devices",
     "list_directories",
     "list_files",
+    "find_largest_files",
     "read_file",
 ]
 
@@ -90,8 +90,8 @@ async def test_get_service_logs_matches_journalctl(mcp_session):
     response = await mcp_session.call_tool("get_service_logs", arguments={"service_name": SERVICE_NAME, "lines": lines})
     assert response is not None
 
-    # Get actual logs from journalctl for comparison (use LC_ALL=C to match server locale)
-    actual_logs = shell(f"LC_ALL=C journalctl -u {SERVICE_NAME} -n {lines} --no-pager", silent=True).stdout.strip()
+    # Get the actual messages from journalctl for comparison
+    actual_messages = shell(f"journalctl -u {SERVICE_NAME} -n {lines} --no-pager -o cat", silent=True).stdout.strip()
 
     response_text = response.content[0].text
     assert len(response_text) > 0
@@ -99,8 +99,8 @@ async def test_get_service_logs_matches_journalctl(mcp_session):
     # Extract log lines (skip the header and empty line from the response)
     response_lines = [line for line in response_text.splitlines()[1:] if line]
 
-    # Verify that the log lines match
-    assert response_lines == actual_logs.splitlines()
+    # Lines are rendered as "TIMESTAMP HOST IDENTIFIER[PID]: MESSAGE"
+    assert [line.split(": ", 1)[1] for line in response_lines] == actual_messages.splitlines()
 
 
 async def test_get_service_logs_non_existing_service(mcp_session):
@@ -113,7 +113,7 @@ async def test_get_service_logs_non_existing_service(mcp_session):
     )
     assert response is not None
 
-    assert "-- No entries --" in response.content[0].text
+    assert "No log entries found" in response.content[0].text
 
 
 async def test_get_service_logs_empty_argument(mcp_session):
@@ -141,8 +141,8 @@ async def test_get_service_logs_with_service_suffix(mcp_session):
     # Verify the response contains the expected header (with .service in name)
     assert f"=== Last {lines} log entries for {service_name} ===" in response.content[0].text
 
-    # Get actual logs from journalctl for comparison (use LC_ALL=C to match server locale)
-    actual_logs = shell(f"LC_ALL=C journalctl -u {service_name} -n {lines} --no-pager", silent=True).stdout.strip()
+    # Get the actual messages from journalctl for comparison
+    actual_messages = shell(f"journalctl -u {service_name} -n {lines} --no-pager -o cat", silent=True).stdout.strip()
 
     response_text = response.content[0].text
     assert len(response_text) > 0
@@ -150,5 +150,5 @@ async def test_get_service_logs_with_service_suffix(mcp_session):
     # Extract log lines (skip the header and empty line from the response)
     response_lines = [line for line in response_text.splitlines()[1:] if line]
 
-    # Verify that the log lines match
-    assert response_lines == actual_logs.splitlines()
+    # Lines are rendered as "TIMESTAMP HOST IDENTIFIER[PID]: MESSAGE"
+    assert [line.split(": ", 1)[1] for line in response_lines] == actual_messages.splitlines()
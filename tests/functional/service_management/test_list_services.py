@@ -1,5 +1,7 @@
 # Copyright Contributors to the linux-mcp-server project
 # SPDX-License-Identifier: Apache-2.0
+import json
+
 from utils.shell import shell
 
 
@@ -8,23 +10,23 @@ async def test_list_services_happy_path(mcp_session):
     Verify that the server lists correctly all the systemd services.
     Happy path test - basic invocation should return service information.
     """
-    response = await mcp_session.call_tool("list_services")
+    response = await mcp_session.call_tool("list_services", arguments={"limit": 1000})
     assert response is not None
-    assert response.content[0].text is not None
-
-    # Verify the response contains the expected header
-    assert "=== System Services ===" in response.content[0].text
+    content = json.loads(response.content[0].text)
 
-    actual_services = shell("systemctl list-units --type=service --all --no-pager", silent=True).stdout.strip()
-    assert actual_services in response.content[0].text
+    actual_services = shell(
+        "systemctl list-units --type=service --all --no-pager --plain --no-legend", silent=True
+    ).stdout.strip()
+    actual_units = {line.split()[0] for line in actual_services.splitlines() if line.strip()}
+    listed_units = {service["unit"] for service in content["services"]}
+    assert listed_units == actual_units
 
-    # Verify that some common services are present (sshd or systemd-journald are common)
     # We check for .service suffix which all services should have
-    assert ".service" in response.content[0].text
+    assert all(unit.endswith(".service") for unit in listed_units)
 
-    # Verify summary is present
-    assert "Summary:" in response.content[0].text
-    assert "services currently running" in response.content[0].text
+    # Verify the counts cover every service
+    assert content["total"] == len(actual_units)
+    assert sum(content["sub_states"].values()) == content["total"]
 
 
 async def test_list_services_contains_known_service(mcp_session):
@@ -32,17 +34,12 @@ async def test_list_services_contains_known_service(mcp_session):
     Verify that a known running service appears in the list.
     Uses systemd-journald as it's a core service that should always be present.
     """
-    response = await mcp_session.call_tool("list_services")
+    response = await mcp_session.call_tool("list_services", arguments={"pattern": "systemd-journald*"})
     assert response is not None
 
-    # At least verify that we got some services in the response
-    assert len(response.content[0].text) > 100  # Should be substantial output
-
-    # Verify that the response has proper service line format
-    # Services are listed with their state (running, exited, etc.)
-    lines = response.content[0].text.split("\n")
-    service_lines = [line for line in lines if ".service" in line]
-    assert len(service_lines) > 0, "Expected at least one service in the output"
+    services = json.loads(response.content[0].text)["services"]
+    assert len(services) > 0, "Expected at least one service in the output"
 
-    # Verify that systemd-journald (a core service) is present
-    assert "systemd-journald.service" in response.content[0].text
+    # Verify that systemd-journald (a core service) is present and running
+    journald = next(service for service in services if service["unit"] == "systemd-journald.service")
+    assert journald["sub"] == "running"
@@ -0,0 +1,52 @@
+import pytest
+
+from linux_mcp_server.parsers import ActivitySample
+from linux_mcp_server.parsers import parse_activity_samples
+
+
+def test_parse_activity_samples():
+    stdout = """@@ sample 10.50
+@@ stat
+cpu  10 1 5 100 2 0 3 0 7 0
+cpu0 10 1 5 100 2 0 3 0 7 0
+@@ net
+    lo:    1000      10    0    0    0     0          0         0     1000      10    0    0    0     0       0          0
+  eth0:123456789012 5 1 2 0 0 0 0 700 6 0 0 0 0 0 0
+@@ disk
+ 254       0 vda 23229 11072 1892602 7699 16503 58661 1779456 8910 0 6016 18387 22969 0 806760 1769 309 7
+   8       1 sda1 5 0 40 1 0 0 0 0 0 1 1
+"""
+
+    (sample,) = parse_activity_samples(stdout)
+
+    assert sample == ActivitySample(
+        uptime=10.5,
+        cpus={"cpu": [10, 1, 5, 100, 2, 0, 3, 0], "cpu0": [10, 1, 5, 100, 2, 0, 3, 0]},
+        interfaces={
+            "lo": [1000, 10, 0, 0, 0, 0, 0, 0, 1000, 10, 0, 0, 0, 0, 0, 0],
+            "eth0": [123456789012, 5, 1, 2, 0, 0, 0, 0, 700, 6, 0, 0, 0, 0, 0, 0],
+        },
+        disks={
+            "vda": [23229, 11072, 1892602, 7699, 16503, 58661, 1779456, 8910, 0, 6016, 18387],
+            "sda1": [5, 0, 40, 1, 0, 0, 0, 0, 0, 1, 1],
+        },
+    )
+
+
+def test_parse_activity_samples_several():
+    samples = parse_activity_samples("@@ sample 1.00\n@@ stat\n@@ sample 2.00\n@@ net\n")
+
+    assert [sample.uptime for sample in samples] == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "stdout",
+    [
+        "@@ stat\ncpu 1 2 3\n",
+        "@@ sample 1.00\n@@ stat\ncpu 1 two 3\n",
+        "@@ sample soon\n",
+    ],
+)
+def test_parse_activity_samples_malformed(stdout):
+    with pytest.raises(ValueError):
+        parse_activity_samples(stdout)
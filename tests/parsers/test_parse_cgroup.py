@@ -0,0 +1,46 @@
+import pytest
+
+from linux_mcp_server.models import UnitResources
+from linux_mcp_server.parsers import parse_cgroup_samples
+
+
+def test_parse_cgroup_samples():
+    stdout = """@@ sample 10.50
+web.service 9000 8000 500 5000 101 202 40
+init.scope 100 - - - - - -
+@@ sample 11.50
+web.service 9100 8100 500 6000 101 202 41
+"""
+
+    samples = parse_cgroup_samples(stdout)
+
+    assert [uptime for uptime, _ in samples] == [10.5, 11.5]
+    assert samples[0][1]["web.service"] == UnitResources(
+        unit="web.service",
+        memory_bytes=9000,
+        memory_anon_bytes=8000,
+        memory_file_bytes=500,
+        cpu_usage_usec=5000,
+        io_read_bytes=101,
+        io_write_bytes=202,
+        pids=40,
+    )
+    assert samples[0][1]["init.scope"] == UnitResources(unit="init.scope", memory_bytes=100)
+    assert list(samples[1][1]) == ["web.service"]
+
+
+def test_parse_cgroup_samples_empty():
+    assert parse_cgroup_samples("") == []
+
+
+@pytest.mark.parametrize(
+    "stdout",
+    [
+        "web.service 1 2 3 4 5 6 7\n",
+        "@@ sample 1.00\nweb.service 1 2 3\n",
+        "@@ sample 1.00\nweb.service 1 2 3 4 5 6 x\n",
+    ],
+)
+def test_parse_cgroup_samples_malformed(stdout):
+    with pytest.raises(ValueError):
+        parse_cgroup_samples(stdout)
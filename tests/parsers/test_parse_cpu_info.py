@@ -1,33 +1,96 @@
 import pytest
 
 from linux_mcp_server.parsers import parse_cpu_info
+from linux_mcp_server.parsers import parse_cpuinfo
+
+
+def cpuinfo_block(processor, package, core, mhz):
+    return (
+        f"processor\t: {processor}\n"
+        "vendor_id\t: GenuineIntel\n"
+        "model name\t: Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz\n"
+        f"cpu MHz\t\t: {mhz}\n"
+        f"physical id\t: {package}\n"
+        f"core id\t\t: {core}\n"
+        "flags\t\t: fpu vme de pse\n"
+        "\n"
+    )
+
+
+# Two packages with two cores each, both with two threads
+TWO_SOCKET_CPUINFO = "".join(
+    cpuinfo_block(processor, package, core, mhz)
+    for processor, package, core, mhz in (
+        (0, 0, 0, "1000.000"),
+        (1, 0, 1, "2000.000"),
+        (2, 1, 0, "3000.000"),
+        (3, 1, 1, "1500.000"),
+        (4, 0, 0, "1200.000"),
+        (5, 0, 1, "2000.000"),
+        (6, 1, 0, "3000.000"),
+        (7, 1, 1, "1500.000"),
+    )
+)
+
+ARM_CPUINFO = """\
+processor\t: 0
+BogoMIPS\t: 50.00
+CPU implementer\t: 0x41
+
+processor\t: 1
+BogoMIPS\t: 50.00
+CPU implementer\t: 0x41
+"""
+
+
+def test_parse_cpuinfo_blocks():
+    processors = parse_cpuinfo(ARM_CPUINFO)
+
+    assert processors == [
+        {"processor": "0", "BogoMIPS": "50.00", "CPU implementer": "0x41"},
+        {"processor": "1", "BogoMIPS": "50.00", "CPU implementer": "0x41"},
+    ]
 
 
 @pytest.mark.parametrize(
-    "stdout, expected",
+    "cpuinfo, load_avg, expected",
     [
-        ({}, {"model": "", "logical_cores": 0}),
+        ("", "", {"model": "", "logical_cores": 0, "physical_cores": 0, "cores": []}),
         (
+            TWO_SOCKET_CPUINFO,
+            "0.50 0.75 1.00 1/234 5678\n",
             {
-                "model": "model name\t: Intel(R) Core(TM) i7-10700 CPU @ 2.90GHz\n",
-                "logical_cores": "8\n",
-                "physical_cores": "core id\t\t: 0\ncore id\t\t: 1\ncore id\t\t: 2\ncore id\t\t: 3\n",
-                "frequency": "cpu MHz\t\t: 2900.000\n",
-                "load_avg": "0.50 0.75 1.00 1/234 5678\n",
-            },
-            {
-                "model": "Intel(R) Core(TM) i7-10700 CPU @ 2.90GHz",
+                "model": "Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz",
                 "logical_cores": 8,
                 "physical_cores": 4,
-                "frequency_mhz": 2900.0,
+                "packages": 2,
+                "frequency_mhz": 1900.0,
+                "frequency_min_mhz": 1000.0,
+                "frequency_max_mhz": 3000.0,
                 "load_avg_1m": 0.50,
                 "load_avg_5m": 0.75,
                 "load_avg_15m": 1.00,
             },
         ),
+        (
+            ARM_CPUINFO,
+            "",
+            {"model": "", "logical_cores": 2, "physical_cores": 0, "packages": 0, "frequency_mhz": 0.0, "cores": []},
+        ),
     ],
 )
-def test_parse_cpu_info(stdout, expected):
-    result = parse_cpu_info(stdout)
+def test_parse_cpu_info(cpuinfo, load_avg, expected):
+    result = parse_cpu_info(cpuinfo, load_avg)
 
     assert all(getattr(result, attr) == value for attr, value in expected.items())
+
+
+def test_parse_cpu_info_topology():
+    result = parse_cpu_info(TWO_SOCKET_CPUINFO)
+
+    assert [(core.package, core.core, core.processors, core.frequency_mhz) for core in result.cores] == [
+        (0, 0, [0, 4], 1200.0),
+        (0, 1, [1, 5], 2000.0),
+        (1, 0, [2, 6], 3000.0),
+        (1, 1, [3, 7], 1500.0),
+    ]
@@ -0,0 +1,102 @@
+import json
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from linux_mcp_server.models import JournalGroup
+from linux_mcp_server.models import MessageSample
+from linux_mcp_server.parsers import iter_journal_json
+from linux_mcp_server.parsers import iter_journal_records
+from linux_mcp_server.parsers import MAX_JOURNAL_MESSAGE_CHARS
+from linux_mcp_server.parsers import parse_journal_aggregate
+
+
+def test_iter_journal_json():
+    stdout = "\n".join(
+        [
+            json.dumps(
+                {
+                    "__CURSOR": "s=1;i=1",
+                    "__REALTIME_TIMESTAMP": "1704110400000000",
+                    "_HOSTNAME": "host",
+                    "SYSLOG_IDENTIFIER": "sshd",
+                    "SYSLOG_PID": "42",
+                    "_PID": "7",
+                    "MESSAGE": "Accepted publickey",
+                }
+            ),
+            "-- No entries --",
+            "{not json",
+            json.dumps(
+                {
+                    "__CURSOR": "s=1;i=2",
+                    "__REALTIME_TIMESTAMP": "1704110401000000",
+                    "_HOSTNAME": "host",
+                    "_COMM": "kworker",
+                    "MESSAGE": [104, 105, 255],
+                }
+            ),
+            json.dumps({"__CURSOR": "s=1;i=3", "__REALTIME_TIMESTAMP": "1704110402000000", "MESSAGE": None}),
+        ]
+    )
+
+    assert list(iter_journal_json(stdout)) == [
+        ("s=1;i=1", "2024-01-01T12:00:00+0000 host sshd[42]: Accepted publickey"),
+        ("s=1;i=2", "2024-01-01T12:00:01+0000 host kworker: hi�"),
+        ("s=1;i=3", "2024-01-01T12:00:02+0000  unknown: "),
+    ]
+
+
+def test_iter_journal_json_empty():
+    assert list(iter_journal_json("")) == []
+
+
+def test_iter_journal_records():
+    stdout = json.dumps(
+        {
+            "__CURSOR": "s=1;i=1",
+            "__REALTIME_TIMESTAMP": "1704110400123456",
+            "_HOSTNAME": "host",
+            "SYSLOG_IDENTIFIER": "nginx",
+            "MESSAGE": "started",
+        }
+    )
+
+    assert list(iter_journal_records(stdout)) == [
+        (1704110400123456, "s=1;i=1", "2024-01-01T12:00:00+0000 host nginx: started")
+    ]
+
+
+def test_iter_journal_json_long_message():
+    message = "x" * (MAX_JOURNAL_MESSAGE_CHARS + 10)
+    stdout = json.dumps({"__CURSOR": "c", "__REALTIME_TIMESTAMP": "0", "SYSLOG_IDENTIFIER": "app", "MESSAGE": message})
+
+    [(_, line)] = iter_journal_json(stdout)
+
+    assert line.endswith(f": {'x' * MAX_JOURNAL_MESSAGE_CHARS}... [truncated 10 characters]")
+
+
+def test_parse_journal_aggregate():
+    stdout = 'T 7 2\nG\t1700000000\tsshd.service\t3\t4\nS\t3\tbad \\"x\\"\nS\t1\tcut \\u00\nG\t1700003600\t\t\t1\n'
+
+    total, ungrouped, groups = parse_journal_aggregate(stdout)
+
+    assert (total, ungrouped) == (7, 2)
+    assert groups == [
+        JournalGroup(
+            start=datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc),
+            unit="sshd.service",
+            priority=3,
+            count=4,
+            samples=[MessageSample(message='bad "x"', count=3), MessageSample(message="cut ", count=1)],
+        ),
+        JournalGroup(start=datetime(2023, 11, 14, 23, 13, 20, tzinfo=timezone.utc), unit="", count=1),
+    ]
+
+
+@pytest.mark.parametrize("stdout", ["", "garbage\n", "T 1 0\nX\tfoo\n", "T 1 0\nG\t1\tunit\n"])
+def test_parse_journal_aggregate_malformed(stdout):
+    with pytest.raises(ValueError):
+        parse_journal_aggregate(stdout)
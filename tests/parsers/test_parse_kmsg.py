@@ -0,0 +1,27 @@
+from linux_mcp_server.parsers import parse_kmsg_records
+
+
+def test_parse_kmsg_records():
+    stdout = "\n".join(
+        [
+            "6,1,0,-;Linux version 6.8.0",
+            " SUBSYSTEM=pci",
+            "3,2,1234567,c;nvme0: I/O error; retrying",
+            "14,3,61000000,-;user message",
+            "garbage",
+            "x,4,0,-;bad level",
+        ]
+    )
+
+    lines, sequence = parse_kmsg_records(stdout)
+
+    assert lines == [
+        "[    0.000000] info: Linux version 6.8.0",
+        "[    1.234567] err: nvme0: I/O error; retrying",
+        "[   61.000000] info: user message",
+    ]
+    assert sequence == 3
+
+
+def test_parse_kmsg_records_empty():
+    assert parse_kmsg_records("") == ([], None)
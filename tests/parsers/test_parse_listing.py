@@ -1,7 +1,9 @@
 import pytest
 
 from linux_mcp_server.parsers import parse_directory_listing
+from linux_mcp_server.parsers import parse_directory_scan
 from linux_mcp_server.parsers import parse_file_listing
+from linux_mcp_server.parsers import parse_largest_files
 
 
 @pytest.mark.parametrize(
@@ -81,3 +83,52 @@ def test_parse_file_listing(stdout, order_by, expected_count, expected):
 
     assert len(result) == expected_count
     assert eval(expected)
+
+
+@pytest.mark.parametrize(
+    ("stdout", "expected"),
+    [
+        pytest.param("", ([], 0, None), id="empty"),
+        pytest.param(
+            "300\t1700000000.5\t/var/log/messages\n9000\t1700000001.0\t/var/lib/big file\nscanned\t42\nstatus\t124\n",
+            ([(300, 1700000000.5, "/var/log/messages"), (9000, 1700000001.0, "/var/lib/big file")], 42, 124),
+            id="trailer",
+        ),
+        pytest.param(
+            "10\t1700000000.0\t/var/a\nbogus line\nx\t1\t/var/b\n20\t1700000000.0\t/var/c\n",
+            ([(10, 1700000000.0, "/var/a"), (20, 1700000000.0, "/var/c")], 2, None),
+            id="fallback_without_trailer",
+        ),
+    ],
+)
+def test_parse_largest_files(stdout, expected):
+    assert parse_largest_files(stdout) == expected
+
+
+def test_parse_directory_scan():
+    stdout = (
+        "d\t4096\t1700000000.5\t/srv\n"
+        "d\t12288\t1700000001.0\t/srv/with\ttab\n"
+        "s\t900\t1700000002.0\t/srv/a/b\n"
+        "c\t/srv/a\n"
+        "l\t2049:17\t100\t/srv/b\n"
+        "l\t2049:17\t100\t/srv/a\n"
+        "l\t2049:18\t50\t/srv\n"
+        "t\t1700000003.25\n"
+        "garbage\nd\tx\t1\t/srv/bad\nt\tlater\n"
+    )
+
+    scan = parse_directory_scan(stdout)
+
+    assert scan.started == 1700000003.25
+    assert scan.directories == {
+        "/srv": (4096, 1700000000.5),
+        "/srv/with\ttab": (12288, 1700000001.0),
+    }
+    assert scan.summaries == {"/srv/a/b": (900, 1700000002.0)}
+    assert scan.children == {"/srv/a"}
+    assert scan.links == {"2049:17": ("/srv/a", 100), "2049:18": ("/srv", 50)}
+
+
+def test_parse_directory_scan_empty():
+    assert parse_directory_scan("") == (None, {}, {}, set(), {})
@@ -0,0 +1,78 @@
+import textwrap
+
+import pytest
+
+from linux_mcp_server.parsers import parse_meminfo
+from linux_mcp_server.parsers import parse_slab_caches
+from linux_mcp_server.parsers import parse_system_memory
+
+
+MEMINFO = textwrap.dedent(
+    """\
+    MemTotal:        6158152 kB
+    MemFree:         4200384 kB
+    MemAvailable:    5523220 kB
+    Buffers:          185428 kB
+    Cached:          1183684 kB
+    SwapTotal:             0 kB
+    SwapFree:              0 kB
+    AnonPages:        221656 kB
+    Shmem:              9484 kB
+    SReclaimable:     258560 kB
+    SUnreclaim:        33392 kB
+    KernelStack:        1184 kB
+    PageTables:         2304 kB
+    VmallocTotal:   34359738367 kB
+    VmallocUsed:       15928 kB
+    Percpu:              284 kB
+    HugePages_Total:       4
+    Hugepagesize:       2048 kB
+    """
+)
+
+
+def test_parse_meminfo():
+    meminfo = parse_meminfo(MEMINFO + "garbage\nEmpty:\n")
+
+    assert meminfo["MemTotal"] == 6158152 * 1024
+    assert meminfo["VmallocTotal"] == 34359738367 * 1024
+    assert meminfo["HugePages_Total"] == 4
+    assert "garbage" not in meminfo
+    assert "Empty" not in meminfo
+
+
+def test_parse_system_memory():
+    memory = parse_system_memory(parse_meminfo(MEMINFO))
+
+    assert memory.ram.total == 6158152 * 1024
+    assert memory.ram.used == (6158152 - 5523220) * 1024
+    assert memory.ram.cached == (1183684 + 258560) * 1024
+    assert memory.swap is not None
+    assert memory.swap.total == 0
+    assert memory.breakdown is not None
+    assert memory.breakdown.page_cache == (1183684 - 9484) * 1024
+    # Without a Hugetlb field, huge pages are counted from the pool size
+    assert memory.breakdown.hugetlb == 4 * 2048 * 1024
+    assert sum(memory.breakdown.model_dump().values()) == memory.ram.total
+
+
+def test_parse_system_memory_without_available():
+    memory = parse_system_memory({"MemTotal": 1000, "MemFree": 400})
+
+    assert memory.ram.available == 400
+    assert memory.ram.used == 600
+    assert memory.swap is None
+
+
+def test_parse_system_memory_missing_totals():
+    with pytest.raises(KeyError):
+        parse_system_memory({"MemFree": 400})
+
+
+def test_parse_slab_caches():
+    stdout = "dentry 185112 185283 192 36139008\nbroken line\nkmalloc-64 10 20 x 4096\n"
+
+    caches = parse_slab_caches(stdout)
+
+    assert [cache.name for cache in caches] == ["dentry"]
+    assert caches[0].size_bytes == 36139008
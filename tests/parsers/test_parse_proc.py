@@ -1,5 +1,10 @@
 import textwrap
 
+import pytest
+
+from linux_mcp_server.models import PressureStall
+from linux_mcp_server.parsers import parse_metrics_sample
+from linux_mcp_server.parsers import parse_pressure_samples
 from linux_mcp_server.parsers import parse_proc_net_dev
 from linux_mcp_server.parsers import parse_proc_status
 
@@ -60,3 +65,40 @@ def test_parse_proc_status():
     assert result["Threads"] == "1"
     assert result["VmRSS"] == "5000 kB"
     assert "SigPnd" not in result
+
+
+def test_parse_metrics_sample():
+    stdout = "uptime 8818.22\nload1 0.65\nMemTotal 6158152\npsi_cpu 6.24\nawk: warning\n\n"
+
+    assert parse_metrics_sample(stdout) == {"uptime": 8818.22, "load1": 0.65, "MemTotal": 6158152.0, "psi_cpu": 6.24}
+
+
+def test_parse_pressure_samples():
+    stdout = """@@ sample 10.50
+cpu some avg10=1.29 avg60=2.55 avg300=3.05 total=395361400
+io full avg10=0.00 avg60=0.00 avg300=0.00 total=0
+@@ sample 11.50
+cpu some avg10=1.30 avg60=2.55 avg300=3.05 total=395400000
+"""
+
+    samples = parse_pressure_samples(stdout)
+
+    assert [uptime for uptime, _ in samples] == [10.5, 11.5]
+    assert samples[0][1] == [
+        PressureStall(resource="cpu", kind="some", avg10=1.29, avg60=2.55, avg300=3.05, total_usec=395361400),
+        PressureStall(resource="io", kind="full", avg10=0.0, avg60=0.0, avg300=0.0, total_usec=0),
+    ]
+    assert samples[1][1][0].total_usec == 395400000
+
+
+@pytest.mark.parametrize(
+    "stdout, error",
+    [
+        ("cpu some avg10=1.00 avg60=1.00 avg300=1.00 total=1\n", ValueError),
+        ("@@ sample 1.00\ncpu some avg10=1.00 total=1\n", KeyError),
+        ("@@ sample 1.00\ncpu some avg10=x avg60=1.00 avg300=1.00 total=1\n", ValueError),
+    ],
+)
+def test_parse_pressure_samples_malformed(stdout, error):
+    with pytest.raises(error):
+        parse_pressure_samples(stdout)
@@ -0,0 +1,80 @@
+import pytest
+
+from linux_mcp_server.parsers import LogMatches
+from linux_mcp_server.parsers import LogSegment
+from linux_mcp_server.parsers import parse_log_file_output
+from linux_mcp_server.parsers import parse_log_matches_output
+from linux_mcp_server.parsers import parse_read_file_output
+
+
+@pytest.mark.parametrize(
+    "stdout, expected",
+    [
+        (
+            b"13 0 42-13-1700000000.123456789\nHello\nWorld\n",
+            (13, 0, "42-13-1700000000.123456789", b"Hello\nWorld\n"),
+        ),
+        (b"13 7 42-13-1700000000.123456789\n", (13, 7, "42-13-1700000000.123456789", b"")),
+        (b"0 0 -\n\xff\xfe", (0, 0, "", b"\xff\xfe")),
+    ],
+)
+def test_parse_read_file_output(stdout, expected):
+    assert parse_read_file_output(stdout) == expected
+
+
+@pytest.mark.parametrize("stdout", [b"", b"garbage", b"13 0\ncontent", b"x 0 1-1-1\n", b"13 0 \xff\n"])
+def test_parse_read_file_output_malformed(stdout):
+    with pytest.raises(ValueError):
+        parse_read_file_output(stdout)
+
+
+@pytest.mark.parametrize(
+    "stdout, expected_fingerprint, expected_segments",
+    [
+        (b"1-5-100\n", "1-5-100", []),
+        (b"1-5-100\nC 1 0 5\nabc\nd", "1-5-100", [LogSegment(False, 1, 0, 5, b"abc\nd")]),
+        (
+            b"7-4-100\nR 5 2 6\nx\nyzC 7 0 4\nnew\n",
+            "7-4-100",
+            [LogSegment(True, 5, 2, 6, b"x\nyz"), LogSegment(False, 7, 0, 4, b"new\n")],
+        ),
+    ],
+)
+def test_parse_log_file_output(stdout, expected_fingerprint, expected_segments):
+    assert parse_log_file_output(stdout) == (expected_fingerprint, expected_segments)
+
+
+@pytest.mark.parametrize("stdout", [b"1-5-100\ngarbage\n", b"1-5-100\nX 1 0 5\n", b"1-5-100\nR 1 0 50\nshort"])
+def test_parse_log_file_output_malformed(stdout):
+    with pytest.raises(ValueError):
+        parse_log_file_output(stdout)
+
+
+@pytest.mark.parametrize(
+    "stdout, expected_fingerprint, expected_segments",
+    [
+        (b"1-5-100\n", "1-5-100", []),
+        (b"1-5-100\nC 1 0 5\nM 0 4 0\n", "1-5-100", [LogMatches(False, 1, 0, 5, 0, 4, [])]),
+        (
+            b"7-4-100\nR 5 2 9\nM 3 7 2\nx\n\nC 7 0 4\nM 1 4 1\nnew\n",
+            "7-4-100",
+            [LogMatches(True, 5, 2, 9, 3, 7, [b"x", b""]), LogMatches(False, 7, 0, 4, 1, 4, [b"new"])],
+        ),
+    ],
+)
+def test_parse_log_matches_output(stdout, expected_fingerprint, expected_segments):
+    assert parse_log_matches_output(stdout) == (expected_fingerprint, expected_segments)
+
+
+@pytest.mark.parametrize(
+    "stdout",
+    [
+        b"1-5-100\nC 1 0 5\n",
+        b"1-5-100\nX 1 0 5\nM 0 0 0\n",
+        b"1-5-100\nC 1 0 5\nabc\n",
+        b"1-5-100\nC 1 0 5\nM 2 5 2\na\n",
+    ],
+)
+def test_parse_log_matches_output_malformed(stdout):
+    with pytest.raises(ValueError):
+        parse_log_matches_output(stdout)
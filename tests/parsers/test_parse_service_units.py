@@ -0,0 +1,69 @@
+import json
+import textwrap
+
+import pytest
+
+from linux_mcp_server.models import ServiceUnit
+from linux_mcp_server.parsers import parse_service_units
+
+
+SSH = ServiceUnit(unit="ssh.service", load="loaded", active="active", sub="running", description="OpenBSD Secure Shell")
+NGINX = ServiceUnit(unit="nginx.service", load="loaded", active="failed", sub="failed", description="nginx web server")
+MISSING = ServiceUnit(unit="missing.service", load="not-found", active="inactive", sub="dead")
+
+
+@pytest.mark.parametrize(
+    "stdout",
+    [
+        json.dumps(
+            [
+                {
+                    "unit": "ssh.service",
+                    "load": "loaded",
+                    "active": "active",
+                    "sub": "running",
+                    "description": "OpenBSD Secure Shell",
+                },
+                {
+                    "unit": "nginx.service",
+                    "load": "loaded",
+                    "active": "failed",
+                    "sub": "failed",
+                    "description": "nginx web server",
+                },
+                {"unit": "missing.service", "load": "not-found", "active": "inactive", "sub": "dead"},
+            ]
+        ),
+        textwrap.dedent(
+            """\
+            ssh.service     loaded    active   running OpenBSD Secure Shell
+            nginx.service   loaded    failed   failed  nginx web server
+            missing.service not-found inactive dead
+            """
+        ),
+        textwrap.dedent(
+            """\
+              UNIT            LOAD      ACTIVE   SUB     DESCRIPTION
+              ssh.service     loaded    active   running OpenBSD Secure Shell
+            ● nginx.service   loaded    failed   failed  nginx web server
+              missing.service not-found inactive dead
+
+            LOAD   = Reflects whether the unit definition was properly loaded.
+            3 loaded units listed.
+            """
+        ),
+    ],
+    ids=["json", "plain", "legend"],
+)
+def test_parse_service_units(stdout):
+    assert parse_service_units(stdout) == [SSH, NGINX, MISSING]
+
+
+def test_parse_service_units_empty():
+    assert parse_service_units("") == []
+    assert parse_service_units("[]") == []
+
+
+def test_parse_service_units_malformed_json():
+    with pytest.raises(ValueError):
+        parse_service_units("[{")
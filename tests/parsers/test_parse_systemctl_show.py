@@ -0,0 +1,76 @@
+import textwrap
+
+from linux_mcp_server.models import ServiceState
+from linux_mcp_server.parsers import parse_systemctl_show
+
+
+def test_parse_systemctl_show():
+    stdout = textwrap.dedent(
+        """\
+        MainPID=812
+        ExecMainStatus=0
+        NRestarts=2
+        Id=sshd.service
+        Description=OpenSSH server daemon
+        LoadState=loaded
+        ActiveState=active
+        SubState=running
+        Result=success
+        UnitFileState=enabled
+        ActiveEnterTimestamp=Mon 2024-01-01 12:00:00 UTC
+        MemoryCurrent=5242880
+        CPUUsageNSec=123456789
+        TasksCurrent=1
+
+        MainPID=0
+        ExecMainStatus=1
+        NRestarts=0
+        Id=nginx.service
+        LoadState=loaded
+        ActiveState=failed
+        SubState=failed
+        Result=exit-code
+        ActiveEnterTimestamp=
+        MemoryCurrent=[not set]
+        CPUUsageNSec=18446744073709551615
+        TasksCurrent=18446744073709551615
+
+        Id=missing.service
+        LoadState=not-found
+        ActiveState=inactive
+        """
+    )
+
+    assert parse_systemctl_show(stdout) == [
+        ServiceState(
+            unit="sshd.service",
+            description="OpenSSH server daemon",
+            load_state="loaded",
+            active_state="active",
+            sub_state="running",
+            unit_file_state="enabled",
+            result="success",
+            active_since="Mon 2024-01-01 12:00:00 UTC",
+            main_pid=812,
+            exit_status=0,
+            restarts=2,
+            memory_bytes=5242880,
+            cpu_usage_ns=123456789,
+            tasks=1,
+        ),
+        ServiceState(
+            unit="nginx.service",
+            load_state="loaded",
+            active_state="failed",
+            sub_state="failed",
+            result="exit-code",
+            exit_status=1,
+            restarts=0,
+        ),
+        ServiceState(unit="missing.service", load_state="not-found", active_state="inactive"),
+    ]
+
+
+def test_parse_systemctl_show_empty():
+    assert parse_systemctl_show("") == []
+    assert parse_systemctl_show("\n\nLoadState=loaded\n") == []
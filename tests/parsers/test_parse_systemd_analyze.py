@@ -0,0 +1,69 @@
+import textwrap
+
+import pytest
+
+from linux_mcp_server.models import ChainUnit
+from linux_mcp_server.models import UnitTiming
+from linux_mcp_server.parsers import parse_critical_chain
+from linux_mcp_server.parsers import parse_systemd_blame
+from linux_mcp_server.parsers import parse_timespan
+from linux_mcp_server.parsers import split_sections
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2.345s", 2.345),
+        ("456ms", 0.456),
+        ("12us", 0.000012),
+        ("1min 2.5s", 62.5),
+        ("1h 2min", 3720.0),
+        ("", None),
+        ("soon", None),
+        ("1min later", None),
+    ],
+)
+def test_parse_timespan(text, expected):
+    assert parse_timespan(text) == expected
+
+
+def test_parse_systemd_blame():
+    stdout = textwrap.dedent(
+        """\
+        1min 2.345s NetworkManager-wait-online.service
+             345ms nginx.service
+        Bootup is not yet finished.
+        """
+    )
+
+    assert parse_systemd_blame(stdout) == [
+        UnitTiming(unit="NetworkManager-wait-online.service", seconds=62.345),
+        UnitTiming(unit="nginx.service", seconds=0.345),
+    ]
+
+
+def test_parse_critical_chain():
+    stdout = textwrap.dedent(
+        """\
+        The time when unit became active or started is printed after the "@" character.
+        The time the unit took to start is printed after the "+" character.
+
+        graphical.target @5.123s
+        └─multi-user.target @5.122s
+          └─nginx.service @3.2s +1min 1.9s
+            └─network-online.target @3.1s
+        """
+    )
+
+    assert parse_critical_chain(stdout) == [
+        ChainUnit(unit="graphical.target", active_at=5.123),
+        ChainUnit(unit="multi-user.target", active_at=5.122),
+        ChainUnit(unit="nginx.service", active_at=3.2, start_seconds=61.9),
+        ChainUnit(unit="network-online.target", active_at=3.1),
+    ]
+
+
+def test_split_sections():
+    stdout = "ignored\n@@ boot abc\n@@ failed\n[]\n@@ blame\n1s a.service\n2s b.service\n@@ chain\n"
+
+    assert split_sections(stdout) == {"boot": "abc", "failed": "[]", "blame": "1s a.service\n2s b.service", "chain": ""}
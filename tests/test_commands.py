@@ -2,6 +2,7 @@
 
 import pytest
 
+from linux_mcp_server.commands import CommandSpec
 from linux_mcp_server.commands import get_command
 from linux_mcp_server.commands import get_command_group
 from linux_mcp_server.commands import substitute_command_args
@@ -72,6 +73,24 @@ class TestSubstituteCommandArgs:
             substitute_command_args(args, **kwargs)
 
 
+class TestCommandSpecVerbatim:
+    """Tests for parameters passed through without substitution."""
+
+    @pytest.mark.parametrize("pattern", ["code [0-9]{3}", "{a}", "\\{x\\}"])
+    def test_verbatim_value_with_braces(self, pattern):
+        spec = CommandSpec(script="true", args=("{path}", "{pattern}"), verbatim=frozenset({"pattern"}))
+
+        args, _ = spec._build_args(path="/var/log/messages", pattern=pattern)
+
+        assert args[-2:] == ("/var/log/messages", pattern)
+
+    def test_other_values_still_checked(self):
+        spec = CommandSpec(args=("{path}", "{pattern}"), verbatim=frozenset({"pattern"}))
+
+        with pytest.raises(ValueError, match="Unsubstituted placeholder"):
+            spec._build_args(path="{x}", pattern="a")
+
+
 class TestGetCommandGroup:
     """Tests for get_command_group function."""
 
@@ -118,3 +137,29 @@ class TestGetCommand:
         """Test that invalid subcommand raises KeyError listing available subcommands."""
         with pytest.raises(KeyError, match=r"Subcommand 'invalid' not found for 'system_info'.*Available:.*hostname"):
             get_command("system_info", "invalid")
+
+
+class TestCommandSpecRun:
+    """Tests for CommandSpec.run."""
+
+    async def test_fallback_placeholders_substituted(self, mocker):
+        """Test that placeholders are substituted in the fallback as well as the command."""
+        mock_execute = mocker.patch(
+            "linux_mcp_server.commands.execute_with_fallback", autospec=True, return_value=(0, "", "")
+        )
+        cmd = CommandSpec(args=("primary", "{path}"), fallback=("fallback", "{path}"))
+
+        await cmd.run(host="remote.host", path="/srv")
+
+        mock_execute.assert_called_once_with(("primary", "/srv"), fallback=("fallback", "/srv"), host="remote.host")
+
+    async def test_script_runs_with_args_as_positional_parameters(self, mocker):
+        """Test that a script is passed verbatim to bash with the substituted args after it."""
+        mock_execute = mocker.patch(
+            "linux_mcp_server.commands.execute_with_fallback", autospec=True, return_value=(0, "", "")
+        )
+        cmd = CommandSpec(script='echo "${1}"', args=("{path}",))
+
+        await cmd.run(path="/srv")
+
+        mock_execute.assert_called_once_with(("bash", "-c", 'echo "${1}"', "bash", "/srv"), fallback=None, host=None)
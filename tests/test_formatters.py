@@ -3,14 +3,15 @@
 from linux_mcp_server.formatters import format_disk_usage
 from linux_mcp_server.formatters import format_hardware_info
 from linux_mcp_server.formatters import format_listening_ports
+from linux_mcp_server.formatters import format_log_templates
 from linux_mcp_server.formatters import format_network_connections
 from linux_mcp_server.formatters import format_network_interfaces
 from linux_mcp_server.formatters import format_process_detail
 from linux_mcp_server.formatters import format_process_list
 from linux_mcp_server.formatters import format_service_logs
 from linux_mcp_server.formatters import format_service_status
-from linux_mcp_server.formatters import format_services_list
 from linux_mcp_server.models import ListeningPort
+from linux_mcp_server.models import LogTemplate
 from linux_mcp_server.models import NetworkConnection
 from linux_mcp_server.models import NetworkInterface
 from linux_mcp_server.models import ProcessInfo
@@ -204,23 +205,6 @@ class TestFormatProcessDetail:
         assert "State: S (sleeping)" in result
 
 
-class TestFormatServicesList:
-    """Tests for format_services_list function."""
-
-    def test_format_basic(self):
-        """Test basic formatting."""
-        stdout = "UNIT LOAD ACTIVE SUB DESCRIPTION\nssh.service loaded active running SSH"
-        result = format_services_list(stdout)
-        assert "=== System Services ===" in result
-        assert "ssh.service" in result
-
-    def test_format_with_count(self):
-        """Test formatting with running count."""
-        stdout = "UNIT LOAD\nssh.service loaded"
-        result = format_services_list(stdout, running_count=5)
-        assert "Summary: 5 services currently running" in result
-
-
 class TestFormatServiceStatus:
     """Tests for format_service_status function."""
 
@@ -243,6 +227,32 @@ class TestFormatServiceLogs:
         assert "Accepted publickey" in result
 
 
+class TestFormatLogTemplates:
+    """Tests for format_log_templates function."""
+
+    def test_format_log_templates(self):
+        """Test formatting templates with counts, time ranges and an example."""
+        templates = [
+            LogTemplate(
+                template="worker <*> exited",
+                count=2,
+                first_seen="Jan 01 12:00:00",
+                last_seen="Jan 01 12:00:05",
+                examples=["Jan 01 12:00:00 worker 1 exited", "Jan 01 12:00:05 worker 2 exited"],
+            ),
+            LogTemplate(template="reloading", count=1),
+        ]
+
+        result = format_log_templates(templates, 4, 1, "=== Templates ===\n")
+
+        assert "2 templates from 4 lines" in result
+        assert "      2x (Jan 01 12:00:00 .. Jan 01 12:00:05) worker <*> exited" in result
+        assert "e.g. Jan 01 12:00:00 worker 1 exited" in result
+        assert "e.g. Jan 01 12:00:05" not in result
+        assert "      1x reloading" in result
+        assert "1 lines did not fit any template" in result
+
+
 class TestFormatDiskUsage:
     """Tests for format_disk_usage function."""
 
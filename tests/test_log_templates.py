@@ -0,0 +1,114 @@
+"""Tests for log template mining."""
+
+from linux_mcp_server.log_templates import compact_log_entries
+from linux_mcp_server.log_templates import mine_templates
+from linux_mcp_server.log_templates import TemplateMiner
+from linux_mcp_server.models import LogEntries
+
+
+def test_numbers_are_masked():
+    miner = mine_templates(
+        [
+            "Accepted publickey for root from 10.0.0.1 port 51234",
+            "Accepted publickey for root from 10.0.0.2 port 40000",
+        ]
+    )
+
+    templates = miner.templates()
+
+    assert len(templates) == 1
+    assert templates[0].template == "Accepted publickey for root from <*> port <*>"
+    assert templates[0].count == 2
+
+
+def test_differing_tokens_become_wildcards():
+    miner = mine_templates(
+        [
+            "Started session for user alice",
+            "Started session for user bob",
+            "Started session for user carol",
+        ]
+    )
+
+    templates = miner.templates()
+
+    assert [template.template for template in templates] == ["Started session for user <*>"]
+    assert templates[0].count == 3
+
+
+def test_dissimilar_lines_start_new_templates():
+    miner = mine_templates(
+        [
+            "disk full on /var",
+            "link down on eth0",
+            "disk full on /var",
+        ]
+    )
+
+    templates = miner.templates()
+
+    assert [(template.template, template.count) for template in templates] == [
+        ("disk full on /var", 2),
+        ("link down on eth<*>", 1),
+    ]
+
+
+def test_timestamps_are_split_off():
+    miner = mine_templates(
+        [
+            "2024-01-01T10:00:00+0000 host sshd[12]: Connection closed",
+            "2024-01-01T10:05:00+0000 host sshd[13]: Connection closed",
+            "Jan  2 10:00:00 host sshd[14]: Connection closed",
+        ]
+    )
+
+    templates = miner.templates()
+
+    assert len(templates) == 1
+    assert templates[0].template == "host sshd[<*>]: Connection closed"
+    assert templates[0].first_seen == "2024-01-01T10:00:00+0000"
+    assert templates[0].last_seen == "Jan  2 10:00:00"
+
+
+def test_examples_are_bounded():
+    miner = TemplateMiner(max_examples=2)
+    for i in range(5):
+        miner.add(f"retry {i}")
+
+    (template,) = miner.templates()
+
+    assert template.count == 5
+    assert template.examples == ["retry 0", "retry 1"]
+
+
+def test_max_templates_counts_ungrouped_lines():
+    miner = TemplateMiner(max_templates=1)
+    miner.add("disk full on /var")
+    miner.add("link down on eth0")
+    miner.add("disk full on /var")
+    miner.add("")
+
+    assert [template.count for template in miner.templates()] == [2]
+    assert miner.lines == 3
+    assert miner.ungrouped == 1
+
+
+def test_templates_sorted_by_count():
+    lines = ["link down on eth0"] + ["disk full on /var"] * 3
+    templates = mine_templates(lines).templates()
+
+    assert [template.count for template in templates] == [3, 1]
+
+
+def test_compact_log_entries():
+    result = LogEntries(entries=["retry 1", "retry 2", "retry 3"], unit="sshd", cursor="s=1")
+
+    compact = compact_log_entries(result)
+
+    assert compact.entries == []
+    assert compact.lines_count == 3
+    assert compact.unit == "sshd"
+    assert compact.cursor == "s=1"
+    assert compact.ungrouped == 0
+    assert compact.templates is not None
+    assert [(template.template, template.count) for template in compact.templates] == [("retry <*>", 3)]
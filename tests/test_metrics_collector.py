@@ -0,0 +1,180 @@
+"""Tests for the background metrics collector."""
+
+import asyncio
+import math
+import subprocess
+import sys
+
+import pytest
+
+from linux_mcp_server.commands import METRICS_SCRIPT
+from linux_mcp_server.execution_context import ExecutionContext
+from linux_mcp_server.execution_context import get_execution_context
+from linux_mcp_server.metrics_collector import derive_metrics
+from linux_mcp_server.metrics_collector import downsample
+from linux_mcp_server.metrics_collector import MetricsCollector
+from linux_mcp_server.metrics_collector import RingBuffer
+
+
+def sample_output(uptime, cpu_busy, cpu_total, rx_bytes):
+    return (
+        f"uptime {uptime}\nload1 1.50\nload5 1.00\nload15 0.50\n"
+        "MemTotal 1000\nMemAvailable 250\nSwapTotal 100\nSwapFree 60\n"
+        f"cpu_busy {cpu_busy}\ncpu_total {cpu_total}\npsi_cpu 2.50\n"
+        f"rx_bytes {rx_bytes}\ntx_bytes 0\n"
+    )
+
+
+def test_ring_buffer_overwrites_oldest():
+    buffer = RingBuffer(3, ("load1",))
+    for second in range(5):
+        buffer.append(float(second), {"load1": second * 10})
+
+    times, values = buffer.window(0)
+
+    assert buffer.count == 3
+    assert times == [2.0, 3.0, 4.0]
+    assert values == {"load1": [20.0, 30.0, 40.0]}
+
+
+def test_ring_buffer_window():
+    buffer = RingBuffer(5, ("load1", "load5"))
+    for second in range(4):
+        buffer.append(float(second), {"load1": second})
+
+    times, values = buffer.window(1, 2)
+
+    assert times == [1.0, 2.0]
+    assert values["load1"] == [1.0, 2.0]
+    assert all(math.isnan(value) for value in values["load5"])
+
+
+def test_derive_metrics():
+    previous = {"uptime": 100.0, "cpu_busy": 100.0, "cpu_total": 400.0, "rx_bytes": 1000.0}
+    current = {
+        "uptime": 110.0,
+        "load1": 1.5,
+        "MemTotal": 1000.0,
+        "MemAvailable": 250.0,
+        "SwapTotal": 100.0,
+        "SwapFree": 60.0,
+        "cpu_busy": 150.0,
+        "cpu_total": 600.0,
+        "rx_bytes": 6000.0,
+        "psi_io": 1.25,
+    }
+
+    metrics = derive_metrics(current, previous)
+
+    assert metrics["load1"] == 1.5
+    assert metrics["cpu_percent"] == 25.0
+    assert metrics["memory_available_bytes"] == 256_000
+    assert metrics["memory_used_percent"] == 75.0
+    assert metrics["swap_used_bytes"] == 40 * 1024
+    assert metrics["rx_bytes_per_sec"] == 500.0
+    assert metrics["psi_io_some"] == 1.25
+    assert math.isnan(metrics["tx_bytes_per_sec"])
+    assert math.isnan(metrics["psi_cpu_some"])
+
+
+def test_derive_metrics_first_sample():
+    metrics = derive_metrics({"uptime": 10.0, "cpu_busy": 5.0, "cpu_total": 10.0, "load1": 0.5}, None)
+
+    assert metrics["load1"] == 0.5
+    assert math.isnan(metrics["cpu_percent"])
+    assert math.isnan(metrics["rx_bytes_per_sec"])
+
+
+def test_downsample():
+    times = [0.0, 1.0, 2.0, 3.0, 9.0]
+    values = [1.0, 3.0, math.nan, 5.0, 7.0]
+
+    assert downsample(times, values, 0, 10, 5) == [2.0, 5.0, None, None, 7.0]
+
+
+async def test_collector_sample(mock_execute_with_fallback):
+    mock_execute_with_fallback.side_effect = [
+        (0, sample_output(100, 100, 400, 1000), ""),
+        (0, sample_output(110, 150, 600, 6000), ""),
+        (0, sample_output(5, 10, 20, 0), ""),
+    ]
+    collector = MetricsCollector([None, "remote"], 10, 10)
+
+    await collector.sample("remote")
+    await collector.sample("remote")
+    await collector.sample("remote")
+
+    times, values = collector.buffers["remote"].window(0)
+    assert len(times) == 3
+    assert values["cpu_percent"][1] == 25.0
+    assert values["rx_bytes_per_sec"][1] == 500.0
+    # The host rebooted before the last sample
+    assert math.isnan(values["cpu_percent"][2])
+    assert collector.buffers[None].count == 0
+    assert mock_execute_with_fallback.call_args.kwargs["host"] == "remote"
+
+
+async def test_collector_sample_failure(mock_execute_with_fallback):
+    mock_execute_with_fallback.return_value = (1, "", "Permission denied")
+    collector = MetricsCollector([None], 10, 10)
+
+    with pytest.raises(RuntimeError, match="Unable to read metrics: Permission denied"):
+        await collector.sample(None)
+
+    assert collector.buffers[None].count == 0
+    assert mock_execute_with_fallback.call_args.kwargs["host"] is None
+
+
+async def test_collector_runs_in_background(mock_execute_with_fallback, mocker):
+    warning = mocker.patch("linux_mcp_server.metrics_collector.logger.warning")
+    collector = MetricsCollector([None, "broken"], 0.01, 10)
+    mock_execute_with_fallback.side_effect = lambda *args, host=None, **kwargs: (
+        (0, sample_output(100, 100, 400, 1000), "") if host is None else (255, "", "unreachable")
+    )
+
+    collector.start({None: ExecutionContext(allow_local=True), "broken": ExecutionContext(allow_ssh_default=True)})
+    await asyncio.sleep(0.05)
+    await collector.stop()
+
+    assert collector.buffers[None].count >= 2
+    assert collector.buffers["broken"].count == 0
+    assert "host=broken" in warning.call_args.args[0]
+
+
+async def test_collector_samples_with_host_context(mock_execute_with_fallback):
+    contexts = {}
+
+    def execute(*args, host=None, **kwargs):
+        contexts[host] = get_execution_context()
+        return 0, sample_output(100, 100, 400, 1000), ""
+
+    mock_execute_with_fallback.side_effect = execute
+    collector = MetricsCollector([None, "web1", "denied"], 0.01, 10)
+    local = ExecutionContext(allow_local=True)
+    remote = ExecutionContext(ssh_key_path="/keys/web1", ssh_key_user="collector")
+
+    collector.start({None: local, "web1": remote})
+    await asyncio.sleep(0.05)
+    await collector.stop()
+
+    assert contexts == {None: local, "web1": remote}
+    assert list(collector.buffers) == [None, "web1"]
+
+
+@pytest.mark.parametrize("hosts", [[], ["denied"]])
+async def test_collector_without_allowed_hosts_does_not_start(hosts):
+    collector = MetricsCollector(hosts, 10, 10)
+
+    collector.start({})
+
+    assert collector._task is None
+    await collector.stop()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires /proc")
+def test_metrics_script():
+    result = subprocess.run(["bash", "-c", METRICS_SCRIPT, "bash"], capture_output=True, text=True)
+    names = [line.split()[0] for line in result.stdout.splitlines()]
+
+    assert result.returncode == 0
+    assert {"uptime", "load1", "MemTotal", "MemAvailable", "cpu_busy", "cpu_total", "rx_bytes"} <= set(names)
@@ -19,22 +19,33 @@ from linux_mcp_server.auth_policy import PolicyAction
 from linux_mcp_server.auth_policy import PolicyRule
 from linux_mcp_server.auth_policy import SSHKeyConfig
 from linux_mcp_server.config import Toolset
+from linux_mcp_server.execution_context import ExecutionContext
+from linux_mcp_server.server import _collector_contexts
+from linux_mcp_server.server import mcp
 
 
 FIXED_TOOLS = set(
     [
+        "find_largest_files",
         "get_cpu_information",
         "get_disk_usage",
         "get_hardware_information",
         "get_journal_logs",
+        "get_kernel_logs",
         "get_listening_ports",
         "get_memory_information",
+        "get_metrics_history",
         "get_network_connections",
         "get_network_interfaces",
+        "get_pressure_information",
         "get_process_info",
         "get_service_logs",
+        "get_service_states",
         "get_service_status",
+        "get_system_activity",
         "get_system_information",
+        "get_triage_summary",
+        "get_unit_resources",
         "list_block_devices",
         "list_directories",
         "list_files",
@@ -163,10 +174,13 @@ async def test_read_mcp_app_resource(mcp_client):
     assert "<title>Run Script</title>" in result[0].text
 
 
-FREE_OUTPUT = """\
-               total        used        free      shared  buff/cache   available
-Mem:        32490308    14925036     2497076     2138132    15082720    17565272
-Swap:        8388604     3555312     4833292
+MEMINFO_OUTPUT = """\
+@@ meminfo
+MemTotal:       32490308 kB
+MemFree:         2497076 kB
+MemAvailable:   17565272 kB
+SwapTotal:       8388604 kB
+SwapFree:        4833292 kB
 """
 
 
@@ -177,7 +191,7 @@ class TestAuthorizationMiddleware:
 
         # Mock out a single tool to use in the tests
         mock_command = mocker.Mock()
-        mock_command.run = mocker.AsyncMock(return_value=(0, FREE_OUTPUT, ""))
+        mock_command.run = mocker.AsyncMock(return_value=(0, MEMINFO_OUTPUT, ""))
         mocker.patch("linux_mcp_server.tools.system_info.get_command", return_value=mock_command)
 
         def setup_fn(
@@ -226,7 +240,7 @@ class TestAuthorizationMiddleware:
     async def test_stdio_no_policy_allows(self, setup: SetupFn):
         client = setup(transport="stdio")
         result = await client.call_tool("get_memory_information")
-        assert result.structured_content and result.structured_content["ram"]["free"] == 2497076
+        assert result.structured_content and result.structured_content["ram"]["free"] == 2497076 * 1024
 
     async def test_http_no_policy_rejects(self, setup: SetupFn):
         client = setup(transport="http")
@@ -242,7 +256,7 @@ class TestAuthorizationMiddleware:
         )
 
         result = await client.call_tool("get_memory_information")
-        assert result.structured_content and result.structured_content["ram"]["free"] == 2497076
+        assert result.structured_content and result.structured_content["ram"]["free"] == 2497076 * 1024
 
     @pytest.mark.parametrize("email,allowed", [("user1@example.com", True), ("user2@example.com", False)])
     async def test_http_policy_one_user(self, email: str, allowed: bool, setup: SetupFn):
@@ -263,7 +277,7 @@ class TestAuthorizationMiddleware:
 
         if allowed:
             result = await client.call_tool("get_memory_information")
-            assert result.structured_content and result.structured_content["ram"]["free"] == 2497076
+            assert result.structured_content and result.structured_content["ram"]["free"] == 2497076 * 1024
         else:
             with pytest.raises(ToolError, match=r"Authorization denied: tool 'get_memory_information'"):
                 await client.call_tool("get_memory_information")
@@ -288,7 +302,7 @@ class TestAuthorizationMiddleware:
         )
 
         result = await client.call_tool("get_memory_information", {"host": "server1.example.com"})
-        assert result.structured_content and result.structured_content["ram"]["free"] == 2497076
+        assert result.structured_content and result.structured_content["ram"]["free"] == 2497076 * 1024
 
         assert "SSH key override: path=/keys/server1.key, user=serviceaccount" in caplog.text
 
@@ -344,7 +358,7 @@ class CaptureContext:
         from linux_mcp_server.execution_context import get_execution_context
 
         self._context = get_execution_context()
-        return (0, FREE_OUTPUT, "")
+        return (0, MEMINFO_OUTPUT, "")
 
     def get_context(self):
         return self._context
@@ -443,3 +457,54 @@ class TestExecutionContextMiddlewareIntegration:
         assert captured_context.allow_ssh_default is False
         assert captured_context.ssh_key_path == Path("/keys/server1.key")
         assert captured_context.ssh_key_user == "serviceaccount"
+
+
+class TestCollectorContexts:
+    async def test_stdio_without_policy_allows_all(self, mocker):
+        mocker.patch("linux_mcp_server.server.CONFIG.transport", "stdio")
+        mocker.patch("linux_mcp_server.server.CONFIG.policy_path", None)
+        mocker.patch.dict("os.environ", {"container": ""})
+
+        contexts = await _collector_contexts(mcp, [None, "web1"])
+
+        assert contexts == dict.fromkeys([None, "web1"], ExecutionContext(allow_local=True, allow_ssh_default=True))
+
+    async def test_local_host_skipped_in_container(self, mocker):
+        mocker.patch("linux_mcp_server.server.CONFIG.transport", "stdio")
+        mocker.patch("linux_mcp_server.server.CONFIG.policy_path", None)
+        mocker.patch.dict("os.environ", {"container": "podman"})
+
+        contexts = await _collector_contexts(mcp, [None, "web1"])
+
+        assert list(contexts) == ["web1"]
+
+    async def test_policy_for_all_users_applies(self, mocker):
+        """Verify hosts are authorized like get_metrics_history calls without user claims."""
+        mocker.patch("linux_mcp_server.server.CONFIG.transport", "streamable-http")
+        mocker.patch("linux_mcp_server.server.CONFIG.policy_path", "/etc/policy.json")
+        mocker.patch.dict("os.environ", {"container": ""})
+        mocker.patch(
+            "linux_mcp_server.auth_policy.get_policy",
+            return_value=AuthPolicy(
+                rules=[
+                    PolicyRule(host="localhost", tools=["@fixed"], all_users=True, action=PolicyAction.LOCAL),
+                    PolicyRule(
+                        host="web*",
+                        tools=["get_metrics_history"],
+                        all_users=True,
+                        action=PolicyAction.SSH_KEY,
+                        ssh_key=SSHKeyConfig(path="/keys/web.key", user="collector"),
+                    ),
+                    PolicyRule(
+                        host="db1", tools=["*"], claims={"email": "admin@example.com"}, action=PolicyAction.SSH_DEFAULT
+                    ),
+                ]
+            ),
+        )
+
+        contexts = await _collector_contexts(mcp, [None, "web1", "db1", "local"])
+
+        assert contexts == {
+            None: ExecutionContext(allow_local=True),
+            "web1": ExecutionContext(ssh_key_path="/keys/web.key", ssh_key_user="collector"),
+        }
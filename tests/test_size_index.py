@@ -0,0 +1,287 @@
+"""Tests for the directory size index."""
+
+import os
+import shutil
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from fastmcp.exceptions import ToolError
+
+from linux_mcp_server.config import CONFIG
+from linux_mcp_server.execution_context import ExecutionContext
+from linux_mcp_server.execution_context import use_execution_context
+from linux_mcp_server.parsers import parse_directory_scan
+from linux_mcp_server.size_index import DirectorySizeIndex
+from linux_mcp_server.size_index import DirectoryTree
+
+
+SCAN = "\n".join(
+    [
+        "t\t1700000000.5",
+        "d\t4096\t1.0\t/srv",
+        "d\t5000\t2.0\t/srv/a",
+        "d\t900\t3.0\t/srv/a/deep",
+        "d\t100\t4.0\t/srv/b",
+        "d\t200\t5.0\t/srv/c",
+        "d\t300\t6.0\t/srv/d",
+        "l\t2049:17\t50\t/srv/c",
+        "l\t2049:17\t50\t/srv/b",
+    ]
+)
+
+
+@pytest.fixture
+def index(mocker):
+    mocker.patch.object(CONFIG, "directory_index_ttl", 0)
+    mocker.patch.object(CONFIG, "directory_index_max_age", 3600)
+    return DirectorySizeIndex()
+
+
+@pytest.fixture
+def mock_execute(mocker):
+    return mocker.patch("linux_mcp_server.commands.execute_with_fallback", autospec=True)
+
+
+def sizes(rows):
+    return sorted((name, size) for size, _, name in rows)
+
+
+def du_sizes(path):
+    du = subprocess.run(["du", "-b", "--max-depth=1", str(path)], capture_output=True, text=True, check=True)
+    return sorted(
+        (Path(path).name, int(size)) for size, path in (line.split("\t") for line in du.stdout.splitlines()[:-1])
+    )
+
+
+def make_files(root, files):
+    for name, size in files:
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text("x" * size)
+
+
+def test_child_rows():
+    tree = DirectoryTree(
+        root="/",
+        directories={"/": (10, 1.0), "/a": (1, 2.0), "/a/b": (2, 3.0), "/a/b/c": (3, 4.0), "/d": (4, 5.0)},
+        links={"1:2": ("/a/b", 20), "1:3": ("/", 30)},
+    )
+
+    assert sorted(tree.child_rows()) == [(4, 5.0, "d"), (26, 2.0, "a")]
+
+
+def test_apply_replaces_rescanned_directories():
+    tree = DirectoryTree(
+        root="/srv",
+        directories={"/srv": (1, 1.0), "/srv/a": (2, 1.0), "/srv/a/gone": (3, 1.0), "/srv/a/gone/x": (4, 1.0)},
+        links={"1:1": ("/srv/a", 10), "1:2": ("/srv/a/gone/x", 20), "1:3": ("/srv", 30)},
+    )
+    scan = parse_directory_scan("t\t5.0\nd\t7\t5.0\t/srv/a\nc\t/srv/a/moved\nl\t1:4\t40\t/srv/a\n")
+
+    missing = tree.apply(scan)
+
+    assert missing == ["/srv/a/moved"]
+    assert tree.directories == {"/srv": (1, 1.0), "/srv/a": (7, 5.0)}
+    assert tree.links == {"1:3": ("/srv", 30), "1:4": ("/srv/a", 40)}
+
+
+def test_apply_summary_replaces_subtree():
+    tree = DirectoryTree(
+        root="/srv",
+        directories={"/srv": (1, 1.0), "/srv/a": (2, 1.0), "/srv/a/b": (30, 1.0)},
+        links={"1:1": ("/srv/a/b", 10)},
+        depth=2,
+    )
+
+    assert tree.apply(parse_directory_scan("t\t5.0\ns\t99\t5.0\t/srv/a/b\n")) == []
+    assert tree.directories["/srv/a/b"] == (99, 5.0)
+    assert tree.links == {}
+
+
+def test_fit_folds_deepest_levels():
+    tree = DirectoryTree(
+        root="/srv",
+        directories={
+            "/srv": (1, 1.0),
+            "/srv/a": (2, 2.0),
+            "/srv/a/b": (4, 3.0),
+            "/srv/a/b/c": (8, 4.0),
+            "/srv/a/b/c/d": (16, 5.0),
+            "/srv/e": (32, 6.0),
+        },
+        links={"1:1": ("/srv/a/b/c/d", 64)},
+    )
+    rows = sorted(tree.child_rows())
+
+    tree.fit(4)
+
+    assert tree.depth == 2
+    assert tree.directories == {"/srv": (1, 1.0), "/srv/a": (2, 2.0), "/srv/a/b": (28, 3.0), "/srv/e": (32, 6.0)}
+    assert tree.links == {"1:1": ("/srv/a/b", 64)}
+    assert sorted(tree.child_rows()) == rows
+
+
+async def test_build_counts_links_once(index, mock_execute):
+    mock_execute.return_value = (0, SCAN, "")
+
+    rows, age = await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert sizes(rows) == [("a", 5900), ("b", 150), ("c", 200), ("d", 300)]
+    assert age == 0.0
+    assert mock_execute.call_args[0][0][-2:] == (str(CONFIG.directory_scan_jobs), "/srv")
+
+
+async def test_update_rescans_changed_directories(index, mock_execute):
+    changes = "t\t1700000100.0\nd\t700\t7.0\t/srv/b\nl\t2049:17\t50\t/srv/b\nd\t4096\t7.0\t/srv\nc\t/srv/a\nc\t/srv/b\nc\t/srv/c\n"
+    mock_execute.side_effect = [(0, SCAN, ""), (0, changes, "")]
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    rows, age = await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert sizes(rows) == [("a", 5900), ("b", 750), ("c", 200)]
+    assert age == 0.0
+    assert mock_execute.call_count == 2
+    assert mock_execute.call_args[0][0][-3:] == ("1699999999.500000", "0", "/srv")
+
+
+async def test_update_without_changes(index, mock_execute):
+    mock_execute.side_effect = [(0, SCAN, ""), (0, "t\t1700000100.0\n", ""), (0, "t\t1700000200.0\n", "")]
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    rows, _ = await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert sizes(rows) == [("a", 5900), ("b", 150), ("c", 200), ("d", 300)]
+    assert mock_execute.call_args[0][0][-3:] == ("1700000099.000000", "0", "/srv")
+
+
+async def test_update_walks_new_subtrees(index, mock_execute):
+    changes = "t\t1700000100.0\nd\t4096\t7.0\t/srv\nc\t/srv/a\nc\t/srv/b\nc\t/srv/c\nc\t/srv/d\nc\t/srv/new\n"
+    walk = "t\t1700000100.0\nd\t10\t7.0\t/srv/new\nd\t20\t7.0\t/srv/new/x\n"
+    mock_execute.side_effect = [(0, SCAN, ""), (0, changes, ""), (0, walk, "")]
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    rows, _ = await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert ("new", 30) in sizes(rows)
+    assert mock_execute.call_args[0][0][-2:] == ("1", "/srv/new")
+
+
+async def test_update_rebuilds_when_root_is_gone(index, mock_execute):
+    mock_execute.side_effect = [
+        (0, SCAN, ""),
+        (2, "t\t1700000100.0\n", "/srv: No such directory"),
+        (1, "t\t1700000100.0\n", "find: '/srv': No such file or directory"),
+    ]
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    with pytest.raises(ToolError, match="return code 1"):
+        await index.child_sizes(Path("/srv"), host="remote.host")
+
+
+async def test_rebuilds_after_max_age(index, mock_execute, mocker):
+    mocker.patch.object(CONFIG, "directory_index_max_age", 0)
+    mock_execute.side_effect = [(0, SCAN, ""), (0, SCAN.replace("d\t100\t4.0", "d\t700\t4.0"), "")]
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    rows, _ = await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert ("b", 750) in sizes(rows)
+    assert mock_execute.call_args[0][0][-2:] == (str(CONFIG.directory_scan_jobs), "/srv")
+
+
+async def test_refresh_rebuilds(index, mock_execute):
+    mock_execute.return_value = (0, SCAN, "")
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    await index.child_sizes(Path("/srv"), host="remote.host", refresh=True)
+
+    assert mock_execute.call_count == 2
+    assert mock_execute.call_args[0][0][-2:] == (str(CONFIG.directory_scan_jobs), "/srv")
+
+
+async def test_cached_within_ttl(index, mock_execute, mocker):
+    mocker.patch.object(CONFIG, "directory_index_ttl", 3600)
+    mock_execute.return_value = (0, SCAN, "")
+
+    await index.child_sizes(Path("/srv"), host="remote.host")
+    _, age = await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert age > 0.0
+    mock_execute.assert_called_once()
+
+
+async def test_separate_per_ssh_identity(index, mock_execute, mocker):
+    mocker.patch.object(CONFIG, "directory_index_ttl", 3600)
+    mock_execute.return_value = (0, SCAN, "")
+
+    for user in ("alice", "bob"):
+        with use_execution_context(ExecutionContext(ssh_key_user=user)):
+            await index.child_sizes(Path("/srv"), host="remote.host")
+
+    assert mock_execute.call_count == 2
+
+
+async def test_scan_error(index, mock_execute):
+    mock_execute.return_value = (1, "", "find: '/srv': No such file or directory")
+
+    with pytest.raises(ToolError, match="return code 1"):
+        await index.child_sizes(Path("/srv"), host="remote.host")
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+@pytest.mark.parametrize("jobs", (1, 4))
+async def test_build_matches_du(index, mocker, tmp_path, jobs):
+    mocker.patch.object(CONFIG, "directory_scan_jobs", jobs)
+    make_files(tmp_path, [("a/x/y/f", 1000), ("a/g", 10), ("b/f", 500), ("c/d/e/f/g", 70), ("top", 7)])
+    (tmp_path / "empty").mkdir()
+    # du counts a file with several links once; across children it depends on walk order
+    os.link(tmp_path / "a" / "g", tmp_path / "a" / "x" / "g")
+    os.link(tmp_path / "b" / "f", tmp_path / "b" / "f2")
+
+    with use_execution_context(ExecutionContext(allow_local=True)):
+        rows, _ = await index.child_sizes(tmp_path)
+
+    assert sizes(rows) == du_sizes(tmp_path)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+@pytest.mark.parametrize("max_directories", (1_000, 4))
+async def test_update_matches_du(index, mocker, tmp_path, max_directories):
+    mocker.patch("linux_mcp_server.size_index.MAX_INDEXED_DIRECTORIES", max_directories)
+    root = tmp_path / "root"
+    make_files(root, [("a/x/y/f", 1000), ("a/g", 10), ("b/f", 500), ("c/d/e/f/g", 70), ("top", 7)])
+    make_files(tmp_path, [("outside/p/q", 300)])
+
+    with use_execution_context(ExecutionContext(allow_local=True)):
+        await index.child_sizes(root)
+
+        make_files(root, [("a/x/y/new", 40), ("new/z/w", 5), ("c/d/e/f/h", 9)])
+        shutil.rmtree(root / "b")
+        (tmp_path / "outside").rename(root / "a" / "x" / "moved")
+        rows, _ = await index.child_sizes(root)
+
+        tree = next(iter(index._trees.values()))
+        assert len(tree.directories) <= max(max_directories, 1 + len(rows))
+        assert sizes(rows) == du_sizes(root)
+
+        # Nothing changed since the last check
+        rows, _ = await index.child_sizes(root)
+
+    assert sizes(rows) == du_sizes(root)
+
+
+@pytest.mark.skipif(not os.path.ismount("/dev/shm"), reason="requires a mount point below /dev")
+@pytest.mark.parametrize("jobs", (1, 4))
+async def test_build_skips_mount_points(index, mocker, jobs):
+    mocker.patch.object(CONFIG, "directory_scan_jobs", jobs)
+
+    with use_execution_context(ExecutionContext(allow_local=True)):
+        rows, _ = await index.child_sizes(Path("/dev"))
+
+    names = {name for _, _, name in rows}
+    assert names
+    assert not any(os.path.ismount(f"/dev/{name}") for name in names)
@@ -18,6 +18,7 @@ class TestToolSchemaExamples:
             ("get_service_status", "service_name"),
             ("get_service_logs", "service_name"),
             ("get_process_info", "pid"),
+            ("find_largest_files", "path"),
             ("list_directories", "path"),
             ("list_files", "path"),
             ("read_file", "path"),
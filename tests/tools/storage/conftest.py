@@ -5,6 +5,30 @@ from pathlib import Path
 
 import pytest
 
+from linux_mcp_server.connection.sftp import SFTPFileBackend
+from linux_mcp_server.size_index import get_directory_index
+
+
+@pytest.fixture(autouse=True)
+def disable_sftp(mocker):
+    """Run remote storage tests through the mocked commands rather than SFTP."""
+    mocker.patch("linux_mcp_server.connection.sftp.CONFIG.sftp", False)
+
+
+@pytest.fixture
+def mock_file_backend(mocker):
+    """Serve remote file operations from a mocked SFTP backend."""
+    backend = mocker.AsyncMock(SFTPFileBackend)
+    mocker.patch("linux_mcp_server.tools.storage.get_file_backend", return_value=backend)
+    return backend
+
+
+@pytest.fixture(autouse=True)
+def clear_directory_index():
+    get_directory_index().clear()
+    yield
+    get_directory_index().clear()
+
 
 @pytest.fixture
 def setup_test_paths(tmp_path) -> Callable[[list[tuple[str, int, float]]], list[str]]:
@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+
+from fastmcp.exceptions import ToolError
+
+from linux_mcp_server.config import CONFIG
+
+
+@pytest.fixture
+def file_tree(tmp_path):
+    sizes = {
+        "small.txt": 10,
+        "a/medium.log": 200,
+        "a/b/large.bin": 3000,
+        "a/b/c/huge.img": 5000,
+    }
+    for name, size in sizes.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * size)
+
+    return tmp_path
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+async def test_find_largest_files(file_tree, mcp_client):
+    result = await mcp_client.call_tool("find_largest_files", arguments={"path": str(file_tree), "top_n": 3})
+    content = result.structured_content
+
+    assert [item["name"] for item in content["files"]] == [
+        str(file_tree / "a/b/c/huge.img"),
+        str(file_tree / "a/b/large.bin"),
+        str(file_tree / "a/medium.log"),
+    ]
+    assert [item["size"] for item in content["files"]] == [5000, 3000, 200]
+    assert content["total"] == 3
+    assert content["scanned"] == 4
+    assert content["complete"] is True
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+async def test_find_largest_files_max_depth(file_tree, mcp_client):
+    result = await mcp_client.call_tool("find_largest_files", arguments={"path": str(file_tree), "max_depth": 2})
+    names = [item["name"] for item in result.structured_content["files"]]
+
+    assert names == [str(file_tree / "a/medium.log"), str(file_tree / "small.txt")]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+async def test_find_largest_files_nonexistent_path(tmp_path, mcp_client):
+    with pytest.raises(ToolError, match="Error running command: command failed with return code 1"):
+        await mcp_client.call_tool("find_largest_files", arguments={"path": str(tmp_path / "nonexistent")})
+
+
+async def test_find_largest_files_remote_timed_out(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (
+        0,
+        "300\t1700000000.0\t/var/b\n9000\t1700000000.0\t/var/a\nscanned\t123456\nstatus\t124\n",
+        "",
+    )
+
+    result = await mcp_client.call_tool("find_largest_files", arguments={"path": "/var", "host": "remote.host"})
+    content = result.structured_content
+
+    assert [item["name"] for item in content["files"]] == ["/var/a", "/var/b"]
+    assert content["scanned"] == 123456
+    assert content["complete"] is False
+
+
+async def test_find_largest_files_remote_fallback(mock_execute_with_fallback, mcp_client):
+    listing = "".join(f"{size}\t1700000000.0\t/var/f{size}\n" for size in (5, 50, 1, 500, 20))
+    mock_execute_with_fallback.return_value = (0, listing, "")
+
+    result = await mcp_client.call_tool(
+        "find_largest_files", arguments={"path": "/var", "top_n": 2, "host": "remote.host"}
+    )
+    content = result.structured_content
+
+    assert [item["size"] for item in content["files"]] == [500, 50]
+    assert content["scanned"] == 5
+    assert content["complete"] is True
+
+
+@pytest.mark.parametrize(("time_budget", "expected"), ((None, "25"), (10, "10"), (100, "25")))
+async def test_find_largest_files_time_budget(mock_execute_with_fallback, mcp_client, mocker, time_budget, expected):
+    mocker.patch.object(CONFIG, "command_timeout", 30)
+    mock_execute_with_fallback.return_value = (0, "scanned\t0\nstatus\t0\n", "")
+
+    arguments = {"path": "/var", "host": "remote.host", "time_budget": time_budget}
+    await mcp_client.call_tool("find_largest_files", arguments={k: v for k, v in arguments.items() if v is not None})
+
+    args = mock_execute_with_fallback.call_args[0][0]
+    assert args[:2] == ("bash", "-c")
+    assert args[4:9] == ("50", expected, "find", "/var", "-xdev")
@@ -1,9 +1,13 @@
+import stat
+import subprocess
 import sys
 
+import asyncssh
 import pytest
 
 from fastmcp.exceptions import ToolError
 
+from linux_mcp_server.config import CONFIG
 from linux_mcp_server.tools.storage import OrderBy
 
 
@@ -101,6 +105,32 @@ async def test_list_directories_with_top_n(setup_test_paths, mcp_client, order,
     assert result.structured_content["total"] == 2
 
 
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+@pytest.mark.parametrize(
+    ("order", "sort", "expected"),
+    (
+        ("size", "descending", ["gamma", "beta"]),
+        ("size", "ascending", ["alpha", "beta"]),
+        ("modified", "descending", ["gamma", "beta"]),
+        ("modified", "ascending", ["alpha", "beta"]),
+    ),
+)
+async def test_list_directories_with_top_n_order(setup_test_paths, mcp_client, order, sort, expected, tmp_path):
+    dir_specs = [
+        ("beta", 2000, 2000.0),
+        ("alpha", 1000, 1000.0),
+        ("gamma", 3000, 3000.0),
+    ]
+    setup_test_paths(dir_specs)
+
+    result = await mcp_client.call_tool(
+        "list_directories", arguments={"path": str(tmp_path), "order_by": order, "sort": sort, "top_n": 2}
+    )
+    names = [dir["name"] for dir in result.structured_content["nodes"]]
+
+    assert names == expected
+
+
 @pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
 async def test_list_directories_nonexistent_path(tmp_path, mcp_client):
     nonexistent = tmp_path / "nonexistent"
@@ -130,3 +160,153 @@ async def test_list_directories_remote(mock_execute_with_fallback, mcp_client):
     mock_execute_with_fallback.assert_called_once()
     call_kwargs = mock_execute_with_fallback.call_args[1]
     assert call_kwargs["host"] == "remote.host"
+
+
+async def test_list_directories_remote_top_n_pushdown(mock_execute_with_fallback, mcp_client, mocker):
+    mocker.patch.object(CONFIG, "directory_size_index", False)
+    mock_execute_with_fallback.return_value = (
+        0,
+        "3000\t/remote/path/gamma\n2000\t/remote/path/beta\n9000\t/remote/path\n",
+        "",
+    )
+
+    result = await mcp_client.call_tool(
+        "list_directories",
+        arguments={"path": "/remote/path", "order_by": "size", "sort": "descending", "top_n": 2, "host": "remote.host"},
+    )
+    names = [dir["name"] for dir in result.structured_content["nodes"]]
+
+    assert names == ["gamma", "beta"]
+
+    args = mock_execute_with_fallback.call_args[0][0]
+    assert args[:2] == ("bash", "-c")
+    assert args[4:9] == ("-nr", "2", "du_children", str(CONFIG.directory_scan_jobs), "/remote/path")
+    assert mock_execute_with_fallback.call_args[1]["fallback"][0] == "du"
+
+
+async def test_list_directories_by_size_parallel(mock_execute_with_fallback, mcp_client, mocker):
+    mocker.patch.object(CONFIG, "directory_size_index", False)
+    mocker.patch.object(CONFIG, "directory_scan_jobs", 8)
+    mock_execute_with_fallback.return_value = (0, "3000\t/remote/path/gamma\n9000\t/remote/path\n", "")
+
+    await mcp_client.call_tool(
+        "list_directories", arguments={"path": "/remote/path", "order_by": "size", "host": "remote.host"}
+    )
+
+    args = mock_execute_with_fallback.call_args[0][0]
+    assert args[:2] == ("bash", "-c")
+    assert args[4:] == ("8", "/remote/path")
+    assert mock_execute_with_fallback.call_args[1]["fallback"][0] == "du"
+
+
+async def test_list_directories_sftp(mock_file_backend, mock_execute_with_fallback, mcp_client):
+    mock_file_backend.scandir.return_value = [
+        asyncssh.SFTPName("beta", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFDIR | 0o755, size=4096, mtime=2)),
+        asyncssh.SFTPName("file.txt", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o644, size=10, mtime=3)),
+        asyncssh.SFTPName("alpha", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFDIR | 0o755, size=4096, mtime=1)),
+    ]
+
+    result = await mcp_client.call_tool(
+        "list_directories", arguments={"path": "/remote/path", "order_by": "modified", "host": "remote.host"}
+    )
+    nodes = result.structured_content["nodes"]
+
+    assert [(item["name"], item["size"], item["modified"]) for item in nodes] == [("alpha", 0, 1.0), ("beta", 0, 2.0)]
+    mock_execute_with_fallback.assert_not_called()
+
+
+async def test_list_directories_by_size_ignores_sftp(mock_file_backend, mock_execute_with_fallback, mcp_client, mocker):
+    mocker.patch.object(CONFIG, "directory_size_index", False)
+    mock_execute_with_fallback.return_value = (0, "3000\t/remote/path/gamma\n9000\t/remote/path\n", "")
+
+    result = await mcp_client.call_tool(
+        "list_directories", arguments={"path": "/remote/path", "order_by": "size", "host": "remote.host"}
+    )
+
+    assert [dir["name"] for dir in result.structured_content["nodes"]] == ["gamma"]
+    mock_file_backend.scandir.assert_not_called()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+async def test_list_directories_by_size_uses_index(setup_test_paths, mcp_client, mocker, tmp_path):
+    mocker.patch.object(CONFIG, "directory_size_index", True)
+    mocker.patch.object(CONFIG, "directory_index_ttl", 0)
+    setup_test_paths([("small", 100, 1000.0), ("large", 300, 3000.0)])
+    arguments = {"path": str(tmp_path), "order_by": "size", "sort": "descending"}
+
+    result = await mcp_client.call_tool("list_directories", arguments=arguments)
+    content = result.structured_content
+
+    assert [dir["name"] for dir in content["nodes"]] == ["large", "small"]
+    assert content["index_age"] == 0.0
+
+    (tmp_path / "small" / "more.txt").write_text("x" * 1000)
+    result = await mcp_client.call_tool("list_directories", arguments=arguments)
+    nodes = result.structured_content["nodes"]
+
+    assert [dir["name"] for dir in nodes] == ["small", "large"]
+    assert nodes[0]["size"] - nodes[1]["size"] == 800
+
+    # A file that grows in place leaves the directory mtime unchanged, so it may be missed until a full walk
+    with (tmp_path / "large" / "content.txt").open("a") as file:
+        file.write("x" * 2000)
+    result = await mcp_client.call_tool("list_directories", arguments={**arguments, "refresh": True})
+    nodes = result.structured_content["nodes"]
+
+    assert [dir["name"] for dir in nodes] == ["large", "small"]
+    assert nodes[0]["size"] - nodes[1]["size"] == 1200
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+async def test_list_directories_by_size_index_off_by_default(setup_test_paths, mcp_client, tmp_path):
+    setup_test_paths([("small", 100, 1000.0), ("large", 300, 3000.0)])
+
+    result = await mcp_client.call_tool(
+        "list_directories", arguments={"path": str(tmp_path), "order_by": "size", "sort": "descending"}
+    )
+    content = result.structured_content
+
+    assert [dir["name"] for dir in content["nodes"]] == ["large", "small"]
+    assert content["index_age"] is None
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+@pytest.mark.parametrize("jobs", (1, 4))
+async def test_list_directories_by_size_matches_du(mcp_client, mocker, tmp_path, jobs):
+    mocker.patch.object(CONFIG, "directory_scan_jobs", jobs)
+    for name, size in (("a/x/f", 1000), ("a/g", 10), ("b/f", 500), ("with space/f", 70), ("top", 7)):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x" * size)
+    (tmp_path / "empty").mkdir()
+    du = subprocess.run(
+        ["du", "-b", "--one-file-system", "--max-depth=1", str(tmp_path)], capture_output=True, text=True, check=True
+    )
+    expected = sorted(
+        (path.rsplit("/", 1)[1], int(size)) for size, path in (line.split("\t") for line in du.stdout.splitlines()[:-1])
+    )
+
+    result = await mcp_client.call_tool("list_directories", arguments={"path": str(tmp_path), "order_by": "size"})
+
+    assert sorted((dir["name"], dir["size"]) for dir in result.structured_content["nodes"]) == expected
+
+
+async def test_list_directories_by_size_cached(mock_execute_with_fallback, mcp_client, mocker):
+    mocker.patch.object(CONFIG, "directory_size_index", True)
+    mocker.patch.object(CONFIG, "directory_index_ttl", 3600)
+    mock_execute_with_fallback.return_value = (
+        0,
+        "d\t4096\t1.0\t/srv\nd\t5000\t2.0\t/srv/a\nd\t100\t3.0\t/srv/b\nd\t900\t4.0\t/srv/a/deep\n",
+        "",
+    )
+    arguments = {"path": "/srv", "order_by": "size", "sort": "descending", "host": "remote.host"}
+
+    await mcp_client.call_tool("list_directories", arguments=arguments)
+    result = await mcp_client.call_tool("list_directories", arguments=arguments)
+    content = result.structured_content
+
+    assert [(dir["name"], dir["size"], dir["modified"]) for dir in content["nodes"]] == [
+        ("a", 5900, 2.0),
+        ("b", 100, 3.0),
+    ]
+    assert content["index_age"] is not None
+    mock_execute_with_fallback.assert_called_once()
@@ -1,5 +1,7 @@
+import stat
 import sys
 
+import asyncssh
 import pytest
 
 from fastmcp.exceptions import ToolError
@@ -88,6 +90,31 @@ async def test_list_files_with_top_n(setup_test_paths, mcp_client, order, tmp_pa
     assert content["total"] == 2
 
 
+@pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+@pytest.mark.parametrize(
+    ("order", "sort", "expected"),
+    (
+        ("size", "descending", ["file3.txt", "file2.txt"]),
+        ("size", "ascending", ["file1.txt", "file2.txt"]),
+        ("modified", "descending", ["file3.txt", "file2.txt"]),
+        ("modified", "ascending", ["file1.txt", "file2.txt"]),
+    ),
+)
+async def test_list_files_with_top_n_order(setup_test_paths, mcp_client, order, sort, expected, tmp_path):
+    file_specs = [
+        ("file2.txt", 200, 2000.0),
+        ("file1.txt", 100, 1000.0),
+        ("file3.txt", 300, 3000.0),
+    ]
+    setup_test_paths(file_specs)
+    result = await mcp_client.call_tool(
+        "list_files", arguments={"path": str(tmp_path), "order_by": order, "sort": sort, "top_n": 2}
+    )
+    names = [item["name"] for item in result.structured_content["nodes"]]
+
+    assert names == expected
+
+
 @pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
 async def test_list_files_nonexistent_path(tmp_path, mcp_client):
     nonexistent = tmp_path / "nonexistent"
@@ -110,3 +137,101 @@ async def test_list_files_remote(mock_execute_with_fallback, mcp_client):
     mock_execute_with_fallback.assert_called_once()
     call_kwargs = mock_execute_with_fallback.call_args[1]
     assert call_kwargs["host"] == "remote.host"
+
+
+async def test_list_files_remote_top_n_pushdown(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (0, "300\tfile3.txt\n200\tfile2.txt\n", "")
+
+    result = await mcp_client.call_tool(
+        "list_files",
+        arguments={"path": "/remote/path", "order_by": "size", "sort": "descending", "top_n": 2, "host": "remote.host"},
+    )
+    names = [item["name"] for item in result.structured_content["nodes"]]
+
+    assert names == ["file3.txt", "file2.txt"]
+
+    args = mock_execute_with_fallback.call_args[0][0]
+    fallback = mock_execute_with_fallback.call_args[1]["fallback"]
+    assert args[:2] == ("bash", "-c")
+    assert args[4:8] == ("-nr", "2", "find", "/remote/path")
+    assert fallback[:2] == ("find", "/remote/path")
+
+
+async def test_list_files_remote_top_n_name_not_pushed_down(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (0, "b.txt\nA.txt\nc.txt\n", "")
+
+    result = await mcp_client.call_tool(
+        "list_files", arguments={"path": "/remote/path", "order_by": "name", "top_n": 2, "host": "remote.host"}
+    )
+    names = [item["name"] for item in result.structured_content["nodes"]]
+
+    assert names == ["A.txt", "b.txt"]
+    assert mock_execute_with_fallback.call_args[0][0][0] == "find"
+
+
+async def test_list_files_sftp(mock_file_backend, mock_execute_with_fallback, mcp_client):
+    mock_file_backend.scandir.return_value = [
+        asyncssh.SFTPName("small.txt", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o644, size=10, mtime=1)),
+        asyncssh.SFTPName("subdir", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFDIR | 0o755, size=4096, mtime=2)),
+        asyncssh.SFTPName("large.txt", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o644, size=500, mtime=3)),
+        asyncssh.SFTPName("link", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFLNK | 0o777, size=9, mtime=4)),
+    ]
+
+    result = await mcp_client.call_tool(
+        "list_files",
+        arguments={"path": "/remote/path", "order_by": "size", "sort": "descending", "host": "remote.host"},
+    )
+    nodes = result.structured_content["nodes"]
+
+    assert [(item["name"], item["size"], item["modified"]) for item in nodes] == [
+        ("large.txt", 500, 0.0),
+        ("small.txt", 10, 0.0),
+    ]
+    mock_execute_with_fallback.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("order_by", "stdout"),
+    (
+        ("size", "500\tlarge.txt\n10\tsmall.txt\n"),
+        ("modified", "3.0\tlarge.txt\n1.0\tsmall.txt\n"),
+        ("name", "large.txt\nsmall.txt\n"),
+    ),
+)
+async def test_list_files_sftp_matches_find(
+    mock_file_backend, mock_execute_with_fallback, mcp_client, mocker, order_by, stdout
+):
+    mock_file_backend.scandir.return_value = [
+        asyncssh.SFTPName("small.txt", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o644, size=10, mtime=1)),
+        asyncssh.SFTPName("large.txt", attrs=asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o644, size=500, mtime=3)),
+    ]
+    mock_execute_with_fallback.return_value = (0, stdout, "")
+    arguments = {"path": "/remote/path", "order_by": order_by, "sort": "descending", "host": "remote.host"}
+
+    sftp = await mcp_client.call_tool("list_files", arguments=arguments)
+    mocker.patch("linux_mcp_server.tools.storage.get_file_backend", return_value=None)
+    find = await mcp_client.call_tool("list_files", arguments=arguments)
+
+    assert sftp.structured_content == find.structured_content
+
+
+@pytest.mark.parametrize("order_by", ("size", "modified"))
+async def test_list_files_top_n_prefers_pushdown_over_sftp(
+    mock_file_backend, mock_execute_with_fallback, mcp_client, order_by
+):
+    mock_execute_with_fallback.return_value = (0, "300\tfile3.txt\n", "")
+
+    await mcp_client.call_tool(
+        "list_files",
+        arguments={"path": "/remote/path", "order_by": order_by, "top_n": 1, "host": "remote.host"},
+    )
+
+    mock_file_backend.scandir.assert_not_called()
+    assert mock_execute_with_fallback.call_args[0][0][:2] == ("bash", "-c")
+
+
+async def test_list_files_sftp_error(mock_file_backend, mcp_client):
+    mock_file_backend.scandir.side_effect = FileNotFoundError("No such file or directory: /remote/missing")
+
+    with pytest.raises(ToolError, match="Error listing /remote/missing"):
+        await mcp_client.call_tool("list_files", arguments={"path": "/remote/missing", "host": "remote.host"})
@@ -1,15 +1,32 @@
+import os
+import stat
+import sys
+
+from pathlib import Path
+
+import asyncssh
 import pytest
 
 from fastmcp.exceptions import ToolError
 
+from linux_mcp_server.config import CONFIG
+
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils")
+
 
 async def test_read_file_success(tmp_path, mcp_client):
     test_file = tmp_path / "test.txt"
     test_file.write_text("Hello, World!")
 
     result = await mcp_client.call_tool("read_file", arguments={"path": str(test_file)})
+    content = result.structured_content
 
-    assert result.content[0].text == "Hello, World!"
+    assert content["content"] == "Hello, World!"
+    assert content["offset"] == 0
+    assert content["length"] == 13
+    assert content["size"] == 13
+    assert content["next_offset"] is None
 
 
 async def test_read_file_nonexistent(tmp_path, mcp_client):
@@ -28,64 +45,274 @@ async def test_read_file_is_directory(tmp_path, mcp_client):
     assert "not a file" in str(exc_info.value)
 
 
-async def test_read_file_remote(mock_execute_with_fallback, mcp_client):
-    mock_execute_with_fallback.side_effect = [
-        (0, "19", ""),
-        (0, "Remote file content", ""),
-    ]
-
-    result = await mcp_client.call_tool("read_file", arguments={"path": "/remote/path/file.txt", "host": "remote.host"})
+async def test_read_file_pages_through_file(tmp_path, mcp_client):
+    test_file = tmp_path / "big.txt"
+    test_file.write_text("0123456789")
 
-    assert result.content[0].text == "Remote file content"
+    chunks = []
+    offset = 0
+    while offset is not None:
+        result = await mcp_client.call_tool(
+            "read_file", arguments={"path": str(test_file), "offset": offset, "length": 4}
+        )
+        chunks.append(result.structured_content["content"])
+        offset = result.structured_content["next_offset"]
 
-    assert mock_execute_with_fallback.call_count == 2
-    for call in mock_execute_with_fallback.call_args_list:
-        assert call[1]["host"] == "remote.host"
+    assert chunks == ["0123", "4567", "89"]
 
 
-async def test_read_file_rejects_large_local_file(tmp_path, mcp_client, mocker):
+async def test_read_file_length_capped_by_limit(tmp_path, mcp_client, mocker):
     mocker.patch("linux_mcp_server.tools.storage.CONFIG.max_file_read_bytes", 8)
     test_file = tmp_path / "big.txt"
     test_file.write_text("0123456789")
 
-    with pytest.raises(ToolError, match="too large"):
-        await mcp_client.call_tool("read_file", arguments={"path": str(test_file)})
+    result = await mcp_client.call_tool("read_file", arguments={"path": str(test_file), "length": 100})
+    content = result.structured_content
 
+    assert content["content"] == "01234567"
+    assert content["size"] == 10
+    assert content["next_offset"] == 8
 
-async def test_read_file_remote_rejects_large_file(mock_execute_with_fallback, mcp_client, mocker):
-    mocker.patch("linux_mcp_server.tools.storage.CONFIG.max_file_read_bytes", 8)
-    mock_execute_with_fallback.return_value = (0, "10", "")
 
-    with pytest.raises(ToolError, match="too large"):
-        await mcp_client.call_tool("read_file", arguments={"path": "/remote/path/file.txt", "host": "remote.host"})
+@pytest.mark.parametrize(
+    ("offset", "expected", "expected_offset"),
+    (
+        (-4, "6789", 6),
+        (-100, "0123456789", 0),
+        (100, "", 100),
+    ),
+)
+async def test_read_file_offsets(tmp_path, mcp_client, offset, expected, expected_offset):
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("0123456789")
 
+    result = await mcp_client.call_tool("read_file", arguments={"path": str(test_file), "offset": offset})
+    content = result.structured_content
 
-async def test_read_file_remote_command_failure(mock_execute_with_fallback, mcp_client):
-    mock_execute_with_fallback.side_effect = [
-        (0, "19", ""),
-        (1, "", "File not found"),
-    ]
+    assert content["content"] == expected
+    assert content["offset"] == expected_offset
+    assert content["next_offset"] is None
 
-    with pytest.raises(ToolError, match="command failed with return code 1"):
-        await mcp_client.call_tool("read_file", arguments={"path": "/remote/path/file.txt", "host": "remote.host"})
 
+async def test_read_file_does_not_split_utf8(tmp_path, mcp_client):
+    test_file = tmp_path / "utf8.txt"
+    test_file.write_text("aé€b", encoding="utf-8")
 
-async def test_read_file_sentinel_rejects_over_limit(tmp_path, mcp_client, mocker):
-    mocker.patch("linux_mcp_server.tools.storage.CONFIG.max_file_read_bytes", 8)
-    test_file = tmp_path / "sneaky.txt"
-    test_file.write_text("012345678")
+    result = await mcp_client.call_tool("read_file", arguments={"path": str(test_file), "length": 4})
+    content = result.structured_content
+
+    # "€" is three bytes starting at offset 3, so it begins the next chunk
+    assert content["content"] == "aé"
+    assert content["next_offset"] == 3
+
+    result = await mcp_client.call_tool("read_file", arguments={"path": str(test_file), "offset": 3})
+
+    assert result.structured_content["content"] == "€b"
+
+
+async def test_read_file_chunk_inside_utf8_character_advances(tmp_path, mcp_client):
+    test_file = tmp_path / "utf8.txt"
+    test_file.write_text("é\n", encoding="utf-8")
+
+    offset, chunks = 0, []
+    while offset is not None:
+        result = await mcp_client.call_tool(
+            "read_file", arguments={"path": str(test_file), "offset": offset, "length": 1}
+        )
+        content = result.structured_content
+        assert content["length"] == 1
+        chunks.append(content["content"])
+        offset = content["next_offset"]
+
+    assert chunks == ["�", "�", "\n"]
+
+
+async def test_read_file_remote(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (0, b"19 0 42-19-1700000000.123456789\nRemote file content", b"")
+
+    result = await mcp_client.call_tool("read_file", arguments={"path": "/remote/path/file.txt", "host": "remote.host"})
+
+    assert result.structured_content["content"] == "Remote file content"
+    assert result.structured_content["size"] == 19
+    assert result.structured_content["fingerprint"] == "42-19-1700000000.123456789"
+
+    mock_execute_with_fallback.assert_called_once()
+    assert mock_execute_with_fallback.call_args[1]["host"] == "remote.host"
 
-    mocker.patch("pathlib.Path.stat", return_value=type("stat", (), {"st_size": 7})())
 
-    with pytest.raises(ToolError, match="too large"):
-        await mcp_client.call_tool("read_file", arguments={"path": str(test_file)})
+@pytest.mark.parametrize("host", (None, "remote.host"))
+async def test_read_file_unchanged(mock_execute_with_fallback, mcp_client, host):
+    mock_execute_with_fallback.return_value = (0, b"19 0 42-19-1700000000.123456789\n", b"")
 
+    result = await mcp_client.call_tool(
+        "read_file",
+        arguments={"path": "/remote/path/file.txt", "if_none_match": "42-19-1700000000.123456789", "host": host},
+    )
+    content = result.structured_content
 
-async def test_read_file_custom_limit(tmp_path, mcp_client, mocker):
-    mocker.patch("linux_mcp_server.tools.storage.CONFIG.max_file_read_bytes", 4096)
-    test_file = tmp_path / "small.txt"
-    test_file.write_text("OK")
+    assert content["unchanged"] is True
+    assert content["content"] == ""
+    assert content["length"] == 0
+    assert content["fingerprint"] == "42-19-1700000000.123456789"
+    assert mock_execute_with_fallback.call_args[0][0][-1] == "42-19-1700000000.123456789"
+
+
+@pytest.mark.parametrize("if_none_match", ("{a}", "5-19-1700000000", "19-1700000000.5", "19-1700000000\n", "-", ""))
+async def test_read_file_rejects_malformed_fingerprint(mock_execute_with_fallback, mcp_client, if_none_match):
+    with pytest.raises(ToolError, match="if_none_match"):
+        await mcp_client.call_tool(
+            "read_file", arguments={"path": "/remote/file.txt", "if_none_match": if_none_match, "host": "remote.host"}
+        )
+
+    mock_execute_with_fallback.assert_not_called()
+
+
+async def test_read_file_fingerprint(tmp_path, mcp_client):
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("0123456789")
+    os.utime(test_file, ns=(1700000000_123456789, 1700000000_123456789))
 
     result = await mcp_client.call_tool("read_file", arguments={"path": str(test_file)})
 
-    assert result.content[0].text == "OK"
+    inode = test_file.stat().st_ino
+    assert result.structured_content["fingerprint"] == f"{inode}-10-1700000000.123456789"
+
+
+@pytest.mark.parametrize("path", ("/proc/loadavg", "/sys/kernel/mm/transparent_hugepage/enabled", "empty"))
+async def test_read_file_no_fingerprint_for_volatile_files(tmp_path, mcp_client, path):
+    if path == "empty":
+        path = tmp_path / "empty"
+        path.touch()
+    if not os.path.isfile(path):
+        pytest.skip(f"{path} does not exist")
+
+    result = await mcp_client.call_tool("read_file", arguments={"path": str(path)})
+
+    assert result.structured_content["fingerprint"] == ""
+    assert result.structured_content["unchanged"] is False
+
+
+async def test_read_file_fingerprint_changes(tmp_path, mcp_client):
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("one")
+
+    first = (await mcp_client.call_tool("read_file", arguments={"path": str(test_file)})).structured_content
+    fingerprint = first["fingerprint"]
+    second = (
+        await mcp_client.call_tool("read_file", arguments={"path": str(test_file), "if_none_match": fingerprint})
+    ).structured_content
+
+    test_file.write_text("three")
+    third = (
+        await mcp_client.call_tool("read_file", arguments={"path": str(test_file), "if_none_match": fingerprint})
+    ).structured_content
+
+    assert first["content"] == "one"
+    assert second["unchanged"] is True
+    assert second["content"] == ""
+    assert third["unchanged"] is False
+    assert third["content"] == "three"
+    assert third["fingerprint"] != fingerprint
+
+
+async def test_read_file_remote_not_a_file(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (3, b"", b"")
+
+    with pytest.raises(ToolError, match="Path is not a file: /remote/path"):
+        await mcp_client.call_tool("read_file", arguments={"path": "/remote/path", "host": "remote.host"})
+
+
+async def test_read_file_remote_command_failure(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (1, b"", b"Permission denied")
+
+    with pytest.raises(ToolError, match="command failed with return code 1"):
+        await mcp_client.call_tool("read_file", arguments={"path": "/remote/path/file.txt", "host": "remote.host"})
+
+
+async def test_read_file_unexpected_output(mock_execute_with_fallback, mcp_client):
+    mock_execute_with_fallback.return_value = (0, b"garbage", b"")
+
+    with pytest.raises(ToolError, match="Unexpected output"):
+        await mcp_client.call_tool("read_file", arguments={"path": "/remote/path/file.txt", "host": "remote.host"})
+
+
+async def test_read_file_sftp(mock_file_backend, mock_execute_with_fallback, mcp_client):
+    mock_file_backend.stat.return_value = asyncssh.SFTPAttrs(
+        permissions=stat.S_IFREG | 0o644, size=10, mtime=1700000000
+    )
+    mock_file_backend.statvfs.return_value = asyncssh.SFTPVFSAttrs(blocks=1000)
+    mock_file_backend.read.return_value = b"6789"
+
+    result = await mcp_client.call_tool(
+        "read_file", arguments={"path": "/remote/file.txt", "offset": -4, "host": "remote.host"}
+    )
+    content = result.structured_content
+
+    assert content["content"] == "6789"
+    assert content["offset"] == 6
+    assert content["size"] == 10
+    assert content["next_offset"] is None
+    assert content["fingerprint"] == "10-1700000000"
+    mock_file_backend.read.assert_awaited_once_with(Path("/remote/file.txt"), 6, CONFIG.max_file_read_bytes)
+    mock_execute_with_fallback.assert_not_called()
+
+
+async def test_read_file_sftp_unchanged(mock_file_backend, mcp_client):
+    mock_file_backend.stat.return_value = asyncssh.SFTPAttrs(
+        permissions=stat.S_IFREG | 0o644, size=10, mtime=1700000000
+    )
+    mock_file_backend.statvfs.return_value = asyncssh.SFTPVFSAttrs(blocks=1000)
+
+    result = await mcp_client.call_tool(
+        "read_file",
+        arguments={"path": "/remote/file.txt", "if_none_match": "10-1700000000", "host": "remote.host"},
+    )
+
+    assert result.structured_content["unchanged"] is True
+    mock_file_backend.read.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "size, filesystem",
+    ((0, asyncssh.SFTPVFSAttrs(blocks=1000)), (4096, asyncssh.SFTPVFSAttrs(blocks=0)), (4096, None)),
+)
+async def test_read_file_sftp_no_fingerprint_for_volatile_files(mock_file_backend, mcp_client, size, filesystem):
+    mock_file_backend.stat.return_value = asyncssh.SFTPAttrs(
+        permissions=stat.S_IFREG | 0o444, size=size, mtime=1700000000
+    )
+    mock_file_backend.statvfs.return_value = filesystem
+    mock_file_backend.read.return_value = b"always [madvise] never\n"
+
+    result = await mcp_client.call_tool(
+        "read_file",
+        arguments={"path": "/sys/file", "if_none_match": f"{size}-1700000000", "host": "remote.host"},
+    )
+
+    assert result.structured_content["unchanged"] is False
+    assert result.structured_content["fingerprint"] == ""
+    assert result.structured_content["content"] == "always [madvise] never\n"
+
+
+@pytest.mark.parametrize(
+    "stat_result",
+    (
+        FileNotFoundError("No such file or directory: /remote/dir"),
+        asyncssh.SFTPAttrs(permissions=stat.S_IFDIR | 0o755),
+    ),
+)
+async def test_read_file_sftp_not_a_file(mock_file_backend, mcp_client, stat_result):
+    if isinstance(stat_result, Exception):
+        mock_file_backend.stat.side_effect = stat_result
+    else:
+        mock_file_backend.stat.return_value = stat_result
+
+    with pytest.raises(ToolError, match="Path is not a file: /remote/dir"):
+        await mcp_client.call_tool("read_file", arguments={"path": "/remote/dir", "host": "remote.host"})
+
+
+async def test_read_file_sftp_permission_denied(mock_file_backend, mcp_client):
+    mock_file_backend.stat.return_value = asyncssh.SFTPAttrs(permissions=stat.S_IFREG | 0o600, size=10)
+    mock_file_backend.read.side_effect = PermissionError("Permission denied: /remote/secret")
+
+    with pytest.raises(ToolError, match="Error reading /remote/secret: Permission denied"):
+        await mcp_client.call_tool("read_file", arguments={"path": "/remote/secret", "host": "remote.host"})
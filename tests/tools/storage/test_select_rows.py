@@ -0,0 +1,74 @@
+import random
+import subprocess
+
+import pytest
+
+from linux_mcp_server.commands import LISTING_TOP_N_SCRIPT
+from linux_mcp_server.tools.storage import OrderBy
+from linux_mcp_server.tools.storage import row_sort_key
+from linux_mcp_server.tools.storage import select_rows
+from linux_mcp_server.tools.storage import SortBy
+
+
+@pytest.fixture
+def rows():
+    rng = random.Random(0)
+    # Small value ranges so that plenty of rows tie on the sort key
+    return [
+        (
+            rng.randrange(20),
+            float(rng.randrange(20)),
+            rng.choice(("Alpha", "alpha", "beta", "Gamma", "delta")) + str(idx),
+        )
+        for idx in range(500)
+    ]
+
+
+@pytest.mark.parametrize("order_by", list(OrderBy))
+@pytest.mark.parametrize("sort", list(SortBy))
+@pytest.mark.parametrize("top_n", (1, 7, 499, 500, 1000))
+def test_select_rows_matches_full_sort(rows, order_by, sort, top_n):
+    key = row_sort_key(order_by, sort)
+    expected = sorted(rows, key=key, reverse=order_by == OrderBy.NAME and sort == SortBy.DESCENDING)[:top_n]
+
+    assert select_rows(iter(rows), order_by, sort, top_n) == expected
+
+
+@pytest.mark.parametrize("order_by", list(OrderBy))
+def test_select_rows_unbounded(rows, order_by):
+    result = select_rows(rows, order_by, SortBy.ASCENDING, None)
+
+    assert len(result) == len(rows)
+    assert result == sorted(rows, key=row_sort_key(order_by))
+
+
+def test_row_sort_key_name_is_case_insensitive():
+    result = select_rows([(0, 0.0, "beta"), (0, 0.0, "Alpha"), (0, 0.0, "gamma")], OrderBy.NAME, SortBy.ASCENDING, 2)
+
+    assert [name for _, _, name in result] == ["Alpha", "beta"]
+
+
+@pytest.mark.parametrize("sort", list(SortBy))
+def test_select_rows_ties_ordered_by_name(sort):
+    rows = [(5, 0.0, "c"), (9, 0.0, "z"), (5, 0.0, "a"), (1, 0.0, "q"), (5, 0.0, "b")]
+
+    result = select_rows(rows, OrderBy.SIZE, sort, 3)
+
+    expected = ["z", "a", "b"] if sort == SortBy.DESCENDING else ["q", "a", "b"]
+    assert [name for _, _, name in result] == expected
+
+
+@pytest.mark.parametrize(("flags", "sort"), (("-nr", SortBy.DESCENDING), ("-n", SortBy.ASCENDING)))
+def test_listing_top_n_script_matches_select_rows(flags, sort):
+    rows = [(5, 0.0, "c"), (9, 0.0, "z"), (5, 0.0, "a"), (1, 0.0, "q"), (5, 0.0, "b")]
+    listing = "".join(f"{size}\t{name}\n" for size, _, name in rows)
+
+    result = subprocess.run(
+        ["bash", "-c", LISTING_TOP_N_SCRIPT, "bash", flags, "3", "printf", "%s", listing],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    expected = select_rows(rows, OrderBy.SIZE, sort, 3)
+    assert result.stdout.splitlines() == [f"{size}\t{name}" for size, _, name in expected]
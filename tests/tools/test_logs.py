@@ -1,9 +1,16 @@
 """Tests for log tools."""
 
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 
 from fastmcp.exceptions import ToolError
 
+from linux_mcp_server.commands import KMSG_AWK
+
 
 @pytest.fixture
 def mock_allowed_log_paths(mocker):
@@ -12,11 +19,30 @@ def mock_allowed_log_paths(mocker):
     def _set_paths(paths=""):
         mock_config = mocker.patch("linux_mcp_server.tools.logs.CONFIG")
         mock_config.allowed_log_paths = paths
+        mock_config.max_file_read_bytes = 1024 * 1024
         return mock_config
 
     return _set_paths
 
 
+def journal_json(*messages, host="host", ident="systemd", pid="1"):
+    """Return journalctl -o json output with one entry per message."""
+    return "".join(
+        json.dumps(
+            {
+                "__CURSOR": f"s=abc;i={index:x}",
+                "__REALTIME_TIMESTAMP": str(1704110400_000000 + index * 1_000_000),
+                "_HOSTNAME": host,
+                "SYSLOG_IDENTIFIER": ident,
+                "_PID": pid,
+                "MESSAGE": message,
+            }
+        )
+        + "\n"
+        for index, message in enumerate(messages, 1)
+    )
+
+
 class TestGetJournalLogs:
     """Tests for get_journal_logs tool."""
 
@@ -81,19 +107,19 @@ class TestGetJournalLogs:
         self, mcp_client, mock_execute_with_fallback, params, expected_args, expected_fields
     ):
         """Test get_journal_logs with various filter combinations."""
-        mock_execute_with_fallback.return_value = (
-            0,
-            "Jan 01 12:00:00 host systemd[1]: Test log entry.",
-            "",
-        )
+        mock_execute_with_fallback.return_value = (0, journal_json("Test log entry."), "")
 
         result = await mcp_client.call_tool("get_journal_logs", params)
         content = result.structured_content
         cmd_args = mock_execute_with_fallback.call_args.args[0]
 
-        assert "Jan 01 12:00:00 host systemd[1]: Test log entry." in content["entries"]
+        assert "2024-01-01T12:00:01+0000 host systemd[1]: Test log entry." in content["entries"]
         assert content["lines_count"] == 1
+        assert content["cursor"] == "s=abc;i=1"
         assert cmd_args[0] == "journalctl"
+        assert "--output=json" in cmd_args
+        # Without --all journalctl replaces fields over 4096 bytes with null
+        assert "--all" in cmd_args
         assert all(content[field] == value for field, value in expected_fields.items())
         assert all(arg in cmd_args for arg in expected_args)
         assert mock_execute_with_fallback.call_count == 1
@@ -141,16 +167,12 @@ class TestGetJournalLogs:
 
     async def test_get_journal_logs_remote_execution(self, mcp_client, mock_execute_with_fallback):
         """Test get_journal_logs with remote execution."""
-        mock_execute_with_fallback.return_value = (
-            0,
-            "Jan 01 12:00:00 remote systemd[1]: remote log entry.",
-            "",
-        )
+        mock_execute_with_fallback.return_value = (0, journal_json("remote log entry.", host="remote"), "")
 
         result = await mcp_client.call_tool("get_journal_logs", {"host": "remote.server.com"})
         content = result.structured_content
 
-        assert "Jan 01 12:00:00 remote systemd[1]: remote log entry." in content["entries"]
+        assert "2024-01-01T12:00:01+0000 remote systemd[1]: remote log entry." in content["entries"]
 
         call_kwargs = mock_execute_with_fallback.call_args[1]
         assert call_kwargs["host"] == "remote.server.com"
@@ -159,7 +181,7 @@ class TestGetJournalLogs:
         """Test get_journal_logs returns multiple entries."""
         mock_execute_with_fallback.return_value = (
             0,
-            "Jan 01 12:00:00 host sshd[1]: Entry one\nJan 01 12:00:01 host sshd[1]: Entry two\nJan 01 12:00:02 host sshd[1]: Entry three",
+            journal_json("Entry one", "Entry two", "Entry three", ident="sshd"),
             "",
         )
 
@@ -167,7 +189,262 @@ class TestGetJournalLogs:
         content = result.structured_content
 
         assert content["lines_count"] == 3
-        assert len(content["entries"]) == 3
+        assert content["entries"][2] == "2024-01-01T12:00:03+0000 host sshd[1]: Entry three"
+        assert content["cursor"] == "s=abc;i=3"
+
+    async def test_get_journal_logs_after_cursor(self, mcp_client, mock_execute_with_fallback):
+        """Test get_journal_logs continues after a cursor and returns the last cursor."""
+        mock_execute_with_fallback.return_value = (0, journal_json("Entry one", "Entry two"), "")
+
+        result = await mcp_client.call_tool("get_journal_logs", {"cursor": "s=abc;i=0", "lines": 2})
+        content = result.structured_content
+        cmd_args = mock_execute_with_fallback.call_args.args[0]
+
+        assert content["lines_count"] == 2
+        assert content["cursor"] == "s=abc;i=2"
+        assert cmd_args[cmd_args.index("--after-cursor") + 1] == "s=abc;i=0"
+
+    async def test_get_journal_logs_compact(self, mcp_client, mock_execute_with_fallback):
+        """Test get_journal_logs returns templates instead of entries when compact."""
+        mock_execute_with_fallback.return_value = (
+            0,
+            journal_json("Session 1 started", "Session 2 started", "Session 3 started", ident="sshd"),
+            "",
+        )
+
+        result = await mcp_client.call_tool("get_journal_logs", {"compact": True})
+        content = result.structured_content
+
+        assert content["entries"] == []
+        assert content["lines_count"] == 3
+        assert content["cursor"] == "s=abc;i=3"
+        assert content["templates"] == [
+            {
+                "template": "host sshd[<*>]: Session <*> started",
+                "count": 3,
+                "first_seen": "2024-01-01T12:00:01+0000",
+                "last_seen": "2024-01-01T12:00:03+0000",
+                "examples": [
+                    "2024-01-01T12:00:01+0000 host sshd[1]: Session 1 started",
+                    "2024-01-01T12:00:02+0000 host sshd[1]: Session 2 started",
+                    "2024-01-01T12:00:03+0000 host sshd[1]: Session 3 started",
+                ],
+            }
+        ]
+
+    @pytest.mark.parametrize("stdout", ["", "-- No entries --\n"])
+    async def test_get_journal_logs_cursor_at_end(self, mcp_client, mock_execute_with_fallback, stdout):
+        """Test get_journal_logs keeps the cursor when no entries follow it."""
+        mock_execute_with_fallback.return_value = (0, stdout, "")
+
+        result = await mcp_client.call_tool("get_journal_logs", {"cursor": "s=abc;i=5"})
+        content = result.structured_content
+
+        assert content["entries"] == []
+        assert content["cursor"] == "s=abc;i=5"
+
+    @pytest.mark.parametrize("cursor", ["", "s=abc;i=", "s=abc;--quiet", "s=ABC"])
+    async def test_get_journal_logs_invalid_cursor(self, mcp_client, mock_execute_with_fallback, cursor):
+        """Test get_journal_logs rejects malformed cursors."""
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool("get_journal_logs", {"cursor": cursor})
+
+        mock_execute_with_fallback.assert_not_called()
+
+
+class TestAggregateJournalLogs:
+    """Tests for get_journal_logs with aggregate_seconds."""
+
+    async def test_aggregate(self, mcp_client, mock_execute_with_fallback):
+        """Test the aggregation groups are parsed, sorted and returned."""
+        mock_execute_with_fallback.return_value = (
+            0,
+            "T 6 1\n"
+            "G\t1700002800\tnginx.service\t6\t1\n"
+            "G\t1699999200\tsshd.service\t3\t4\n"
+            'S\t3\tfailed \\"root\\"\n'
+            "S\t1\tother\n",
+            "",
+        )
+
+        result = await mcp_client.call_tool(
+            "get_journal_logs",
+            {"aggregate_seconds": 3600, "top_messages": 2, "unit": "sshd.service", "since": "-2h"},
+        )
+        content = result.structured_content
+        cmd_args = mock_execute_with_fallback.call_args.args[0]
+
+        assert content["entries"] == []
+        assert content["matches"] == 6
+        assert content["ungrouped"] == 1
+        assert [(group["unit"], group["priority"], group["count"]) for group in content["groups"]] == [
+            ("sshd.service", 3, 4),
+            ("nginx.service", 6, 1),
+        ]
+        assert content["groups"][0]["start"] == "2023-11-14T22:00:00Z"
+        assert content["groups"][0]["samples"] == [
+            {"message": 'failed "root"', "count": 3},
+            {"message": "other", "count": 1},
+        ]
+        assert cmd_args[:2] == ("bash", "-c")
+        assert cmd_args[4:] == ("3600", "2", "--unit", "sshd.service", "--since", "-2h")
+
+    @pytest.mark.parametrize(
+        "returncode, stdout, match",
+        [
+            (1, "", "Error reading journal logs"),
+            (0, "garbage", "Unexpected output"),
+        ],
+    )
+    async def test_aggregate_errors(self, mcp_client, mock_execute_with_fallback, returncode, stdout, match):
+        """Test aggregation failures are reported."""
+        mock_execute_with_fallback.return_value = (returncode, stdout, "failed")
+
+        with pytest.raises(ToolError, match=match):
+            await mcp_client.call_tool("get_journal_logs", {"aggregate_seconds": 60})
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires bash and awk")
+    async def test_aggregate_on_target(self, mcp_client, tmp_path, monkeypatch):
+        """Test the aggregation script against journalctl JSON output."""
+        entries = [
+            {
+                "__REALTIME_TIMESTAMP": "1700000010000000",
+                "_SYSTEMD_UNIT": "sshd.service",
+                "PRIORITY": "3",
+                "MESSAGE": 'bad "x"',
+            },
+            {
+                "__REALTIME_TIMESTAMP": "1700000020000000",
+                "_SYSTEMD_UNIT": "sshd.service",
+                "PRIORITY": "3",
+                "MESSAGE": 'bad "x"',
+            },
+            {
+                "__REALTIME_TIMESTAMP": "1700000030000000",
+                "_SYSTEMD_UNIT": "sshd.service",
+                "PRIORITY": "3",
+                "MESSAGE": "ok",
+            },
+            {"__REALTIME_TIMESTAMP": "1700003700000000", "PRIORITY": "6", "MESSAGE": [104, 105]},
+            {"__REALTIME_TIMESTAMP": "1700003701000000", "_SYSTEMD_UNIT": "a\\x2db.service", "MESSAGE": "é"},
+        ]
+        journal = tmp_path / "journal.json"
+        journal.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+        journalctl = tmp_path / "journalctl"
+        journalctl.write_text(f"#!/bin/sh\ncat {journal}\n")
+        journalctl.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        result = await mcp_client.call_tool("get_journal_logs", {"aggregate_seconds": 3600, "top_messages": 1})
+        groups = result.structured_content["groups"]
+
+        assert result.structured_content["matches"] == 5
+        assert [(group["unit"], group["priority"], group["count"]) for group in groups] == [
+            ("sshd.service", 3, 3),
+            ("", 6, 1),
+            ("a\\x2db.service", None, 1),
+        ]
+        assert groups[0]["samples"] == [{"message": 'bad "x"', "count": 2}]
+        assert groups[2]["samples"] == [{"message": "é", "count": 1}]
+
+
+KMSG = "".join(
+    [
+        "6,10,1000000,-;first\n",
+        " SUBSYSTEM=pci\n",
+        "3,11,2000000,-;disk error\n",
+        "7,12,3000000,-;debug noise\n",
+        "4,13,4000000,-;low memory\n",
+    ]
+)
+
+
+def _kmsg_can_be_read():
+    try:
+        with open("/dev/kmsg", "rb"):
+            return True
+    except OSError:
+        return False
+
+
+class TestGetKernelLogs:
+    """Tests for get_kernel_logs tool."""
+
+    async def test_get_kernel_logs(self, mcp_client, mock_execute_with_fallback):
+        """Test get_kernel_logs renders records and returns the last sequence number."""
+        mock_execute_with_fallback.return_value = (0, "6,10,1000000,-;first\n3,11,2000000,-;disk error\n", "")
+
+        result = await mcp_client.call_tool("get_kernel_logs", {"level": 4, "lines": 20, "host": "remote"})
+        content = result.structured_content
+
+        assert content["entries"] == ["[    1.000000] info: first", "[    2.000000] err: disk error"]
+        assert content["cursor"] == "11"
+        assert mock_execute_with_fallback.call_args.args[0][-3:] == ("", "20", "4")
+        assert mock_execute_with_fallback.call_args.kwargs["host"] == "remote"
+
+    async def test_get_kernel_logs_cursor_at_end(self, mcp_client, mock_execute_with_fallback):
+        """Test get_kernel_logs keeps the cursor when no newer records exist."""
+        mock_execute_with_fallback.return_value = (0, "", "")
+
+        result = await mcp_client.call_tool("get_kernel_logs", {"cursor": "13"})
+        content = result.structured_content
+
+        assert content["entries"] == []
+        assert content["cursor"] == "13"
+        assert mock_execute_with_fallback.call_args.args[0][-3] == "13"
+
+    async def test_get_kernel_logs_failure(self, mcp_client, mock_execute_with_fallback):
+        """Test get_kernel_logs reports an unreadable /dev/kmsg."""
+        mock_execute_with_fallback.return_value = (2, "", "bash: /dev/kmsg: Operation not permitted")
+
+        with pytest.raises(ToolError, match="Error reading kernel logs: .*Operation not permitted"):
+            await mcp_client.call_tool("get_kernel_logs", {})
+
+    @pytest.mark.parametrize("cursor", ["", "-1", "1;2", "abc"])
+    async def test_get_kernel_logs_invalid_cursor(self, mcp_client, mock_execute_with_fallback, cursor):
+        """Test get_kernel_logs rejects malformed cursors."""
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool("get_kernel_logs", {"cursor": cursor})
+
+        mock_execute_with_fallback.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "after, lines, level, expected",
+        [
+            # Newest records
+            (-1, 2, 7, [12, 13]),
+            (-1, 10, 4, [11, 13]),
+            # Oldest records after the cursor
+            (10, 2, 7, [11, 12]),
+            (13, 10, 7, []),
+            # A cursor from an earlier boot starts over
+            (99, 2, 7, [10, 11]),
+        ],
+    )
+    def test_kmsg_selection(self, after, lines, level, expected):
+        """Test the record selection run on the target."""
+        result = subprocess.run(
+            ["awk", "-v", f"after={after}", "-v", f"lines={lines}", "-v", f"level={level}", KMSG_AWK],
+            input=KMSG,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert [int(line.split(",")[1]) for line in result.stdout.splitlines()] == expected
+
+    @pytest.mark.skipif(not _kmsg_can_be_read(), reason="requires read access to /dev/kmsg")
+    async def test_get_kernel_logs_on_target(self, mcp_client):
+        """Test paging through the local kernel log."""
+        first = (await mcp_client.call_tool("get_kernel_logs", {"lines": 2})).structured_content
+        cursor = int(first["cursor"])
+        older = (
+            await mcp_client.call_tool("get_kernel_logs", {"cursor": str(cursor - 2), "lines": 1})
+        ).structured_content
+
+        assert len(first["entries"]) == 2
+        assert older["entries"] == first["entries"][:1]
+        assert older["cursor"] == str(cursor - 1)
 
 
 class TestReadLogFile:
@@ -188,7 +465,7 @@ class TestReadLogFile:
     async def test_read_log_file_success(self, mcp_client, mock_execute_with_fallback, setup_log_file):
         """Test read_log_file returns structured data."""
         log_file = setup_log_file()
-        mock_execute_with_fallback.return_value = (0, "Test log content\nLine 2", "")
+        mock_execute_with_fallback.return_value = (0, "1-22-1700000000\nC 1 0 22\nTest log content\nLine 2", "")
 
         result = await mcp_client.call_tool("read_log_file", {"log_path": log_file})
         content = result.structured_content
@@ -196,15 +473,31 @@ class TestReadLogFile:
         assert content["entries"] == ["Test log content", "Line 2"]
         assert content["lines_count"] == 2
         assert content["path"] == str(log_file)
+        assert content["fingerprint"] == "1-22-1700000000"
+        assert content["cursor"] == "1:16"
+        assert content["unchanged"] is False
 
         cmd_args = mock_execute_with_fallback.call_args[0][0]
-        assert "-n" in cmd_args
-        assert "100" in cmd_args
+        assert cmd_args[-10:] == (str(log_file), "100", "", "", str(1024 * 1024), "", "0", "0", "100", "0")
+
+    async def test_read_log_file_compact(self, mcp_client, mock_execute_with_fallback, setup_log_file):
+        """Test read_log_file returns templates instead of entries when compact."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, "1-22-1700000000\nC 1 0 30\nretry 1 failed\nretry 2 failed", "")
+
+        result = await mcp_client.call_tool("read_log_file", {"log_path": log_file, "compact": True})
+        content = result.structured_content
+
+        assert content["entries"] == []
+        assert content["lines_count"] == 2
+        assert [(template["template"], template["count"]) for template in content["templates"]] == [
+            ("retry <*> failed", 2)
+        ]
 
     async def test_read_log_file_custom_lines(self, mcp_client, mock_execute_with_fallback, setup_log_file):
         """Test read_log_file with custom line count."""
         log_file = setup_log_file()
-        mock_execute_with_fallback.return_value = (0, "Test log content\nLine 2", "")
+        mock_execute_with_fallback.return_value = (0, "1-22-1700000000\nC 1 0 22\nTest log content\nLine 2", "")
 
         result = await mcp_client.call_tool("read_log_file", {"log_path": log_file, "lines": 50})
         content = result.structured_content
@@ -212,7 +505,267 @@ class TestReadLogFile:
         assert content["lines_count"] == 2
 
         cmd_args = mock_execute_with_fallback.call_args[0][0]
-        assert "50" in cmd_args
+        assert cmd_args[-9] == "50"
+
+    async def test_read_log_file_unchanged(self, mcp_client, mock_execute_with_fallback, setup_log_file):
+        """Test read_log_file returns no entries when the fingerprint matches."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, "1-22-1700000000\n", "")
+
+        result = await mcp_client.call_tool("read_log_file", {"log_path": log_file, "if_none_match": "1-22-1700000000"})
+        content = result.structured_content
+
+        assert content["unchanged"] is True
+        assert content["entries"] == []
+        assert content["fingerprint"] == "1-22-1700000000"
+        assert mock_execute_with_fallback.call_args[0][0][-8] == "1-22-1700000000"
+
+    @pytest.mark.parametrize(
+        "arguments",
+        (
+            {"if_none_match": "{a}"},
+            {"if_none_match": "22-1700000000"},
+            {"cursor": "{a}"},
+        ),
+    )
+    async def test_read_log_file_rejects_malformed_fingerprint_and_cursor(
+        self, mcp_client, mock_execute_with_fallback, setup_log_file, arguments
+    ):
+        """Test fingerprints and cursors are validated before reaching the command."""
+        log_file = setup_log_file()
+
+        with pytest.raises(ToolError, match=next(iter(arguments))):
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, **arguments})
+
+        mock_execute_with_fallback.assert_not_called()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils")
+    async def test_read_log_file_fingerprint_changes(self, mcp_client, setup_log_file):
+        """Test the fingerprint of a real file round-trips until the file changes."""
+        log_file = setup_log_file()
+
+        first = (await mcp_client.call_tool("read_log_file", {"log_path": log_file})).structured_content
+        fingerprint = first["fingerprint"]
+        second = (
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "if_none_match": fingerprint})
+        ).structured_content
+
+        with log_file.open("a") as f:
+            f.write("\nLine 4")
+        third = (
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "if_none_match": fingerprint})
+        ).structured_content
+
+        assert first["entries"] == ["Test log content", "Line 2", "Line 3"]
+        assert second["unchanged"] is True
+        assert third["unchanged"] is False
+        assert third["entries"][-1] == "Line 4"
+
+    @pytest.mark.parametrize(
+        "output, lines, expected, expected_cursor",
+        [
+            # Only complete lines are returned
+            ("C 7 10 40\nnew one\nnew two\npart", 100, ["new one", "new two"], "7:26"),
+            ("C 7 10 10\n", 100, [], "7:10"),
+            # The line limit stops the cursor after the last returned line
+            ("C 7 10 40\nnew one\nnew two\n", 1, ["new one"], "7:18"),
+            # The rest of the rotated file comes first, then the new file
+            ("R 5 30 38\nold one\nC 7 0 8\nnew one\n", 100, ["old one", "new one"], "7:8"),
+            ("R 5 30 37\nold endC 7 0 8\nnew one\n", 100, ["old end", "new one"], "7:8"),
+            ("R 5 30 38\nold one\nC 7 0 8\nnew one\n", 1, ["old one"], "5:38"),
+        ],
+    )
+    async def test_read_log_file_cursor(
+        self, mcp_client, mock_execute_with_fallback, setup_log_file, output, lines, expected, expected_cursor
+    ):
+        """Test read_log_file returns the lines after a cursor and the next cursor."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, f"7-40-1700000000\n{output}", "")
+
+        result = await mcp_client.call_tool("read_log_file", {"log_path": log_file, "cursor": "5:30", "lines": lines})
+        content = result.structured_content
+
+        assert content["entries"] == expected
+        assert content["cursor"] == expected_cursor
+        assert mock_execute_with_fallback.call_args[0][0][-7] == "5:30"
+
+    async def test_read_log_file_last_lines_skip_partial_first_line(
+        self, mcp_client, mock_execute_with_fallback, setup_log_file
+    ):
+        """Test that a byte window starting mid-line does not return the line fragment."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, "1-100-1700000000\nC 1 80 100\nent\nlast line\nnewest", "")
+
+        result = await mcp_client.call_tool("read_log_file", {"log_path": log_file})
+        content = result.structured_content
+
+        assert content["entries"] == ["last line", "newest"]
+        assert content["cursor"] == "1:94"
+
+    @pytest.mark.parametrize("cursor", ["12", "a:1", "1:-1", "1:2:3"])
+    async def test_read_log_file_invalid_cursor(self, mcp_client, setup_log_file, cursor):
+        """Test read_log_file rejects malformed cursors."""
+        log_file = setup_log_file()
+
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "cursor": cursor})
+
+    async def test_read_log_file_unexpected_output(self, mcp_client, mock_execute_with_fallback, setup_log_file):
+        """Test read_log_file reports malformed command output."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, "1-22-1700000000\nR 1 0 50\nshort", "")
+
+        with pytest.raises(ToolError, match="Unexpected output"):
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "cursor": "1:0"})
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+    async def test_read_log_file_follows_rotation(self, mcp_client, setup_log_file):
+        """Test following a real log file across appends and a rename rotation."""
+        log_file = setup_log_file("one\ntwo\n")
+
+        first = (await mcp_client.call_tool("read_log_file", {"log_path": log_file})).structured_content
+        with log_file.open("a") as f:
+            f.write("three\npartial")
+        second = (
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "cursor": first["cursor"]})
+        ).structured_content
+
+        with log_file.open("a") as f:
+            f.write(" line\n")
+        log_file.rename(log_file.with_name("test.log.1"))
+        log_file.write_text("four\n")
+        third = (
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "cursor": second["cursor"]})
+        ).structured_content
+
+        assert first["entries"] == ["one", "two"]
+        assert second["entries"] == ["three"]
+        assert third["entries"] == ["partial line", "four"]
+        assert third["cursor"] == f"{log_file.stat().st_ino}:5"
+
+    async def test_read_log_file_pattern(self, mcp_client, mock_execute_with_fallback, setup_log_file):
+        """Test read_log_file passes the filter to the target and reports matches."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (
+            0,
+            "1-60-1700000000\nC 1 0 60\nM 3 55 2\nerror two\nerror three\n",
+            "",
+        )
+
+        result = await mcp_client.call_tool(
+            "read_log_file",
+            {"log_path": log_file, "pattern": "error", "ignore_case": True, "invert": True, "max_matches": 2},
+        )
+        content = result.structured_content
+
+        assert content["entries"] == ["error two", "error three"]
+        assert content["matches"] == 3
+        assert content["cursor"] == "1:55"
+
+        cmd_args = mock_execute_with_fallback.call_args[0][0]
+        assert cmd_args[-5:] == ("error", "1", "1", "2", "0")
+
+    @pytest.mark.parametrize(
+        "output, expected, expected_matches, expected_cursor",
+        [
+            ("C 7 10 40\nM 0 20 0\n", [], 0, "7:30"),
+            ("R 5 30 38\nM 1 8 1\nold one\nC 7 0 8\nM 1 8 1\nnew one\n", ["old one", "new one"], 2, "7:8"),
+            # The rotated file reached the match limit, so the new file is left for later
+            ("R 5 30 50\nM 1 8 1\nold one\n", ["old one"], 1, "5:38"),
+            # Matched lines may be empty or contain only a carriage return
+            ("C 7 0 10\nM 3 10 3\n\nx\r\n\r\n", ["x"], 3, "7:10"),
+        ],
+    )
+    async def test_read_log_file_pattern_cursor(
+        self,
+        mcp_client,
+        mock_execute_with_fallback,
+        setup_log_file,
+        output,
+        expected,
+        expected_matches,
+        expected_cursor,
+    ):
+        """Test read_log_file returns the matches after a cursor and the next cursor."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, f"7-40-1700000000\n{output}", "")
+
+        result = await mcp_client.call_tool(
+            "read_log_file", {"log_path": log_file, "cursor": "5:30", "pattern": "o", "max_matches": 1}
+        )
+        content = result.structured_content
+
+        assert content["entries"] == expected
+        assert content["matches"] == expected_matches
+        assert content["cursor"] == expected_cursor
+
+    async def test_read_log_file_pattern_unexpected_output(
+        self, mcp_client, mock_execute_with_fallback, setup_log_file
+    ):
+        """Test read_log_file reports a filtered segment with missing lines."""
+        log_file = setup_log_file()
+        mock_execute_with_fallback.return_value = (0, "1-22-1700000000\nC 1 0 22\nM 2 22 2\nonly one\n", "")
+
+        with pytest.raises(ToolError, match="Unexpected output"):
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "pattern": "one"})
+
+    @pytest.mark.parametrize("pattern", ["(a", "a\\1", "\\d+", "(?i)error", "x" * 513, "code [0-9]{3}", "a{1,2}"])
+    async def test_read_log_file_invalid_pattern(self, mcp_client, setup_log_file, pattern):
+        """Test read_log_file rejects patterns awk would not match the same way."""
+        log_file = setup_log_file()
+
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool("read_log_file", {"log_path": log_file, "pattern": pattern})
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils")
+    @pytest.mark.parametrize(
+        "arguments, expected, expected_matches",
+        [
+            ({"pattern": "error"}, ["error: disk", "error: net"], 2),
+            ({"pattern": "ERROR", "ignore_case": True, "max_matches": 1}, ["error: net"], 2),
+            ({"pattern": "error", "invert": True}, ["info: start", "info: $(id) [x]", '{"level": "warn"}'], 3),
+            ({"pattern": "[[:digit:]]|\\$\\(id\\)"}, ["info: $(id) [x]"], 1),
+            ({"pattern": '\\{"level": "warn"\\}'}, ['{"level": "warn"}'], 1),
+            # The first line of a window that starts mid-line is never matched
+            ({"pattern": "disk", "max_bytes": 30}, [], 0),
+            ({"pattern": "disk", "max_bytes": 30, "search_whole_file": True}, ["error: disk"], 1),
+        ],
+    )
+    async def test_read_log_file_pattern_real_file(
+        self, mcp_client, setup_log_file, arguments, expected, expected_matches
+    ):
+        """Test filtering a real log file on the target."""
+        log_file = setup_log_file('info: start\nerror: disk\ninfo: $(id) [x]\nerror: net\n{"level": "warn"}\n')
+
+        result = await mcp_client.call_tool("read_log_file", {"log_path": log_file, **arguments})
+        content = result.structured_content
+
+        assert content["entries"] == expected
+        assert content["matches"] == expected_matches
+        assert content["cursor"] == f"{log_file.stat().st_ino}:{log_file.stat().st_size}"
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires GNU version of coreutils/findutils")
+    async def test_read_log_file_pattern_follows_rotation(self, mcp_client, setup_log_file):
+        """Test paging through matches with a cursor across a rename rotation."""
+        log_file = setup_log_file("start\n")
+        inode = log_file.stat().st_ino
+
+        with log_file.open("a") as f:
+            f.write("error 1\nok\nerror 2\nerror 3\npartial error")
+        log_file.rename(log_file.with_name("test.log.1"))
+        log_file.write_text("error 4\nerror 5\n")
+
+        arguments = {"log_path": log_file, "pattern": "^error", "max_matches": 2, "cursor": f"{inode}:6"}
+        pages = []
+        while True:
+            content = (await mcp_client.call_tool("read_log_file", arguments)).structured_content
+            if not content["entries"]:
+                break
+            pages.append(content["entries"])
+            arguments["cursor"] = content["cursor"]
+
+        assert pages == [["error 1", "error 2"], ["error 3", "error 4"], ["error 5"]]
+        assert arguments["cursor"] == f"{log_file.stat().st_ino}:16"
 
     async def test_read_log_file_no_allowed_paths(self, mcp_client, mock_allowed_log_paths):
         """Test read_log_file when no allowed paths are configured."""
@@ -281,7 +834,7 @@ class TestReadLogFile:
     async def test_read_log_file_empty(self, mcp_client, mock_execute_with_fallback, setup_log_file):
         """Test read_log_file with empty log file."""
         log_file = setup_log_file(content="")
-        mock_execute_with_fallback.return_value = (0, "", "")
+        mock_execute_with_fallback.return_value = (0, "1-0-1700000000\nC 1 0 0\n", "")
 
         with pytest.raises(ToolError, match="Log file is empty"):
             await mcp_client.call_tool("read_log_file", {"log_path": log_file})
@@ -304,7 +857,7 @@ class TestReadLogFile:
         log_file2.write_text("content2")
 
         mock_allowed_log_paths(f"{log_file1},{log_file2}")
-        mock_execute_with_fallback.return_value = (0, "content2", "")
+        mock_execute_with_fallback.return_value = (0, "2-8-1700000000\nC 2 0 8\ncontent2", "")
 
         result = await mcp_client.call_tool("read_log_file", {"log_path": log_file2})
         content = result.structured_content
@@ -315,7 +868,7 @@ class TestReadLogFile:
         """Test read_log_file with remote execution."""
         log_path = "/var/log/remote.log"
         mock_allowed_log_paths(log_path)
-        mock_execute_with_fallback.return_value = (0, "Remote log content\nLine 2", "")
+        mock_execute_with_fallback.return_value = (0, "3-25-1700000000\nC 3 0 25\nRemote log content\nLine 2", "")
 
         result = await mcp_client.call_tool("read_log_file", {"log_path": log_path, "host": "remote.server.com"})
         content = result.structured_content
@@ -332,7 +885,7 @@ class TestReadLogFile:
         """Test that remote execution skips local path validation."""
         log_path = "/nonexistent/remote.log"
         mock_allowed_log_paths(log_path)
-        mock_execute_with_fallback.return_value = (0, "Remote content", "")
+        mock_execute_with_fallback.return_value = (0, "4-14-1700000000\nC 4 0 14\nRemote content", "")
 
         result = await mcp_client.call_tool("read_log_file", {"log_path": log_path, "host": "remote.server.com"})
         content = result.structured_content
@@ -1,21 +1,45 @@
 """Tests for service management tools."""
 
+import json
+import os
+import subprocess
 import sys
 
+from collections import OrderedDict
+
 import pytest
 
+from fastmcp.exceptions import ToolError
+
+from linux_mcp_server.commands import CGROUP_STATS_SCRIPT
+
+
+def journal_json(ident, *entries):
+    """Return journalctl -o json output for (timestamp, message) entries."""
+    return "".join(
+        json.dumps(
+            {
+                "__CURSOR": f"s={ident}",
+                "__REALTIME_TIMESTAMP": str(timestamp),
+                "_HOSTNAME": "host",
+                "SYSLOG_IDENTIFIER": ident,
+                "MESSAGE": message,
+            }
+        )
+        + "\n"
+        for timestamp, message in entries
+    )
+
 
 @pytest.mark.skipif(sys.platform != "linux", reason="Only passes on Linux")
 class TestServices:
     async def test_list_services(self, mcp_client):
         result = await mcp_client.call_tool("list_services")
-        result_text = result.content[0].text.casefold()
-        expected = (
-            ("service", "unit"),
-            ("active", "inactive", "running"),
-        )
+        content = result.structured_content
 
-        assert all(any(n in result_text for n in case) for case in expected), "Did not find all expected values"
+        assert content["total"] > 0
+        assert all(service["unit"].endswith(".service") for service in content["services"])
+        assert sum(content["active_states"].values()) == content["total"]
 
     @pytest.mark.parametrize(
         "service_name, expected",
@@ -60,7 +84,7 @@ class TestServices:
         result_text = result.content[0].text.casefold()
         expected = (
             "not found",
-            "no entries",
+            "no log entries",
             "error",
         )
 
@@ -76,10 +100,18 @@ class TestRemoteServices:
         mock_execute_with_fallback.return_value = (0, mock_output, "")
 
         result = await mcp_client.call_tool("list_services", arguments={"host": "remote.example.com"})
-        result_text = result.content[0].text.casefold()
+        content = result.structured_content
 
-        assert "nginx.service" in result_text
-        assert "system services" in result_text
+        assert content["services"] == [
+            {
+                "unit": "nginx.service",
+                "load": "loaded",
+                "active": "active",
+                "sub": "running",
+                "description": "Nginx server",
+            }
+        ]
+        assert content["sub_states"] == {"running": 1}
         mock_execute_with_fallback.assert_called()
 
     async def test_get_service_status_remote(self, mock_execute_with_fallback, mcp_client):
@@ -96,16 +128,477 @@ class TestRemoteServices:
         assert "active" in result_text
         mock_execute_with_fallback.assert_called()
 
+    @pytest.mark.parametrize(
+        "arguments, expected, next_offset",
+        [
+            ({}, ["a.service", "b.service", "c.service", "d.service"], None),
+            ({"state": "failed"}, ["b.service"], None),
+            ({"sub_state": "running"}, ["a.service", "c.service"], None),
+            ({"pattern": "[cd]*"}, ["c.service", "d.service"], None),
+            ({"limit": 2}, ["a.service", "b.service"], 2),
+            ({"offset": 2, "limit": 1}, ["c.service"], 3),
+            ({"offset": 3, "limit": 1}, ["d.service"], None),
+        ],
+    )
+    async def test_list_services_filters(
+        self, mock_execute_with_fallback, mcp_client, arguments, expected, next_offset
+    ):
+        """Test filtering and paging services while counting all of them."""
+        units = [
+            ("a.service", "active", "running"),
+            ("b.service", "failed", "failed"),
+            ("c.service", "active", "running"),
+            ("d.service", "inactive", "dead"),
+        ]
+        stdout = json.dumps(
+            [
+                {"unit": unit, "load": "loaded", "active": active, "sub": sub, "description": ""}
+                for unit, active, sub in units
+            ]
+        )
+        mock_execute_with_fallback.return_value = (0, stdout, "")
+
+        result = await mcp_client.call_tool("list_services", arguments={**arguments, "host": "remote.example.com"})
+        content = result.structured_content
+
+        assert [service["unit"] for service in content["services"]] == expected
+        assert content["total"] == 4
+        assert content["active_states"] == {"active": 2, "failed": 1, "inactive": 1}
+        assert content["sub_states"] == {"running": 2, "failed": 1, "dead": 1}
+        assert content["next_offset"] == next_offset
+        mock_execute_with_fallback.assert_called_once()
+
+    async def test_list_services_failure(self, mock_execute_with_fallback, mcp_client):
+        """Test that a failing systemctl is reported."""
+        mock_execute_with_fallback.return_value = (1, "", "Failed to connect to bus")
+
+        with pytest.raises(ToolError, match="Error listing services: Failed to connect to bus"):
+            await mcp_client.call_tool("list_services", arguments={"host": "remote.example.com"})
+
+    async def test_get_service_states(self, mock_execute_with_fallback, mcp_client):
+        """Test reading the state of several services in one call."""
+        mock_execute_with_fallback.return_value = (
+            0,
+            "Id=sshd.service\nActiveState=active\nMainPID=812\nNRestarts=1\n\n"
+            "Id=docker.socket\nActiveState=inactive\nMainPID=0\n",
+            "",
+        )
+
+        result = await mcp_client.call_tool(
+            "get_service_states",
+            arguments={"service_names": ["sshd", "docker.socket", "sshd.service"], "host": "remote.example.com"},
+        )
+        content = result.structured_content
+
+        assert content["total"] == 2
+        assert content["services"][0]["unit"] == "sshd.service"
+        assert content["services"][0]["main_pid"] == 812
+        assert content["services"][0]["restarts"] == 1
+        assert content["services"][1]["main_pid"] is None
+        mock_execute_with_fallback.assert_called_once()
+        assert mock_execute_with_fallback.call_args.args[0][-1] == "sshd.service\ndocker.socket"
+
+    async def test_get_service_states_failure(self, mock_execute_with_fallback, mcp_client):
+        """Test that a failing systemctl is reported."""
+        mock_execute_with_fallback.return_value = (1, "", "Failed to connect to bus")
+
+        with pytest.raises(ToolError, match="Error getting service states: Failed to connect to bus"):
+            await mcp_client.call_tool(
+                "get_service_states", arguments={"service_names": ["sshd"], "host": "remote.example.com"}
+            )
+
+    async def test_get_service_states_rejects_newlines(self, mock_execute_with_fallback, mcp_client):
+        """Test that unit names cannot smuggle in extra list entries."""
+        with pytest.raises(ToolError, match="newlines"):
+            await mcp_client.call_tool(
+                "get_service_states", arguments={"service_names": ["sshd\ncrond"], "host": "remote.example.com"}
+            )
+
+        mock_execute_with_fallback.assert_not_called()
+
     async def test_get_service_logs_remote(self, mock_execute_with_fallback, mcp_client):
         """Test getting service logs on a remote host."""
-        mock_output = "Jan 01 12:00:00 host nginx[1234]: Starting Nginx\nJan 01 12:00:01 host nginx[1234]: Started"
+        mock_output = journal_json("nginx", (1704110400_000000, "Starting Nginx"), (1704110401_000000, "Started"))
         mock_execute_with_fallback.return_value = (0, mock_output, "")
 
         result = await mcp_client.call_tool(
             "get_service_logs", arguments={"service_name": "nginx", "host": "remote.example.com", "lines": 50}
         )
-        result_text = result.content[0].text.casefold()
+        result_text = result.content[0].text
+        cmd = mock_execute_with_fallback.call_args.args[0]
 
-        assert "nginx" in result_text
-        assert "starting" in result_text
-        mock_execute_with_fallback.assert_called()
+        assert cmd[cmd.index("--unit") + 1] == "nginx.service"
+        assert "--output=json" in cmd
+        assert result_text.splitlines() == [
+            "=== Last 50 log entries for nginx.service ===",
+            "",
+            "2024-01-01T12:00:00+0000 host nginx: Starting Nginx",
+            "2024-01-01T12:00:01+0000 host nginx: Started",
+        ]
+
+    async def test_get_service_logs_single_matches_list(self, mock_execute_with_fallback, mcp_client):
+        """Test that one service renders the same whether given by name or in a list."""
+        mock_execute_with_fallback.return_value = (
+            0,
+            journal_json("sshd", (1704110400_000000, "Accepted publickey"), (1704110405_000000, "session closed")),
+            "",
+        )
+
+        single = await mcp_client.call_tool("get_service_logs", arguments={"service_name": "sshd", "host": "remote"})
+        listed = await mcp_client.call_tool("get_service_logs", arguments={"service_name": ["sshd"], "host": "remote"})
+        cmds = [call.args[0] for call in mock_execute_with_fallback.mock_calls]
+
+        assert single.content[0].text == listed.content[0].text
+        assert cmds[0] == cmds[1]
+
+    async def test_get_service_logs_empty(self, mock_execute_with_fallback, mcp_client):
+        """Test a service without journal entries."""
+        mock_execute_with_fallback.return_value = (0, "-- No entries --\n", "")
+
+        result = await mcp_client.call_tool("get_service_logs", arguments={"service_name": "nginx", "host": "remote"})
+
+        assert result.content[0].text == "No log entries found for service 'nginx.service'."
+
+    async def test_get_service_logs_compact(self, mock_execute_with_fallback, mcp_client):
+        """Test summarizing service logs as templates."""
+        mock_output = journal_json(
+            "nginx",
+            (1704110400_000000, "worker 1 exited"),
+            (1704110405_000000, "worker 2 exited"),
+            (1704110409_000000, "reloading"),
+        )
+        mock_execute_with_fallback.return_value = (0, mock_output, "")
+
+        result = await mcp_client.call_tool(
+            "get_service_logs", arguments={"service_name": "nginx", "host": "remote.example.com", "compact": True}
+        )
+        result_text = result.content[0].text
+
+        assert "=== Log templates of the last 50 entries for nginx.service ===" in result_text
+        assert "2 templates from 3 lines" in result_text
+        assert "2x (2024-01-01T12:00:00+0000 .. 2024-01-01T12:00:05+0000) host nginx: worker <*> exited" in result_text
+
+    async def test_get_service_logs_merged(self, mock_execute_with_fallback, mcp_client):
+        """Test merging the logs of several services in time order."""
+        outputs = {
+            "nginx.service": journal_json("nginx", (1704110400_000000, "request 1"), (1704110402_000000, "request 2")),
+            "php-fpm.service": journal_json("php-fpm", (1704110401_500000, "child spawned")),
+            "mariadb.service": "-- No entries --\n",
+        }
+
+        async def execute(cmd, **kwargs):
+            return 0, outputs[cmd[cmd.index("--unit") + 1]], ""
+
+        mock_execute_with_fallback.side_effect = execute
+
+        result = await mcp_client.call_tool(
+            "get_service_logs",
+            arguments={"service_name": ["nginx", "php-fpm", "mariadb", "nginx.service"], "lines": 20, "host": "remote"},
+        )
+        result_text = result.content[0].text
+
+        assert mock_execute_with_fallback.call_count == 3
+        assert all(call.args[0][call.args[0].index("-n") + 1] == "20" for call in mock_execute_with_fallback.mock_calls)
+        assert "=== Last 20 log entries for each of nginx.service, php-fpm.service, mariadb.service ===" in result_text
+        assert result_text.splitlines()[2:] == [
+            "2024-01-01T12:00:00+0000 host nginx: request 1",
+            "2024-01-01T12:00:01+0000 host php-fpm: child spawned",
+            "2024-01-01T12:00:02+0000 host nginx: request 2",
+        ]
+
+    async def test_get_service_logs_merged_partial_failure(self, mock_execute_with_fallback, mcp_client):
+        """Test that a failing service is reported next to the others' logs."""
+
+        async def execute(cmd, **kwargs):
+            if "sshd.service" in cmd:
+                return 0, journal_json("sshd", (1704110400_000000, "Accepted publickey")), ""
+            return 1, "", "No such unit\n"
+
+        mock_execute_with_fallback.side_effect = execute
+
+        result = await mcp_client.call_tool(
+            "get_service_logs", arguments={"service_name": ["sshd", "missing"], "host": "remote"}
+        )
+        result_text = result.content[0].text
+
+        assert "host sshd: Accepted publickey" in result_text
+        assert result_text.endswith("Error getting logs for missing.service: No such unit")
+
+    async def test_get_service_logs_merged_compact(self, mock_execute_with_fallback, mcp_client):
+        """Test summarizing merged logs as templates."""
+
+        async def execute(cmd, **kwargs):
+            ident = cmd[cmd.index("--unit") + 1].removesuffix(".service")
+            return (
+                0,
+                journal_json(ident, (1704110400_000000, "worker 1 exited"), (1704110401_000000, "worker 2 exited")),
+                "",
+            )
+
+        mock_execute_with_fallback.side_effect = execute
+
+        result = await mcp_client.call_tool(
+            "get_service_logs", arguments={"service_name": ["a", "b"], "compact": True, "host": "remote"}
+        )
+        result_text = result.content[0].text
+
+        assert "=== Log templates of the last 50 entries for each of a.service, b.service ===" in result_text
+        assert "2 templates from 4 lines" in result_text
+
+    async def test_get_service_logs_too_many_services(self, mock_execute_with_fallback, mcp_client):
+        """Test that the number of merged services is limited."""
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool(
+                "get_service_logs", arguments={"service_name": [f"svc{i}" for i in range(11)], "host": "remote"}
+            )
+
+        mock_execute_with_fallback.assert_not_called()
+
+
+FAILED_JSON = json.dumps(
+    [{"unit": "nginx.service", "load": "loaded", "active": "failed", "sub": "failed", "description": "nginx"}]
+)
+BLAME = "1min 2.345s NetworkManager-wait-online.service\n    345ms nginx.service\n     12ms sshd.service\n"
+CHAIN = "graphical.target @5.123s\n└─multi-user.target @5.122s\n  └─nginx.service @3.2s +1.9s\n"
+
+
+def triage_output(boot_id, blame=BLAME, chain=CHAIN, timings=True):
+    output = f"@@ boot {boot_id}\n@@ failed\n{FAILED_JSON}\n"
+    if timings:
+        output += f"@@ blame\n{blame}@@ chain\n{chain}"
+    return output
+
+
+class TestTriageSummary:
+    @pytest.fixture(autouse=True)
+    def boot_timings(self, mocker):
+        return mocker.patch("linux_mcp_server.tools.services._boot_timings", OrderedDict())
+
+    async def test_triage_summary(self, mock_execute_with_fallback, mcp_client):
+        """Test the summary of failed units and boot timings."""
+        mock_execute_with_fallback.return_value = (0, triage_output("b1"), "")
+
+        result = await mcp_client.call_tool("get_triage_summary", arguments={"slowest": 2, "host": "remote"})
+        content = result.structured_content
+
+        assert content["boot_id"] == "b1"
+        assert [unit["unit"] for unit in content["failed"]] == ["nginx.service"]
+        assert content["slowest"] == [
+            {"unit": "NetworkManager-wait-online.service", "seconds": 62.345},
+            {"unit": "nginx.service", "seconds": 0.345},
+        ]
+        assert [unit["unit"] for unit in content["critical_chain"]] == [
+            "graphical.target",
+            "multi-user.target",
+            "nginx.service",
+        ]
+        assert content["critical_chain"][2]["start_seconds"] == 1.9
+        assert content["boot_cached"] is False
+        assert mock_execute_with_fallback.call_args.args[0][-2:] == ("", "50")
+
+    async def test_triage_summary_caches_boot_timings(self, mock_execute_with_fallback, mcp_client):
+        """Test that boot timings are read once per boot."""
+        mock_execute_with_fallback.side_effect = [
+            (0, triage_output("b1"), ""),
+            (0, triage_output("b1", timings=False), ""),
+            (0, triage_output("b2", blame="3s slow.service\n"), ""),
+        ]
+
+        first = await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+        second = await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+        rebooted = await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+
+        boot_ids = [call.args[0][-2] for call in mock_execute_with_fallback.call_args_list]
+        assert boot_ids == ["", "b1", "b1"]
+        assert second.structured_content["boot_cached"] is True
+        assert second.structured_content["slowest"] == first.structured_content["slowest"]
+        assert second.structured_content["failed"] == first.structured_content["failed"]
+        assert rebooted.structured_content["boot_cached"] is False
+        assert rebooted.structured_content["slowest"] == [{"unit": "slow.service", "seconds": 3.0}]
+
+    async def test_triage_summary_refresh(self, mock_execute_with_fallback, mcp_client):
+        """Test that refresh reads the boot timings again."""
+        mock_execute_with_fallback.return_value = (0, triage_output("b1"), "")
+
+        await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+        result = await mcp_client.call_tool("get_triage_summary", arguments={"refresh": True, "host": "remote"})
+
+        assert mock_execute_with_fallback.call_args.args[0][-2] == ""
+        assert result.structured_content["boot_cached"] is False
+
+    async def test_triage_summary_unfinished_boot_not_cached(self, mock_execute_with_fallback, mcp_client):
+        """Test that missing timings, e.g. while booting, are read again on the next call."""
+        mock_execute_with_fallback.return_value = (0, triage_output("b1", blame="", chain=""), "")
+
+        await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+        await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+
+        assert mock_execute_with_fallback.call_args.args[0][-2] == ""
+
+    async def test_triage_summary_failure(self, mock_execute_with_fallback, mcp_client):
+        """Test that a failing systemctl is reported."""
+        mock_execute_with_fallback.return_value = (1, "@@ boot b1\n@@ failed\n", "Failed to connect to bus")
+
+        with pytest.raises(ToolError, match="Error listing failed units: Failed to connect to bus"):
+            await mcp_client.call_tool("get_triage_summary", arguments={"host": "remote"})
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires /proc/sys/kernel/random/boot_id")
+    async def test_triage_summary_on_target(self, mcp_client, tmp_path, monkeypatch):
+        """Test the triage script with fake systemctl and systemd-analyze commands."""
+        (tmp_path / "systemctl").write_text(f"#!/bin/sh\necho '{FAILED_JSON}'\n")
+        (tmp_path / "systemd-analyze").write_text(
+            f"#!/bin/sh\n[ \"$1\" = blame ] && printf '{BLAME}' || printf '{CHAIN}'\n"
+        )
+        for name in ("systemctl", "systemd-analyze"):
+            (tmp_path / name).chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        first = (await mcp_client.call_tool("get_triage_summary", arguments={"slowest": 1})).structured_content
+        second = (await mcp_client.call_tool("get_triage_summary", arguments={"slowest": 1})).structured_content
+
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            assert first["boot_id"] == f.read().strip()
+        assert first["failed"][0]["unit"] == "nginx.service"
+        assert first["slowest"] == [{"unit": "NetworkManager-wait-online.service", "seconds": 62.345}]
+        assert len(first["critical_chain"]) == 3
+        assert second["boot_cached"] is True
+        assert second["slowest"] == first["slowest"]
+
+
+CGROUP_FIRST = """@@ sample 100.00
+db.service 4000 3000 900 1000000 100 1000 12
+web.service 9000 8000 500 5000000 0 0 40
+cron.service 100 - - 20000 - - 1
+"""
+
+CGROUP_SECOND = """@@ sample 102.00
+db.service 4100 3100 900 3000000 2100 5000 12
+web.service 9000 8000 500 5500000 0 4096 40
+cron.service 100 - - 20000 - - 1
+"""
+
+
+class TestUnitResources:
+    async def test_unit_resources_by_memory(self, mock_execute_with_fallback, mcp_client):
+        """Test that a single sample is sorted by memory without rates."""
+        mock_execute_with_fallback.return_value = (0, CGROUP_FIRST, "")
+
+        result = await mcp_client.call_tool("get_unit_resources", arguments={"limit": 2, "host": "remote"})
+        content = result.structured_content
+
+        assert [unit["unit"] for unit in content["units"]] == ["web.service", "db.service"]
+        assert content["total"] == 3
+        assert content["interval"] is None
+        assert content["units"][1]["io_write_bytes"] == 1000
+        assert content["units"][1]["cpu_percent"] is None
+        assert mock_execute_with_fallback.call_args.args[0][-2:] == ("/sys/fs/cgroup/system.slice", "0")
+
+    async def test_unit_resources_rates(self, mock_execute_with_fallback, mcp_client):
+        """Test that two samples give CPU and I/O rates over the measured interval."""
+        mock_execute_with_fallback.return_value = (0, CGROUP_FIRST + CGROUP_SECOND, "")
+
+        result = await mcp_client.call_tool(
+            "get_unit_resources", arguments={"sort_by": "cpu", "interval": 2, "host": "remote"}
+        )
+        content = result.structured_content
+
+        assert content["interval"] == 2.0
+        assert [unit["unit"] for unit in content["units"]] == ["db.service", "web.service", "cron.service"]
+        db, web, cron = content["units"]
+        assert db["cpu_percent"] == 100.0
+        assert db["io_read_bytes_per_sec"] == 1000.0
+        assert db["io_write_bytes_per_sec"] == 2000.0
+        assert web["cpu_percent"] == 25.0
+        assert cron["cpu_percent"] == 0.0
+        assert cron["io_read_bytes_per_sec"] is None
+        assert mock_execute_with_fallback.call_args.args[0][-1] == "2"
+
+    async def test_unit_resources_sort_by_io_totals(self, mock_execute_with_fallback, mcp_client):
+        """Test that units without I/O accounting sort last."""
+        mock_execute_with_fallback.return_value = (0, CGROUP_FIRST, "")
+
+        result = await mcp_client.call_tool("get_unit_resources", arguments={"sort_by": "io", "host": "remote"})
+
+        assert [unit["unit"] for unit in result.structured_content["units"]] == [
+            "db.service",
+            "web.service",
+            "cron.service",
+        ]
+
+    async def test_unit_resources_restarted_unit(self, mock_execute_with_fallback, mcp_client):
+        """Test that counters reset by a restart give no rate."""
+        second = CGROUP_SECOND.replace("db.service 4100 3100 900 3000000", "db.service 4100 3100 900 10")
+        mock_execute_with_fallback.return_value = (0, CGROUP_FIRST + second, "")
+
+        result = await mcp_client.call_tool(
+            "get_unit_resources", arguments={"interval": 2, "sort_by": "cpu", "host": "remote"}
+        )
+
+        assert result.structured_content["units"][-1]["unit"] == "db.service"
+        assert result.structured_content["units"][-1]["cpu_percent"] is None
+
+    @pytest.mark.parametrize("slice_name", ["../etc", "system.slice/../../etc", "nginx.service", "a slice.slice"])
+    async def test_unit_resources_invalid_slice(self, mock_execute_with_fallback, mcp_client, slice_name):
+        """Test that only slices under /sys/fs/cgroup are accepted."""
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool("get_unit_resources", arguments={"slice_name": slice_name})
+
+        mock_execute_with_fallback.assert_not_called()
+
+    async def test_unit_resources_failure(self, mock_execute_with_fallback, mcp_client):
+        """Test that a missing cgroup v2 hierarchy is reported."""
+        mock_execute_with_fallback.return_value = (2, "", "No cgroup v2 accounting files under /sys/fs/cgroup/x")
+
+        with pytest.raises(ToolError, match="Error reading resource usage of system.slice: No cgroup v2"):
+            await mcp_client.call_tool("get_unit_resources", arguments={"host": "remote"})
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires /proc/uptime")
+    def test_cgroup_stats_script(self, tmp_path):
+        """Test the cgroup_stats script against a fake cgroup v2 tree."""
+        web = tmp_path / "web.service"
+        web.mkdir()
+        (web / "memory.current").write_text("9000\n")
+        (web / "memory.stat").write_text("anon 8000\nfile 500\nkernel 12\n")
+        (web / "cpu.stat").write_text("usage_usec 5000\nuser_usec 4000\nsystem_usec 1000\n")
+        (web / "io.stat").write_text("8:0 rbytes=100 wbytes=200 rios=1 wios=2\n8:16 rbytes=1 wbytes=2 rios=1 wios=1\n")
+        (web / "pids.current").write_text("40\n")
+        (tmp_path / "init.scope").mkdir()
+        (tmp_path / "init.scope" / "memory.current").write_text("100\n")
+
+        result = subprocess.run(
+            ["bash", "-c", CGROUP_STATS_SCRIPT, "bash", str(tmp_path), "0.1"], capture_output=True, text=True
+        )
+
+        samples = result.stdout.split("@@ sample ")[1:]
+        assert result.returncode == 0
+        assert len(samples) == 2
+        assert sorted(samples[1].splitlines()[1:]) == [
+            "init.scope 100 - - - - - -",
+            "web.service 9000 8000 500 5000 101 202 40",
+        ]
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="requires /proc/uptime")
+    def test_cgroup_stats_script_empty_io_stat(self, tmp_path):
+        """Test that a unit with io enabled but no I/O yet reports zero bytes."""
+        idle = tmp_path / "idle.service"
+        idle.mkdir()
+        (idle / "io.stat").write_text("")
+        (idle / "pids.current").write_text("1\n")
+
+        result = subprocess.run(
+            ["bash", "-c", CGROUP_STATS_SCRIPT, "bash", str(tmp_path), "0"], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.splitlines()[1:] == ["idle.service - - - - 0 0 1"]
+
+    def test_cgroup_stats_script_without_cgroup_v2(self, tmp_path):
+        """Test that a tree without accounting files fails."""
+        result = subprocess.run(
+            ["bash", "-c", CGROUP_STATS_SCRIPT, "bash", str(tmp_path / "missing.slice"), "0"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 2
+        assert "No cgroup v2 accounting files" in result.stderr
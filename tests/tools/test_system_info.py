@@ -1,12 +1,17 @@
 """Tests for system information tools."""
 
 import json
+import math
+import os
 import sys
 
 import pytest
 
 from fastmcp import exceptions
 
+from linux_mcp_server.metrics_collector import Metric
+from linux_mcp_server.metrics_collector import MetricsCollector
+
 
 @pytest.fixture
 def mock_execute(mock_execute_with_fallback_for):
@@ -111,7 +116,7 @@ async def test_system_info_tools_unsuccessful_empty(tool, mcp_client, mock_execu
     "tool, failing_command",
     [
         ("get_system_information", "hostname"),
-        ("get_cpu_information", "model"),
+        ("get_cpu_information", "bash"),
     ],
 )
 async def test_system_info_tools_exception(tool, failing_command, mcp_client, mock_execute):
@@ -131,15 +136,88 @@ async def test_get_memory_information_command_exception(mcp_client, mock_execute
 
 
 async def test_get_memory_information_parse_error(mcp_client, mock_execute):
-    """Test get_memory_information with malformed output that causes parsing to fail."""
-    # Return output that will cause int() to fail in parse_free_output
-    malformed_output = "Mem: invalid total used free"
+    """Test get_memory_information with output that lacks the memory totals."""
+    malformed_output = "@@ meminfo\nMemTotal: invalid kB\n"
     mock_execute.return_value = (0, malformed_output, "")
 
-    with pytest.raises(exceptions.ToolError, match="Error calling tool 'get_memory_information'"):
+    with pytest.raises(exceptions.ToolError, match="Unexpected output reading memory information"):
         await mcp_client.call_tool("get_memory_information")
 
 
+MEMINFO_OUTPUT = """@@ meminfo
+MemTotal:        1000 kB
+MemFree:          200 kB
+MemAvailable:     600 kB
+Buffers:           50 kB
+Cached:           300 kB
+SwapTotal:        100 kB
+SwapFree:          40 kB
+AnonPages:        250 kB
+Shmem:             20 kB
+SReclaimable:      60 kB
+SUnreclaim:        40 kB
+KernelStack:       10 kB
+PageTables:         5 kB
+HugePages_Total:    0
+"""
+
+
+async def test_get_memory_information_meminfo(mcp_client, mock_execute):
+    """Test totals and breakdown read from /proc/meminfo."""
+    mock_execute.return_value = (0, MEMINFO_OUTPUT, "")
+
+    result = await mcp_client.call_tool("get_memory_information")
+    content = result.structured_content
+
+    assert content["ram"] == {
+        "total": 1024000,
+        "used": 409600,
+        "free": 204800,
+        "shared": 20480,
+        "buffers": 51200,
+        "cached": 368640,
+        "available": 614400,
+    }
+    assert content["swap"] == {"total": 102400, "used": 61440, "free": 40960}
+    assert content["breakdown"]["page_cache"] == 280 * 1024
+    assert content["breakdown"]["slab_unreclaimable"] == 40 * 1024
+    assert content["breakdown"]["unaccounted"] == 85 * 1024
+    assert content["meminfo"]["HugePages_Total"] == 0
+    assert content["slab_caches"] is None
+    assert mock_execute.call_args.args[0][-1] == "0"
+
+
+async def test_get_memory_information_slab_caches(mcp_client, mock_execute):
+    """Test the slab caches selected on the target."""
+    slabinfo = "@@ slabinfo\next4_inode_cache 167849 168126 1120 196755456\ndentry 185112 185283 192 36139008\n"
+    mock_execute.return_value = (0, MEMINFO_OUTPUT + slabinfo, "")
+
+    result = await mcp_client.call_tool("get_memory_information", arguments={"slab_caches": 2})
+    content = result.structured_content
+
+    assert content["slab_caches"] == [
+        {
+            "name": "ext4_inode_cache",
+            "active_objects": 167849,
+            "objects": 168126,
+            "object_size": 1120,
+            "size_bytes": 196755456,
+        },
+        {"name": "dentry", "active_objects": 185112, "objects": 185283, "object_size": 192, "size_bytes": 36139008},
+    ]
+    assert mock_execute.call_args.args[0][-1] == "2"
+
+
+async def test_get_memory_information_slabinfo_unreadable(mcp_client, mock_execute):
+    """Test that slab caches are None when /proc/slabinfo could not be read."""
+    mock_execute.return_value = (0, MEMINFO_OUTPUT, "")
+
+    result = await mcp_client.call_tool("get_memory_information", arguments={"slab_caches": 5})
+
+    assert result.structured_content["slab_caches"] is None
+    assert result.structured_content["ram"]["total"] == 1024000
+
+
 async def test_get_disk_usage_parse_error(mcp_client, mock_execute):
     """Test get_disk_usage with unexpected exception during execution."""
     # Mock cmd.run to raise an unexpected exception
@@ -306,3 +384,317 @@ async def test_get_hardware_information_remote_execution(mcp_client, mock_execut
     mock_execute.assert_called()
     call_kwargs = mock_execute.call_args[1]
     assert call_kwargs["host"] == "remote.host.com"
+
+
+CPU_INFO_OUTPUT = """\
+@@ sample 100.00
+@@ stat
+cpu  100 0 50 800 50 0 0 0 0 0
+@@ cpuinfo
+processor\t: 0
+model name\t: Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz
+cpu MHz\t\t: 2100.000
+physical id\t: 0
+core id\t\t: 0
+
+processor\t: 1
+model name\t: Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz
+cpu MHz\t\t: 2300.000
+physical id\t: 0
+core id\t\t: 0
+
+@@ loadavg
+0.50 0.75 1.00 1/234 5678
+"""
+
+
+@pytest.mark.parametrize(
+    "interval, output, expected",
+    (
+        (0.5, CPU_INFO_OUTPUT + "@@ sample 100.50\n@@ stat\ncpu  300 100 150 1200 150 50 50 0 0 0\n", 50.0),
+        (0, CPU_INFO_OUTPUT, 15.0),
+    ),
+    ids=("interval", "since_boot"),
+)
+async def test_get_cpu_information(mcp_client, mock_execute, interval, output, expected):
+    """Test CPU information and utilization from a single command."""
+    mock_execute.return_value = (0, output, "")
+
+    result = await mcp_client.call_tool("get_cpu_information", arguments={"interval": interval})
+    content = result.structured_content
+
+    assert content["model"] == "Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz"
+    assert content["logical_cores"] == 2
+    assert content["physical_cores"] == 1
+    assert content["frequency_mhz"] == 2200.0
+    assert content["load_avg_15m"] == 1.0
+    assert content["utilization"]["busy_percent"] == expected
+    assert content["cores"] is None
+    mock_execute.assert_called_once()
+    assert mock_execute.call_args.args[0][-1] == f"{interval:g}"
+
+
+async def test_get_cpu_information_per_core(mcp_client, mock_execute):
+    """Test listing physical cores."""
+    mock_execute.return_value = (0, CPU_INFO_OUTPUT, "")
+
+    result = await mcp_client.call_tool("get_cpu_information", arguments={"interval": 0, "per_core": True})
+
+    assert result.structured_content["cores"] == [
+        {"package": 0, "core": 0, "processors": [0, 1], "frequency_mhz": 2300.0}
+    ]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires /proc")
+async def test_get_cpu_information_local(mcp_client):
+    """Test the CPU information script on this host."""
+    result = await mcp_client.call_tool("get_cpu_information", arguments={"interval": 0.1, "per_core": True})
+    content = result.structured_content
+
+    assert content["logical_cores"] == os.cpu_count()
+    assert content["utilization"] is not None
+
+
+def activity_sample(uptime, cpu, net, disk):
+    """Return one sample of activity_sample output from counter tuples."""
+    return (
+        f"@@ sample {uptime}\n@@ stat\n"
+        f"cpu  {' '.join(map(str, cpu))} 0 0\n"
+        f"cpu0 {' '.join(map(str, cpu))} 0 0\n"
+        "@@ net\n"
+        f"  eth0: {' '.join(map(str, net))}\n"
+        "@@ disk\n"
+        f" 254 0 vda {' '.join(map(str, disk))} 0 0 0 0\n"
+        " 7 0 loop0 0 0 0 0 0 0 0 0 0 0 0\n"
+    )
+
+
+ACTIVITY_OUTPUT = activity_sample(
+    "100.00", (100, 0, 50, 800, 50, 0, 0, 0), (1000, 10) + (0,) * 6 + (500, 5) + (0,) * 6, (10, 0, 80, 20) + (0,) * 7
+) + activity_sample(
+    "102.00",
+    (300, 100, 150, 1200, 150, 50, 50, 0),
+    (5000, 50, 1, 1) + (0,) * 4 + (2500, 25) + (0,) * 6,
+    (30, 0, 4176, 60, 4, 0, 8, 40, 0, 1000, 0),
+)
+
+
+async def test_get_system_activity(mcp_client, mock_execute):
+    """Test rates computed from two samples."""
+    mock_execute.return_value = (0, ACTIVITY_OUTPUT, "")
+
+    result = await mcp_client.call_tool("get_system_activity", arguments={"interval": 2})
+    content = result.structured_content
+
+    assert content["interval"] == 2.0
+    assert [cpu["cpu"] for cpu in content["cpus"]] == ["cpu", "cpu0"]
+    assert content["cpus"][0] == {
+        "cpu": "cpu",
+        "busy_percent": 50.0,
+        "user_percent": 30.0,
+        "system_percent": 20.0,
+        "iowait_percent": 10.0,
+        "steal_percent": 0.0,
+        "idle_percent": 40.0,
+    }
+    assert content["interfaces"] == [
+        {
+            "interface": "eth0",
+            "rx_bytes_per_sec": 2000.0,
+            "tx_bytes_per_sec": 1000.0,
+            "rx_packets_per_sec": 20.0,
+            "tx_packets_per_sec": 10.0,
+            "rx_errors_per_sec": 1.0,
+            "tx_errors_per_sec": 0.0,
+        }
+    ]
+    assert content["disks"] == [
+        {
+            "device": "vda",
+            "read_iops": 10.0,
+            "write_iops": 2.0,
+            "read_bytes_per_sec": 1048576.0,
+            "write_bytes_per_sec": 2048.0,
+            "read_await_ms": 2.0,
+            "write_await_ms": 10.0,
+            "utilization_percent": 50.0,
+        }
+    ]
+    assert mock_execute.call_args.args[0][-1] == "2"
+
+
+@pytest.mark.parametrize(
+    "stdout",
+    [
+        ACTIVITY_OUTPUT.split("@@ sample 102.00")[0],
+        "cpu 1 2 3 4 5 6 7 8\n",
+        ACTIVITY_OUTPUT.replace("102.00", "100.00"),
+    ],
+)
+async def test_get_system_activity_unexpected_output(mcp_client, mock_execute, stdout):
+    mock_execute.return_value = (0, stdout, "")
+
+    with pytest.raises(exceptions.ToolError, match="Unexpected output sampling system activity"):
+        await mcp_client.call_tool("get_system_activity")
+
+
+async def test_get_system_activity_failure(mcp_client, mock_execute):
+    mock_execute.return_value = (1, "", "sleep: invalid time interval")
+
+    with pytest.raises(exceptions.ToolError, match="Error sampling system activity: sleep"):
+        await mcp_client.call_tool("get_system_activity")
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="requires /proc")
+async def test_get_system_activity_on_target(mcp_client):
+    result = await mcp_client.call_tool("get_system_activity", arguments={"interval": 0.2})
+    content = result.structured_content
+
+    assert content["interval"] > 0
+    assert content["cpus"][0]["cpu"] == "cpu"
+    assert any(interface["interface"] == "lo" for interface in content["interfaces"])
+
+
+@pytest.fixture
+def collector(mocker):
+    collector = MetricsCollector([None, "web1"], 10, 100)
+    mocker.patch("linux_mcp_server.tools.system_info.get_collector", return_value=collector)
+    return collector
+
+
+async def test_get_metrics_history(mcp_client, collector, mocker):
+    mocker.patch("linux_mcp_server.tools.system_info.time.time", return_value=1000.0)
+    for timestamp, load in ((450.0, 9.0), (700.0, 1.0), (710.0, 3.0), (950.0, 2.0), (990.0, math.nan)):
+        collector.buffers["web1"].append(timestamp, {"load1": load, "cpu_percent": load * 10})
+
+    result = await mcp_client.call_tool(
+        "get_metrics_history",
+        arguments={"metrics": ["load1", "cpu_percent"], "minutes": 5, "points": 3, "host": "web1"},
+    )
+    content = result.structured_content
+
+    assert content["host"] == "web1"
+    assert content["interval"] == 10
+    assert len(content["timestamps"]) == 3
+    load, cpu = content["series"]
+    assert load == {
+        "metric": "load1",
+        "values": [2.0, None, 2.0],
+        "samples": 3,
+        "min": 1.0,
+        "max": 3.0,
+        "mean": 2.0,
+        "p95": 3.0,
+        "last": 2.0,
+    }
+    assert cpu["metric"] == "cpu_percent"
+    assert cpu["max"] == 30.0
+
+
+async def test_get_metrics_history_all_metrics_empty(mcp_client, collector):
+    result = await mcp_client.call_tool("get_metrics_history", arguments={"points": 2})
+    series = result.structured_content["series"]
+
+    assert len(series) == len(Metric)
+    assert series[0] == {
+        "metric": "load1",
+        "values": [None, None],
+        "samples": 0,
+        "min": None,
+        "max": None,
+        "mean": None,
+        "p95": None,
+        "last": None,
+    }
+
+
+@pytest.mark.parametrize("host", ["db1", "local"])
+async def test_get_metrics_history_host_not_collected(mcp_client, collector, host):
+    collector.buffers[None].append(1000.0, {"load1": 1.0})
+
+    with pytest.raises(exceptions.ToolError, match=f"Metrics are not collected for {host}"):
+        await mcp_client.call_tool("get_metrics_history", arguments={"host": host})
+
+
+PRESSURE_FIRST = """@@ sample 50.00
+cpu some avg10=1.29 avg60=2.55 avg300=3.05 total=395000000
+cpu full avg10=0.00 avg60=0.00 avg300=0.00 total=0
+memory some avg10=0.00 avg60=0.00 avg300=0.00 total=1000
+io some avg10=12.50 avg60=8.00 avg300=2.00 total=5000000
+"""
+
+PRESSURE_SECOND = """@@ sample 52.00
+cpu some avg10=1.40 avg60=2.55 avg300=3.05 total=395100000
+cpu full avg10=0.00 avg60=0.00 avg300=0.00 total=0
+memory some avg10=0.00 avg60=0.00 avg300=0.00 total=1000
+io some avg10=20.00 avg60=9.00 avg300=2.10 total=6000000
+io full avg10=5.00 avg60=1.00 avg300=0.50 total=900000
+"""
+
+
+async def test_get_pressure_information(mcp_client, mock_execute):
+    """Test averages and stall rates from two samples."""
+    mock_execute.return_value = (0, PRESSURE_FIRST + PRESSURE_SECOND, "")
+
+    result = await mcp_client.call_tool("get_pressure_information", arguments={"interval": 2})
+    content = result.structured_content
+
+    assert content["cgroup"] is None
+    assert content["interval"] == 2.0
+    assert [(stall["resource"], stall["kind"], stall["stall_percent"]) for stall in content["pressures"]] == [
+        ("cpu", "some", 5.0),
+        ("cpu", "full", 0.0),
+        ("memory", "some", 0.0),
+        ("io", "some", 50.0),
+        ("io", "full", None),
+    ]
+    assert content["pressures"][3]["avg10"] == 20.0
+    assert content["pressures"][3]["total_usec"] == 6000000
+    assert mock_execute.call_args.args[0][-3:] == ("/proc/pressure", "", "2")
+
+
+async def test_get_pressure_information_cgroup_averages_only(mcp_client, mock_execute):
+    mock_execute.return_value = (0, PRESSURE_FIRST, "")
+
+    result = await mcp_client.call_tool(
+        "get_pressure_information", arguments={"cgroup": "system.slice/sshd.service", "interval": 0}
+    )
+    content = result.structured_content
+
+    assert content["cgroup"] == "system.slice/sshd.service"
+    assert content["interval"] is None
+    assert all(stall["stall_percent"] is None for stall in content["pressures"])
+    assert mock_execute.call_args.args[0][-3:] == ("/sys/fs/cgroup/system.slice/sshd.service", ".pressure", "0")
+
+
+@pytest.mark.parametrize("cgroup", ["../../etc", "system.slice/..", "/system.slice", "a b"])
+async def test_get_pressure_information_invalid_cgroup(mcp_client, mock_execute, cgroup):
+    with pytest.raises(exceptions.ToolError):
+        await mcp_client.call_tool("get_pressure_information", arguments={"cgroup": cgroup})
+
+    mock_execute.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "returncode, stdout, error",
+    [
+        (2, "", "Error reading pressure stall information: Pressure stall information is not available"),
+        (0, "", "Unexpected output reading pressure stall information"),
+        (0, "@@ sample 1.00\ncpu some avg10=1.00\n", "Unexpected output reading pressure stall information"),
+    ],
+)
+async def test_get_pressure_information_errors(mcp_client, mock_execute, returncode, stdout, error):
+    mock_execute.return_value = (returncode, stdout, "Pressure stall information is not available in /proc/pressure")
+
+    with pytest.raises(exceptions.ToolError, match=error):
+        await mcp_client.call_tool("get_pressure_information")
+
+
+@pytest.mark.skipif(not os.access("/proc/pressure/cpu", os.R_OK), reason="requires PSI")
+async def test_get_pressure_information_on_target(mcp_client):
+    result = await mcp_client.call_tool("get_pressure_information", arguments={"interval": 0.2})
+    content = result.structured_content
+
+    cpu_some = next(stall for stall in content["pressures"] if (stall["resource"], stall["kind"]) == ("cpu", "some"))
+    assert content["interval"] > 0
+    assert cpu_some["stall_percent"] is not None
@@ -7,6 +7,7 @@ import pytest
 from linux_mcp_server.utils.validation import is_empty_output
 from linux_mcp_server.utils.validation import is_successful_output
 from linux_mcp_server.utils.validation import PathValidationError
+from linux_mcp_server.utils.validation import validate_log_pattern
 from linux_mcp_server.utils.validation import validate_path
 
 
@@ -150,3 +151,36 @@ class TestValidatePath:
         """Paths containing '..' components are rejected to prevent path traversal."""
         with pytest.raises(PathValidationError, match=r"invalid component '\.\.'"):
             validate_path(path)
+
+
+class TestValidateLogPattern:
+    """Test validate_log_pattern function."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["", "error", "^Jan +5 ", "sshd\\[[0-9]+\\]", "a\\tb", "\\\\1", "(fail|error)ed", "\\{[0-9]\\}", "{}"],
+    )
+    def test_valid_patterns(self, pattern):
+        """Portable extended regular expressions are accepted unchanged."""
+        assert validate_log_pattern(pattern) == pattern
+
+    @pytest.mark.parametrize(
+        "pattern, match",
+        [
+            ("x" * 513, "longer than"),
+            ("a\nb", "invalid characters"),
+            ("a\x00", "invalid characters"),
+            ("(a)\\1", "Unsupported escape"),
+            ("\\d+", "Unsupported escape"),
+            ("(?i)error", "not supported"),
+            ("[[:digit:]]{3}", "Interval expressions"),
+            ("code [0-9]{3}", "Interval expressions"),
+            ("a{1,2}", "Interval expressions"),
+            ("a{2,}", "Interval expressions"),
+            ("(unclosed", "Invalid pattern"),
+        ],
+    )
+    def test_rejects_invalid_patterns(self, pattern, match):
+        """Unportable or malformed patterns raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            validate_log_pattern(pattern)